@@ -13,6 +13,7 @@ Typical usage:
 
 from typing import Any
 
+from airborne.core.game_loop import PluginScheduler
 from airborne.core.logging_system import get_logger
 from airborne.core.plugin import IPlugin
 
@@ -43,9 +44,24 @@ class Aircraft:
         self.name = name
         self.metadata = metadata or {}
         self._systems: dict[str, IPlugin] = {}
+        self._scheduler = PluginScheduler()
 
         logger.info("Created aircraft: %s", name)
 
+    @property
+    def profiler(self) -> Any:
+        """Optional FrameProfiler timing each system update."""
+        return self._scheduler.profiler
+
+    @profiler.setter
+    def profiler(self, profiler: Any) -> None:
+        self._scheduler.profiler = profiler
+
+    @property
+    def scheduler(self) -> PluginScheduler:
+        """Scheduler updating the systems (configures parallel stages)."""
+        return self._scheduler
+
     def add_system(self, instance_id: str, plugin: IPlugin) -> None:
         """Add a system plugin to the aircraft.
 
@@ -64,6 +80,7 @@ class Aircraft:
             raise ValueError(f"System with instance_id '{instance_id}' already exists")
 
         self._systems[instance_id] = plugin
+        self._scheduler.add(plugin, instance_id)
         logger.debug("Added system '%s' to aircraft '%s'", instance_id, self.name)
 
     def remove_system(self, instance_id: str) -> None:
@@ -84,6 +101,7 @@ class Aircraft:
         plugin = self._systems[instance_id]
         plugin.shutdown()
         del self._systems[instance_id]
+        self._scheduler.remove(plugin)
 
         logger.debug("Removed system '%s' from aircraft '%s'", instance_id, self.name)
 
@@ -140,7 +158,13 @@ class Aircraft:
 
         Systems are updated in the order they were added. For proper
         dependency ordering, add systems in the correct sequence or use
-        the AircraftBuilder which handles dependency resolution.
+        the AircraftBuilder which handles dependency resolution. When the
+        scheduler has worker threads, systems are instead updated stage by
+        stage, concurrently within a stage (see PluginScheduler).
+
+        Systems that declare an update_rate_hz in their metadata are only
+        updated when due, with the time accumulated since their last update.
+        Errors raised by a system are logged and passed to its on_error().
 
         Args:
             dt: Delta time in seconds since last update.
@@ -148,21 +172,7 @@ class Aircraft:
         Examples:
             >>> aircraft.update(0.016)  # 60 FPS
         """
-        for instance_id, plugin in self._systems.items():
-            try:
-                plugin.update(dt)
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                logger.error(
-                    "Error updating system '%s' in aircraft '%s': %s",
-                    instance_id,
-                    self.name,
-                    e,
-                )
-                # Notify plugin of error
-                try:
-                    plugin.on_error(e)
-                except Exception:  # pylint: disable=broad-exception-caught
-                    pass  # Plugin error handler failed, continue
+        self._scheduler.tick(dt)
 
     def shutdown(self) -> None:
         """Shutdown all aircraft systems.
@@ -182,6 +192,7 @@ class Aircraft:
                 logger.error("Error shutting down system '%s': %s", instance_id, e)
 
         self._systems.clear()
+        self._scheduler.shutdown()
         logger.info("Aircraft '%s' shutdown complete", self.name)
 
     def __repr__(self) -> str:
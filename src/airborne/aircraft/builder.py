@@ -14,6 +14,7 @@ from typing import Any
 import yaml
 
 from airborne.aircraft.aircraft import Aircraft
+from airborne.core.config import ConfigLoader
 from airborne.core.logging_system import get_logger
 from airborne.core.plugin import IPlugin, PluginContext
 from airborne.core.plugin_loader import PluginLoader
@@ -71,8 +72,7 @@ class AircraftBuilder:
         logger.info("Loading aircraft from: %s", config_path)
 
         # Load YAML config
-        with open(config_path, encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+        config = ConfigLoader.load_yaml(config_path)
 
         if not config or "aircraft" not in config:
             raise ValueError(f"Invalid aircraft config: {config_path}")
@@ -236,8 +236,7 @@ class AircraftBuilder:
             raise FileNotFoundError(f"Config file not found: {config_path}")
 
         try:
-            with open(config_path, encoding="utf-8") as f:
-                config: dict[str, Any] = yaml.safe_load(f)
+            config: dict[str, Any] = ConfigLoader.load_yaml(config_path)
 
             if not config:
                 raise ValueError("Empty configuration file")
@@ -16,8 +16,6 @@ import time
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 try:
     import pyfmodex  # type: ignore[import-untyped]
 
@@ -27,6 +25,7 @@ except ImportError:
     pyfmodex = None
 
 from airborne.audio.effects.radio_filter import RadioEffectFilter
+from airborne.core.config import ConfigLoader
 from airborne.core.logging_system import get_logger
 from airborne.core.resource_path import get_resource_path
 
@@ -119,8 +118,7 @@ class ATCAudioManager:
             return
 
         try:
-            with open(config_file, encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+            config = ConfigLoader.load_yaml(config_file)
 
             self._file_extension = config.get("file_extension", "mp3")
             self._message_map = config.get("messages", {})
@@ -154,8 +152,7 @@ class ATCAudioManager:
             return
 
         try:
-            with open(config_file, encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+            config = ConfigLoader.load_yaml(config_file)
 
             # Add pilot messages to the same message map
             pilot_messages = config.get("messages", {})
@@ -196,8 +193,7 @@ class ATCAudioManager:
             }
         else:
             try:
-                with open(config_file, encoding="utf-8") as f:
-                    config = yaml.safe_load(f)
+                config = ConfigLoader.load_yaml(config_file)
                 radio_config = config.get("radio_effect", {})
                 # Store PTT beep configuration
                 self._ptt_config = radio_config.get("ptt_beeps", {})
@@ -301,7 +297,7 @@ class ATCAudioManager:
             channel.stop()
             oscillator.release()
 
-            logger.debug(f"Played PTT {beep_type} beep: {frequency}Hz, {duration_ms}ms")
+            logger.debug("Played PTT %s beep: %sHz, %sms", beep_type, frequency, duration_ms)
 
         except Exception as e:
             logger.warning(f"Error playing PTT beep: {e}")
@@ -384,11 +380,11 @@ class ATCAudioManager:
                 if self._radio_filter and self._radio_filter.is_enabled() and source_id:
                     if voice_channel:
                         self._radio_filter.apply_to_channel(voice_channel)
-                        logger.info(f"Playing ATC message with radio effect: {key}")
+                        logger.info("Playing ATC message with radio effect: %s", key)
                     else:
                         logger.warning(f"Channel not found for source {source_id}")
                 else:
-                    logger.info(f"Playing ATC message without radio effect: {key}")
+                    logger.info("Playing ATC message without radio effect: %s", key)
 
                 # Wait for message to finish
                 if voice_channel:
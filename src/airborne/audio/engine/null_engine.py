@@ -0,0 +1,170 @@
+"""Silent audio engine for headless runs.
+
+NullAudioEngine implements IAudioEngine without touching any audio device.
+Sounds "load" without reading the file and "play" for zero time, so the sound
+manager, TTS queue and audio plugin run their normal logic in scripted,
+headless or CI simulations.
+
+Typical usage example:
+    from airborne.audio.engine.null_engine import NullAudioEngine
+
+    engine = NullAudioEngine()
+    engine.initialize({})
+    source_id = engine.play_2d(engine.load_sound("beep.wav"))
+"""
+
+from typing import Any
+
+from airborne.audio.engine.base import (
+    AudioFormat,
+    IAudioEngine,
+    Sound,
+    SourceState,
+    Vector3,
+)
+
+
+class NullAudioEngine(IAudioEngine):
+    """Audio engine that produces no sound.
+
+    Every played source finishes immediately: get_source_state() reports
+    STOPPED, so code waiting for a sound to end moves on at once.
+
+    Examples:
+        >>> engine = NullAudioEngine()
+        >>> engine.initialize({})
+        >>> engine.get_source_state(engine.play_2d(engine.load_sound("x.wav")))
+        <SourceState.STOPPED: 1>
+    """
+
+    def __init__(self) -> None:
+        """Initialize the engine."""
+        self._initialized = False
+        self._sounds: dict[str, Sound] = {}
+        self._next_source_id = 1
+        self._master_volume = 1.0
+        self.play_count = 0
+
+    def initialize(self, config: dict[str, Any]) -> None:
+        """Initialize the engine (no device is opened).
+
+        Args:
+            config: Ignored.
+        """
+        self._initialized = True
+
+    def shutdown(self) -> None:
+        """Release all sounds."""
+        self._sounds.clear()
+        self._initialized = False
+
+    def update(self) -> None:
+        """Per-frame update (nothing to do)."""
+
+    def load_sound(self, path: str, preload: bool = True) -> Sound:
+        """Create a placeholder sound without reading the file.
+
+        Args:
+            path: Path to the sound file.
+            preload: Ignored.
+
+        Returns:
+            Zero-length sound resource.
+        """
+        sound = self._sounds.get(path)
+        if sound is None:
+            sound = Sound(
+                path=path,
+                format=AudioFormat.UNKNOWN,
+                duration=0.0,
+                sample_rate=44100,
+                channels=1,
+                handle=None,
+            )
+            self._sounds[path] = sound
+        return sound
+
+    def unload_sound(self, sound: Sound) -> None:
+        """Unload a sound.
+
+        Args:
+            sound: Sound to unload.
+        """
+        self._sounds.pop(sound.path, None)
+
+    def _play(self) -> int:
+        source_id = self._next_source_id
+        self._next_source_id += 1
+        self.play_count += 1
+        return source_id
+
+    def play_2d(
+        self, sound: Sound, volume: float = 1.0, pitch: float = 1.0, loop: bool = False
+    ) -> int:
+        """Pretend to play a sound.
+
+        Returns:
+            New source ID.
+        """
+        return self._play()
+
+    def play_3d(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        sound: Sound,
+        position: Vector3,
+        velocity: Vector3 | None = None,
+        volume: float = 1.0,
+        pitch: float = 1.0,
+        loop: bool = False,
+    ) -> int:
+        """Pretend to play a positioned sound.
+
+        Returns:
+            New source ID.
+        """
+        return self._play()
+
+    def stop_source(self, source_id: int) -> None:
+        """Stop a source (no-op)."""
+
+    def pause_source(self, source_id: int) -> None:
+        """Pause a source (no-op)."""
+
+    def resume_source(self, source_id: int) -> None:
+        """Resume a source (no-op)."""
+
+    def update_source_position(
+        self, source_id: int, position: Vector3, velocity: Vector3 | None = None
+    ) -> None:
+        """Move a source (no-op)."""
+
+    def update_source_volume(self, source_id: int, volume: float) -> None:
+        """Change source volume (no-op)."""
+
+    def update_source_pitch(self, source_id: int, pitch: float) -> None:
+        """Change source pitch (no-op)."""
+
+    def set_listener(
+        self,
+        position: Vector3,
+        forward: Vector3,
+        up: Vector3,
+        velocity: Vector3 | None = None,
+    ) -> None:
+        """Move the listener (no-op)."""
+
+    def get_source_state(self, source_id: int) -> SourceState:
+        """Get source state.
+
+        Returns:
+            Always STOPPED: null sources finish immediately.
+        """
+        return SourceState.STOPPED
+
+    def set_master_volume(self, volume: float) -> None:
+        """Set master volume.
+
+        Args:
+            volume: Master volume (0.0 to 1.0).
+        """
+        self._master_volume = max(0.0, min(1.0, volume))
@@ -20,8 +20,6 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 try:
     import pyfmodex
     from pyfmodex.enums import CHANNELCONTROL_CALLBACK_TYPE
@@ -30,6 +28,7 @@ except ImportError:
     CHANNELCONTROL_CALLBACK_TYPE = None
 
 from airborne.audio.tts.base import ITTSProvider, TTSPriority, TTSState
+from airborne.core.config import ConfigLoader
 from airborne.core.logging_system import get_logger
 
 logger = get_logger(__name__)
@@ -130,8 +129,7 @@ class AudioSpeechProvider(ITTSProvider):
                 return
             # Load old format
             try:
-                with open(config_file, encoding="utf-8") as f:
-                    speech_config = yaml.safe_load(f)
+                speech_config = ConfigLoader.load_yaml(config_file)
                 self._file_extension = speech_config.get("file_extension", "wav")
                 # Convert old format to new format
                 old_messages = speech_config.get("messages", {})
@@ -144,8 +142,7 @@ class AudioSpeechProvider(ITTSProvider):
         else:
             # Load new unified format
             try:
-                with open(config_file, encoding="utf-8") as f:
-                    speech_config = yaml.safe_load(f)
+                speech_config = ConfigLoader.load_yaml(config_file)
 
                 # Build voice directory map
                 voices = speech_config.get("voices", {})
@@ -299,7 +296,7 @@ class AudioSpeechProvider(ITTSProvider):
         self._playback_queue.extend(sound_objects)
 
         self._state = TTSState.SPEAKING
-        logger.info(f"Queued speech sequence: {message_keys} ({len(sound_objects)} files)")
+        logger.info("Queued speech sequence: %s (%d files)", message_keys, len(sound_objects))
 
         # Start playback if not already playing
         if not self._playing:
@@ -18,7 +18,7 @@ from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 
-import yaml
+from airborne.core.config import ConfigLoader
 
 logger = logging.getLogger(__name__)
 
@@ -148,8 +148,7 @@ class CallsignGenerator:
             return
 
         try:
-            with open(path, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            data = ConfigLoader.load_yaml(path)
 
             if "airlines" in data:
                 for airline in data["airlines"]:
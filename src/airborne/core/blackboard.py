@@ -0,0 +1,293 @@
+"""Shared, versioned aircraft state blackboard.
+
+Continuous aircraft state (position, engine RPM, bus voltage, fuel quantity...)
+is written once per update by the plugin that owns it and read directly by any
+plugin that needs it, instead of being fanned out as messages and cached by
+every subscriber.
+
+Values live in a single NumPy structured record. Every write that changes a
+field bumps a global version counter and stamps the field with it, so readers
+can cheaply ask whether anything they care about changed since they last
+looked and skip their work otherwise.
+
+Writes may come from several threads when plugins are updated in parallel
+stages; version stamping is locked so no change is lost. An access hook can be
+installed to observe every read and write, which the plugin scheduler uses to
+detect plugins of one stage touching the same field.
+
+Typical usage example:
+    from airborne.core.blackboard import StateBlackboard
+
+    blackboard = StateBlackboard()
+    blackboard.write_many(engine_rpm=2400.0, engine_running=True)
+
+    # In a reader plugin
+    if blackboard.changed_since(self._seen_version, "engine_rpm"):
+        rpm = blackboard.read("engine_rpm")
+        self._seen_version = blackboard.version
+"""
+
+import threading
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+
+class BlackboardError(Exception):
+    """Raised when accessing an undeclared blackboard field."""
+
+
+@dataclass(frozen=True)
+class BlackboardField:
+    """Declaration of one blackboard field.
+
+    Attributes:
+        name: Field name (e.g., "engine_rpm").
+        dtype: NumPy dtype string (e.g., "f8", "?").
+        shape: Element shape; () for scalars, (3,) for vectors.
+        description: Human-readable description including units.
+    """
+
+    name: str
+    dtype: str = "f8"
+    shape: tuple[int, ...] = ()
+    description: str = ""
+
+
+# Fields written by the core physics and aircraft system plugins
+AIRCRAFT_STATE_FIELDS: tuple[BlackboardField, ...] = (
+    # Physics
+    BlackboardField("position", "f8", (3,), "World position (m), x/y/z"),
+    BlackboardField("velocity", "f8", (3,), "Velocity (m/s), x/y/z"),
+    BlackboardField("rotation", "f8", (3,), "Euler angles (rad), pitch/roll/yaw"),
+    BlackboardField("airspeed_mps", "f8", (), "Airspeed (m/s)"),
+    BlackboardField("groundspeed_kts", "f8", (), "Ground speed (knots)"),
+    BlackboardField("on_ground", "?", (), "Aircraft on the ground"),
+    BlackboardField("mass_kg", "f8", (), "Total mass (kg)"),
+    # Engine
+    BlackboardField("engine_running", "?", (), "Engine running"),
+    BlackboardField("engine_rpm", "f8", (), "Engine RPM"),
+    BlackboardField("engine_manifold_pressure_inhg", "f8", (), "Manifold pressure (inHg)"),
+    BlackboardField("engine_power_hp", "f8", (), "Engine power output (hp)"),
+    BlackboardField("engine_fuel_flow_gph", "f8", (), "Engine fuel flow (gal/h)"),
+    # Electrical
+    BlackboardField("battery_voltage", "f8", (), "Battery voltage (V)"),
+    BlackboardField("bus_voltage", "f8", (), "Main bus voltage (V)"),
+    BlackboardField("alternator_online", "?", (), "Alternator charging"),
+    BlackboardField("electrical_power_available", "?", (), "Bus powered"),
+    # Fuel
+    BlackboardField("fuel_total_gal", "f8", (), "Total usable fuel (gal)"),
+    BlackboardField("fuel_flow_gph", "f8", (), "Fuel system flow (gal/h)"),
+    BlackboardField("fuel_pressure_psi", "f8", (), "Fuel pressure (psi)"),
+    BlackboardField("fuel_available", "?", (), "Fuel reaching the engine"),
+)
+
+
+class StateBlackboard:
+    """Typed blackboard with per-field version counters.
+
+    Versions are monotonically increasing integers shared by all fields:
+    ``version`` is the stamp of the most recent change anywhere, and
+    ``get_version(name)`` is the stamp of the most recent change to one field.
+    Writing a value equal to the current one does not bump any version.
+
+    Examples:
+        >>> board = StateBlackboard()
+        >>> seen = board.version
+        >>> board.write("bus_voltage", 28.0)
+        True
+        >>> board.changed_since(seen, "bus_voltage")
+        True
+        >>> board.changed_since(board.version, "bus_voltage")
+        False
+    """
+
+    def __init__(self, fields: Sequence[BlackboardField] = AIRCRAFT_STATE_FIELDS) -> None:
+        """Initialize a zeroed blackboard.
+
+        Args:
+            fields: Field declarations. Defaults to AIRCRAFT_STATE_FIELDS.
+
+        Raises:
+            BlackboardError: If a field name is declared twice.
+        """
+        names = [f.name for f in fields]
+        if len(set(names)) != len(names):
+            raise BlackboardError("Duplicate blackboard field names")
+
+        self._fields: dict[str, BlackboardField] = {f.name: f for f in fields}
+        self._dtype = np.dtype([(f.name, f.dtype, f.shape) for f in fields])
+        self._record: npt.NDArray[Any] = np.zeros((), dtype=self._dtype)
+
+        # Writable views into the record, plus read-only twins handed to readers
+        self._views: dict[str, npt.NDArray[Any]] = {n: self._record[n] for n in names}
+        self._readonly: dict[str, npt.NDArray[Any]] = {}
+        for name, view in self._views.items():
+            ro = view.view()
+            ro.flags.writeable = False
+            self._readonly[name] = ro
+
+        self._versions: dict[str, int] = dict.fromkeys(names, 0)
+        self._version = 0
+        self._version_lock = threading.Lock()
+        self._access_hook: Callable[[str, bool], None] | None = None
+
+    @property
+    def version(self) -> int:
+        """Stamp of the most recent change to any field."""
+        return self._version
+
+    @property
+    def fields(self) -> tuple[BlackboardField, ...]:
+        """Declared fields in storage order."""
+        return tuple(self._fields.values())
+
+    def set_access_hook(self, hook: Callable[[str, bool], None] | None) -> None:
+        """Observe every field access (debugging aid).
+
+        Args:
+            hook: Called with the field name and True for writes, False for
+                reads, before the access happens. None removes the hook.
+        """
+        self._access_hook = hook
+
+    def _view(self, name: str) -> npt.NDArray[Any]:
+        view = self._views.get(name)
+        if view is None:
+            raise BlackboardError(f"Unknown blackboard field: {name}")
+        return view
+
+    def write(self, name: str, value: Any) -> bool:
+        """Write one field.
+
+        Args:
+            name: Field name.
+            value: New value (scalar, or sequence matching the field shape).
+
+        Returns:
+            True if the value changed and the field version was bumped.
+
+        Raises:
+            BlackboardError: If the field is not declared.
+        """
+        view = self._view(name)
+        if self._access_hook is not None:
+            self._access_hook(name, True)
+        if view.ndim:
+            if view.tolist() == list(value):
+                return False
+            view[...] = value
+        else:
+            if view.item() == value:
+                return False
+            view[()] = value
+
+        with self._version_lock:
+            self._version += 1
+            self._versions[name] = self._version
+        return True
+
+    def write_many(self, **values: Any) -> bool:
+        """Write several fields at once.
+
+        Args:
+            **values: Field names and their new values.
+
+        Returns:
+            True if at least one field changed.
+
+        Raises:
+            BlackboardError: If any field is not declared.
+        """
+        changed = False
+        for name, value in values.items():
+            changed = self.write(name, value) or changed
+        return changed
+
+    def read(self, name: str) -> Any:
+        """Read one field.
+
+        Args:
+            name: Field name.
+
+        Returns:
+            Python scalar for scalar fields, or a read-only NumPy view for
+            vector fields (copy it if you need to keep the values).
+
+        Raises:
+            BlackboardError: If the field is not declared.
+        """
+        view = self._readonly.get(name)
+        if view is None:
+            raise BlackboardError(f"Unknown blackboard field: {name}")
+        if self._access_hook is not None:
+            self._access_hook(name, False)
+        if view.ndim:
+            return view
+        return view.item()
+
+    def get_version(self, name: str) -> int:
+        """Get the stamp of the last change to a field.
+
+        Args:
+            name: Field name.
+
+        Returns:
+            Version number, or 0 if the field was never written.
+
+        Raises:
+            BlackboardError: If the field is not declared.
+        """
+        version = self._versions.get(name)
+        if version is None:
+            raise BlackboardError(f"Unknown blackboard field: {name}")
+        return version
+
+    def changed_since(self, version: int, *names: str) -> bool:
+        """Check whether fields changed after a given version.
+
+        Args:
+            version: Version previously observed via the version property.
+            *names: Fields to check. If omitted, checks every field.
+
+        Returns:
+            True if any of the fields changed after ``version``.
+
+        Raises:
+            BlackboardError: If a field is not declared.
+        """
+        if not names:
+            return self._version > version
+        return any(self.get_version(name) > version for name in names)
+
+    def has_field(self, name: str) -> bool:
+        """Check whether a field is declared.
+
+        Args:
+            name: Field name.
+
+        Returns:
+            True if the field exists.
+        """
+        return name in self._fields
+
+    def as_record(self) -> npt.NDArray[Any]:
+        """Get a read-only view of the whole structured record.
+
+        Returns:
+            0-d structured array containing every field.
+        """
+        record = self._record.view()
+        record.flags.writeable = False
+        return record
+
+    def to_dict(self) -> dict[str, Any]:
+        """Copy every field into a plain dictionary.
+
+        Returns:
+            Mapping of field name to Python scalar or list.
+        """
+        return {name: view.tolist() for name, view in self._views.items()}
@@ -0,0 +1,352 @@
+"""Traffic and latency instrumentation for the message queue and event bus.
+
+A BusMetrics instance attached to a MessageQueue or EventBus counts publishes
+and dispatches per topic, times every handler call, and records how deep the
+queue was after each process() call and how many messages were deferred by the
+max_messages cap. When a frame spikes, the handler table shows which topic and
+handler took the time.
+
+Metrics are opt-in: a queue or bus without a BusMetrics attached runs the
+original uninstrumented dispatch path.
+
+Typical usage example:
+    from airborne.core.bus_metrics import BusMetrics, BusMetricsReporter
+
+    metrics = BusMetrics("message_queue")
+    queue = MessageQueue(metrics=metrics)
+
+    reporter = BusMetricsReporter([metrics], interval=10.0, json_path="bus.json")
+    while running:
+        ...
+        reporter.tick()
+
+    print(metrics.top_handlers(5))
+"""
+
+import json
+import math
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from airborne.core.logging_system import get_logger
+
+logger = get_logger(__name__)
+
+# Latency samples kept per handler for percentile estimates
+_DEFAULT_SAMPLE_SIZE = 1024
+
+
+def handler_name(handler: Callable[..., Any]) -> str:
+    """Get a readable, stable name for a handler.
+
+    Args:
+        handler: Function, bound method or callable object.
+
+    Returns:
+        Qualified name such as "AudioPlugin.handle_message".
+    """
+    name = getattr(handler, "__qualname__", None)
+    if name is None:
+        name = type(handler).__qualname__
+    return str(name)
+
+
+class LatencyHistogram:
+    """Running latency statistics for one handler.
+
+    Count, total and max are exact. Percentiles are computed from the most
+    recent ``sample_size`` calls.
+
+    Examples:
+        >>> hist = LatencyHistogram()
+        >>> for ms in (1, 2, 3, 4):
+        ...     hist.record(ms / 1000)
+        >>> hist.max_s
+        0.004
+    """
+
+    __slots__ = ("count", "total_s", "max_s", "_samples")
+
+    def __init__(self, sample_size: int = _DEFAULT_SAMPLE_SIZE) -> None:
+        """Initialize an empty histogram.
+
+        Args:
+            sample_size: Number of recent samples kept for percentiles.
+        """
+        self.count = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+        self._samples: deque[float] = deque(maxlen=sample_size)
+
+    def record(self, seconds: float) -> None:
+        """Record one handler call.
+
+        Args:
+            seconds: Call duration in seconds.
+        """
+        self.count += 1
+        self.total_s += seconds
+        if seconds > self.max_s:
+            self.max_s = seconds
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> float:
+        """Get a latency percentile over the recent samples.
+
+        Args:
+            q: Percentile in the range 0-100.
+
+        Returns:
+            Latency in seconds (nearest-rank), or 0.0 if nothing was recorded.
+        """
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        rank = math.ceil(q / 100.0 * len(ordered))
+        return ordered[min(len(ordered), max(rank, 1)) - 1]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarize the histogram.
+
+        Returns:
+            Dictionary with count and p50/p95/max/mean latencies in milliseconds.
+        """
+        mean = self.total_s / self.count if self.count else 0.0
+        return {
+            "count": self.count,
+            "total_ms": self.total_s * 1000.0,
+            "mean_ms": mean * 1000.0,
+            "p50_ms": self.percentile(50) * 1000.0,
+            "p95_ms": self.percentile(95) * 1000.0,
+            "max_ms": self.max_s * 1000.0,
+        }
+
+
+@dataclass
+class TopicMetrics:
+    """Traffic counters for one topic.
+
+    Attributes:
+        published: Messages/events published on the topic.
+        dispatched: Handler invocations for the topic.
+    """
+
+    published: int = 0
+    dispatched: int = 0
+
+
+class BusMetrics:
+    """Counters and latency histograms for one message queue or event bus.
+
+    Examples:
+        >>> metrics = BusMetrics("message_queue")
+        >>> metrics.record_publish("engine.state")
+        >>> metrics.record_dispatch("engine.state", "FuelPlugin.handle_message", 0.0002)
+        >>> metrics.topics["engine.state"].dispatched
+        1
+    """
+
+    def __init__(self, name: str, sample_size: int = _DEFAULT_SAMPLE_SIZE) -> None:
+        """Initialize empty metrics.
+
+        Args:
+            name: Name of the instrumented bus, used in logs and dumps.
+            sample_size: Latency samples kept per handler.
+        """
+        self.name = name
+        self._sample_size = sample_size
+        self.topics: dict[str, TopicMetrics] = {}
+        self.handlers: dict[tuple[str, str], LatencyHistogram] = {}
+        self.process_calls = 0
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.deferred = 0
+        self.deferred_total = 0
+
+    def _topic(self, topic: str) -> TopicMetrics:
+        metrics = self.topics.get(topic)
+        if metrics is None:
+            metrics = self.topics[topic] = TopicMetrics()
+        return metrics
+
+    def record_publish(self, topic: str) -> None:
+        """Count one publish.
+
+        Args:
+            topic: Message topic or event type name.
+        """
+        self._topic(topic).published += 1
+
+    def record_dispatch(self, topic: str, handler: str, seconds: float) -> None:
+        """Count one handler call and record its latency.
+
+        Args:
+            topic: Message topic or event type name.
+            handler: Handler name (see handler_name()).
+            seconds: Call duration in seconds.
+        """
+        self._topic(topic).dispatched += 1
+        key = (topic, handler)
+        hist = self.handlers.get(key)
+        if hist is None:
+            hist = self.handlers[key] = LatencyHistogram(self._sample_size)
+        hist.record(seconds)
+
+    def record_process(self, depth: int, deferred: int) -> None:
+        """Record the state of the queue after a process() call.
+
+        Args:
+            depth: Messages still pending after the call.
+            deferred: Messages left pending because max_messages was reached.
+        """
+        self.process_calls += 1
+        self.queue_depth = depth
+        if depth > self.max_queue_depth:
+            self.max_queue_depth = depth
+        self.deferred = deferred
+        self.deferred_total += deferred
+
+    def top_handlers(self, count: int = 5, key: str = "max_ms") -> list[dict[str, Any]]:
+        """Get the slowest handlers.
+
+        Args:
+            count: Number of handlers to return.
+            key: Statistic to sort by ("max_ms", "p95_ms", "total_ms"...).
+
+        Returns:
+            Handler summaries with topic and handler name, slowest first.
+        """
+        rows: list[dict[str, Any]] = [
+            {"topic": topic, "handler": name, **hist.to_dict()}
+            for (topic, name), hist in self.handlers.items()
+        ]
+        rows.sort(key=lambda row: row[key], reverse=True)
+        return rows[:count]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Build a JSON-serializable summary.
+
+        Returns:
+            Dictionary with queue, topic and handler statistics.
+        """
+        return {
+            "name": self.name,
+            "process_calls": self.process_calls,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "deferred": self.deferred,
+            "deferred_total": self.deferred_total,
+            "topics": {
+                topic: {"published": m.published, "dispatched": m.dispatched}
+                for topic, m in sorted(self.topics.items())
+            },
+            "handlers": self.top_handlers(len(self.handlers)),
+        }
+
+    def log_summary(self, top: int = 5) -> None:
+        """Log queue state and the slowest handlers at INFO level.
+
+        Args:
+            top: Number of handlers to include.
+        """
+        logger.info(
+            "[%s] depth=%d max_depth=%d deferred_total=%d topics=%d",
+            self.name,
+            self.queue_depth,
+            self.max_queue_depth,
+            self.deferred_total,
+            len(self.topics),
+        )
+        for row in self.top_handlers(top):
+            logger.info(
+                "[%s]   %s -> %s: n=%d p50=%.3fms p95=%.3fms max=%.3fms",
+                self.name,
+                row["topic"],
+                row["handler"],
+                row["count"],
+                row["p50_ms"],
+                row["p95_ms"],
+                row["max_ms"],
+            )
+
+    def reset(self) -> None:
+        """Clear all counters and histograms."""
+        self.topics.clear()
+        self.handlers.clear()
+        self.process_calls = 0
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.deferred = 0
+        self.deferred_total = 0
+
+
+def dump_metrics_json(metrics: Sequence[BusMetrics], path: str | Path) -> None:
+    """Write metrics summaries to a JSON file.
+
+    Args:
+        metrics: Metrics to include, keyed by their name in the output.
+        path: Output file path.
+    """
+    payload = {m.name: m.to_dict() for m in metrics}
+    Path(path).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+class BusMetricsReporter:
+    """Periodically logs and dumps bus metrics from the main loop.
+
+    Examples:
+        >>> reporter = BusMetricsReporter([metrics], interval=10.0)
+        >>> reporter.tick()  # call once per frame
+    """
+
+    def __init__(
+        self,
+        metrics: Sequence[BusMetrics],
+        interval: float = 10.0,
+        json_path: str | Path | None = None,
+        top: int = 5,
+    ) -> None:
+        """Initialize the reporter.
+
+        Args:
+            metrics: Metrics to report.
+            interval: Seconds between reports.
+            json_path: If set, the JSON summary is rewritten on each report.
+            top: Number of slowest handlers to log per bus.
+        """
+        self.metrics = list(metrics)
+        self.interval = interval
+        self.json_path = Path(json_path) if json_path else None
+        self.top = top
+        self._next_report = time.monotonic() + interval
+
+    def tick(self, now: float | None = None) -> bool:
+        """Report if the interval has elapsed.
+
+        Args:
+            now: Current monotonic time. Defaults to time.monotonic().
+
+        Returns:
+            True if a report was written.
+        """
+        if now is None:
+            now = time.monotonic()
+        if now < self._next_report:
+            return False
+        self._next_report = now + self.interval
+        self.report()
+        return True
+
+    def report(self) -> None:
+        """Log and dump the metrics immediately."""
+        for m in self.metrics:
+            m.log_summary(self.top)
+        if self.json_path is not None:
+            try:
+                dump_metrics_json(self.metrics, self.json_path)
+            except OSError as e:
+                logger.warning("Failed to write bus metrics to %s: %s", self.json_path, e)
@@ -3,14 +3,27 @@
 This module provides configuration loading with support for nested access,
 defaults, and validation.
 
+All YAML parsing goes through ConfigLoader.load_yaml(), which uses the libyaml
+C loader when PyYAML was built with it. Once enable_cache() has been called,
+parsed documents are also cached as pickles keyed by the source path and
+validated against its mtime, size and SHA-256, so unchanged files skip YAML
+parsing entirely on the next launch.
+
 Typical usage example:
     from airborne.core.config import ConfigLoader
 
+    ConfigLoader.enable_cache(get_cache_dir() / "config")
     config = ConfigLoader.load("config/settings.yaml")
     audio_volume = config.get("audio.master_volume", default=1.0)
+
+    speech = ConfigLoader.load_yaml("config/speech.yaml")
 """
 
+import hashlib
 import logging
+import os
+import pickle
+import shutil
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +31,12 @@ import yaml
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when available (much faster than the pure-Python one)
+YAML_LOADER: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Bump to invalidate every cached document (e.g. after a loader change)
+_CACHE_FORMAT = 1
+
 
 class ConfigError(Exception):
     """Raised when configuration operations fail."""
@@ -33,6 +52,9 @@ class ConfigLoader:
         >>> volume = config.get("audio.volume", default=1.0)
     """
 
+    # Directory of cached parsed documents (None disables the cache)
+    _cache_dir: Path | None = None
+
     def __init__(self, data: dict[str, Any]) -> None:
         """Initialize with configuration data.
 
@@ -41,6 +63,121 @@ class ConfigLoader:
         """
         self._data = data
 
+    @classmethod
+    def enable_cache(cls, cache_dir: str | Path, rebuild: bool = False) -> None:
+        """Cache parsed YAML documents in a directory.
+
+        Args:
+            cache_dir: Directory for cached documents (created on first write).
+            rebuild: Discard all existing cached documents first.
+
+        Examples:
+            >>> ConfigLoader.enable_cache(get_cache_dir() / "config", rebuild=True)
+        """
+        cache_dir = Path(cache_dir)
+        if rebuild and cache_dir.exists():
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            logger.info("Cleared configuration cache: %s", cache_dir)
+        cls._cache_dir = cache_dir
+
+    @classmethod
+    def disable_cache(cls) -> None:
+        """Stop using the parsed-document cache."""
+        cls._cache_dir = None
+
+    @classmethod
+    def load_yaml(cls, path: str | Path) -> Any:
+        """Parse a YAML file, using the cache when enabled.
+
+        Behaves like ``yaml.safe_load`` on the file: errors opening or parsing
+        it propagate unchanged. Each call returns a fresh object, so callers
+        may modify the result.
+
+        Args:
+            path: Path to the YAML file.
+
+        Returns:
+            Parsed document (None for an empty file).
+
+        Raises:
+            OSError: If the file cannot be read.
+            yaml.YAMLError: If the file is not valid YAML.
+
+        Examples:
+            >>> data = ConfigLoader.load_yaml("config/aircraft/cessna172.yaml")
+        """
+        path = Path(path)
+        if cls._cache_dir is None:
+            with path.open("r", encoding="utf-8") as f:
+                return yaml.load(f, Loader=YAML_LOADER)
+
+        source = path.read_bytes()
+        stat = path.stat()
+        cache_file = cls._cache_dir / (
+            hashlib.sha256(str(path.resolve()).encode("utf-8")).hexdigest() + ".pickle"
+        )
+
+        cached = cls._read_cache(cache_file)
+        if cached is not None:
+            if (cached["mtime_ns"], cached["size"]) == (stat.st_mtime_ns, stat.st_size):
+                return cached["data"]
+            if cached["sha256"] == hashlib.sha256(source).hexdigest():
+                cls._write_cache(cache_file, {**cached, "mtime_ns": stat.st_mtime_ns})
+                return cached["data"]
+
+        data = yaml.load(source.decode("utf-8"), Loader=YAML_LOADER)
+        cls._write_cache(
+            cache_file,
+            {
+                "format": _CACHE_FORMAT,
+                "path": str(path),
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha256": hashlib.sha256(source).hexdigest(),
+                "data": data,
+            },
+        )
+        return data
+
+    @staticmethod
+    def _read_cache(cache_file: Path) -> dict[str, Any] | None:
+        """Read a cached document.
+
+        Args:
+            cache_file: Cache file path.
+
+        Returns:
+            Cache record, or None if missing, unreadable or of another format.
+        """
+        try:
+            with cache_file.open("rb") as f:
+                record = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.debug("Ignoring unreadable config cache %s: %s", cache_file, e)
+            return None
+        if not isinstance(record, dict) or record.get("format") != _CACHE_FORMAT:
+            return None
+        return record
+
+    @staticmethod
+    def _write_cache(cache_file: Path, record: dict[str, Any]) -> None:
+        """Atomically write a cached document.
+
+        Args:
+            cache_file: Cache file path.
+            record: Cache record including the parsed data.
+        """
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with tmp_file.open("wb") as f:
+                pickle.dump(record, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except (OSError, pickle.PicklingError) as e:
+            logger.warning("Failed to write config cache %s: %s", cache_file, e)
+
     @classmethod
     def load(cls, path: str | Path) -> "ConfigLoader":
         """Load configuration from a YAML file.
@@ -63,8 +200,7 @@ class ConfigLoader:
             raise ConfigError(f"Configuration file not found: {path}")
 
         try:
-            with path.open("r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            data = cls.load_yaml(path)
 
             if data is None:
                 data = {}
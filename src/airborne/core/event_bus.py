@@ -21,6 +21,8 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Any
 
+from airborne.core.bus_metrics import BusMetrics, handler_name
+
 
 class EventPriority(Enum):
     """Priority levels for event handlers.
@@ -63,9 +65,28 @@ class EventBus:
         Received: hello
     """
 
-    def __init__(self) -> None:
-        """Initialize an empty event bus."""
+    def __init__(self, metrics: BusMetrics | None = None) -> None:
+        """Initialize an empty event bus.
+
+        Args:
+            metrics: Optional instrumentation sink. Events are counted and
+                timed under their class name.
+        """
         self._handlers: dict[type[Event], list[tuple[Callable[[Any], None], EventPriority]]] = {}
+        self._metrics = metrics
+
+    @property
+    def metrics(self) -> BusMetrics | None:
+        """Attached instrumentation, or None if disabled."""
+        return self._metrics
+
+    def set_metrics(self, metrics: BusMetrics | None) -> None:
+        """Attach or detach instrumentation.
+
+        Args:
+            metrics: Metrics sink, or None to disable instrumentation.
+        """
+        self._metrics = metrics
 
     def subscribe(
         self,
@@ -137,11 +158,34 @@ class EventBus:
             block the caller.
         """
         event_type = type(event)
+        metrics = self._metrics
+
+        if metrics is not None:
+            self._publish_instrumented(event, metrics)
+            return
 
         if event_type in self._handlers:
             for handler, _ in self._handlers[event_type]:
                 handler(event)
 
+    def _publish_instrumented(self, event: Event, metrics: BusMetrics) -> None:
+        """Publish an event while recording per-handler latency.
+
+        Args:
+            event: The event to publish.
+            metrics: Metrics sink.
+        """
+        event_type = type(event)
+        topic = event_type.__name__
+        metrics.record_publish(topic)
+
+        for handler, _ in self._handlers.get(event_type, ()):
+            start = time.perf_counter()
+            try:
+                handler(event)
+            finally:
+                metrics.record_dispatch(topic, handler_name(handler), time.perf_counter() - start)
+
     def clear(self) -> None:
         """Remove all event handlers.
 
@@ -1,7 +1,11 @@
 """Game loop with fixed timestep physics and variable framerate.
 
 This module provides the main game loop that coordinates plugin updates,
-message processing, and frame rate management.
+message processing, and frame rate management, the FixedTimestep accumulator
+that turns variable frame times into fixed simulation steps, and the
+PluginScheduler that updates each plugin at the rate declared in its
+PluginMetadata. The scheduler can group plugins into dependency stages and
+update the plugins of one stage concurrently on a thread pool.
 
 Typical usage example:
     from airborne.core.game_loop import GameLoop
@@ -10,12 +14,453 @@ Typical usage example:
     loop.run()
 """
 
+import itertools
 import logging
 import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Any
 
+from airborne.core.plugin_loader import DependencyError, dependency_stages
+
 logger = logging.getLogger(__name__)
 
+# Phase step used to stagger low-rate plugins (golden ratio conjugate): each
+# new plugin lands in the largest gap left by the previous ones.
+_AUTO_PHASE_STEP = 0.6180339887498949
+
+# Tolerance for floating-point drift when comparing against due times
+_DUE_EPSILON = 1e-9
+
+
+class FixedTimestep:
+    """Accumulator that converts variable frame times into fixed steps.
+
+    Each frame, advance() adds the elapsed time and returns how many whole
+    steps to simulate; the remainder carries over. alpha is the fraction of a
+    step left in the accumulator, used to interpolate rendered state between
+    the last two simulated states. To avoid a spiral of death after a long
+    frame, at most max_steps are run per frame and the excess time is dropped.
+
+    Examples:
+        >>> stepper = FixedTimestep(120)
+        >>> for _ in range(stepper.advance(frame_dt)):
+        ...     physics.update(stepper.step_dt)
+        >>> render(alpha=stepper.alpha)
+    """
+
+    def __init__(self, rate_hz: float, max_steps: int = 5) -> None:
+        """Initialize the accumulator.
+
+        Args:
+            rate_hz: Simulation step rate in Hz.
+            max_steps: Maximum steps returned by one advance() call.
+
+        Raises:
+            ValueError: If rate_hz or max_steps is not positive.
+        """
+        if rate_hz <= 0:
+            raise ValueError("Step rate must be positive")
+        if max_steps < 1:
+            raise ValueError("max_steps must be at least 1")
+        self.rate_hz = rate_hz
+        self.step_dt = 1.0 / rate_hz
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.dropped_time = 0.0
+
+    @property
+    def alpha(self) -> float:
+        """Fraction of a step remaining in the accumulator (0.0-1.0)."""
+        return min(self.accumulator / self.step_dt, 1.0)
+
+    def advance(self, frame_dt: float) -> int:
+        """Add frame time and get the number of steps to simulate.
+
+        Args:
+            frame_dt: Time elapsed since the previous frame in seconds.
+
+        Returns:
+            Number of fixed steps to run this frame.
+        """
+        self.accumulator += frame_dt
+
+        # Clamp accumulator to prevent spiral of death
+        max_accumulator = self.step_dt * self.max_steps
+        if self.accumulator > max_accumulator:
+            logger.warning("Physics accumulator clamped: %.3fs", self.accumulator)
+            self.dropped_time += self.accumulator - max_accumulator
+            self.accumulator = max_accumulator
+
+        steps = int(self.accumulator / self.step_dt + _DUE_EPSILON)
+        self.accumulator = max(0.0, self.accumulator - steps * self.step_dt)
+        return steps
+
+    def reset(self) -> None:
+        """Discard accumulated time."""
+        self.accumulator = 0.0
+
+
+@dataclass
+class ScheduledPlugin:
+    """Scheduling state of one plugin.
+
+    Attributes:
+        plugin: Plugin instance (IPlugin).
+        name: Name used in logs and profiler sections.
+        period: Seconds between updates, or 0.0 to update every tick.
+        phase: Offset of the update slot within one period (0.0-1.0).
+        next_due: Scheduler time of the next update.
+        accumulated_dt: Time elapsed since the last update.
+        dependencies: Names of the plugins this one depends on.
+        provides: Names other plugins may depend on (metadata name and services).
+        stage: Index of the dependency stage the plugin runs in.
+    """
+
+    plugin: Any
+    name: str
+    period: float = 0.0
+    phase: float = 0.0
+    next_due: float = 0.0
+    accumulated_dt: float = 0.0
+    dependencies: tuple[str, ...] = ()
+    provides: tuple[str, ...] = ()
+    stage: int = 0
+
+
+class PluginScheduler:
+    """Updates plugins at the rate declared in their metadata.
+
+    Plugins without an update_rate_hz are updated on every tick. Low-rate
+    plugins are updated when their slot comes due and receive the total time
+    elapsed since their previous update as dt, so integrators and timers stay
+    correct. Plugins sharing a rate are spread across different ticks using
+    their update_phase (assigned automatically when not declared), so they do
+    not all land on the same frame.
+
+    By default plugins are updated serially in the order they were added.
+    Plugins are also grouped into stages from the dependencies in their
+    metadata: a dependency is matched against the scheduled names, metadata
+    names and provided services, and unmatched dependencies are ignored. With
+    more than one worker, each stage runs after the previous one finished and
+    the due plugins of a stage are updated concurrently on a thread pool.
+
+    Race checking is a debugging mode for the staged schedule: stages run
+    serially and every blackboard access is attributed to the plugin making
+    it. Two plugins of one stage touching the same field, at least one of them
+    writing it, are reported once as a race.
+
+    Examples:
+        >>> scheduler = PluginScheduler()
+        >>> scheduler.add(physics_plugin)   # every tick
+        >>> scheduler.add(tcas_plugin)      # metadata.update_rate_hz=10
+        >>> scheduler.tick(1 / 240)
+        >>> scheduler.set_max_workers(4)    # run stages on a thread pool
+    """
+
+    def __init__(self, profiler: Any = None, max_workers: int = 0) -> None:
+        """Initialize an empty scheduler.
+
+        Args:
+            profiler: Optional FrameProfiler timing each plugin update.
+            max_workers: Threads used to update one stage; 0 or 1 updates
+                every plugin serially on the calling thread.
+        """
+        self.profiler = profiler
+        self._entries: list[ScheduledPlugin] = []
+        self._snapshot: tuple[ScheduledPlugin, ...] = ()
+        self._stage_count = 0
+        self._time = 0.0
+        self._next_auto_phase = 0.0
+        self._max_workers = 0
+        self._executor: ThreadPoolExecutor | None = None
+        self._race_blackboard: Any = None
+        self._races: set[tuple[str, str, str]] = set()
+        self.set_max_workers(max_workers)
+
+    @property
+    def time(self) -> float:
+        """Total time ticked so far in seconds."""
+        return self._time
+
+    @property
+    def entries(self) -> tuple[ScheduledPlugin, ...]:
+        """Scheduled plugins in update order."""
+        return self._snapshot
+
+    @property
+    def stages(self) -> list[list[ScheduledPlugin]]:
+        """Scheduled plugins grouped by dependency stage, in execution order."""
+        stages: list[list[ScheduledPlugin]] = [[] for _ in range(self._stage_count)]
+        for entry in self._snapshot:
+            stages[entry.stage].append(entry)
+        return stages
+
+    @property
+    def max_workers(self) -> int:
+        """Threads used to update one stage (0 when updating serially)."""
+        return self._max_workers
+
+    @property
+    def races(self) -> list[tuple[str, str, str]]:
+        """Races found by race checking, as (field, plugin, plugin) tuples."""
+        return sorted(self._races)
+
+    def set_max_workers(self, max_workers: int) -> None:
+        """Choose between serial and staged parallel updates.
+
+        Args:
+            max_workers: Threads used to update one stage; 0 or 1 updates every
+                plugin serially, in the order they were added.
+
+        Raises:
+            ValueError: If max_workers is negative.
+        """
+        if max_workers < 0:
+            raise ValueError("max_workers must not be negative")
+        self.shutdown()
+        if max_workers > 1:
+            self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="plugin-stage")
+            self._max_workers = max_workers
+        else:
+            self._max_workers = 0
+
+    def enable_race_check(self, blackboard: Any) -> None:
+        """Run stages serially and report plugins of one stage sharing state.
+
+        Args:
+            blackboard: StateBlackboard whose accesses are tracked.
+        """
+        self._race_blackboard = blackboard
+        self._races.clear()
+
+    def disable_race_check(self) -> None:
+        """Stop race checking."""
+        self._race_blackboard = None
+
+    def shutdown(self) -> None:
+        """Stop the worker threads, if any (the scheduler falls back to serial)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._max_workers = 0
+
+    def _make_entry(self, plugin: Any, name: str | None) -> ScheduledPlugin:
+        metadata = plugin.get_metadata()
+        period = 1.0 / metadata.update_rate_hz if metadata.update_rate_hz else 0.0
+        phase = metadata.update_phase
+        if phase is None:
+            phase = 0.0
+            if period:
+                phase = self._next_auto_phase
+                self._next_auto_phase = (self._next_auto_phase + _AUTO_PHASE_STEP) % 1.0
+
+        return ScheduledPlugin(
+            plugin=plugin,
+            name=name or metadata.name,
+            period=period,
+            phase=phase,
+            next_due=self._time + phase * period,
+            dependencies=tuple(metadata.dependencies),
+            provides=(metadata.name, *metadata.provides),
+        )
+
+    def _set_entries(self, entries: list[ScheduledPlugin]) -> None:
+        """Replace the schedule and recompute dependency stages.
+
+        Args:
+            entries: Scheduling entries in update order.
+        """
+        self._entries = entries
+        self._snapshot = tuple(entries)
+
+        owners: dict[str, int] = {}
+        for index, entry in enumerate(entries):
+            for key in (entry.name, *entry.provides):
+                owners.setdefault(key, index)
+        graph = {
+            index: [owners[dep] for dep in entry.dependencies if dep in owners]
+            for index, entry in enumerate(entries)
+        }
+        try:
+            stages = dependency_stages(graph)
+        except DependencyError as e:
+            logger.warning("%s; plugins will run one per stage", e)
+            stages = [[index] for index in range(len(entries))]
+
+        for stage_index, stage in enumerate(stages):
+            for index in stage:
+                entries[index].stage = stage_index
+        self._stage_count = len(stages)
+
+    def add(self, plugin: Any, name: str | None = None) -> ScheduledPlugin:
+        """Schedule a plugin using its metadata.
+
+        Args:
+            plugin: Plugin instance (IPlugin).
+            name: Name for logs and profiling. Defaults to the metadata name.
+
+        Returns:
+            The scheduling entry for the plugin.
+        """
+        entry = self._make_entry(plugin, name)
+        self._set_entries([*self._entries, entry])
+        return entry
+
+    def remove(self, plugin: Any) -> bool:
+        """Stop scheduling a plugin.
+
+        Args:
+            plugin: Plugin instance to remove.
+
+        Returns:
+            True if the plugin was scheduled.
+        """
+        kept = [e for e in self._entries if e.plugin is not plugin]
+        if len(kept) == len(self._entries):
+            return False
+        self._set_entries(kept)
+        return True
+
+    def sync(self, plugins: Iterable[tuple[Any, str]]) -> None:
+        """Make the schedule match a list of plugins, keeping existing state.
+
+        Args:
+            plugins: (plugin, name) pairs in the desired update order.
+        """
+        wanted = list(plugins)
+        if len(wanted) == len(self._snapshot) and all(
+            plugin is entry.plugin
+            for (plugin, _), entry in zip(wanted, self._snapshot, strict=True)
+        ):
+            return
+
+        existing = {id(e.plugin): e for e in self._entries}
+        self._set_entries(
+            [existing.get(id(plugin)) or self._make_entry(plugin, name) for plugin, name in wanted]
+        )
+
+    def clear(self) -> None:
+        """Remove every plugin."""
+        self._set_entries([])
+
+    def tick(self, dt: float) -> int:
+        """Advance time and update every plugin that is due.
+
+        Args:
+            dt: Time elapsed since the previous tick in seconds.
+
+        Returns:
+            Number of plugins updated.
+        """
+        self._time = now = self._time + dt
+        serial = self._executor is None and self._race_blackboard is None
+        due: list[tuple[ScheduledPlugin, float]] = []
+
+        for entry in self._snapshot:
+            entry.accumulated_dt += dt
+            period = entry.period
+            if period:
+                if now + _DUE_EPSILON < entry.next_due:
+                    continue
+                entry.next_due += period
+                if entry.next_due <= now:
+                    # Fell behind (e.g. a long frame): skip the missed slots
+                    entry.next_due = now + period
+
+            step = entry.accumulated_dt
+            entry.accumulated_dt = 0.0
+            if serial:
+                self._update(entry, step)
+            due.append((entry, step))
+
+        if not serial and due:
+            # Stable sort: stage order, insertion order within a stage
+            due.sort(key=lambda item: item[0].stage)
+            for stage, group in itertools.groupby(due, key=lambda item: item[0].stage):
+                self._run_stage(stage, list(group))
+
+        return len(due)
+
+    def _run_stage(self, stage: int, batch: list[tuple[ScheduledPlugin, float]]) -> None:
+        """Update the due plugins of one stage and wait for all of them.
+
+        Args:
+            stage: Stage index.
+            batch: Due (entry, accumulated dt) pairs of the stage.
+        """
+        if self._race_blackboard is not None:
+            self._run_stage_checked(stage, batch)
+            return
+        if self._executor is None or len(batch) == 1:
+            for entry, step in batch:
+                self._update(entry, step)
+            return
+
+        # The calling thread takes the first plugin instead of idling
+        futures = [self._executor.submit(self._update, entry, step) for entry, step in batch[1:]]
+        self._update(*batch[0])
+        for future in futures:
+            future.result()
+
+    def _run_stage_checked(self, stage: int, batch: list[tuple[ScheduledPlugin, float]]) -> None:
+        """Update one stage serially while tracking blackboard accesses.
+
+        Args:
+            stage: Stage index.
+            batch: Due (entry, accumulated dt) pairs of the stage.
+        """
+        blackboard = self._race_blackboard
+        accesses: list[tuple[str, set[str], set[str]]] = []
+        for entry, step in batch:
+            reads: set[str] = set()
+            writes: set[str] = set()
+            blackboard.set_access_hook(
+                lambda name, write, r=reads, w=writes: (w if write else r).add(name)
+            )
+            try:
+                self._update(entry, step)
+            finally:
+                blackboard.set_access_hook(None)
+            accesses.append((entry.name, reads, writes))
+
+        for (first, reads_a, writes_a), (second, reads_b, writes_b) in itertools.combinations(
+            accesses, 2
+        ):
+            for field in sorted(writes_a & (reads_b | writes_b) | writes_b & reads_a):
+                race = (field, first, second)
+                if race not in self._races:
+                    self._races.add(race)
+                    logger.warning(
+                        "Race in stage %d: %s and %s both access blackboard field %s",
+                        stage,
+                        first,
+                        second,
+                        field,
+                    )
+
+    def _update(self, entry: ScheduledPlugin, dt: float) -> None:
+        """Update one plugin, isolating its errors.
+
+        Args:
+            entry: Scheduled plugin.
+            dt: Accumulated delta time.
+        """
+        plugin = entry.plugin
+        try:
+            if self.profiler is None:
+                plugin.update(dt)
+            else:
+                with self.profiler.section(f"plugin.{entry.name}", "plugin"):
+                    plugin.update(dt)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Error updating plugin %s: %s", entry.name, e)
+            try:
+                plugin.on_error(e)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Error handler of plugin %s failed", entry.name)
+
 
 class GameLoop:
     """Main game loop with fixed timestep physics.
@@ -36,6 +481,7 @@ class GameLoop:
         plugin_registry: Any,
         target_fps: int = 60,
         physics_hz: int = 60,
+        profiler: Any = None,
     ) -> None:
         """Initialize the game loop.
 
@@ -45,21 +491,24 @@ class GameLoop:
             plugin_registry: Registry of loaded plugins.
             target_fps: Target frames per second (default: 60).
             physics_hz: Physics update rate in Hz (default: 60).
+            profiler: Optional FrameProfiler timing each plugin update.
         """
         self.event_bus = event_bus
         self.message_queue = message_queue
         self.plugin_registry = plugin_registry
         self.target_fps = target_fps
         self.physics_hz = physics_hz
+        self.profiler = profiler
+        self.scheduler = PluginScheduler(profiler)
 
-        self.physics_dt = 1.0 / physics_hz
+        self.physics_step = FixedTimestep(physics_hz)
+        self.physics_dt = self.physics_step.step_dt
         self.frame_time_target = 1.0 / target_fps
 
         self.running = False
         self.paused = False
 
         self.frame_count = 0
-        self.physics_accumulator = 0.0
 
         self.last_time = 0.0
         self.last_fps_time = 0.0
@@ -107,23 +556,23 @@ class GameLoop:
             self.frame_count = 0
             self.last_fps_time = current_time
 
-        if not self.paused:
-            # Fixed timestep physics
-            self.physics_accumulator += frame_time
-
-            # Clamp accumulator to prevent spiral of death
-            max_accumulator = self.physics_dt * 5
-            if self.physics_accumulator > max_accumulator:
-                logger.warning("Physics accumulator clamped: %.3fs", self.physics_accumulator)
-                self.physics_accumulator = max_accumulator
+        if self.profiler is not None:
+            self.profiler.begin_frame()
 
+        if not self.paused:
             # Update physics at fixed rate
-            while self.physics_accumulator >= self.physics_dt:
+            for _ in range(self.physics_step.advance(frame_time)):
                 self._update_physics(self.physics_dt)
-                self.physics_accumulator -= self.physics_dt
 
             # Process messages
-            self.message_queue.process(max_messages=100)
+            if self.profiler is not None:
+                with self.profiler.section("message_queue.process", "messaging"):
+                    self.message_queue.process(max_messages=100)
+            else:
+                self.message_queue.process(max_messages=100)
+
+        if self.profiler is not None:
+            self.profiler.end_frame()
 
         # Limit frame rate
         self._limit_framerate()
@@ -131,21 +580,17 @@ class GameLoop:
         self.frame_count += 1
 
     def _update_physics(self, dt: float) -> None:
-        """Update all physics-enabled plugins.
+        """Update all physics-enabled plugins at their declared rates.
 
         Args:
             dt: Fixed delta time for physics update.
         """
-        # Get plugins sorted by update priority
+        # Keep the schedule in step with the registry, in update priority order
         plugins = self.plugin_registry.get_plugins_by_priority()
-
-        for plugin_info in plugins:
-            if plugin_info.metadata.requires_physics:
-                try:
-                    plugin_info.plugin.update(dt)
-                except Exception as e:
-                    logger.error("Error updating plugin %s: %s", plugin_info.metadata.name, e)
-                    plugin_info.plugin.on_error(e)
+        self.scheduler.sync(
+            (info.plugin, info.metadata.name) for info in plugins if info.metadata.requires_physics
+        )
+        self.scheduler.tick(dt)
 
     def _limit_framerate(self) -> None:
         """Sleep to maintain target frame rate."""
@@ -174,9 +619,14 @@ class GameLoop:
     def resume(self) -> None:
         """Resume physics and plugin updates."""
         self.paused = False
-        self.physics_accumulator = 0.0  # Reset to avoid catchup
+        self.physics_step.reset()  # Reset to avoid catchup
         logger.info("Game loop resumed")
 
+    @property
+    def physics_accumulator(self) -> float:
+        """Simulation time not yet consumed by a physics step."""
+        return self.physics_step.accumulator
+
     def get_fps(self) -> float:
         """Get current frames per second.
 
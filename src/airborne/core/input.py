@@ -30,7 +30,7 @@ import pygame  # pylint: disable=no-member
 
 from airborne.core.event_bus import Event, EventBus
 from airborne.core.logging_system import get_logger
-from airborne.core.messaging import Message, MessagePriority, MessageQueue, MessageTopic
+from airborne.core.messaging import MessagePriority, MessageQueue, MessageTopic
 
 logger = get_logger(__name__)
 
@@ -368,6 +368,21 @@ class InputManager:  # pylint: disable=too-many-instance-attributes
         else:
             logger.debug("No joystick detected")
 
+    def set_controls(self, throttle: float, flaps: float) -> None:
+        """Set the throttle and flaps directly, without smoothing.
+
+        Used to start from a trimmed state (e.g., an airborne spawn).
+
+        Args:
+            throttle: Throttle setting (0.0 to 1.0).
+            flaps: Flap position (0.0 to 1.0).
+        """
+        self.state.throttle = throttle
+        self.state.flaps = flaps
+        self.state.clamp_all()
+        self._target_throttle = self.state.throttle
+        self._previous_throttle = self.state.throttle
+
     def process_events(self, events: list[pygame.event.Event]) -> None:
         """Process pygame events.
 
@@ -657,9 +672,9 @@ class InputManager:  # pylint: disable=too-many-instance-attributes
                 )
                 self._previous_throttle = self.state.throttle
 
-            # Publish control inputs message for physics plugin
+            # Publish control inputs message for physics plugin (pooled: sent every frame)
             self.message_queue.publish(
-                Message(
+                self.message_queue.acquire_message(
                     sender="input_manager",
                     recipients=["*"],
                     topic=MessageTopic.CONTROL_INPUT,
@@ -17,13 +17,13 @@ Typical usage:
 from pathlib import Path
 
 import pygame
-import yaml
 
 from airborne.core.action_binding import (
     ActionBinding,
     ActionBindingRegistry,
     InputBinding,
 )
+from airborne.core.config import ConfigLoader
 from airborne.core.input_event import InputSourceType
 from airborne.core.logging_system import get_logger
 
@@ -160,8 +160,7 @@ class InputConfig:
             file_path: Path to YAML file.
         """
         try:
-            with open(file_path, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            data = ConfigLoader.load_yaml(file_path)
 
             if not data:
                 logger.warning(f"Empty YAML file: {file_path}")
@@ -10,6 +10,17 @@ Platform-specific log locations:
 
 Each game start rotates logs, keeping the last 5 launches.
 
+Logging never has to stall a frame:
+    - async: records are handed to a bounded queue and formatted and written
+      by a background QueueListener thread. When the queue is full, records
+      are dropped and counted instead of blocking the caller.
+    - rate_limits: per-logger token buckets cap how many records below
+      WARNING a chatty logger may emit per second.
+    - ring_buffer: records below a threshold (by default the DEBUG records)
+      are held in memory and written only when an error is logged, giving
+      context for failures without paying for verbose file output during
+      normal runs.
+
 Typical usage example:
     from airborne.core.logging_system import get_logger
 
@@ -22,20 +33,31 @@ Typical usage example:
             self._log.debug("Debug details: %s", data)
 """
 
+import atexit
+import copy
 import logging
 import logging.handlers
 import os
 import platform
+import queue
+import threading
 import time
+from collections import deque
 from pathlib import Path
 from typing import Any
 
-import yaml
+from airborne.core.config import ConfigLoader
 
 # Global configuration
 _logging_config: dict[str, Any] = {}
 _loggers_cache: dict[str, logging.Logger] = {}
 _initialized = False
+_listener: logging.handlers.QueueListener | None = None
+# Dedicated per-logger file handlers (logger name -> handler)
+_dedicated_handlers: dict[str, logging.Handler] = {}
+
+# Argument types that cannot change between logging and formatting
+_IMMUTABLE_ARG_TYPES = (str, int, float, bool, bytes, type(None))
 
 
 class LoggingError(Exception):
@@ -137,8 +159,7 @@ def initialize_logging(
             if not config_path.exists():
                 raise LoggingError(f"Logging config file not found: {config_path}")
 
-            with config_path.open("r", encoding="utf-8") as f:
-                _logging_config = yaml.safe_load(f) or {}
+            _logging_config = ConfigLoader.load_yaml(config_path) or {}
 
         except Exception as e:
             raise LoggingError(f"Failed to load logging config: {e}") from e
@@ -164,6 +185,262 @@ def initialize_logging(
     _initialized = True
 
 
+class TokenBucket:
+    """Token bucket allowing ``rate`` events per second with bursts of ``burst``.
+
+    Examples:
+        >>> bucket = TokenBucket(rate=5.0, burst=10)
+        >>> bucket.consume()
+        True
+    """
+
+    __slots__ = ("rate", "burst", "tokens", "_last")
+
+    def __init__(self, rate: float, burst: float) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second.
+            burst: Bucket capacity.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self._last = time.monotonic()
+
+    def consume(self, now: float | None = None) -> bool:
+        """Take one token if available.
+
+        Args:
+            now: Current monotonic time. Defaults to time.monotonic().
+
+        Returns:
+            True if a token was taken.
+        """
+        if now is None:
+            now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self._last) * self.rate)
+        self._last = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+
+class RateLimitFilter(logging.Filter):
+    """Drops records from chatty loggers beyond a per-logger rate.
+
+    Limits apply to a logger and its children (the most specific configured
+    name wins). Records at WARNING and above are never dropped. The first
+    record let through after some were dropped carries how many were dropped
+    in its ``rate_limited`` attribute, which the log formatter appends to the
+    message; the record's message itself is not changed.
+
+    Examples:
+        >>> handler.addFilter(RateLimitFilter({"airborne.audio": (5.0, 20)}))
+    """
+
+    def __init__(self, limits: dict[str, tuple[float, float]]) -> None:
+        """Initialize the filter.
+
+        Args:
+            limits: Logger name -> (records per second, burst size).
+        """
+        super().__init__()
+        self._limits = dict(limits)
+        self._buckets: dict[str, TokenBucket] = {}
+        # Resolved limit name per logger name ("" when unlimited)
+        self._resolved: dict[str, str] = {}
+        self._suppressed: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _resolve(self, name: str) -> str:
+        key = self._resolved.get(name)
+        if key is None:
+            key = ""
+            candidate = name
+            while candidate:
+                if candidate in self._limits:
+                    key = candidate
+                    break
+                candidate = candidate.rpartition(".")[0]
+            self._resolved[name] = key
+        return key
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Decide whether a record may pass.
+
+        Args:
+            record: Log record.
+
+        Returns:
+            False if the record's logger is over its rate limit.
+        """
+        if record.levelno >= logging.WARNING:
+            return True
+        key = self._resolve(record.name)
+        if not key:
+            return True
+        # One decision per record, even when the filter is shared by handlers
+        decision: bool | None = getattr(record, "_rate_limit_passed", None)
+        if decision is not None:
+            return decision
+        suppressed = 0
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                rate, burst = self._limits[key]
+                bucket = self._buckets[key] = TokenBucket(rate, burst)
+            decision = bucket.consume()
+            if decision:
+                suppressed = self._suppressed.pop(key, 0)
+            else:
+                self._suppressed[key] = self._suppressed.get(key, 0) + 1
+        record._rate_limit_passed = decision
+        if decision and suppressed:
+            record.rate_limited = suppressed
+        return decision
+
+    def suppressed_count(self, name: str) -> int:
+        """Get the number of records dropped since the last one let through.
+
+        Args:
+            name: Configured logger name.
+
+        Returns:
+            Pending suppressed record count.
+        """
+        return self._suppressed.get(name, 0)
+
+
+class RingBufferHandler(logging.Handler):
+    """Holds low-level records in memory and writes them only on error.
+
+    Records at or above ``passthrough_level`` go straight to the target.
+    Lower records are kept in a ring of ``capacity`` entries (oldest are
+    discarded) and written, oldest first, just before the next record at or
+    above ``flush_level``. With the default passthrough level of INFO the
+    target gets INFO and above as they happen, and the ring holds the DEBUG
+    records leading up to an error.
+
+    Examples:
+        >>> ring = RingBufferHandler(file_handler, capacity=2000)
+        >>> root.addHandler(ring)
+    """
+
+    def __init__(
+        self,
+        target: logging.Handler,
+        capacity: int = 2000,
+        passthrough_level: int = logging.INFO,
+        flush_level: int = logging.ERROR,
+    ) -> None:
+        """Initialize the handler.
+
+        Args:
+            target: Handler receiving passed-through and flushed records.
+            capacity: Maximum records held in memory.
+            passthrough_level: Records at or above this level are not buffered.
+            flush_level: Records at or above this level flush the buffer.
+        """
+        super().__init__(logging.DEBUG)
+        self.target = target
+        self.passthrough_level = passthrough_level
+        self.flush_level = flush_level
+        self.buffer: deque[logging.LogRecord] = deque(maxlen=capacity)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Buffer or forward a record.
+
+        Args:
+            record: Log record.
+        """
+        if record.levelno < self.passthrough_level:
+            self.buffer.append(record)
+            return
+        if record.levelno >= self.flush_level:
+            self.flush()
+        self.target.handle(record)
+
+    def flush(self) -> None:
+        """Write all buffered records to the target."""
+        while self.buffer:
+            self.target.handle(self.buffer.popleft())
+        self.target.flush()
+
+    def close(self) -> None:
+        """Close the handler and its target (buffered records are discarded)."""
+        self.buffer.clear()
+        self.target.close()
+        super().close()
+
+
+class AsyncQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that never blocks and defers formatting when safe.
+
+    The standard QueueHandler formats every record on the calling thread.
+    This one merges the message there only if an argument is mutable (so the
+    logged value cannot change before it is written); otherwise formatting is
+    left to the listener thread. Records are dropped and counted when the
+    queue is full.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[Any]") -> None:
+        """Initialize the handler.
+
+        Args:
+            log_queue: Bounded queue shared with the QueueListener.
+        """
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Make a record safe to hand to another thread.
+
+        Args:
+            record: Log record.
+
+        Returns:
+            Copy of the record for the queue.
+        """
+        record = copy.copy(record)
+        if record.args and not (
+            isinstance(record.args, tuple)
+            and all(isinstance(arg, _IMMUTABLE_ARG_TYPES) for arg in record.args)
+        ):
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info:
+            # Traceback objects must be rendered before the frames go away
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Queue a record without blocking.
+
+        Args:
+            record: Prepared log record.
+        """
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def _build_rate_limit_filter() -> RateLimitFilter | None:
+    """Create the rate limit filter from the ``rate_limits`` config section.
+
+    Returns:
+        Filter, or None if no limits are configured.
+    """
+    limits = {
+        name: (float(limit.get("rate", 10.0)), float(limit.get("burst", limit.get("rate", 10.0))))
+        for name, limit in (_logging_config.get("rate_limits") or {}).items()
+    }
+    return RateLimitFilter(limits) if limits else None
+
+
 def _get_default_config() -> dict[str, Any]:
     """Get default logging configuration.
 
@@ -186,6 +463,14 @@ def _get_default_config() -> dict[str, Any]:
             "enabled": True,
             "level": "INFO",
         },
+        "async": {
+            "enabled": True,
+            "queue_size": 10000,
+        },
+        "rate_limits": {},
+        "ring_buffer": {
+            "enabled": False,
+        },
         "plugins": {},
     }
 
@@ -198,11 +483,20 @@ def _setup_directories() -> None:
 
 def _configure_root_logger() -> None:
     """Configure the root logger with handlers."""
+    global _listener
+
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)  # Capture all, filter in handlers
 
-    # Clear existing handlers
+    # Clear existing handlers (stopping a previous listener flushes its queue)
+    _stop_listener()
+    for handler in root_logger.handlers:
+        handler.close()
     root_logger.handlers.clear()
+    for name, handler in _dedicated_handlers.items():
+        logging.getLogger(name).removeHandler(handler)
+
+    handlers: list[logging.Handler] = []
 
     # Console handler
     if _logging_config.get("console", {}).get("enabled", True):
@@ -210,7 +504,7 @@ def _configure_root_logger() -> None:
         console_level = _logging_config.get("console", {}).get("level", "INFO")
         console_handler.setLevel(getattr(logging, console_level))
         console_handler.setFormatter(_get_formatter())
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     # Combined log file handler (simple FileHandler, rotation done on startup)
     if _logging_config.get("combined_log", {}).get("enabled", True):
@@ -226,11 +520,87 @@ def _configure_root_logger() -> None:
         )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(_get_formatter())
-        root_logger.addHandler(file_handler)
+
+        # Hold verbose records in memory, writing them only when an error occurs
+        ring_config = _logging_config.get("ring_buffer") or {}
+        if ring_config.get("enabled", False):
+            handlers.append(
+                RingBufferHandler(
+                    file_handler,
+                    capacity=ring_config.get("capacity", 2000),
+                    passthrough_level=getattr(logging, ring_config.get("level", "INFO")),
+                    flush_level=getattr(logging, ring_config.get("flush_level", "ERROR")),
+                )
+            )
+        else:
+            handlers.append(file_handler)
+
+    rate_limit_filter = _build_rate_limit_filter()
+    async_config = _logging_config.get("async") or {}
+
+    if async_config.get("enabled", False):
+        # Format and write on a background thread
+        log_queue: queue.Queue[Any] = queue.Queue(async_config.get("queue_size", 10000))
+        queue_handler = AsyncQueueHandler(log_queue)
+        if rate_limit_filter:
+            queue_handler.addFilter(rate_limit_filter)
+        root_logger.addHandler(queue_handler)
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.unregister(_stop_listener)
+        atexit.register(_stop_listener)
+    else:
+        for handler in handlers:
+            if rate_limit_filter:
+                handler.addFilter(rate_limit_filter)
+            root_logger.addHandler(handler)
+
+    for name, handler in _dedicated_handlers.items():
+        _attach_dedicated_handler(name, handler)
+
+
+def _attach_dedicated_handler(name: str, handler: logging.Handler) -> None:
+    """Route a logger's records (and its children's) to a dedicated handler.
+
+    With async logging the handler is written by the QueueListener thread
+    like the other handlers, and picks the logger's records out of the
+    queue with a name filter. Otherwise it is attached to the logger.
+
+    Args:
+        name: Logger name.
+        handler: Dedicated handler (with a logging.Filter(name)).
+    """
+    if _listener is not None:
+        # The listener thread reads the tuple per record; swap it atomically
+        _listener.handlers = (*_listener.handlers, handler)
+    else:
+        logging.getLogger(name).addHandler(handler)
+
+
+def _stop_listener() -> None:
+    """Stop the background listener, writing every queued record."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
 
 
 class MillisecondFormatter(logging.Formatter):
-    """Custom formatter that shows milliseconds with dot separator."""
+    """Custom formatter that shows milliseconds with dot separator.
+
+    Also notes records dropped by RateLimitFilter before this one.
+    """
+
+    def formatMessage(self, record: logging.LogRecord) -> str:  # noqa: N802
+        """Format the record, noting earlier rate-limited records."""
+        text = super().formatMessage(record)
+        suppressed = getattr(record, "rate_limited", 0)
+        if suppressed:
+            text = f"{text} [{suppressed} earlier records rate-limited]"
+        return text
 
     def formatTime(self, record, datefmt=None):
         """Format time with milliseconds using dot separator."""
@@ -310,7 +680,9 @@ def get_logger(name: str) -> logging.Logger:
             )
             file_handler.setLevel(logging.DEBUG)
             file_handler.setFormatter(_get_formatter())
-            logger.addHandler(file_handler)
+            file_handler.addFilter(logging.Filter(name))
+            _dedicated_handlers[name] = file_handler
+            _attach_dedicated_handler(name, file_handler)
     else:
         # Disable logger if explicitly disabled
         logger.disabled = True
@@ -328,7 +700,12 @@ def shutdown_logging() -> None:
     Examples:
         >>> shutdown_logging()
     """
+    _stop_listener()
     logging.shutdown()
+    for name, handler in _dedicated_handlers.items():
+        logging.getLogger(name).removeHandler(handler)
+        handler.close()
+    _dedicated_handlers.clear()
     _loggers_cache.clear()
 
 
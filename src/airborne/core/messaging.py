@@ -3,6 +3,16 @@
 This module provides a priority-based message queue for plugins to communicate
 without tight coupling. Messages are processed asynchronously in batches.
 
+The queue keeps one FIFO lane per priority level instead of a heap, so publish
+and dispatch are O(1) and take no lock in the default single-threaded mode.
+High-frequency publishers can recycle Message objects through a small pool via
+MessageQueue.acquire_message().
+
+Topics are dot-separated. Besides exact topics, handlers can subscribe to
+patterns: "*" matches exactly one segment ("system.*" receives
+"system.warning" but not "system.engine.state") and a trailing "**" matches
+any number of segments ("system.**" receives everything under "system").
+
 Typical usage example:
     from airborne.core.messaging import MessageQueue, Message, MessagePriority
 
@@ -17,13 +27,17 @@ Typical usage example:
     queue.process()  # Process pending messages
 """
 
+import threading
 import time
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Mapping
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass, field
 from enum import Enum
-from queue import PriorityQueue
 from typing import Any
 
+from airborne.core.bus_metrics import BusMetrics, handler_name
+
 
 class MessagePriority(Enum):
     """Priority levels for messages.
@@ -46,11 +60,15 @@ class Message:
 
     Attributes:
         priority: Message priority (affects processing order).
-        timestamp: Unix timestamp when message was created.
+        timestamp: Unix timestamp when message was created (for pooled
+            messages, when it was published).
         sender: Name of the plugin sending the message.
         recipients: List of recipient plugin names, or ["*"] for broadcast.
         topic: Message category/type (e.g., "engine.state").
         data: Arbitrary message payload.
+        pooled: Whether the message belongs to a queue's recycling pool. Pooled
+            messages are reused after dispatch, so handlers must not keep a
+            reference to the Message object itself (keeping ``data`` is fine).
     """
 
     priority: int = field(compare=True)  # Store as int for comparison
@@ -58,14 +76,15 @@ class Message:
     sender: str = field(default="", compare=False)
     recipients: list[str] = field(default_factory=list, compare=False)
     topic: str = field(default="", compare=False)
-    data: dict[str, Any] = field(default_factory=dict, compare=False)
+    data: Mapping[str, Any] = field(default_factory=dict, compare=False)
+    pooled: bool = field(default=False, compare=False, repr=False)
 
     def __init__(
         self,
         sender: str,
         recipients: list[str],
         topic: str,
-        data: dict[str, Any],
+        data: Mapping[str, Any],
         priority: MessagePriority = MessagePriority.NORMAL,
     ) -> None:
         """Initialize a message.
@@ -83,6 +102,7 @@ class Message:
         self.recipients = recipients
         self.topic = topic
         self.data = data
+        self.pooled = False
 
 
 class MessageTopic:
@@ -90,6 +110,10 @@ class MessageTopic:
 
     This class serves as a registry of well-known topic names to avoid
     typos and provide documentation.
+
+    Topics listed in COALESCING carry a complete state snapshot on every
+    publish. The message queue only delivers the newest pending message per
+    (topic, sender) for these topics; older ones are dropped.
     """
 
     # Environmental
@@ -138,6 +162,155 @@ class MessageTopic:
     PROXIMITY_BEEP = "ui.audio.proximity_beep"  # Proximity beep cue
     SYSTEM_STATE_CHANGED = "system.state_changed"
 
+    # State-stream topics where only the latest message matters
+    COALESCING: frozenset[str] = frozenset(
+        {
+            POSITION_UPDATED,
+            CONTROL_INPUT,
+            TERRAIN_UPDATED,
+        }
+    )
+
+
+# Upper bound on recycled Message objects kept per queue
+_MESSAGE_POOL_SIZE = 256
+
+# Wildcard segments in subscription patterns
+_SINGLE_WILDCARD = "*"
+_MULTI_WILDCARD = "**"
+
+MessageHandler = Callable[[Message], None]
+
+
+def is_topic_pattern(topic: str) -> bool:
+    """Check whether a subscription topic contains wildcard segments.
+
+    Args:
+        topic: Topic or pattern string.
+
+    Returns:
+        True if any segment is "*" or "**".
+    """
+    return _SINGLE_WILDCARD in topic and any(
+        segment in (_SINGLE_WILDCARD, _MULTI_WILDCARD) for segment in topic.split(".")
+    )
+
+
+class _TopicTrieNode:
+    """Node of the wildcard subscription trie."""
+
+    __slots__ = ("children", "wildcard", "handlers", "tail_handlers")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TopicTrieNode] = {}
+        self.wildcard: _TopicTrieNode | None = None
+        # (subscription sequence, handler) for patterns ending at this node
+        self.handlers: list[tuple[int, MessageHandler]] = []
+        # Same, for patterns ending with "**" right below this node
+        self.tail_handlers: list[tuple[int, MessageHandler]] = []
+
+
+class _TopicTrie:
+    """Trie of wildcard subscription patterns, keyed by topic segment."""
+
+    def __init__(self) -> None:
+        self._root = _TopicTrieNode()
+        self._sequence = 0
+        self.size = 0
+
+    def _walk(
+        self, pattern: str, create: bool
+    ) -> tuple[_TopicTrieNode, list[tuple[int, MessageHandler]]] | None:
+        """Find the handler list a pattern is stored in.
+
+        Args:
+            pattern: Subscription pattern.
+            create: Create missing nodes along the way.
+
+        Returns:
+            (node, handler list) or None if the pattern is not in the trie.
+
+        Raises:
+            ValueError: If "**" is not the last segment.
+        """
+        node = self._root
+        segments = pattern.split(".")
+        last = len(segments) - 1
+        for i, segment in enumerate(segments):
+            if segment == _MULTI_WILDCARD:
+                if i != last:
+                    raise ValueError(f"'**' must be the last segment of a pattern: {pattern}")
+                return node, node.tail_handlers
+
+            if segment == _SINGLE_WILDCARD:
+                child = node.wildcard
+                if child is None and create:
+                    child = node.wildcard = _TopicTrieNode()
+            else:
+                child = node.children.get(segment)
+                if child is None and create:
+                    child = node.children[segment] = _TopicTrieNode()
+            if child is None:
+                return None
+            node = child
+
+        return node, node.handlers
+
+    def add(self, pattern: str, handler: MessageHandler) -> None:
+        """Add a handler for a pattern."""
+        found = self._walk(pattern, create=True)
+        assert found is not None
+        self._sequence += 1
+        found[1].append((self._sequence, handler))
+        self.size += 1
+
+    def remove(self, pattern: str, handler: MessageHandler) -> None:
+        """Remove every registration of a handler for a pattern."""
+        found = self._walk(pattern, create=False)
+        if found is None:
+            return
+        entries = found[1]
+        kept = [entry for entry in entries if entry[1] != handler]
+        self.size -= len(entries) - len(kept)
+        entries[:] = kept
+
+    def count(self, pattern: str) -> int:
+        """Get the number of handlers registered for a pattern."""
+        found = self._walk(pattern, create=False)
+        return 0 if found is None else len(found[1])
+
+    def match(self, topic: str) -> list[MessageHandler]:
+        """Get handlers whose pattern matches a concrete topic.
+
+        Args:
+            topic: Concrete topic (no wildcards).
+
+        Returns:
+            Matching handlers in subscription order.
+        """
+        matches: list[tuple[int, MessageHandler]] = []
+        segments = topic.split(".")
+        stack = [(self._root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            matches.extend(node.tail_handlers)
+            if depth == len(segments):
+                matches.extend(node.handlers)
+                continue
+            child = node.children.get(segments[depth])
+            if child is not None:
+                stack.append((child, depth + 1))
+            if node.wildcard is not None:
+                stack.append((node.wildcard, depth + 1))
+
+        matches.sort(key=lambda entry: entry[0])
+        return [handler for _, handler in matches]
+
+    def clear(self) -> None:
+        """Remove every pattern."""
+        self._root = _TopicTrieNode()
+        self.size = 0
+
 
 class MessageQueue:
     """Asynchronous message queue for plugin communication.
@@ -145,6 +318,26 @@ class MessageQueue:
     The message queue processes messages in batches, ordered by priority.
     Plugins subscribe to topics and receive messages matching those topics.
 
+    Messages are stored in one deque per MessagePriority. Within a priority
+    level they are delivered in publish order. Every publisher and consumer
+    normally runs on the main thread, so no locking is done by default; pass
+    ``thread_safe=True`` when messages are published from other threads.
+
+    Subscriptions may use "*" and trailing "**" wildcards. The handler list
+    for each concrete topic is compiled on first dispatch and cached until the
+    next subscribe/unsubscribe, so wildcard matching costs nothing per message.
+
+    Coalescing topics (see MessageTopic.COALESCING) keep at most one pending
+    message per (topic, sender): a newer publish replaces the pending one in
+    place, so a backed-up queue never delivers stale snapshots and cannot use
+    up the max_messages budget of process().
+
+    Attach a BusMetrics (constructor or set_metrics()) to count traffic per
+    topic and time every handler call; without one, dispatch is uninstrumented.
+
+    A publish tap (set_publish_tap()) sees every message as it is published;
+    the replay journal uses it to record messages injected by input handling.
+
     Examples:
         >>> queue = MessageQueue()
         >>> def handler(msg: Message) -> None:
@@ -161,10 +354,70 @@ class MessageQueue:
         Engine RPM: 2400
     """
 
-    def __init__(self) -> None:
-        """Initialize an empty message queue."""
-        self._queue: PriorityQueue[Message] = PriorityQueue()
+    def __init__(
+        self,
+        thread_safe: bool = False,
+        coalescing_topics: set[str] | frozenset[str] | None = None,
+        metrics: BusMetrics | None = None,
+    ) -> None:
+        """Initialize an empty message queue.
+
+        Args:
+            thread_safe: Guard publish/process with a lock so that messages can
+                be published from threads other than the one calling process().
+            coalescing_topics: Topics delivered latest-value only. Defaults to
+                MessageTopic.COALESCING.
+            metrics: Optional instrumentation sink for traffic and latency.
+        """
+        self._lanes: tuple[deque[Message], ...] = tuple(deque() for _ in MessagePriority)
         self._subscriptions: dict[str, list[Callable[[Message], None]]] = {}
+        self._patterns = _TopicTrie()
+        # Compiled handlers per concrete topic (exact + matching patterns)
+        self._dispatch_cache: dict[str, tuple[MessageHandler, ...]] = {}
+        self._pool: list[Message] = []
+        self._thread_safe = thread_safe
+        self._lock: AbstractContextManager[Any] = threading.Lock() if thread_safe else nullcontext()
+        # Latest-value coalescing: (topic, sender) of messages waiting in a
+        # lane, and the newest message replacing each of them
+        self._coalescing_topics: set[str] = set(
+            MessageTopic.COALESCING if coalescing_topics is None else coalescing_topics
+        )
+        self._coalesced_pending: set[tuple[str, str]] = set()
+        self._coalesced: dict[tuple[str, str], Message] = {}
+        self._dropped: dict[str, int] = {}
+
+        self._metrics = metrics
+        self._publish_tap: MessageHandler | None = None
+
+    @property
+    def thread_safe(self) -> bool:
+        """Whether the queue locks around publish and process."""
+        return self._thread_safe
+
+    @property
+    def metrics(self) -> BusMetrics | None:
+        """Attached instrumentation, or None if disabled."""
+        return self._metrics
+
+    def set_metrics(self, metrics: BusMetrics | None) -> None:
+        """Attach or detach instrumentation.
+
+        Args:
+            metrics: Metrics sink, or None to disable instrumentation.
+        """
+        self._metrics = metrics
+
+    def set_publish_tap(self, tap: MessageHandler | None) -> None:
+        """Observe every published message.
+
+        The tap is called synchronously from publish(), before the message is
+        queued. Pooled messages are recycled after dispatch, so a tap that keeps
+        a message must copy it.
+
+        Args:
+            tap: Callback receiving each published message, or None to remove.
+        """
+        self._publish_tap = tap
 
     def subscribe(self, topic: str, handler: Callable[[Message], None]) -> None:
         """Subscribe a handler to a topic.
@@ -173,17 +426,26 @@ class MessageQueue:
         Handlers are called during the process() method.
 
         Args:
-            topic: Topic string to subscribe to (e.g., "engine.state").
+            topic: Topic string or wildcard pattern to subscribe to
+                (e.g., "engine.state", "system.*", "ui.audio.**").
             handler: Callable that accepts a Message as its only parameter.
 
+        Raises:
+            ValueError: If "**" appears anywhere but the last segment.
+
         Examples:
             >>> def on_engine_state(msg: Message) -> None:
             ...     print(f"RPM: {msg.data['rpm']}")
             >>> queue.subscribe("engine.state", on_engine_state)
+            >>> queue.subscribe("system.**", on_any_system_message)
         """
-        if topic not in self._subscriptions:
-            self._subscriptions[topic] = []
-        self._subscriptions[topic].append(handler)
+        if is_topic_pattern(topic):
+            self._patterns.add(topic, handler)
+        else:
+            if topic not in self._subscriptions:
+                self._subscriptions[topic] = []
+            self._subscriptions[topic].append(handler)
+        self._dispatch_cache.clear()
 
     def unsubscribe(self, topic: str, handler: Callable[[Message], None]) -> None:
         """Unsubscribe a handler from a topic.
@@ -192,24 +454,119 @@ class MessageQueue:
         is not subscribed, this is a no-op.
 
         Args:
-            topic: Topic to unsubscribe from.
+            topic: Topic or pattern to unsubscribe from, exactly as subscribed.
             handler: Handler function to remove.
 
         Examples:
             >>> queue.unsubscribe("engine.state", on_engine_state)
         """
-        if topic in self._subscriptions:
+        if is_topic_pattern(topic):
+            self._patterns.remove(topic, handler)
+        elif topic in self._subscriptions:
             self._subscriptions[topic] = [h for h in self._subscriptions[topic] if h != handler]
 
             # Clean up empty subscription lists
             if not self._subscriptions[topic]:
                 del self._subscriptions[topic]
+        self._dispatch_cache.clear()
+
+    def set_coalescing(self, topic: str, enabled: bool = True) -> None:
+        """Declare whether a topic is delivered latest-value only.
+
+        Takes effect for messages published after the call.
+
+        Args:
+            topic: Topic to configure.
+            enabled: True to coalesce the topic, False to deliver every message.
+
+        Examples:
+            >>> queue.set_coalescing("network.traffic.update")
+        """
+        if enabled:
+            self._coalescing_topics.add(topic)
+        else:
+            self._coalescing_topics.discard(topic)
+
+    def is_coalescing(self, topic: str) -> bool:
+        """Check whether a topic is delivered latest-value only.
+
+        Args:
+            topic: Topic to query.
+
+        Returns:
+            True if pending messages on this topic are coalesced.
+        """
+        return topic in self._coalescing_topics
+
+    def acquire_message(
+        self,
+        sender: str,
+        recipients: list[str],
+        topic: str,
+        data: Mapping[str, Any],
+        priority: MessagePriority = MessagePriority.NORMAL,
+    ) -> Message:
+        """Get a recycled Message from the pool, or a new one if it is empty.
+
+        Intended for publishers that send the same kind of message every
+        frame. The returned message is returned to the pool automatically once
+        it has been dispatched, so handlers must not retain it.
+
+        Args:
+            sender: Name of sending plugin.
+            recipients: List of recipient plugin names.
+            topic: Message topic/category.
+            data: Message payload.
+            priority: Message priority (defaults to NORMAL).
+
+        Returns:
+            A pooled Message ready to be passed to publish().
+
+        Examples:
+            >>> queue.publish(queue.acquire_message(
+            ...     "main", ["physics_plugin"], MessageTopic.CONTROL_INPUT, {"pitch": 0.1}
+            ... ))
+        """
+        with self._lock:
+            message = self._pool.pop() if self._pool else Message.__new__(Message)
+
+        message.priority = priority.value
+        message.timestamp = 0.0  # Stamped by publish()
+        message.sender = sender
+        message.recipients = recipients
+        message.topic = topic
+        message.data = data
+        message.pooled = True
+        return message
+
+    def _release(self, message: Message) -> None:
+        """Return a dispatched pooled message to the pool.
+
+        Args:
+            message: Message that has been dispatched.
+        """
+        with self._lock:
+            self._release_locked(message)
+
+    def _release_locked(self, message: Message) -> None:
+        """Return a pooled message to the pool; caller must hold the lock.
+
+        Args:
+            message: Pooled message that will not be dispatched again.
+        """
+        # Drop payload references so the pool does not keep them alive
+        message.recipients = []
+        message.data = {}
+        if len(self._pool) < _MESSAGE_POOL_SIZE:
+            self._pool.append(message)
 
     def publish(self, message: Message) -> None:
         """Publish a message to the queue.
 
-        The message is added to the priority queue and will be processed
-        during the next process() call.
+        The message is appended to the lane for its priority and will be
+        processed during the next process() call. On a coalescing topic, a
+        message from the same sender that is still pending is replaced by this
+        one and counted as dropped. Pooled messages are timestamped here.
 
         Args:
             message: Message to publish.
@@ -223,7 +580,51 @@ class MessageQueue:
             ...     priority=MessagePriority.HIGH
             ... ))
         """
-        self._queue.put(message)
+        if message.pooled:
+            message.timestamp = time.time()
+        if self._publish_tap is not None:
+            self._publish_tap(message)
+        with self._lock:
+            if self._metrics is not None:
+                self._metrics.record_publish(message.topic)
+            if message.topic in self._coalescing_topics:
+                key = (message.topic, message.sender)
+                if key in self._coalesced_pending:
+                    # Keep the pending lane slot, deliver this payload instead
+                    replaced = self._coalesced.get(key)
+                    if replaced is not None and replaced.pooled:
+                        # An earlier replacement never reaches a lane
+                        self._release_locked(replaced)
+                    self._coalesced[key] = message
+                    self._dropped[message.topic] = self._dropped.get(message.topic, 0) + 1
+                    return
+                self._coalesced_pending.add(key)
+            self._lanes[message.priority].append(message)
+
+    def _pop_next(self) -> Message | None:
+        """Remove and return the highest-priority pending message.
+
+        For coalescing topics, the message occupying the lane slot is swapped
+        for the newest message published with the same topic and sender.
+
+        Returns:
+            Next message to dispatch, or None if all lanes are empty.
+        """
+        with self._lock:
+            for lane in self._lanes:
+                if lane:
+                    message = lane.popleft()
+                    if self._coalesced_pending:
+                        key = (message.topic, message.sender)
+                        if key in self._coalesced_pending:
+                            self._coalesced_pending.discard(key)
+                            latest = self._coalesced.pop(key, None)
+                            if latest is not None:
+                                if message.pooled:
+                                    self._release_locked(message)
+                                return latest
+                    return message
+        return None
 
     def process(self, max_messages: int = 100) -> int:
         """Process queued messages.
@@ -246,13 +647,26 @@ class MessageQueue:
         Note:
             This should be called once per frame in the game loop.
         """
+        metrics = self._metrics
+        dispatch = self._dispatch if metrics is None else self._dispatch_instrumented
         processed = 0
 
-        while not self._queue.empty() and processed < max_messages:
-            message = self._queue.get()
-            self._dispatch(message)
+        while processed < max_messages:
+            message = self._pop_next()
+            if message is None:
+                break
+
+            try:
+                dispatch(message)
+            finally:
+                if message.pooled:
+                    self._release(message)
             processed += 1
 
+        if metrics is not None:
+            depth = self.pending_count()
+            metrics.record_process(depth, depth if processed >= max_messages else 0)
+
         return processed
 
     def _dispatch(self, message: Message) -> None:
@@ -264,9 +678,48 @@ class MessageQueue:
         Args:
             message: Message to dispatch.
         """
-        if message.topic in self._subscriptions:
-            for handler in self._subscriptions[message.topic]:
+        handlers = self._dispatch_cache.get(message.topic)
+        if handlers is None:
+            handlers = self._compile_handlers(message.topic)
+        for handler in handlers:
+            handler(message)
+
+    def _dispatch_instrumented(self, message: Message) -> None:
+        """Dispatch a message while recording per-handler latency.
+
+        Args:
+            message: Message to dispatch.
+        """
+        metrics = self._metrics
+        assert metrics is not None
+        topic = message.topic
+        handlers = self._dispatch_cache.get(topic)
+        if handlers is None:
+            handlers = self._compile_handlers(topic)
+        for handler in handlers:
+            start = time.perf_counter()
+            try:
                 handler(message)
+            finally:
+                metrics.record_dispatch(topic, handler_name(handler), time.perf_counter() - start)
+
+    def _compile_handlers(self, topic: str) -> tuple[MessageHandler, ...]:
+        """Build and cache the handler list for a concrete topic.
+
+        Exact subscribers come first, followed by wildcard subscribers in the
+        order they subscribed.
+
+        Args:
+            topic: Concrete message topic.
+
+        Returns:
+            Handlers to call for messages on this topic.
+        """
+        handlers = tuple(self._subscriptions.get(topic, ()))
+        if self._patterns.size:
+            handlers += tuple(self._patterns.match(topic))
+        self._dispatch_cache[topic] = handlers
+        return handlers
 
     def clear(self) -> None:
         """Remove all pending messages and subscriptions.
@@ -274,14 +727,17 @@ class MessageQueue:
         This is primarily useful for testing or resetting the queue.
         """
         # Clear the queue
-        while not self._queue.empty():
-            try:
-                self._queue.get_nowait()
-            except Exception:
-                break
+        with self._lock:
+            for lane in self._lanes:
+                lane.clear()
+            self._coalesced_pending.clear()
+            self._coalesced.clear()
+            self._pool.clear()
 
         # Clear subscriptions
         self._subscriptions.clear()
+        self._patterns.clear()
+        self._dispatch_cache.clear()
 
     def pending_count(self) -> int:
         """Get the number of pending messages in the queue.
@@ -289,15 +745,30 @@ class MessageQueue:
         Returns:
             Number of messages waiting to be processed.
         """
-        return self._queue.qsize()
+        return sum(len(lane) for lane in self._lanes)
+
+    def get_dropped_count(self, topic: str | None = None) -> int:
+        """Get the number of messages dropped by coalescing.
+
+        Args:
+            topic: Topic to query, or None for the total across all topics.
+
+        Returns:
+            Number of pending messages replaced by a newer one.
+        """
+        if topic is None:
+            return sum(self._dropped.values())
+        return self._dropped.get(topic, 0)
 
     def get_subscriber_count(self, topic: str) -> int:
         """Get the number of subscribers for a topic.
 
         Args:
-            topic: Topic to query.
+            topic: Topic or pattern to query, exactly as subscribed.
 
         Returns:
-            Number of handlers subscribed to this topic.
+            Number of handlers subscribed to this topic or pattern.
         """
+        if is_topic_pattern(topic):
+            return self._patterns.count(topic)
         return len(self._subscriptions.get(topic, []))
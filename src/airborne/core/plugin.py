@@ -60,6 +60,11 @@ class PluginMetadata:
         provides: List of services/capabilities this plugin provides.
         optional: Whether aircraft can function without this plugin.
         update_priority: Lower values update earlier in the frame (0-1000).
+        update_rate_hz: Update rate in Hz, or None to update every frame.
+            Low-rate plugins receive the time accumulated since their last
+            update as dt.
+        update_phase: Offset of the update slot within one period (0.0-1.0).
+            None lets the scheduler stagger the plugin automatically.
         requires_physics: Whether this plugin needs physics updates.
         requires_network: Whether this plugin needs network connectivity.
         config_schema: Optional JSON schema for configuration validation.
@@ -75,6 +80,8 @@ class PluginMetadata:
     provides: list[str] = field(default_factory=list)
     optional: bool = False
     update_priority: int = 100
+    update_rate_hz: float | None = None
+    update_phase: float | None = None
     requires_physics: bool = True
     requires_network: bool = False
     config_schema: dict[str, Any] | None = None
@@ -91,6 +98,10 @@ class PluginMetadata:
             raise ValueError("Plugin author cannot be empty")
         if self.update_priority < 0 or self.update_priority > 1000:
             raise ValueError("Update priority must be between 0 and 1000")
+        if self.update_rate_hz is not None and self.update_rate_hz <= 0:
+            raise ValueError("Update rate must be positive")
+        if self.update_phase is not None and not 0.0 <= self.update_phase < 1.0:
+            raise ValueError("Update phase must be in [0.0, 1.0)")
 
 
 @dataclass
@@ -105,12 +116,14 @@ class PluginContext:
         message_queue: Message queue for async plugin communication.
         config: Plugin-specific configuration dictionary.
         plugin_registry: Registry to access other loaded plugins.
+        blackboard: Shared aircraft state blackboard, if the host provides one.
     """
 
     event_bus: Any  # EventBus type (avoid circular import)
     message_queue: Any  # MessageQueue type
     config: dict[str, Any]
     plugin_registry: Any  # PluginRegistry type
+    blackboard: Any = None  # StateBlackboard type
 
 
 class IPlugin(ABC):
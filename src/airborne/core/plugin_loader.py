@@ -1,19 +1,32 @@
 """Plugin loader with dependency resolution.
 
 This module handles dynamic loading of plugins, dependency resolution using
-topological sorting, and lifecycle management.
+topological sorting, and lifecycle management. The dependency graph can also be
+split into execution stages: every plugin in a stage depends only on plugins in
+earlier stages, so the plugins of one stage can be updated concurrently.
+
+Discovery can use a manifest cache: a JSON file recording, per plugin file,
+its mtime, size and SHA-256 together with the plugin class name and metadata.
+Files that are unchanged since the manifest was written are not imported at
+discovery time; their module is imported only when load_plugin() needs it.
 
 Typical usage example:
     from airborne.core.plugin_loader import PluginLoader
 
-    loader = PluginLoader([Path("src/airborne/plugins")])
+    loader = PluginLoader([Path("src/airborne/plugins")], manifest_path="plugins.json")
     loader.discover_plugins()
     plugin = loader.load_plugin("my_plugin", context)
 """
 
+import dataclasses
+import hashlib
 import importlib.util
+import json
 import logging
+import os
+from collections.abc import Hashable, Iterable, Mapping
 from pathlib import Path
+from typing import Any, TypeVar
 
 from airborne.core.plugin import (
     IPlugin,
@@ -21,10 +34,16 @@ from airborne.core.plugin import (
     PluginInfo,
     PluginMetadata,
     PluginState,
+    PluginType,
 )
 
 logger = logging.getLogger(__name__)
 
+# Bump when the manifest layout or PluginMetadata serialization changes
+MANIFEST_VERSION = 1
+
+_Node = TypeVar("_Node", bound=Hashable)
+
 
 class PluginLoadError(Exception):
     """Raised when a plugin fails to load."""
@@ -34,6 +53,53 @@ class DependencyError(Exception):
     """Raised when plugin dependencies cannot be resolved."""
 
 
+def dependency_stages(dependencies: Mapping[_Node, Iterable[_Node]]) -> list[list[_Node]]:
+    """Group a dependency graph into execution stages.
+
+    A node's stage is one past the latest stage of its dependencies, so each
+    stage depends only on earlier ones. Dependencies that are not keys of the
+    mapping are assumed to be satisfied elsewhere and ignored. Within a stage,
+    nodes keep the order of the mapping, which makes the result deterministic.
+
+    Args:
+        dependencies: Node (e.g., plugin name) to the nodes it depends on.
+
+    Returns:
+        Stages in execution order, each a list of nodes.
+
+    Raises:
+        DependencyError: If the graph contains a cycle.
+
+    Examples:
+        >>> dependency_stages({"electrical": [], "fuel": [], "engine": ["electrical", "fuel"]})
+        [['electrical', 'fuel'], ['engine']]
+    """
+    levels: dict[_Node, int] = {}
+    visiting: set[_Node] = set()
+
+    def level(name: _Node) -> int:
+        known = levels.get(name)
+        if known is not None:
+            return known
+        if name in visiting:
+            raise DependencyError(f"Circular dependency detected involving {name}")
+        visiting.add(name)
+        deps = [d for d in dependencies[name] if d in dependencies and d != name]
+        result = 1 + max((level(d) for d in deps), default=-1)
+        visiting.discard(name)
+        levels[name] = result
+        return result
+
+    stages: list[list[_Node]] = []
+    for name in dependencies:
+        index = level(name)
+        while len(stages) <= index:
+            stages.append([])
+    for name in dependencies:
+        stages[levels[name]].append(name)
+    return stages
+
+
 class PluginLoader:
     """Dynamic plugin loader with dependency resolution.
 
@@ -48,22 +114,34 @@ class PluginLoader:
         >>> loader.unload_plugin("engine_plugin")
     """
 
-    def __init__(self, plugin_dirs: list[Path] | list[str]) -> None:
+    def __init__(
+        self,
+        plugin_dirs: list[Path] | list[str],
+        manifest_path: Path | str | None = None,
+    ) -> None:
         """Initialize the plugin loader.
 
         Args:
             plugin_dirs: List of directories to search for plugins.
+            manifest_path: Discovery manifest cache file. None imports every
+                plugin file on each discovery.
         """
         self.plugin_dirs = [Path(d) if isinstance(d, str) else d for d in plugin_dirs]
+        self.manifest_path = Path(manifest_path) if manifest_path else None
         self.loaded_plugins: dict[str, PluginInfo] = {}
+        # Imported plugin classes (filled lazily when a manifest is used)
         self.plugin_classes: dict[str, type[IPlugin]] = {}
         self._metadata_cache: dict[str, PluginMetadata] = {}
+        # Plugin name -> (file, class attribute name), for lazy import
+        self._plugin_sources: dict[str, tuple[Path, str]] = {}
 
     def discover_plugins(self) -> list[PluginMetadata]:
         """Discover all available plugins in the plugin directories.
 
         Scans the configured directories for Python files ending in
-        '_plugin.py' and attempts to load their metadata.
+        '_plugin.py' and attempts to load their metadata. With a manifest,
+        only new or modified files are imported; the manifest is rewritten if
+        anything changed.
 
         Returns:
             List of discovered plugin metadata.
@@ -75,6 +153,9 @@ class PluginLoader:
             ...     print(f"{meta.name} v{meta.version} by {meta.author}")
         """
         discovered = []
+        manifest = self._read_manifest()
+        entries: dict[str, dict[str, Any]] = {}
+        cached = 0
 
         for plugin_dir in self.plugin_dirs:
             if not plugin_dir.exists():
@@ -82,19 +163,41 @@ class PluginLoader:
                 continue
 
             for plugin_file in plugin_dir.rglob("*_plugin.py"):
+                key = str(plugin_file.resolve())
                 try:
-                    metadata = self._load_plugin_metadata(plugin_file)
-                    if metadata:
-                        discovered.append(metadata)
-                        self._metadata_cache[metadata.name] = metadata
-                        logger.info("Discovered plugin: %s v%s", metadata.name, metadata.version)
+                    entry = self._match_manifest_entry(plugin_file, manifest.get(key))
+                    if entry is not None:
+                        cached += 1
+                    else:
+                        entry = self._scan_plugin_file(plugin_file)
+                        if entry is None:
+                            continue
+                    entries[key] = entry
+
+                    if entry["class_name"] is None:
+                        continue
+                    metadata = _metadata_from_dict(entry["metadata"])
+                    discovered.append(metadata)
+                    self._metadata_cache[metadata.name] = metadata
+                    self._plugin_sources[metadata.name] = (plugin_file, entry["class_name"])
+                    logger.info("Discovered plugin: %s v%s", metadata.name, metadata.version)
                 except Exception as e:
                     logger.error("Failed to discover plugin %s: %s", plugin_file, e)
 
+        if self.manifest_path is not None:
+            logger.info(
+                "Plugin manifest: %d of %d files unchanged, %d imported",
+                cached,
+                len(entries),
+                len(entries) - cached,
+            )
+            if entries != manifest:
+                self._write_manifest(entries)
+
         return discovered
 
     def _load_plugin_metadata(self, plugin_file: Path) -> PluginMetadata | None:
-        """Load metadata from a plugin file.
+        """Load metadata from a plugin file by importing it.
 
         Args:
             plugin_file: Path to the plugin Python file.
@@ -102,14 +205,29 @@ class PluginLoader:
         Returns:
             PluginMetadata if successful, None otherwise.
         """
+        entry = self._scan_plugin_file(plugin_file)
+        if entry is None or entry["class_name"] is None:
+            return None
+        return _metadata_from_dict(entry["metadata"])
+
+    def _scan_plugin_file(self, plugin_file: Path) -> dict[str, Any] | None:
+        """Import a plugin file and build its manifest entry.
+
+        Args:
+            plugin_file: Path to the plugin Python file.
+
+        Returns:
+            Manifest entry (class_name is None if the file defines no plugin),
+            or None if the file could not be imported or queried.
+        """
         try:
-            # Import the module
-            spec = importlib.util.spec_from_file_location(f"plugin_{plugin_file.stem}", plugin_file)
-            if spec is None or spec.loader is None:
+            module = _import_plugin_module(plugin_file)
+            if module is None:
                 return None
 
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+            entry: dict[str, Any] = {**_file_signature(plugin_file, with_hash=True)}
+            entry["class_name"] = None
+            entry["metadata"] = None
 
             # Find the plugin class (should have a class implementing IPlugin)
             for item_name in dir(module):
@@ -120,17 +238,117 @@ class PluginLoader:
                         instance = item()
                         metadata = instance.get_metadata()
                         self.plugin_classes[metadata.name] = item
-                        return metadata
+                        entry["class_name"] = item_name
+                        entry["metadata"] = _metadata_to_dict(metadata)
+                        return entry
                     except Exception as e:
                         logger.error("Failed to get metadata from %s: %s", item_name, e)
                         return None
 
-            return None
+            return entry
 
         except Exception as e:
             logger.error("Failed to load plugin file %s: %s", plugin_file, e)
             return None
 
+    def _match_manifest_entry(
+        self, plugin_file: Path, entry: dict[str, Any] | None
+    ) -> dict[str, Any] | None:
+        """Check whether a manifest entry still describes a plugin file.
+
+        The mtime and size are compared first; the file is hashed only if they
+        differ, so touching a file without editing it keeps the entry valid.
+
+        Args:
+            plugin_file: Path to the plugin Python file.
+            entry: Manifest entry for the file, if any.
+
+        Returns:
+            Up-to-date entry, or None if the file must be imported.
+        """
+        if entry is None:
+            return None
+        try:
+            if entry["class_name"] is not None:
+                _metadata_from_dict(entry["metadata"])  # stale or malformed entries rescan
+            signature = _file_signature(plugin_file, with_hash=False)
+            if entry["mtime_ns"] == signature["mtime_ns"] and entry["size"] == signature["size"]:
+                return entry
+            if _file_signature(plugin_file, with_hash=True)["sha256"] != entry["sha256"]:
+                return None
+        except (KeyError, TypeError, ValueError):
+            return None
+        return {**entry, **signature}
+
+    def _read_manifest(self) -> dict[str, dict[str, Any]]:
+        """Read the discovery manifest.
+
+        Returns:
+            Manifest entries keyed by resolved file path; empty if there is no
+            usable manifest.
+        """
+        if self.manifest_path is None or not self.manifest_path.exists():
+            return {}
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable plugin manifest %s: %s", self.manifest_path, e)
+            return {}
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return {}
+        plugins = data.get("plugins")
+        return plugins if isinstance(plugins, dict) else {}
+
+    def _write_manifest(self, entries: dict[str, dict[str, Any]]) -> None:
+        """Atomically write the discovery manifest.
+
+        Args:
+            entries: Manifest entries keyed by resolved file path.
+        """
+        if self.manifest_path is None:
+            return
+        tmp_path = self.manifest_path.with_suffix(self.manifest_path.suffix + ".tmp")
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": MANIFEST_VERSION, "plugins": entries}, f, indent=1)
+            os.replace(tmp_path, self.manifest_path)
+        except OSError as e:
+            logger.warning("Failed to write plugin manifest %s: %s", self.manifest_path, e)
+
+    def _get_plugin_class(self, plugin_name: str) -> type[IPlugin]:
+        """Get a plugin class, importing its module on first use.
+
+        Args:
+            plugin_name: Name of the plugin.
+
+        Returns:
+            Plugin class.
+
+        Raises:
+            PluginLoadError: If the plugin is unknown or its class cannot be imported.
+        """
+        plugin_class = self.plugin_classes.get(plugin_name)
+        if plugin_class is not None:
+            return plugin_class
+
+        source = self._plugin_sources.get(plugin_name)
+        if source is None:
+            raise PluginLoadError(f"Plugin not found: {plugin_name}")
+
+        plugin_file, class_name = source
+        try:
+            module = _import_plugin_module(plugin_file)
+            item = getattr(module, class_name, None)
+        except Exception as e:
+            raise PluginLoadError(f"Failed to import plugin {plugin_name}: {e}") from e
+        if not (isinstance(item, type) and issubclass(item, IPlugin)):
+            raise PluginLoadError(f"Plugin class {class_name} not found in {plugin_file}")
+
+        self.plugin_classes[plugin_name] = item
+        return item
+
     def load_plugin(self, plugin_name: str, context: PluginContext) -> IPlugin:
         """Load and initialize a plugin.
 
@@ -157,14 +375,13 @@ class PluginLoader:
         if plugin_name in self.loaded_plugins:
             return self.loaded_plugins[plugin_name].plugin
 
-        # Check if plugin is known
-        if plugin_name not in self.plugin_classes:
-            raise PluginLoadError(f"Plugin not found: {plugin_name}")
+        # Get the plugin class (imports the module on first use)
+        plugin_class = self._get_plugin_class(plugin_name)
 
         # Get metadata
-        plugin_class = self.plugin_classes[plugin_name]
-        temp_instance = plugin_class()
-        metadata = temp_instance.get_metadata()
+        metadata = self._metadata_cache.get(plugin_name)
+        if metadata is None:
+            metadata = plugin_class().get_metadata()
 
         # Load dependencies first
         for dep_name in metadata.dependencies:
@@ -314,6 +531,33 @@ class PluginLoader:
         # Reverse to get dependencies-first order
         return list(reversed(result))
 
+    def resolve_stages(self, plugin_names: list[str]) -> list[list[str]]:
+        """Group plugins into stages that can be updated concurrently.
+
+        Every plugin's dependencies are in earlier stages (see
+        dependency_stages()). Concatenating the stages gives a valid load order.
+
+        Args:
+            plugin_names: List of plugin names to resolve.
+
+        Returns:
+            Stages in execution order, each a list of plugin names.
+
+        Raises:
+            DependencyError: If metadata is missing or dependencies are circular.
+
+        Examples:
+            >>> loader.resolve_stages(["engine", "fuel", "electrical"])
+            [['fuel', 'electrical'], ['engine']]
+        """
+        graph: dict[str, list[str]] = {}
+        for name in plugin_names:
+            metadata = self._metadata_cache.get(name)
+            if metadata is None:
+                raise DependencyError(f"Plugin metadata not found: {name}")
+            graph[name] = list(metadata.dependencies)
+        return dependency_stages(graph)
+
     def get_plugin(self, plugin_name: str) -> IPlugin | None:
         """Get a loaded plugin by name.
 
@@ -361,3 +605,64 @@ class PluginLoader:
         """
         self.unload_plugin(plugin_name)
         return self.load_plugin(plugin_name, context)
+
+
+def _import_plugin_module(plugin_file: Path) -> Any:
+    """Import a plugin file as a standalone module.
+
+    Args:
+        plugin_file: Path to the plugin Python file.
+
+    Returns:
+        The executed module, or None if no loader is available for the file.
+    """
+    spec = importlib.util.spec_from_file_location(f"plugin_{plugin_file.stem}", plugin_file)
+    if spec is None or spec.loader is None:
+        return None
+
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _file_signature(plugin_file: Path, with_hash: bool) -> dict[str, Any]:
+    """Describe a file's current contents for manifest validation.
+
+    Args:
+        plugin_file: File to describe.
+        with_hash: Whether to include the SHA-256 of the contents.
+
+    Returns:
+        Dictionary with mtime_ns and size (and sha256 if requested).
+    """
+    stat = plugin_file.stat()
+    signature: dict[str, Any] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+    if with_hash:
+        signature["sha256"] = hashlib.sha256(plugin_file.read_bytes()).hexdigest()
+    return signature
+
+
+def _metadata_to_dict(metadata: PluginMetadata) -> dict[str, Any]:
+    """Convert plugin metadata to JSON-serializable form.
+
+    Args:
+        metadata: Plugin metadata.
+
+    Returns:
+        Dictionary of metadata fields, with the plugin type as its value.
+    """
+    data = dataclasses.asdict(metadata)
+    data["plugin_type"] = metadata.plugin_type.value
+    return data
+
+
+def _metadata_from_dict(data: dict[str, Any]) -> PluginMetadata:
+    """Rebuild plugin metadata from a manifest entry.
+
+    Args:
+        data: Dictionary produced by _metadata_to_dict().
+
+    Returns:
+        Plugin metadata.
+    """
+    return PluginMetadata(**{**data, "plugin_type": PluginType(data["plugin_type"])})
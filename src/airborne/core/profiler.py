@@ -0,0 +1,204 @@
+"""Frame profiler with rolling percentiles and Chrome trace export.
+
+Times named sections of each frame (plugin updates, message processing,
+rendering, display update) and keeps rolling p50/p95/max per section. Every
+timed section is also recorded as a complete ("X") trace event, so a run can
+be inspected in chrome://tracing or https://ui.perfetto.dev.
+
+The profiler is opt-in. A disabled profiler hands out a shared no-op context
+manager, so instrumented call sites cost a single attribute check.
+
+Typical usage example:
+    from airborne.core.profiler import FrameProfiler
+
+    profiler = FrameProfiler(enabled=True)
+    while running:
+        profiler.begin_frame()
+        with profiler.section("physics", "plugin"):
+            physics.update(dt)
+        profiler.end_frame()
+
+    profiler.log_summary()
+    profiler.write_trace("trace.json")
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
+from typing import Any
+
+from airborne.core.bus_metrics import LatencyHistogram
+from airborne.core.logging_system import get_logger
+
+logger = get_logger(__name__)
+
+_NULL_SECTION: AbstractContextManager[None] = nullcontext()
+
+# Trace events kept in memory (oldest are discarded first)
+_DEFAULT_MAX_EVENTS = 500_000
+
+
+class _Section:
+    """Context manager timing one section."""
+
+    __slots__ = ("_profiler", "_name", "_category", "_start")
+
+    def __init__(self, profiler: "FrameProfiler", name: str, category: str) -> None:
+        self._profiler = profiler
+        self._name = name
+        self._category = category
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc: object) -> None:
+        self._profiler.record(self._name, self._start, time.perf_counter(), self._category)
+
+
+class FrameProfiler:
+    """Per-section frame profiler.
+
+    Examples:
+        >>> profiler = FrameProfiler()
+        >>> with profiler.section("render"):
+        ...     draw()
+        >>> profiler.stats["render"].count
+        1
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        max_events: int = _DEFAULT_MAX_EVENTS,
+        sample_size: int = 1024,
+    ) -> None:
+        """Initialize the profiler.
+
+        Args:
+            enabled: Whether sections are timed at all.
+            max_events: Trace events kept in memory for export.
+            sample_size: Samples kept per section for rolling percentiles.
+        """
+        self.enabled = enabled
+        self.stats: dict[str, LatencyHistogram] = {}
+        self.frame_count = 0
+        self._sample_size = sample_size
+        self._events: deque[tuple[str, str, float, float, int]] = deque(maxlen=max_events)
+        self._origin = time.perf_counter()
+        self._frame_start: float | None = None
+
+    def section(self, name: str, category: str = "frame") -> AbstractContextManager[None]:
+        """Time a block of code.
+
+        Args:
+            name: Section name (e.g., "physics", "message_queue.process").
+            category: Trace category (e.g., "plugin", "render").
+
+        Returns:
+            Context manager timing the block, or a no-op when disabled.
+        """
+        if not self.enabled:
+            return _NULL_SECTION
+        return _Section(self, name, category)
+
+    def record(self, name: str, start: float, end: float, category: str = "frame") -> None:
+        """Record a timed section.
+
+        Args:
+            name: Section name.
+            start: Start time from time.perf_counter().
+            end: End time from time.perf_counter().
+            category: Trace category.
+        """
+        hist = self.stats.get(name)
+        if hist is None:
+            hist = self.stats[name] = LatencyHistogram(self._sample_size)
+        hist.record(end - start)
+        self._events.append((name, category, start, end, threading.get_ident()))
+
+    def begin_frame(self) -> None:
+        """Mark the start of a frame."""
+        if self.enabled:
+            self._frame_start = time.perf_counter()
+
+    def end_frame(self) -> None:
+        """Mark the end of a frame and record its total duration."""
+        if self._frame_start is None:
+            return
+        self.record("frame", self._frame_start, time.perf_counter(), "frame")
+        self._frame_start = None
+        self.frame_count += 1
+
+    def summary(self) -> list[dict[str, Any]]:
+        """Summarize every section.
+
+        Returns:
+            One row per section with count and p50/p95/max in milliseconds,
+            sorted by total time spent, largest first.
+        """
+        rows: list[dict[str, Any]] = [
+            {"section": name, **hist.to_dict()} for name, hist in self.stats.items()
+        ]
+        rows.sort(key=lambda row: row["total_ms"], reverse=True)
+        return rows
+
+    def log_summary(self, top: int = 15) -> None:
+        """Log the most expensive sections at INFO level.
+
+        Args:
+            top: Number of sections to include.
+        """
+        logger.info("Frame profile over %d frames:", self.frame_count)
+        for row in self.summary()[:top]:
+            logger.info(
+                "  %-32s n=%-7d p50=%.3fms p95=%.3fms max=%.3fms",
+                row["section"],
+                row["count"],
+                row["p50_ms"],
+                row["p95_ms"],
+                row["max_ms"],
+            )
+
+    def to_trace(self) -> dict[str, Any]:
+        """Build a Chrome trace (Trace Event Format) document.
+
+        Returns:
+            Dictionary with a "traceEvents" list of complete events.
+        """
+        pid = os.getpid()
+        origin = self._origin
+        events = [
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - origin) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": pid,
+                "tid": tid,
+            }
+            for name, category, start, end, tid in self._events
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_trace(self, path: str | Path) -> None:
+        """Write recorded sections as a Chrome/Perfetto trace file.
+
+        Args:
+            path: Output file path (conventionally trace.json).
+        """
+        Path(path).write_text(json.dumps(self.to_trace()), encoding="utf-8")
+        logger.info("Wrote %d trace events to %s", len(self._events), path)
+
+    def reset(self) -> None:
+        """Discard all statistics and trace events."""
+        self.stats.clear()
+        self._events.clear()
+        self.frame_count = 0
+        self._origin = time.perf_counter()
+        self._frame_start = None
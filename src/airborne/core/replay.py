@@ -0,0 +1,303 @@
+"""Deterministic record and replay of simulation inputs.
+
+A run depends on live keyboard and joystick timing. To turn a real flight into
+a repeatable benchmark, JournalWriter records everything that enters the
+simulation from outside during each frame:
+
+- the frame delta time fed to the fixed-step clock,
+- the InputState after input handling,
+- every message published to the queue while input was being handled.
+
+It also stores the seed of the ``random`` module and a CRC32 of the physics
+state after each frame. JournalReader streams the frames back so a headless
+run can feed them to the same update path, skipping live input, and report
+the first frame whose physics state differs from the recording.
+
+Journal layout (little-endian):
+    header:  magic "ABRJ", u16 version, f64 physics rate (Hz), u32 seed
+    message: b"M", u32 length, pickled (sender, recipients, topic, data, priority)
+    frame:   b"F", f64 frame dt, 7 x f64 controls, u32 physics state CRC32
+
+The message records of a frame precede its frame record. Paths ending in
+".gz" are gzip-compressed.
+
+Typical usage example:
+    from airborne.core.replay import JournalReader, JournalWriter
+
+    with JournalWriter("flight.abrj", physics_hz=120, seed=seed) as journal:
+        queue.set_publish_tap(journal.write_message)
+        handle_input()
+        queue.set_publish_tap(None)
+        update(dt)
+        journal.write_frame(dt, input_manager.state, state_checksum(snapshot))
+
+    with JournalReader("flight.abrj") as journal:
+        for frame in journal:
+            ...
+"""
+
+import gzip
+import pickle
+import struct
+import zlib
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any
+
+from airborne.core.input import InputState
+from airborne.core.logging_system import get_logger
+from airborne.core.messaging import Message, MessagePriority
+
+logger = get_logger(__name__)
+
+JOURNAL_MAGIC = b"ABRJ"
+JOURNAL_VERSION = 1
+
+_HEADER = struct.Struct("<4sHdI")
+_LENGTH = struct.Struct("<I")
+_FRAME = struct.Struct("<8dI")
+_TAG_MESSAGE = b"M"
+_TAG_FRAME = b"F"
+
+# InputState fields stored per frame, in journal order
+CONTROL_FIELDS = ("pitch", "roll", "yaw", "throttle", "brakes", "flaps", "gear")
+
+
+class JournalError(Exception):
+    """Raised when a journal file is malformed or of an unsupported version."""
+
+
+def state_checksum(state: Any) -> int:
+    """Checksum a physics state for divergence detection.
+
+    Args:
+        state: AircraftStateSnapshot (anything with a numpy ``array``).
+
+    Returns:
+        CRC32 of the raw state bytes.
+    """
+    return zlib.crc32(state.array.tobytes())
+
+
+def _open(path: Path, mode: str) -> IO[bytes]:
+    if path.suffix == ".gz":
+        return gzip.open(path, mode)  # type: ignore[return-value]
+    return open(path, mode)  # noqa: SIM115
+
+
+@dataclass
+class RecordedMessage:
+    """A message captured at publish time.
+
+    Attributes:
+        sender: Name of the sending component.
+        recipients: Recipient names.
+        topic: Message topic.
+        data: Message payload.
+        priority: Message priority.
+    """
+
+    sender: str
+    recipients: list[str]
+    topic: str
+    data: dict[str, Any]
+    priority: MessagePriority
+
+    def to_message(self) -> Message:
+        """Create a fresh message with the recorded contents.
+
+        Returns:
+            Message ready to publish.
+        """
+        return Message(
+            sender=self.sender,
+            recipients=list(self.recipients),
+            topic=self.topic,
+            data=dict(self.data),
+            priority=self.priority,
+        )
+
+
+@dataclass
+class JournalFrame:
+    """Everything recorded for one frame.
+
+    Attributes:
+        dt: Frame delta time in seconds.
+        controls: InputState values in CONTROL_FIELDS order.
+        state_crc: Physics state checksum after the frame (see state_checksum()).
+        messages: Messages published during input handling.
+    """
+
+    dt: float
+    controls: tuple[float, ...]
+    state_crc: int
+    messages: list[RecordedMessage] = field(default_factory=list)
+
+    def apply_controls(self, state: InputState) -> None:
+        """Overwrite an input state with the recorded controls.
+
+        Args:
+            state: Input state to update in place.
+        """
+        for name, value in zip(CONTROL_FIELDS, self.controls, strict=True):
+            setattr(state, name, value)
+
+
+class JournalWriter:
+    """Writes a replay journal.
+
+    Examples:
+        >>> with JournalWriter("run.abrj", physics_hz=120.0, seed=42) as journal:
+        ...     journal.write_frame(1 / 60, InputState(), 0)
+    """
+
+    def __init__(self, path: str | Path, physics_hz: float, seed: int) -> None:
+        """Create the journal and write its header.
+
+        Args:
+            path: Output path (".gz" suffix enables compression).
+            physics_hz: Fixed simulation step rate of the recorded run.
+            seed: Seed the ``random`` module was initialized with.
+        """
+        self.path = Path(path)
+        self.frames = 0
+        self.messages = 0
+        self._file = _open(self.path, "wb")
+        self._file.write(_HEADER.pack(JOURNAL_MAGIC, JOURNAL_VERSION, physics_hz, seed))
+
+    def write_message(self, message: Message) -> None:
+        """Record a published message.
+
+        Suitable as a MessageQueue publish tap. Messages whose payload cannot
+        be pickled are skipped with a warning.
+
+        Args:
+            message: Message being published.
+        """
+        try:
+            payload = pickle.dumps(
+                (
+                    message.sender,
+                    list(message.recipients),
+                    message.topic,
+                    dict(message.data),
+                    message.priority,
+                ),
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.warning("Not recording message on %s: %s", message.topic, e)
+            return
+        self._file.write(_TAG_MESSAGE + _LENGTH.pack(len(payload)) + payload)
+        self.messages += 1
+
+    def write_frame(self, dt: float, state: InputState, state_crc: int) -> None:
+        """Close the current frame.
+
+        Args:
+            dt: Frame delta time in seconds.
+            state: Input state used for the frame.
+            state_crc: Physics state checksum after the frame.
+        """
+        controls = [getattr(state, name) for name in CONTROL_FIELDS]
+        self._file.write(_TAG_FRAME + _FRAME.pack(dt, *controls, state_crc))
+        self.frames += 1
+
+    def close(self) -> None:
+        """Flush and close the journal."""
+        if not self._file.closed:
+            self._file.close()
+            logger.info(
+                "Recorded %d frames and %d messages to %s", self.frames, self.messages, self.path
+            )
+
+    def __enter__(self) -> "JournalWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class JournalReader:
+    """Reads a replay journal frame by frame.
+
+    Examples:
+        >>> with JournalReader("run.abrj") as journal:
+        ...     total = sum(frame.dt for frame in journal)
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Open a journal and read its header.
+
+        Args:
+            path: Journal path (".gz" suffix for compressed journals).
+
+        Raises:
+            JournalError: If the file is not a journal or has an unsupported version.
+        """
+        self.path = Path(path)
+        self._file = _open(self.path, "rb")
+        header = self._file.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            self._file.close()
+            raise JournalError(f"Truncated journal header: {self.path}")
+        magic, version, self.physics_hz, self.seed = _HEADER.unpack(header)
+        if magic != JOURNAL_MAGIC:
+            self._file.close()
+            raise JournalError(f"Not a replay journal: {self.path}")
+        if version != JOURNAL_VERSION:
+            self._file.close()
+            raise JournalError(f"Unsupported journal version {version}: {self.path}")
+
+    def _read(self, size: int) -> bytes:
+        data = self._file.read(size)
+        if len(data) < size:
+            raise JournalError(f"Truncated journal: {self.path}")
+        return data
+
+    def __iter__(self) -> Iterator[JournalFrame]:
+        """Iterate over the recorded frames.
+
+        Yields:
+            One JournalFrame per recorded frame, in order.
+
+        Raises:
+            JournalError: If a record is malformed.
+        """
+        messages: list[RecordedMessage] = []
+        while tag := self._file.read(1):
+            if tag == _TAG_MESSAGE:
+                (length,) = _LENGTH.unpack(self._read(_LENGTH.size))
+                sender, recipients, topic, data, priority = pickle.loads(self._read(length))
+                messages.append(
+                    RecordedMessage(sender, recipients, topic, data, MessagePriority(priority))
+                )
+            elif tag == _TAG_FRAME:
+                dt, *controls, state_crc = _FRAME.unpack(self._read(_FRAME.size))
+                yield JournalFrame(dt, tuple(controls), state_crc, messages)
+                messages = []
+            else:
+                raise JournalError(f"Unknown record {tag!r} in {self.path}")
+
+    def close(self) -> None:
+        """Close the journal."""
+        self._file.close()
+
+    def __enter__(self) -> "JournalReader":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
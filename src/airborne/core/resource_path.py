@@ -10,6 +10,8 @@ Typical usage:
     plugin_dir = get_plugin_dir()
 """
 
+import os
+import platform
 import sys
 from pathlib import Path
 
@@ -175,3 +177,31 @@ def get_lib_path(lib_file: str) -> Path:
         '/private/var/.../Contents/Frameworks/lib/fmod/libfmod.dylib'  # From bundle
     """
     return get_resource_path(f"lib/{lib_file}")
+
+
+def get_cache_dir() -> Path:
+    """Get the directory for derived, rebuildable caches.
+
+    The AIRBORNE_CACHE_DIR environment variable overrides the default.
+
+    Returns:
+        Path to the platform-appropriate cache directory (not created):
+        - macOS: ~/Library/Caches/AirBorne
+        - Linux: ~/.airborne/cache
+        - Windows: %LocalAppData%/AirBorne/Cache
+
+    Examples:
+        >>> str(get_cache_dir() / "plugin_manifest.json")
+        '/Users/user/Library/Caches/AirBorne/plugin_manifest.json'
+    """
+    override = os.environ.get("AIRBORNE_CACHE_DIR")
+    if override:
+        return Path(override)
+
+    system = platform.system()
+    if system == "Darwin":
+        return Path.home() / "Library" / "Caches" / "AirBorne"
+    if system == "Windows":
+        local = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
+        return local / "AirBorne" / "Cache"
+    return Path.home() / ".airborne" / "cache"
@@ -7,10 +7,18 @@ Typical usage:
     uv run python -m airborne.main
     uv run python -m airborne.main --from-airport KPAO
     uv run python -m airborne.main --from-airport KPAO --to-airport KSFO
+    uv run python -m airborne.main --headless --end-altitude 3000 --summary run.json
+    uv run python -m airborne.main --spawn-altitude 3000 --spawn-airspeed 95
+    uv run python -m airborne.main --record flight.abrj
+    uv run python -m airborne.main --replay flight.abrj --profile
 """
 
 import argparse
+import json
+import os
+import random
 import sys
+import time
 from typing import TYPE_CHECKING
 
 import pygame
@@ -20,8 +28,11 @@ from airborne.adapters import (
     ControlPanelInputHandler,
     MenuInputHandler,
 )
+from airborne.core.blackboard import StateBlackboard
+from airborne.core.bus_metrics import BusMetrics, BusMetricsReporter
+from airborne.core.config import ConfigLoader
 from airborne.core.event_bus import EventBus
-from airborne.core.game_loop import GameLoop  # noqa: F401
+from airborne.core.game_loop import FixedTimestep, GameLoop  # noqa: F401
 from airborne.core.input import InputActionEvent, InputManager, InputStateEvent  # noqa: F401
 from airborne.core.input_config import InputConfig
 from airborne.core.input_event import InputEvent
@@ -30,17 +41,23 @@ from airborne.core.logging_system import get_logger, initialize_logging
 from airborne.core.messaging import Message, MessagePriority, MessageQueue, MessageTopic
 from airborne.core.plugin import PluginContext
 from airborne.core.plugin_loader import PluginLoader
+from airborne.core.profiler import FrameProfiler
 from airborne.core.registry import ComponentRegistry
+from airborne.core.replay import JournalFrame, JournalReader, JournalWriter, state_checksum
 from airborne.core.resource_path import (
+    get_cache_dir,
     get_config_path,
     get_data_path,
     get_plugin_dir,
 )
+from airborne.physics.state_snapshot import AircraftStateSnapshot
+from airborne.ui.text_renderer import DirtyTextRenderer
 
 if TYPE_CHECKING:
     from airborne.aircraft.aircraft import Aircraft
     from airborne.plugins.audio.audio_plugin import AudioPlugin
     from airborne.plugins.core.physics_plugin import PhysicsPlugin
+    from airborne.scenario import ScenarioRunStats
 
 logger = get_logger(__name__)
 
@@ -60,6 +77,12 @@ class AirBorne:
         # Store CLI arguments
         self.args = args or argparse.Namespace(from_airport=None, to_airport=None, callsign=None)
 
+        # Cache parsed YAML configs between launches
+        ConfigLoader.enable_cache(
+            get_cache_dir() / "config",
+            rebuild=bool(getattr(self.args, "rebuild_config_cache", False)),
+        )
+
         # Initialize logging first (use platform-specific directories)
         logging_config = get_config_path("logging.yaml")
         if logging_config.exists():
@@ -69,19 +92,67 @@ class AirBorne:
             initialize_logging(use_platform_dir=True)
         logger.info("AirBorne starting up...")
 
+        # Replay journal (a replay always runs headless)
+        self.journal_reader: JournalReader | None = None
+        self.journal_writer: JournalWriter | None = None
+        replay_path = getattr(self.args, "replay", None)
+        record_path = getattr(self.args, "record", None)
+        if replay_path:
+            self.journal_reader = JournalReader(replay_path)
+            self.random_seed = self.journal_reader.seed
+            logger.info("Replaying %s (seed %d)", replay_path, self.random_seed)
+        else:
+            self.random_seed = time.time_ns() & 0xFFFFFFFF
+        if replay_path or record_path:
+            random.seed(self.random_seed)
+
+        # Headless runs have no window and no audio device
+        self.headless = bool(getattr(self.args, "headless", False) or self.journal_reader)
+        if self.headless:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
         # Initialize Pygame
         pygame.init()
-        pygame.display.set_caption("AirBorne - Flight Simulator")
 
-        # Create window
-        self.screen = pygame.display.set_mode((800, 600), pygame.RESIZABLE)
+        # Create window (headless runs never render, so an off-screen surface will do)
+        if self.headless:
+            self.screen = pygame.Surface((800, 600))
+        else:
+            pygame.display.set_caption("AirBorne - Flight Simulator")
+            self.screen = pygame.display.set_mode((800, 600), pygame.RESIZABLE)
         self.clock = pygame.time.Clock()
         self.running = True
 
-        # Initialize core systems
-        self.event_bus = EventBus()
-        self.message_queue = MessageQueue()
+        # Frame profiler (no-op unless --profile is given)
+        self.profile_trace_path: str | None = getattr(self.args, "profile", None)
+        self.profiler = FrameProfiler(enabled=bool(self.profile_trace_path))
+
+        # Parallel system stages publish from worker threads. Journals need a
+        # reproducible message order, so recording and replaying stay serial.
+        self.plugin_workers = max(0, getattr(self.args, "plugin_workers", 0) or 0)
+        if self.plugin_workers > 1 and (replay_path or record_path):
+            logger.info("Recording or replaying: updating aircraft systems serially")
+            self.plugin_workers = 0
+        thread_safe_queue = self.plugin_workers > 1
+
+        # Initialize core systems (optionally instrumented)
+        self.bus_metrics_reporter: BusMetricsReporter | None = None
+        bus_metrics_path = getattr(self.args, "bus_metrics", None)
+        if bus_metrics_path:
+            event_metrics = BusMetrics("event_bus")
+            queue_metrics = BusMetrics("message_queue")
+            self.bus_metrics_reporter = BusMetricsReporter(
+                [event_metrics, queue_metrics], interval=10.0, json_path=bus_metrics_path
+            )
+            self.event_bus = EventBus(metrics=event_metrics)
+            self.message_queue = MessageQueue(thread_safe=thread_safe_queue, metrics=queue_metrics)
+            logger.info("Bus metrics enabled, writing %s", bus_metrics_path)
+        else:
+            self.event_bus = EventBus()
+            self.message_queue = MessageQueue(thread_safe=thread_safe_queue)
         self.registry = ComponentRegistry()
+        self.blackboard = StateBlackboard()
 
         # Initialize input system (will be updated with aircraft config after loading)
         self.input_manager = InputManager(self.event_bus, message_queue=self.message_queue)
@@ -93,13 +164,18 @@ class AirBorne:
         logger.info("Input handler system initialized")
 
         # Plugin system
-        self.plugin_loader = PluginLoader([str(get_plugin_dir())])
+        self.plugin_loader = PluginLoader(
+            [str(get_plugin_dir())], manifest_path=get_cache_dir() / "plugin_manifest.json"
+        )
         self.plugin_context = PluginContext(
             event_bus=self.event_bus,
             message_queue=self.message_queue,
             config={},  # Will be populated by plugins
             plugin_registry=self.registry,
+            blackboard=self.blackboard,
         )
+        if self.headless:
+            self.plugin_context.config["audio"] = {"engine": "null"}
 
         # Core plugins
         self.physics_plugin: PhysicsPlugin | None = None
@@ -111,7 +187,18 @@ class AirBorne:
         # Initialize navigation and scenario systems
         self._initialize_navigation_systems()
 
-        # Load plugins and aircraft
+        # Fixed-step simulation, decoupled from the (capped) render rate
+        self.render_hz: int = getattr(self.args, "render_hz", None) or 60
+        if self.journal_reader:
+            physics_hz = self.journal_reader.physics_hz
+        else:
+            physics_hz = getattr(self.args, "physics_hz", None) or 120
+        self.physics_step = FixedTimestep(physics_hz)
+        logger.info(
+            "Simulation at %.0f Hz, rendering at %d Hz", self.physics_step.rate_hz, self.render_hz
+        )
+
+        # Load plugins and aircraft (physics needs the step rate)
         self._initialize_plugins()
 
         # Subscribe to quit events
@@ -121,6 +208,10 @@ class AirBorne:
         self.font = pygame.font.SysFont("monospace", 14)
         self.large_font = pygame.font.SysFont("monospace", 32, bold=True)
 
+        # Status window text: cached surfaces, only changed lines are repainted
+        self.text_renderer = DirtyTextRenderer(background=(0, 0, 0))
+        self._dirty_rects: list[pygame.Rect] = []
+
         # Game state
         self.paused = False
         self.show_debug = True
@@ -129,6 +220,17 @@ class AirBorne:
         self.frame_times: list[float] = []
         self.max_frame_samples = 60
 
+        # Physics state before the latest step and the blend shown on screen
+        self._previous_state = AircraftStateSnapshot()
+        self._render_state = AircraftStateSnapshot()
+        self._rewinds_seen = 0  # PhysicsPlugin.rewind_count at the last blend
+
+        if record_path and not self.journal_reader:
+            self.journal_writer = JournalWriter(
+                record_path, self.physics_step.rate_hz, self.random_seed
+            )
+            logger.info("Recording inputs to %s (seed %d)", record_path, self.random_seed)
+
         logger.info("AirBorne initialized successfully")
 
         # Send startup announcement via TTS
@@ -151,7 +253,12 @@ class AirBorne:
         """Initialize navigation, aviation, and scenario systems."""
         from airborne.airports.database import AirportDatabase
         from airborne.aviation import CallsignGenerator
-        from airborne.scenario import ScenarioBuilder, SpawnLocation, SpawnManager
+        from airborne.scenario import (
+            ScenarioBuilder,
+            ScenarioEndCondition,
+            SpawnLocation,
+            SpawnManager,
+        )
 
         logger.info("Initializing navigation systems...")
 
@@ -181,14 +288,32 @@ class AirBorne:
             callsign_obj = self.callsign_gen.generate_ga_callsign("N")
             callsign = callsign_obj.full
 
+        # Replays run to the end of the journal unless told otherwise
+        end_time = getattr(self.args, "end_time", None)
+        if end_time is None and not self.journal_reader:
+            end_time = 600.0
+
         # Build scenario
-        self.scenario = (
+        builder = (
             ScenarioBuilder()
             .with_airport(airport_icao)
             .with_spawn_location(SpawnLocation.RAMP)
             .with_callsign(callsign)
-            .build()
+            .with_end_condition(
+                ScenarioEndCondition(
+                    max_sim_time_s=end_time,
+                    altitude_ft=getattr(self.args, "end_altitude", None),
+                    on_landing=bool(getattr(self.args, "end_on_landing", False)),
+                )
+            )
         )
+        spawn_altitude = getattr(self.args, "spawn_altitude", None)
+        if spawn_altitude is not None:
+            builder.with_airborne_spawn(
+                altitude_ft=spawn_altitude,
+                airspeed_kts=getattr(self.args, "spawn_airspeed", None) or 100.0,
+            )
+        self.scenario = builder.build()
 
         logger.info(
             f"Scenario created: {callsign} at {airport_icao} ({self.scenario.spawn_location.value})"
@@ -234,7 +359,8 @@ class AirBorne:
 
             # Update plugin context with flight model config
             self.plugin_context.config["physics"] = {
-                "flight_model": {"type": "simple_6dof", **flight_model_config}
+                "flight_model": {"type": "simple_6dof", **flight_model_config},
+                "physics_hz": self.physics_step.rate_hz,
             }
 
             # Add propeller config if present
@@ -343,6 +469,8 @@ class AirBorne:
             # Build aircraft with systems
             builder = AircraftBuilder(self.plugin_loader, self.plugin_context)
             self.aircraft = builder.build(aircraft_config_path)
+            self.aircraft.profiler = self.profiler
+            self._configure_system_stages(self.aircraft)
 
             logger.info("All plugins and aircraft loaded successfully")
 
@@ -355,6 +483,9 @@ class AirBorne:
                 f"InputManager updated with aircraft config: fixed_gear={self.input_manager.fixed_gear}"
             )
 
+            # Place the aircraft (after the systems, so they see the spawn state)
+            self._apply_spawn(config)
+
             # Initialize input handlers with loaded plugins
             self._initialize_input_handlers()
 
@@ -362,6 +493,37 @@ class AirBorne:
             logger.error("Failed to initialize plugins: %s", e)
             raise
 
+    def _apply_spawn(self, aircraft_config: dict) -> None:
+        """Put the aircraft at the scenario's spawn point.
+
+        Airborne spawns start trimmed, with the input manager holding the
+        trimmed throttle and flaps.
+
+        Args:
+            aircraft_config: Loaded aircraft configuration (for the engine limits).
+
+        Raises:
+            TrimError: If the aircraft cannot hold the airborne spawn conditions.
+        """
+        if not self.spawn_state or not self.physics_plugin:
+            return
+
+        # Engine limits for trimming with a propeller
+        engine: dict = next(
+            (
+                plugin["config"]
+                for plugin in aircraft_config.get("aircraft", {}).get("plugins", [])
+                if "max_power_hp" in plugin.get("config", {})
+            ),
+            {},
+        )
+
+        trim = self.physics_plugin.apply_spawn(
+            self.spawn_state, engine.get("max_power_hp"), engine.get("max_rpm")
+        )
+        if trim is not None:
+            self.input_manager.set_controls(trim.throttle, trim.flaps)
+
     def _initialize_input_handlers(self) -> None:
         """Initialize and register input handlers with priority-based dispatch."""
         logger.info("Registering input handlers...")
@@ -560,31 +722,186 @@ class AirBorne:
 
     def run(self) -> None:
         """Run the main game loop."""
+        if self.headless:
+            self._run_headless()
+            return
+
         logger.info("Starting main game loop")
 
+        profiler = self.profiler
+        journal = self.journal_writer
+
         while self.running:
             # Calculate delta time
-            dt = self.clock.tick(240) / 1000.0  # 240 FPS - Convert ms to seconds
+            dt = self.clock.tick(self.render_hz) / 1000.0  # Convert ms to seconds
             self._track_frametime(dt)
+            profiler.begin_frame()
+
+            # Record messages injected by input handling (attached to the next
+            # simulated frame, so nothing is lost while paused)
+            if journal:
+                self.message_queue.set_publish_tap(journal.write_message)
 
             # Process events
-            self._process_events()
+            with profiler.section("process_events"):
+                self._process_events()
 
             if not self.paused:
                 # Update input
-                self.input_manager.update(dt)
+                with profiler.section("input_manager.update"):
+                    self.input_manager.update(dt)
 
+            if journal:
+                self.message_queue.set_publish_tap(None)
+
+            if not self.paused:
                 # Update game state
                 self._update(dt)
 
+                if journal:
+                    journal.write_frame(dt, self.input_manager.state, self._state_checksum())
+
             # Render
-            self._render()
+            with profiler.section("render", "render"):
+                self._render()
+
+            # Update the changed parts of the display
+            if self._dirty_rects:
+                with profiler.section("display.update", "render"):
+                    pygame.display.update(self._dirty_rects)
+
+            profiler.end_frame()
+
+            if self.bus_metrics_reporter:
+                self.bus_metrics_reporter.tick()
+
+        self._shutdown()
 
-            # Update display
-            pygame.display.flip()
+    def _run_headless(self) -> None:
+        """Run the simulation without display until the scenario ends.
 
+        Each frame advances simulated time by 1/render_hz. With --time-scale 0
+        (the default) frames run back to back as fast as the CPU allows;
+        otherwise the loop sleeps to hold simulated time at N x wall-clock time.
+        """
+        from airborne.scenario import ScenarioEndCondition, ScenarioRunStats
+
+        time_scale: float = getattr(self.args, "time_scale", None) or 0.0
+        condition = self.scenario.end_condition or ScenarioEndCondition()
+        stats = ScenarioRunStats()
+        frame_dt = 1.0 / self.render_hz
+        profiler = self.profiler
+        frames = iter(self.journal_reader) if self.journal_reader else None
+        frame: JournalFrame | None = None
+
+        logger.info(
+            "Starting headless run (time scale: %s, end condition: %s)",
+            f"{time_scale:g}x" if time_scale > 0 else "unlimited",
+            condition,
+        )
+
+        start = time.perf_counter()
+        while self.running:
+            if frames is not None:
+                frame = next(frames, None)
+                if frame is None:
+                    stats.end_reason = "replay_complete"
+                    break
+                frame_dt = frame.dt
+
+            profiler.begin_frame()
+            if frame is not None:
+                with profiler.section("replay.inputs"):
+                    self._apply_journal_frame(frame)
+            else:
+                with profiler.section("input_manager.update"):
+                    self.input_manager.update(frame_dt)
+            self._update(frame_dt)
+            profiler.end_frame()
+
+            stats.advance(frame_dt)
+            if self.physics_plugin:
+                stats.record(self.physics_plugin.state_snapshot)
+
+            if (
+                frame is not None
+                and stats.diverged_frame is None
+                and self._state_checksum() != frame.state_crc
+            ):
+                stats.diverged_frame = stats.frames
+                logger.warning(
+                    "Replay diverged from the recording at frame %d (%.3f s)",
+                    stats.frames,
+                    stats.sim_time_s,
+                )
+
+            reason = condition.check(stats)
+            if reason:
+                stats.end_reason = reason
+                break
+
+            if self.bus_metrics_reporter:
+                self.bus_metrics_reporter.tick()
+
+            if time_scale > 0:
+                ahead = stats.sim_time_s / time_scale - (time.perf_counter() - start)
+                if ahead > 0:
+                    time.sleep(ahead)
+        else:
+            stats.end_reason = "stopped"
+        stats.wall_time_s = time.perf_counter() - start
+
+        self._report_headless_run(stats)
         self._shutdown()
 
+    def _apply_journal_frame(self, frame: JournalFrame) -> None:
+        """Feed one recorded frame's input in place of live input handling.
+
+        Args:
+            frame: Recorded frame.
+        """
+        frame.apply_controls(self.input_manager.state)
+        for message in frame.messages:
+            self.message_queue.publish(message.to_message())
+
+    def _state_checksum(self) -> int:
+        """Checksum the current physics state (see airborne.core.replay).
+
+        Returns:
+            CRC32 of the physics state, or 0 without a physics plugin.
+        """
+        if not self.physics_plugin:
+            return 0
+        return state_checksum(self.physics_plugin.state_snapshot)
+
+    def _report_headless_run(self, stats: "ScenarioRunStats") -> None:
+        """Log, print and optionally save the headless run summary.
+
+        Args:
+            stats: Statistics of the finished run.
+        """
+        summary = stats.to_dict()
+        logger.info(
+            "Headless run ended (%s): %.1f s simulated in %.1f s (%.1fx), "
+            "%d frames, max altitude %.0f ft, max airspeed %.0f kts",
+            stats.end_reason,
+            stats.sim_time_s,
+            stats.wall_time_s,
+            stats.time_scale,
+            stats.frames,
+            stats.max_altitude_ft,
+            stats.max_airspeed_kts,
+        )
+        print(json.dumps(summary, indent=2))
+
+        summary_path = getattr(self.args, "summary", None)
+        if summary_path:
+            try:
+                with open(summary_path, "w", encoding="utf-8") as f:
+                    json.dump(summary, f, indent=2)
+            except OSError as e:
+                logger.warning("Failed to write run summary: %s", e)
+
     def _process_events(self) -> None:
         """Process pygame events using new input handler system."""
         events = pygame.event.get()
@@ -598,6 +915,10 @@ class AirBorne:
                 self.screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
                 logger.debug("Window resized to %dx%d", event.w, event.h)
                 remaining_events.append(event)
+            elif event.type == pygame.WINDOWEXPOSED:
+                # Parts of the window were uncovered: repaint all of it
+                self.text_renderer.invalidate()
+                remaining_events.append(event)
             elif event.type == pygame.KEYDOWN:
                 # Convert pygame event to InputEvent
                 input_event = InputEvent.from_keyboard(key=event.key, mods=pygame.key.get_mods())
@@ -614,37 +935,109 @@ class AirBorne:
         # Pass remaining events to input manager
         self.input_manager.process_events(remaining_events)
 
+    def _configure_system_stages(self, aircraft: "Aircraft") -> None:
+        """Apply --plugin-workers and --race-check to the aircraft systems.
+
+        Args:
+            aircraft: Aircraft whose system scheduler is configured.
+        """
+        scheduler = aircraft.scheduler
+        scheduler.set_max_workers(self.plugin_workers)
+        if getattr(self.args, "race_check", False):
+            scheduler.enable_race_check(self.blackboard)
+        if scheduler.max_workers or getattr(self.args, "race_check", False):
+            for index, stage in enumerate(scheduler.stages):
+                logger.info("System stage %d: %s", index, ", ".join(e.name for e in stage))
+
     def _update(self, dt: float) -> None:
-        """Update game state.
+        """Update game state for one rendered frame.
+
+        Runs as many fixed simulation steps as the elapsed time calls for,
+        then updates the frame-rate systems (audio, radio) once.
 
         Args:
-            dt: Delta time in seconds.
+            dt: Frame delta time in seconds.
+        """
+        profiler = self.profiler
+
+        for _ in range(self.physics_step.advance(dt)):
+            self._remember_previous_state()
+            self._step_simulation(self.physics_step.step_dt)
+
+        # Update audio plugin
+        if self.audio_plugin:
+            with profiler.section("plugin.audio", "plugin"):
+                self.audio_plugin.update(dt)
+
+        # Update radio plugin
+        if hasattr(self, "radio_plugin") and self.radio_plugin:
+            with profiler.section("plugin.radio", "plugin"):
+                self.radio_plugin.update(dt)
+
+        # Deliver messages published by the frame-rate systems
+        with profiler.section("message_queue.process", "messaging"):
+            self.message_queue.process()
+
+    def _step_simulation(self, dt: float) -> None:
+        """Advance physics and aircraft systems by one fixed step.
+
+        Args:
+            dt: Fixed step in seconds.
         """
+        profiler = self.profiler
+
         # Send control inputs to physics
         self._send_control_inputs()
 
         # Update physics plugin
         if self.physics_plugin:
-            self.physics_plugin.update(dt)
+            with profiler.section("plugin.physics", "plugin"):
+                self.physics_plugin.update(dt)
 
-        # Update aircraft systems
+        # Update aircraft systems (each system is timed by the aircraft)
         if self.aircraft:
             self.aircraft.update(dt)
 
         # Update autopilot
         if hasattr(self, "autopilot_plugin") and self.autopilot_plugin:
-            self.autopilot_plugin.update(dt)
+            with profiler.section("plugin.autopilot", "plugin"):
+                self.autopilot_plugin.update(dt)
 
-        # Update audio plugin
-        if self.audio_plugin:
-            self.audio_plugin.update(dt)
+        # Process message queue
+        with profiler.section("message_queue.process", "messaging"):
+            self.message_queue.process()
 
-        # Update radio plugin
-        if hasattr(self, "radio_plugin") and self.radio_plugin:
-            self.radio_plugin.update(dt)
+    def _remember_previous_state(self) -> None:
+        """Keep the physics state from before the next step for interpolation."""
+        if not self.physics_plugin:
+            return
+        current = self.physics_plugin.state_snapshot
+        self._previous_state.array[:] = current.array
+        self._previous_state.sequence = current.sequence
 
-        # Process message queue
-        self.message_queue.process()
+    def _interpolated_state(self) -> AircraftStateSnapshot | None:
+        """Get the physics state to display, blended between the last two steps.
+
+        Returns:
+            Interpolated snapshot, or None before the first physics step.
+        """
+        if not self.physics_plugin:
+            return None
+        current = self.physics_plugin.state_snapshot
+        if current.sequence == 0:
+            return None
+        if self._previous_state.sequence == 0:
+            return current
+        if self._rewinds_seen != self.physics_plugin.rewind_count:
+            # The state jumped back; blending across the jump would sweep the
+            # aircraft through positions it never had
+            self._rewinds_seen = self.physics_plugin.rewind_count
+            self._remember_previous_state()
+            self._render_state.array[:] = current.array
+            self._render_state.sequence = current.sequence
+            return current
+        self._render_state.interpolate(self._previous_state, current, self.physics_step.alpha)
+        return self._render_state
 
     def _send_control_inputs(self) -> None:
         """Send control inputs to physics plugin."""
@@ -654,9 +1047,9 @@ class AirBorne:
         # Get current input state
         state = self.input_manager.get_state()
 
-        # Publish control input message
+        # Publish control input message (pooled: sent every frame)
         self.message_queue.publish(
-            Message(
+            self.message_queue.acquire_message(
                 sender="main",
                 recipients=["physics_plugin"],
                 topic=MessageTopic.CONTROL_INPUT,
@@ -674,51 +1067,69 @@ class AirBorne:
         )
 
     def _render(self) -> None:
-        """Render the current frame."""
-        # Clear screen
-        self.screen.fill((0, 0, 0))
+        """Render the current frame.
+
+        Text goes through the DirtyTextRenderer: a line is only rendered and
+        repainted when its text changed, and the changed areas are kept in
+        _dirty_rects for pygame.display.update().
+        """
+        text = self.text_renderer
+        text.begin_frame(self.screen)
 
         # Draw title
-        title_text = self.large_font.render("AirBorne", True, (255, 255, 255))
-        title_rect = title_text.get_rect(center=(self.screen.get_width() // 2, 50))
-        self.screen.blit(title_text, title_rect)
+        center_x = self.screen.get_width() // 2
+        text.draw("title", self.large_font, "AirBorne", (255, 255, 255), center=(center_x, 50))
 
         # Draw subtitle
-        subtitle = self.font.render("Blind-Accessible Flight Simulator", True, (200, 200, 200))
-        subtitle_rect = subtitle.get_rect(center=(self.screen.get_width() // 2, 80))
-        self.screen.blit(subtitle, subtitle_rect)
+        text.draw(
+            "subtitle",
+            self.font,
+            "Blind-Accessible Flight Simulator",
+            (200, 200, 200),
+            center=(center_x, 80),
+        )
+
+        # Physics state blended between the last two fixed steps
+        flight_state = self._interpolated_state()
 
         # Draw flight instruments (central display)
-        self._render_flight_instruments()
+        self._render_flight_instruments(flight_state)
 
         if self.paused:
             # Draw paused indicator
-            paused_text = self.large_font.render("PAUSED", True, (255, 255, 0))
-            paused_rect = paused_text.get_rect(
-                center=(self.screen.get_width() // 2, self.screen.get_height() // 2)
+            text.draw(
+                "paused",
+                self.large_font,
+                "PAUSED",
+                (255, 255, 0),
+                center=(center_x, self.screen.get_height() // 2),
             )
-            self.screen.blit(paused_text, paused_rect)
 
         # Draw debug info
         if self.show_debug:
-            self._render_debug_info()
+            self._render_debug_info(flight_state)
 
         # Draw instructions
         self._render_instructions()
 
-    def _render_flight_instruments(self) -> None:
-        """Render primary flight instruments in center of screen."""
-        if not self.physics_plugin or not self.physics_plugin.flight_model:
+        self._dirty_rects = text.end_frame()
+
+    def _render_flight_instruments(self, flight_state: AircraftStateSnapshot | None) -> None:
+        """Render primary flight instruments in center of screen.
+
+        Args:
+            flight_state: Interpolated physics state, or None if unavailable.
+        """
+        if flight_state is None:
             return
 
-        flight_state = self.physics_plugin.flight_model.get_state()
         center_x = self.screen.get_width() // 2
         center_y = self.screen.get_height() // 2
 
         # Convert to aviation units
-        airspeed_kts = flight_state.get_airspeed() * 1.94384  # m/s to knots
-        altitude_ft = flight_state.position.y * 3.28084  # meters to feet
-        vertical_speed_fpm = flight_state.velocity.y * 196.85  # m/s to feet per minute
+        airspeed_kts = flight_state.airspeed * 1.94384  # m/s to knots
+        altitude_ft = flight_state.position[1] * 3.28084  # meters to feet
+        vertical_speed_fpm = flight_state.velocity[1] * 196.85  # m/s to feet per minute
 
         # Primary instruments (large, centered)
         instruments = [
@@ -729,10 +1140,14 @@ class AirBorne:
 
         # Render instruments
         y_offset = center_y - 50
-        for instrument in instruments:
-            text = self.large_font.render(instrument, True, (0, 255, 0))
-            text_rect = text.get_rect(center=(center_x, y_offset))
-            self.screen.blit(text, text_rect)
+        for index, instrument in enumerate(instruments):
+            self.text_renderer.draw(
+                f"instrument.{index}",
+                self.large_font,
+                instrument,
+                (0, 255, 0),
+                center=(center_x, y_offset),
+            )
             y_offset += 40
 
         # Control inputs (smaller, below instruments)
@@ -744,27 +1159,36 @@ class AirBorne:
         ]
 
         y_offset += 20
-        for control in controls:
-            text = self.font.render(control, True, (200, 200, 0))
-            text_rect = text.get_rect(center=(center_x, y_offset))
-            self.screen.blit(text, text_rect)
+        for index, control in enumerate(controls):
+            self.text_renderer.draw(
+                f"control.{index}", self.font, control, (200, 200, 0), center=(center_x, y_offset)
+            )
             y_offset += 20
 
-    def _render_debug_info(self) -> None:
-        """Render debug information."""
+    def _render_debug_info(self, flight_state: AircraftStateSnapshot | None) -> None:
+        """Render debug information.
+
+        Args:
+            flight_state: Interpolated physics state, or None if unavailable.
+        """
+        text = self.text_renderer
         y_offset = 10
         line_height = 16
 
         # FPS
         fps = self.clock.get_fps()
-        fps_text = self.font.render(f"FPS: {fps:.1f}", True, (0, 255, 0))
-        self.screen.blit(fps_text, (10, y_offset))
+        text.draw("debug.fps", self.font, f"FPS: {fps:.1f}", (0, 255, 0), topleft=(10, y_offset))
         y_offset += line_height
 
         # Aircraft info
         if self.aircraft:
-            aircraft_text = self.font.render(f"Aircraft: {self.aircraft.name}", True, (0, 255, 255))
-            self.screen.blit(aircraft_text, (10, y_offset))
+            text.draw(
+                "debug.aircraft",
+                self.font,
+                f"Aircraft: {self.aircraft.name}",
+                (0, 255, 255),
+                topleft=(10, y_offset),
+            )
             y_offset += line_height
 
         # Input state
@@ -779,26 +1203,32 @@ class AirBorne:
             f"Gear: {'DOWN' if state.gear > 0.5 else 'UP'}",
         ]
 
-        for input_line in inputs:
-            text = self.font.render(input_line, True, (0, 255, 0))
-            self.screen.blit(text, (10, y_offset))
+        for index, input_line in enumerate(inputs):
+            text.draw(
+                f"debug.input.{index}", self.font, input_line, (0, 255, 0), topleft=(10, y_offset)
+            )
             y_offset += line_height
 
         # Physics state
-        if self.physics_plugin and self.physics_plugin.flight_model:
-            flight_state = self.physics_plugin.flight_model.get_state()
+        if flight_state is not None:
+            x, y, z = flight_state.position
             physics_info = [
                 "",  # Blank line
                 "FLIGHT STATE:",
-                f"Pos: ({flight_state.position.x:.1f}, {flight_state.position.y:.1f}, {flight_state.position.z:.1f})",
-                f"Vel: {flight_state.get_airspeed():.1f} m/s",
-                f"Alt: {flight_state.position.y:.1f} m",
+                f"Pos: ({x:.1f}, {y:.1f}, {z:.1f})",
+                f"Vel: {flight_state.airspeed:.1f} m/s",
+                f"Alt: {y:.1f} m",
                 f"Mass: {flight_state.mass:.0f} kg",
             ]
 
-            for info_line in physics_info:
-                text = self.font.render(info_line, True, (255, 255, 0))
-                self.screen.blit(text, (10, y_offset))
+            for index, info_line in enumerate(physics_info):
+                text.draw(
+                    f"debug.physics.{index}",
+                    self.font,
+                    info_line,
+                    (255, 255, 0),
+                    topleft=(10, y_offset),
+                )
                 y_offset += line_height
 
     def _render_instructions(self) -> None:
@@ -818,9 +1248,14 @@ class AirBorne:
         y_offset = self.screen.get_height() - len(instructions) * 16 - 10
         x_offset = self.screen.get_width() - 200
 
-        for instruction in instructions:
-            text = self.font.render(instruction, True, (150, 150, 150))
-            self.screen.blit(text, (x_offset, y_offset))
+        for index, instruction in enumerate(instructions):
+            self.text_renderer.draw(
+                f"instruction.{index}",
+                self.font,
+                instruction,
+                (150, 150, 150),
+                topleft=(x_offset, y_offset),
+            )
             y_offset += 16
 
     def _track_frametime(self, dt: float) -> None:
@@ -859,6 +1294,21 @@ class AirBorne:
             logger.info("Shutting down physics plugin...")
             self.physics_plugin.shutdown()
 
+        if self.bus_metrics_reporter:
+            self.bus_metrics_reporter.report()
+
+        if self.journal_writer:
+            self.journal_writer.close()
+        if self.journal_reader:
+            self.journal_reader.close()
+
+        if self.profile_trace_path:
+            self.profiler.log_summary()
+            try:
+                self.profiler.write_trace(self.profile_trace_path)
+            except OSError as e:
+                logger.warning("Failed to write profile trace: %s", e)
+
         pygame.quit()
         logger.info("Shutdown complete")
 
@@ -889,6 +1339,136 @@ def parse_args() -> argparse.Namespace:
         help="Aircraft callsign (e.g., N12345, Cessna 123)",
     )
 
+    parser.add_argument(
+        "--spawn-altitude",
+        type=float,
+        metavar="FT",
+        help="Start in level flight at this altitude (MSL, feet) over the departure airport",
+    )
+
+    parser.add_argument(
+        "--spawn-airspeed",
+        type=float,
+        default=100.0,
+        metavar="KTS",
+        help="Airspeed of an airborne start in knots (default: 100)",
+    )
+
+    parser.add_argument(
+        "--physics-hz",
+        type=int,
+        default=120,
+        help="Fixed simulation step rate in Hz (default: 120)",
+    )
+
+    parser.add_argument(
+        "--render-hz",
+        type=int,
+        default=60,
+        help="Maximum frame rate for rendering and audio updates (default: 60)",
+    )
+
+    parser.add_argument(
+        "--bus-metrics",
+        type=str,
+        nargs="?",
+        const="bus_metrics.json",
+        metavar="PATH",
+        help="Instrument the message queue and event bus; log a summary every 10 s "
+        "and dump it as JSON to PATH (default: bus_metrics.json)",
+    )
+
+    parser.add_argument(
+        "--profile",
+        type=str,
+        nargs="?",
+        const="trace.json",
+        metavar="PATH",
+        help="Time every plugin update, message processing, render and display update; "
+        "write a Chrome/Perfetto trace to PATH on exit (default: trace.json)",
+    )
+
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Run without window or audio output until the scenario end condition "
+        "is met, then print a JSON run summary",
+    )
+
+    parser.add_argument(
+        "--time-scale",
+        type=float,
+        default=0.0,
+        metavar="N",
+        help="Headless: run at N times real time (default: 0, as fast as possible)",
+    )
+
+    parser.add_argument(
+        "--end-time",
+        type=float,
+        metavar="SECONDS",
+        help="Headless: end after this much simulated time "
+        "(default: 600, or the whole journal when replaying)",
+    )
+
+    parser.add_argument(
+        "--end-altitude",
+        type=float,
+        metavar="FT",
+        help="Headless: end once the aircraft reaches this altitude (MSL, feet)",
+    )
+
+    parser.add_argument(
+        "--end-on-landing",
+        action="store_true",
+        help="Headless: end when the aircraft touches down after being airborne",
+    )
+
+    parser.add_argument(
+        "--summary",
+        type=str,
+        metavar="PATH",
+        help="Headless: also write the run summary as JSON to PATH",
+    )
+
+    parser.add_argument(
+        "--rebuild-config-cache",
+        action="store_true",
+        help="Discard cached parsed YAML configuration and re-parse every file",
+    )
+
+    parser.add_argument(
+        "--record",
+        type=str,
+        metavar="PATH",
+        help="Record frame timing, control inputs and input-driven messages to a "
+        "replay journal (.gz to compress)",
+    )
+
+    parser.add_argument(
+        "--replay",
+        type=str,
+        metavar="PATH",
+        help="Replay a journal headlessly, reporting timing and the first frame "
+        "where the physics state differs from the recording",
+    )
+
+    parser.add_argument(
+        "--plugin-workers",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Update independent aircraft systems of each dependency stage on N "
+        "threads (default: 0, serial; ignored when recording or replaying)",
+    )
+
+    parser.add_argument(
+        "--race-check",
+        action="store_true",
+        help="Debug: run dependency stages serially and warn when two systems of a "
+        "stage access the same blackboard field",
+    )
+
     return parser.parse_args()
 
 
@@ -0,0 +1,300 @@
+"""International Standard Atmosphere with precomputed lookup tables.
+
+Atmosphere tabulates temperature, pressure, density and speed of sound at
+1 m altitude resolution (from -500 m to 20 km: troposphere and lower
+stratosphere) once, so per-step lookups are O(1) array reads with linear
+interpolation instead of exp()/pow() calls. Scalar lookups serve the flight
+model, propeller and engine; the *_array() variants serve vectorized
+consumers such as the batched flight model.
+
+Non-standard days are modeled as ISA plus a uniform temperature offset and a
+sea level pressure other than 1013.25 hPa. get_atmosphere() caches one table
+set per weather state, so every consumer under the same weather shares the
+same tables.
+
+Typical usage example:
+    from airborne.physics.atmosphere import get_atmosphere
+
+    atmosphere = get_atmosphere(temperature_offset_c=15.0)
+    rho = atmosphere.density(1500.0)
+    sigma = atmosphere.density_ratio(1500.0)
+"""
+
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import numpy.typing as npt
+
+from airborne.physics.interpolation import UniformAxis, lerp, mirror
+
+# ISA sea level and layer constants
+SEA_LEVEL_TEMPERATURE_K = 288.15
+SEA_LEVEL_PRESSURE_PA = 101325.0
+SEA_LEVEL_DENSITY = 1.225  # kg/m³
+LAPSE_RATE = 0.0065  # K/m (troposphere)
+TROPOPAUSE_M = 11000.0
+GAS_CONSTANT = 287.05287  # J/(kg·K), dry air
+GRAVITY = 9.80665  # m/s²
+HEAT_CAPACITY_RATIO = 1.4
+
+# Table range and resolution
+MIN_ALTITUDE_M = -500.0
+MAX_ALTITUDE_M = 20000.0
+
+# Columns of Atmosphere.table
+TEMPERATURE = 0
+PRESSURE = 1
+DENSITY = 2
+SPEED_OF_SOUND = 3
+
+_PRESSURE_EXPONENT = GRAVITY / (LAPSE_RATE * GAS_CONSTANT)  # ≈ 5.2559
+_TROPOPAUSE_TEMPERATURE_K = SEA_LEVEL_TEMPERATURE_K - LAPSE_RATE * TROPOPAUSE_M
+
+
+@dataclass(frozen=True)
+class AtmosphereConditions:
+    """Air properties at one altitude.
+
+    Attributes:
+        temperature_k: Static air temperature (K).
+        pressure_pa: Static pressure (Pa).
+        density: Air density (kg/m³).
+        speed_of_sound: Speed of sound (m/s).
+    """
+
+    temperature_k: float
+    pressure_pa: float
+    density: float
+    speed_of_sound: float
+
+
+def isa_conditions(
+    altitude_m: float,
+    temperature_offset_c: float = 0.0,
+    sea_level_pressure_pa: float = SEA_LEVEL_PRESSURE_PA,
+) -> AtmosphereConditions:
+    """Compute air properties analytically (reference for the tables).
+
+    Pressure follows the standard profile scaled to the sea level pressure;
+    temperature is the standard one plus the offset.
+
+    Args:
+        altitude_m: Geopotential altitude (m).
+        temperature_offset_c: Deviation from ISA temperature (°C).
+        sea_level_pressure_pa: Sea level pressure (Pa).
+
+    Returns:
+        Air properties.
+    """
+    if altitude_m <= TROPOPAUSE_M:
+        standard_temperature = SEA_LEVEL_TEMPERATURE_K - LAPSE_RATE * altitude_m
+        pressure_ratio = (standard_temperature / SEA_LEVEL_TEMPERATURE_K) ** _PRESSURE_EXPONENT
+    else:
+        standard_temperature = _TROPOPAUSE_TEMPERATURE_K
+        pressure_ratio = (_TROPOPAUSE_TEMPERATURE_K / SEA_LEVEL_TEMPERATURE_K) ** (
+            _PRESSURE_EXPONENT
+        ) * math.exp(
+            -GRAVITY * (altitude_m - TROPOPAUSE_M) / (GAS_CONSTANT * _TROPOPAUSE_TEMPERATURE_K)
+        )
+
+    temperature = standard_temperature + temperature_offset_c
+    pressure = sea_level_pressure_pa * pressure_ratio
+    return AtmosphereConditions(
+        temperature_k=temperature,
+        pressure_pa=pressure,
+        density=pressure / (GAS_CONSTANT * temperature),
+        speed_of_sound=math.sqrt(HEAT_CAPACITY_RATIO * GAS_CONSTANT * temperature),
+    )
+
+
+class Atmosphere:
+    """Tabulated atmosphere for one weather state.
+
+    Altitudes outside MIN_ALTITUDE_M..MAX_ALTITUDE_M are clamped to the
+    table edges.
+
+    Attributes:
+        temperature_offset_c: Deviation from ISA temperature (°C).
+        sea_level_pressure_pa: Sea level pressure (Pa).
+        altitudes: Sample altitudes (m), 1 m apart.
+        table: Contiguous array (samples, 4) of the TEMPERATURE, PRESSURE,
+            DENSITY and SPEED_OF_SOUND columns.
+
+    Examples:
+        >>> atmosphere = Atmosphere(temperature_offset_c=-10.0)
+        >>> atmosphere.density(3000.0)
+        0.944...
+    """
+
+    def __init__(
+        self,
+        temperature_offset_c: float = 0.0,
+        sea_level_pressure_pa: float = SEA_LEVEL_PRESSURE_PA,
+    ) -> None:
+        """Precompute the tables (about 20,000 samples per column).
+
+        Args:
+            temperature_offset_c: Deviation from ISA temperature (°C).
+            sea_level_pressure_pa: Sea level pressure (Pa).
+
+        Raises:
+            ValueError: If the sea level pressure is not positive or the
+                offset makes a temperature non-positive.
+        """
+        if sea_level_pressure_pa <= 0.0:
+            raise ValueError("Sea level pressure must be positive")
+        if _TROPOPAUSE_TEMPERATURE_K + temperature_offset_c <= 0.0:
+            raise ValueError(f"Temperature offset too low: {temperature_offset_c}")
+        self.temperature_offset_c = temperature_offset_c
+        self.sea_level_pressure_pa = sea_level_pressure_pa
+
+        altitudes = np.arange(MIN_ALTITUDE_M, MAX_ALTITUDE_M + 1.0)
+        standard_temperature = np.maximum(
+            SEA_LEVEL_TEMPERATURE_K - LAPSE_RATE * altitudes, _TROPOPAUSE_TEMPERATURE_K
+        )
+        pressure_ratio = (standard_temperature / SEA_LEVEL_TEMPERATURE_K) ** _PRESSURE_EXPONENT
+        stratosphere = altitudes > TROPOPAUSE_M
+        pressure_ratio[stratosphere] *= np.exp(
+            -GRAVITY
+            * (altitudes[stratosphere] - TROPOPAUSE_M)
+            / (GAS_CONSTANT * _TROPOPAUSE_TEMPERATURE_K)
+        )
+
+        table = np.empty((len(altitudes), 4))
+        table[:, TEMPERATURE] = standard_temperature + temperature_offset_c
+        table[:, PRESSURE] = sea_level_pressure_pa * pressure_ratio
+        table[:, DENSITY] = table[:, PRESSURE] / (GAS_CONSTANT * table[:, TEMPERATURE])
+        table[:, SPEED_OF_SOUND] = np.sqrt(
+            HEAT_CAPACITY_RATIO * GAS_CONSTANT * table[:, TEMPERATURE]
+        )
+        self.altitudes = altitudes
+        self.table = table
+
+        self._axis = UniformAxis(MIN_ALTITUDE_M, 1.0, len(altitudes))
+        self._temperature = mirror(table[:, TEMPERATURE])
+        self._pressure = mirror(table[:, PRESSURE])
+        self._density = mirror(table[:, DENSITY])
+        self._speed_of_sound = mirror(table[:, SPEED_OF_SOUND])
+
+    def _lookup(self, column: list[float], altitude_m: float) -> float:
+        """Interpolate one column at an altitude (clamped to the table)."""
+        i, t = self._axis.locate(altitude_m)
+        return lerp(column, i, t)
+
+    def temperature(self, altitude_m: float) -> float:
+        """Static air temperature (K) at an altitude (m)."""
+        return self._lookup(self._temperature, altitude_m)
+
+    def pressure(self, altitude_m: float) -> float:
+        """Static pressure (Pa) at an altitude (m)."""
+        return self._lookup(self._pressure, altitude_m)
+
+    def density(self, altitude_m: float) -> float:
+        """Air density (kg/m³) at an altitude (m)."""
+        return self._lookup(self._density, altitude_m)
+
+    def speed_of_sound(self, altitude_m: float) -> float:
+        """Speed of sound (m/s) at an altitude (m)."""
+        return self._lookup(self._speed_of_sound, altitude_m)
+
+    def density_ratio(self, altitude_m: float) -> float:
+        """Density relative to ISA sea level (σ) at an altitude (m)."""
+        return self._lookup(self._density, altitude_m) / SEA_LEVEL_DENSITY
+
+    def conditions(self, altitude_m: float) -> AtmosphereConditions:
+        """All air properties at an altitude.
+
+        Args:
+            altitude_m: Altitude (m).
+
+        Returns:
+            Air properties.
+        """
+        return AtmosphereConditions(
+            temperature_k=self.temperature(altitude_m),
+            pressure_pa=self.pressure(altitude_m),
+            density=self.density(altitude_m),
+            speed_of_sound=self.speed_of_sound(altitude_m),
+        )
+
+    def lookup_array(self, altitude_m: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """All air properties at many altitudes.
+
+        Args:
+            altitude_m: Altitudes (m).
+
+        Returns:
+            Array (N, 4) with the TEMPERATURE, PRESSURE, DENSITY and
+            SPEED_OF_SOUND columns.
+        """
+        i, t = self._axis.locate_array(altitude_m)
+        low = self.table[i]
+        return low + (self.table[i + 1] - low) * t[:, None]
+
+    def density_array(self, altitude_m: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """Air densities (kg/m³) at many altitudes (m)."""
+        i, t = self._axis.locate_array(altitude_m)
+        column = self.table[:, DENSITY]
+        low = column[i]
+        return low + (column[i + 1] - low) * t
+
+    def density_altitude(self, altitude_m: float) -> float:
+        """Altitude of the standard atmosphere with the same density.
+
+        Args:
+            altitude_m: Altitude (m).
+
+        Returns:
+            Density altitude (m).
+        """
+        return standard_altitude_for_density(self.density(altitude_m))
+
+
+def standard_altitude_for_density(density: float) -> float:
+    """Invert the ISA density profile.
+
+    Args:
+        density: Air density (kg/m³).
+
+    Returns:
+        Altitude (m) at which the standard atmosphere has that density.
+    """
+    sigma = density / SEA_LEVEL_DENSITY
+    tropopause_sigma = (_TROPOPAUSE_TEMPERATURE_K / SEA_LEVEL_TEMPERATURE_K) ** (
+        _PRESSURE_EXPONENT - 1.0
+    )
+    if sigma >= tropopause_sigma:
+        return (SEA_LEVEL_TEMPERATURE_K / LAPSE_RATE) * (
+            1.0 - float(sigma ** (1.0 / (_PRESSURE_EXPONENT - 1.0)))
+        )
+    return TROPOPAUSE_M - (GAS_CONSTANT * _TROPOPAUSE_TEMPERATURE_K / GRAVITY) * math.log(
+        sigma / tropopause_sigma
+    )
+
+
+def get_atmosphere(
+    temperature_offset_c: float = 0.0,
+    sea_level_pressure_pa: float = SEA_LEVEL_PRESSURE_PA,
+) -> Atmosphere:
+    """Get the shared tables for a weather state (built on first use).
+
+    Args:
+        temperature_offset_c: Deviation from ISA temperature (°C).
+        sea_level_pressure_pa: Sea level pressure (Pa).
+
+    Returns:
+        The cached Atmosphere for these conditions.
+
+    Examples:
+        >>> get_atmosphere() is get_atmosphere(0.0, 101325.0)
+        True
+    """
+    return _cached_atmosphere(float(temperature_offset_c), float(sea_level_pressure_pa))
+
+
+@lru_cache(maxsize=8)
+def _cached_atmosphere(temperature_offset_c: float, sea_level_pressure_pa: float) -> Atmosphere:
+    """Build tables once per (normalized) weather state."""
+    return Atmosphere(temperature_offset_c, sea_level_pressure_pa)
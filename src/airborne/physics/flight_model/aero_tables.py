@@ -0,0 +1,266 @@
+"""Table-driven aerodynamic coefficients.
+
+AeroCoefficientTable holds lift (CL), profile drag (CD) and pitching moment
+(CM) coefficients tabulated over angle of attack, flap position and landing
+gear position, stored in one contiguous NumPy array. Coefficients between
+breakpoints are interpolated linearly along each axis (trilinear, or
+bilinear for fixed gear); values outside the table are held at the nearest
+edge.
+
+Induced drag is not tabulated: the factor 1 / (π × AR × e) is precomputed
+once per flap setting from the aspect ratio and the per-setting Oswald
+efficiency, and lookups return the total drag CD_profile + k × CL².
+
+Tables are described in the "aerodynamics" section of flight_model_config:
+
+    aerodynamics:
+      aspect_ratio: 7.4
+      alpha_deg: [-10, 0, 10, 16, 20]      # Angle of attack breakpoints
+      flaps: [0.0, 1.0]                    # Flap positions (0 = up, 1 = full)
+      oswald_efficiency: [0.75, 0.65]      # Per flap position
+      gear_down:                           # Rows: flaps, columns: alpha_deg
+        cl: [[...], [...]]
+        cd: [[...], [...]]                 # Profile drag (induced drag added)
+        cm: [[...], [...]]
+      gear_up: {...}                       # Optional, retractable gear only
+
+Typical usage example:
+    from airborne.physics.flight_model.aero_tables import AeroCoefficientTable
+
+    table = AeroCoefficientTable.from_config(config["aerodynamics"])
+    cl, cd, cm = table.lookup(alpha_deg=4.0, flaps=0.5, gear=1.0)
+"""
+
+import math
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from airborne.physics.interpolation import locate, locate_array, mirror
+
+# Coefficient columns of AeroCoefficientTable.coefficients
+CL = 0
+CD = 1
+CM = 2
+
+_COEFFICIENTS = ("cl", "cd", "cm")
+
+
+def _grid(config: dict[str, Any], key: str, default: list[float] | None = None) -> list[float]:
+    """Read an increasing breakpoint list.
+
+    Raises:
+        ValueError: If the list is missing, empty or not increasing.
+    """
+    values = config.get(key, default)
+    if not values:
+        raise ValueError(f"aerodynamics.{key} required")
+    grid = [float(value) for value in values]
+    if any(b <= a for a, b in zip(grid, grid[1:], strict=False)):
+        raise ValueError(f"aerodynamics.{key} must be increasing")
+    return grid
+
+
+class AeroCoefficientTable:
+    """CL, CD and CM over angle of attack, flap position and gear position.
+
+    Attributes:
+        alpha_deg: Angle of attack breakpoints (degrees).
+        flaps: Flap position breakpoints (0.0 to 1.0).
+        gear: Gear position breakpoints ([1.0] for fixed gear, [0.0, 1.0]
+            when both gear_up and gear_down tables are given).
+        coefficients: Contiguous array of shape (gear, flaps, alpha, 3) with
+            the CL, CD (profile) and CM columns.
+        induced_drag_factors: 1 / (π × AR × e) per flap position.
+
+    Examples:
+        >>> table = AeroCoefficientTable.from_config(config["aerodynamics"])
+        >>> cl, cd, cm = table.lookup(5.0, flaps=0.0, gear=1.0)
+    """
+
+    def __init__(
+        self,
+        alpha_deg: list[float],
+        flaps: list[float],
+        gear: list[float],
+        coefficients: npt.ArrayLike,
+        induced_drag_factors: list[float],
+    ) -> None:
+        """Initialize the table.
+
+        Args:
+            alpha_deg: Increasing angle of attack breakpoints (degrees).
+            flaps: Increasing flap position breakpoints.
+            gear: Increasing gear position breakpoints.
+            coefficients: Values of shape (gear, flaps, alpha, 3).
+            induced_drag_factors: Induced drag factor per flap position.
+
+        Raises:
+            ValueError: If the shapes do not match the breakpoints.
+        """
+        self.alpha_deg = np.array(alpha_deg, dtype=np.float64)
+        self.flaps = np.array(flaps, dtype=np.float64)
+        self.gear = np.array(gear, dtype=np.float64)
+        self.coefficients = np.ascontiguousarray(coefficients, dtype=np.float64)
+        self.induced_drag_factors = np.array(induced_drag_factors, dtype=np.float64)
+
+        expected = (len(gear), len(flaps), len(alpha_deg), 3)
+        if self.coefficients.shape != expected:
+            raise ValueError(
+                f"Coefficient table shape {self.coefficients.shape}, expected {expected}"
+            )
+        if self.induced_drag_factors.shape != (len(flaps),):
+            raise ValueError("One induced drag factor per flap position required")
+
+        # List mirrors for the scalar lookup, which runs every physics step
+        self._alpha = mirror(self.alpha_deg)
+        self._flaps = mirror(self.flaps)
+        self._gear = mirror(self.gear)
+        self._rows: list[list[list[list[float]]]] = self.coefficients.tolist()
+        self._induced = mirror(self.induced_drag_factors)
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "AeroCoefficientTable":
+        """Create a table from an aerodynamics configuration section.
+
+        Args:
+            config: Mapping with alpha_deg, flaps (optional, default [0.0]),
+                aspect_ratio (optional, default 7.4), oswald_efficiency (one
+                value per flap position, or a single value; default 0.7) and
+                gear_down and/or gear_up tables with cl, cd and cm rows (one
+                row per flap position, one value per alpha_deg).
+
+        Returns:
+            The coefficient table.
+
+        Raises:
+            ValueError: If a section is missing or has the wrong shape.
+        """
+        alpha_deg = _grid(config, "alpha_deg")
+        flaps = _grid(config, "flaps", [0.0])
+
+        gear_tables: list[tuple[float, dict[str, Any]]] = [
+            (position, table)
+            for position, table in ((0.0, config.get("gear_up")), (1.0, config.get("gear_down")))
+            if table
+        ]
+        if not gear_tables:
+            raise ValueError("aerodynamics.gear_down or aerodynamics.gear_up required")
+        if len(gear_tables) == 1:
+            # A single table applies whatever the gear position
+            gear_tables = [(1.0, gear_tables[0][1])]
+
+        coefficients = np.empty((len(gear_tables), len(flaps), len(alpha_deg), 3))
+        for k, (_, table) in enumerate(gear_tables):
+            for column, name in enumerate(_COEFFICIENTS):
+                rows = np.asarray(table.get(name, []), dtype=np.float64)
+                if rows.shape != (len(flaps), len(alpha_deg)):
+                    raise ValueError(
+                        f"aerodynamics {name} table must have {len(flaps)} rows "
+                        f"of {len(alpha_deg)} values"
+                    )
+                coefficients[k, :, :, column] = rows
+
+        aspect_ratio = float(config.get("aspect_ratio", 7.4))
+        oswald = config.get("oswald_efficiency", 0.7)
+        if not isinstance(oswald, list):
+            oswald = [oswald] * len(flaps)
+        if len(oswald) != len(flaps):
+            raise ValueError("aerodynamics.oswald_efficiency needs one value per flap position")
+
+        return cls(
+            alpha_deg,
+            flaps,
+            [position for position, _ in gear_tables],
+            coefficients,
+            [induced_drag_factor(aspect_ratio, float(e)) for e in oswald],
+        )
+
+    def lookup(
+        self, alpha_deg: float, flaps: float = 0.0, gear: float = 1.0
+    ) -> tuple[float, float, float]:
+        """Interpolate the coefficients for one aircraft.
+
+        Args:
+            alpha_deg: Angle of attack (degrees).
+            flaps: Flap position (0.0 to 1.0).
+            gear: Gear position (0.0 = up, 1.0 = down).
+
+        Returns:
+            CL, total CD (profile + induced) and CM.
+        """
+        a0, a1, ta = locate(self._alpha, alpha_deg)
+        f0, f1, tf = locate(self._flaps, flaps)
+        g0, g1, tg = locate(self._gear, gear)
+
+        cl = cd = cm = 0.0
+        for g, wg in ((g0, 1.0 - tg), (g1, tg)):
+            if wg == 0.0:
+                continue
+            rows = self._rows[g]
+            for f, wf in ((f0, 1.0 - tf), (f1, tf)):
+                w = wg * wf
+                if w == 0.0:
+                    continue
+                lo = rows[f][a0]
+                hi = rows[f][a1]
+                cl += w * (lo[CL] + (hi[CL] - lo[CL]) * ta)
+                cd += w * (lo[CD] + (hi[CD] - lo[CD]) * ta)
+                cm += w * (lo[CM] + (hi[CM] - lo[CM]) * ta)
+
+        induced = self._induced[f0] + (self._induced[f1] - self._induced[f0]) * tf
+        return cl, cd + induced * cl * cl, cm
+
+    def lookup_array(
+        self,
+        alpha_deg: npt.ArrayLike,
+        flaps: npt.ArrayLike = 0.0,
+        gear: npt.ArrayLike = 1.0,
+    ) -> npt.NDArray[np.float64]:
+        """Interpolate the coefficients for many aircraft at once.
+
+        Args:
+            alpha_deg: Angles of attack (degrees).
+            flaps: Flap positions (scalar or one per angle).
+            gear: Gear positions (scalar or one per angle).
+
+        Returns:
+            Array of shape (N, 3) with the CL, total CD and CM columns.
+        """
+        alpha, flaps, gear = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(alpha_deg, dtype=np.float64)),
+            np.asarray(flaps, dtype=np.float64),
+            np.asarray(gear, dtype=np.float64),
+        )
+        a0, a1, ta = locate_array(self.alpha_deg, alpha)
+        f0, f1, tf = locate_array(self.flaps, flaps)
+        g0, g1, tg = locate_array(self.gear, gear)
+
+        result = np.zeros((len(alpha), 3))
+        ta = ta[:, None]
+        for g, wg in ((g0, 1.0 - tg), (g1, tg)):
+            for f, wf in ((f0, 1.0 - tf), (f1, tf)):
+                lo = self.coefficients[g, f, a0]
+                hi = self.coefficients[g, f, a1]
+                result += (wg * wf)[:, None] * (lo + (hi - lo) * ta)
+
+        induced = self.induced_drag_factors
+        factor = induced[f0] + (induced[f1] - induced[f0]) * tf
+        result[:, CD] += factor * result[:, CL] ** 2
+        return result
+
+
+def induced_drag_factor(aspect_ratio: float, oswald_efficiency: float) -> float:
+    """Induced drag coefficient per CL², 1 / (π × AR × e).
+
+    Args:
+        aspect_ratio: Wing aspect ratio.
+        oswald_efficiency: Oswald span efficiency.
+
+    Returns:
+        The factor, or 0.0 if either parameter is not positive.
+    """
+    if aspect_ratio > 0 and oswald_efficiency > 0:
+        return 1.0 / (math.pi * aspect_ratio * oswald_efficiency)
+    return 0.0
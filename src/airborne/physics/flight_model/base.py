@@ -58,7 +58,9 @@ class ControlInputs:
 class AircraftState:
     """Complete aircraft state for physics simulation.
 
-    Uses efficient storage and provides cached computed properties.
+    Uses efficient storage and provides cached computed properties. Flight
+    models update the vectors in place, so keep a copy of a vector whose
+    earlier value is needed later.
 
     Attributes:
         position: Position in world space (meters).
@@ -163,8 +165,7 @@ class FlightForces:
 
         Updates the total field in-place for efficiency.
         """
-        # In-place addition for performance
-        self.total = self.lift + self.drag + self.thrust + self.weight
+        self.total.copy_from(self.lift).iadd(self.drag).iadd(self.thrust).iadd(self.weight)
 
 
 class IFlightModel(ABC):
@@ -0,0 +1,501 @@
+"""Vectorized flight model advancing many aircraft in one step.
+
+BatchedFlightModel holds the state of N aircraft as NumPy struct-of-arrays
+(position, velocity, rotation, mass, fuel, control inputs and per-aircraft
+parameters) and applies the Simple6DOFFlightModel physics to all of them at
+once: lift, parasite and induced drag at the ISA density of each aircraft's
+altitude, throttle thrust and weight, followed by a semi-implicit Euler step,
+the simplified rotation response, the ground clamp and fuel burn. Running a
+few hundred aircraft costs about as much as a handful of scalar models, which
+makes physically simulated traffic affordable. The traffic plugins do not use
+it yet: AIAircraft still moves kinematically along its flight plan.
+
+Per-aircraft parameters come from the flight_model_config section of aircraft
+YAML files (see AircraftParameters). The propeller model and external forces
+of the scalar model are not simulated; thrust is throttle * max thrust.
+
+Aircraft are addressed by id. Removing one moves the last aircraft into its
+slot, so array rows are dense but not stable across removals; use index_of()
+rather than caching row numbers.
+
+Typical usage example:
+    from airborne.physics.flight_model.batched import (
+        AircraftParameters,
+        BatchedFlightModel,
+    )
+
+    c172 = AircraftParameters.from_yaml("config/aircraft/cessna172.yaml")
+    fleet = BatchedFlightModel()
+    fleet.add("N123AB", c172, position=(0.0, 1000.0, 0.0), velocity=(0.0, 0.0, 55.0))
+    fleet.set_inputs("N123AB", throttle=0.7)
+    fleet.step(1 / 60)
+"""
+
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+
+from airborne.core.config import ConfigLoader
+from airborne.physics.atmosphere import Atmosphere, get_atmosphere
+from airborne.physics.flight_model.aero_tables import induced_drag_factor
+from airborne.physics.flight_model.base import AircraftState
+from airborne.physics.flight_model.simple_6dof import (
+    GRAVITY,
+    RADIANS_TO_DEGREES,
+)
+from airborne.physics.vectors import Vector3
+
+# Control input columns
+PITCH = 0
+ROLL = 1
+YAW = 2
+THROTTLE = 3
+
+# Rotational response (rad/s per unit input), as in Simple6DOFFlightModel
+_ROTATION_RATES = np.array([1.0, 2.0, 0.5])
+
+_DEFAULT_CAPACITY = 16
+
+_ScalarT = TypeVar("_ScalarT", bound=np.generic)
+
+Vec3Like = Vector3 | tuple[float, float, float] | npt.ArrayLike
+
+
+@dataclass(frozen=True)
+class AircraftParameters:
+    """Flight model parameters of one aircraft type, in metric units.
+
+    Attributes:
+        wing_area: Wing area (m²).
+        empty_mass: Mass without fuel (kg).
+        max_thrust: Thrust at full throttle (N).
+        max_fuel: Fuel capacity (kg).
+        drag_coefficient: Parasite drag coefficient (CD0).
+        lift_coefficient_slope: CL per degree of angle of attack.
+        aspect_ratio: Wing aspect ratio (induced drag).
+        oswald_efficiency: Oswald span efficiency (induced drag).
+    """
+
+    wing_area: float
+    empty_mass: float
+    max_thrust: float
+    max_fuel: float
+    drag_coefficient: float = 0.027
+    lift_coefficient_slope: float = 0.1
+    aspect_ratio: float = 7.4
+    oswald_efficiency: float = 0.7
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "AircraftParameters":
+        """Create parameters from a flight_model_config mapping.
+
+        Uses the same keys and imperial units as Simple6DOFFlightModel.initialize(),
+        plus optional lift_coefficient_slope, aspect_ratio and oswald_efficiency.
+
+        Args:
+            config: Flight model configuration.
+
+        Returns:
+            Parameters in metric units.
+
+        Raises:
+            ValueError: If a required key is missing.
+        """
+        for key in ("wing_area_sqft", "weight_lbs", "max_thrust_lbs"):
+            if key not in config:
+                raise ValueError(f"{key} required")
+        return cls(
+            wing_area=config["wing_area_sqft"] * 0.092903,
+            empty_mass=config["weight_lbs"] * 0.453592,
+            max_thrust=config["max_thrust_lbs"] * 4.44822,
+            max_fuel=config.get("fuel_capacity_lbs", 220.0) * 0.453592,
+            drag_coefficient=config.get("drag_coefficient", 0.027),
+            lift_coefficient_slope=config.get("lift_coefficient_slope", 0.1),
+            aspect_ratio=config.get("aspect_ratio", 7.4),
+            oswald_efficiency=config.get("oswald_efficiency", 0.7),
+        )
+
+    @classmethod
+    def from_yaml(cls, path: str | Path) -> "AircraftParameters":
+        """Load parameters from an aircraft YAML file.
+
+        Args:
+            path: Aircraft configuration (aircraft.flight_model_config is used).
+
+        Returns:
+            Parameters in metric units.
+
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If the flight model configuration is incomplete.
+        """
+        config = ConfigLoader.load_yaml(path) or {}
+        return cls.from_config(config.get("aircraft", {}).get("flight_model_config", {}))
+
+    @property
+    def induced_drag_factor(self) -> float:
+        """Induced drag coefficient per CL², 1 / (π × AR × e)."""
+        return induced_drag_factor(self.aspect_ratio, self.oswald_efficiency)
+
+
+class BatchedFlightModel:
+    """Simple 6DOF physics for many aircraft, one vectorized step for all.
+
+    The public arrays are views over the first count rows of the storage and
+    may be read or written directly (e.g., inputs[:, THROTTLE] = 0.5); fetch
+    them again after add() or remove(), which may reallocate. Air density
+    comes from the atmosphere attribute (standard day unless replaced).
+
+    Examples:
+        >>> fleet = BatchedFlightModel()
+        >>> for i in range(300):
+        ...     fleet.add(f"AI{i}", c172, position=(i * 100.0, 1000.0, 0.0))
+        >>> fleet.inputs[:, THROTTLE] = 0.8
+        >>> fleet.step(1 / 60)
+        >>> fleet.position[:, 1]  # altitudes (m)
+    """
+
+    def __init__(self, capacity: int = _DEFAULT_CAPACITY) -> None:
+        """Initialize an empty fleet.
+
+        Args:
+            capacity: Initial number of aircraft rows (grows as needed).
+        """
+        self.atmosphere: Atmosphere = get_atmosphere()
+        self._count = 0
+        self._ids: list[str] = []
+        self._index: dict[str, int] = {}
+
+        self._capacity = max(1, capacity)
+        rows = self._capacity
+        self._position: npt.NDArray[np.float64] = np.zeros((rows, 3))
+        self._velocity: npt.NDArray[np.float64] = np.zeros((rows, 3))
+        self._acceleration: npt.NDArray[np.float64] = np.zeros((rows, 3))
+        self._rotation: npt.NDArray[np.float64] = np.zeros((rows, 3))
+        self._inputs: npt.NDArray[np.float64] = np.zeros((rows, 4))
+        self._mass: npt.NDArray[np.float64] = np.zeros(rows)
+        self._fuel: npt.NDArray[np.float64] = np.zeros(rows)
+        self._on_ground: npt.NDArray[np.bool_] = np.zeros(rows, dtype=np.bool_)
+        # Per-aircraft parameters
+        self._wing_area: npt.NDArray[np.float64] = np.zeros(rows)
+        self._empty_mass: npt.NDArray[np.float64] = np.zeros(rows)
+        self._max_thrust: npt.NDArray[np.float64] = np.zeros(rows)
+        self._drag_coefficient: npt.NDArray[np.float64] = np.zeros(rows)
+        self._lift_slope: npt.NDArray[np.float64] = np.zeros(rows)
+        self._induced_factor: npt.NDArray[np.float64] = np.zeros(rows)
+
+    def _row_arrays(self) -> tuple[npt.NDArray[Any], ...]:
+        """Arrays holding one row per aircraft (moved together on removal)."""
+        return (
+            self._position,
+            self._velocity,
+            self._acceleration,
+            self._rotation,
+            self._inputs,
+            self._mass,
+            self._fuel,
+            self._on_ground,
+            self._wing_area,
+            self._empty_mass,
+            self._max_thrust,
+            self._drag_coefficient,
+            self._lift_slope,
+            self._induced_factor,
+        )
+
+    def _grow(self, capacity: int) -> None:
+        """Reallocate storage with more rows, keeping existing aircraft.
+
+        Args:
+            capacity: Number of aircraft rows.
+        """
+        n = self._count
+        self._position = _grown(self._position, n, capacity)
+        self._velocity = _grown(self._velocity, n, capacity)
+        self._acceleration = _grown(self._acceleration, n, capacity)
+        self._rotation = _grown(self._rotation, n, capacity)
+        self._inputs = _grown(self._inputs, n, capacity)
+        self._mass = _grown(self._mass, n, capacity)
+        self._fuel = _grown(self._fuel, n, capacity)
+        self._on_ground = _grown(self._on_ground, n, capacity)
+        self._wing_area = _grown(self._wing_area, n, capacity)
+        self._empty_mass = _grown(self._empty_mass, n, capacity)
+        self._max_thrust = _grown(self._max_thrust, n, capacity)
+        self._drag_coefficient = _grown(self._drag_coefficient, n, capacity)
+        self._lift_slope = _grown(self._lift_slope, n, capacity)
+        self._induced_factor = _grown(self._induced_factor, n, capacity)
+        self._capacity = capacity
+
+    @property
+    def count(self) -> int:
+        """Number of aircraft."""
+        return self._count
+
+    @property
+    def ids(self) -> list[str]:
+        """Aircraft ids in row order."""
+        return list(self._ids)
+
+    @property
+    def position(self) -> npt.NDArray[np.float64]:
+        """Positions (N×3, m)."""
+        return self._position[: self._count]
+
+    @property
+    def velocity(self) -> npt.NDArray[np.float64]:
+        """Velocities (N×3, m/s)."""
+        return self._velocity[: self._count]
+
+    @property
+    def acceleration(self) -> npt.NDArray[np.float64]:
+        """Accelerations of the last step (N×3, m/s²)."""
+        return self._acceleration[: self._count]
+
+    @property
+    def rotation(self) -> npt.NDArray[np.float64]:
+        """Euler angles (N×3: pitch, roll, yaw in radians)."""
+        return self._rotation[: self._count]
+
+    @property
+    def inputs(self) -> npt.NDArray[np.float64]:
+        """Control inputs (N×4: PITCH, ROLL, YAW, THROTTLE columns)."""
+        return self._inputs[: self._count]
+
+    @property
+    def mass(self) -> npt.NDArray[np.float64]:
+        """Masses including fuel (N, kg)."""
+        return self._mass[: self._count]
+
+    @property
+    def fuel(self) -> npt.NDArray[np.float64]:
+        """Fuel remaining (N, kg)."""
+        return self._fuel[: self._count]
+
+    @property
+    def on_ground(self) -> npt.NDArray[np.bool_]:
+        """Ground contact flags (N)."""
+        return self._on_ground[: self._count]
+
+    def index_of(self, aircraft_id: str) -> int:
+        """Get the current row of an aircraft.
+
+        Args:
+            aircraft_id: Aircraft id.
+
+        Returns:
+            Row index into the state arrays.
+
+        Raises:
+            KeyError: If the aircraft is unknown.
+        """
+        return self._index[aircraft_id]
+
+    def add(
+        self,
+        aircraft_id: str,
+        parameters: AircraftParameters,
+        position: Vec3Like = (0.0, 0.0, 0.0),
+        velocity: Vec3Like = (0.0, 0.0, 0.0),
+        rotation: Vec3Like = (0.0, 0.0, 0.0),
+        fuel: float | None = None,
+    ) -> int:
+        """Add an aircraft.
+
+        Args:
+            aircraft_id: Unique id (e.g., callsign).
+            parameters: Flight model parameters of its type.
+            position: Initial position (m).
+            velocity: Initial velocity (m/s).
+            rotation: Initial pitch, roll, yaw (rad).
+            fuel: Initial fuel (kg), full tanks by default.
+
+        Returns:
+            Row index of the aircraft.
+
+        Raises:
+            ValueError: If the id is already used.
+        """
+        if aircraft_id in self._index:
+            raise ValueError(f"Aircraft already simulated: {aircraft_id}")
+        if self._count == self._capacity:
+            self._grow(self._capacity * 2)
+
+        i = self._count
+        self._position[i] = _as_xyz(position)
+        self._velocity[i] = _as_xyz(velocity)
+        self._rotation[i] = _as_xyz(rotation)
+        self._acceleration[i] = 0.0
+        self._inputs[i] = 0.0
+        self._fuel[i] = parameters.max_fuel if fuel is None else fuel
+        self._mass[i] = parameters.empty_mass + self._fuel[i]
+        self._on_ground[i] = False
+        self._wing_area[i] = parameters.wing_area
+        self._empty_mass[i] = parameters.empty_mass
+        self._max_thrust[i] = parameters.max_thrust
+        self._drag_coefficient[i] = parameters.drag_coefficient
+        self._lift_slope[i] = parameters.lift_coefficient_slope
+        self._induced_factor[i] = parameters.induced_drag_factor
+
+        self._ids.append(aircraft_id)
+        self._index[aircraft_id] = i
+        self._count += 1
+        return i
+
+    def remove(self, aircraft_id: str) -> bool:
+        """Remove an aircraft, moving the last one into its row.
+
+        Args:
+            aircraft_id: Aircraft id.
+
+        Returns:
+            True if the aircraft was removed, False if it was unknown.
+        """
+        i = self._index.pop(aircraft_id, None)
+        if i is None:
+            return False
+
+        last = self._count - 1
+        if i != last:
+            for array in self._row_arrays():
+                array[i] = array[last]
+            moved = self._ids[last]
+            self._ids[i] = moved
+            self._index[moved] = i
+        self._ids.pop()
+        self._count = last
+        return True
+
+    def clear(self) -> None:
+        """Remove every aircraft."""
+        self._count = 0
+        self._ids.clear()
+        self._index.clear()
+
+    def set_inputs(
+        self,
+        aircraft_id: str,
+        pitch: float | None = None,
+        roll: float | None = None,
+        yaw: float | None = None,
+        throttle: float | None = None,
+    ) -> None:
+        """Set control inputs of one aircraft (clamped like ControlInputs).
+
+        Args:
+            aircraft_id: Aircraft id.
+            pitch: Elevator (-1.0 to 1.0), unchanged if None.
+            roll: Ailerons (-1.0 to 1.0), unchanged if None.
+            yaw: Rudder (-1.0 to 1.0), unchanged if None.
+            throttle: Throttle (0.0 to 1.0), unchanged if None.
+
+        Raises:
+            KeyError: If the aircraft is unknown.
+        """
+        row = self._inputs[self._index[aircraft_id]]
+        for column, value, low in ((PITCH, pitch, -1.0), (ROLL, roll, -1.0), (YAW, yaw, -1.0)):
+            if value is not None:
+                row[column] = max(low, min(1.0, value))
+        if throttle is not None:
+            row[THROTTLE] = max(0.0, min(1.0, throttle))
+
+    def step(self, dt: float) -> None:
+        """Advance every aircraft by dt.
+
+        Args:
+            dt: Time step in seconds.
+        """
+        n = self._count
+        if n == 0:
+            return
+
+        position = self._position[:n]
+        velocity = self._velocity[:n]
+        acceleration = self._acceleration[:n]
+        rotation = self._rotation[:n]
+        inputs = self._inputs[:n]
+        mass = self._mass[:n]
+        fuel = self._fuel[:n]
+
+        speed = np.sqrt(np.einsum("ij,ij->i", velocity, velocity))
+        density = self.atmosphere.density_array(position[:, 1])
+        qs = 0.5 * density * speed * speed * self._wing_area[:n]
+
+        # Angle of attack approximated by pitch, as in the scalar model
+        cl = self._lift_slope[:n] * (rotation[:, 0] * RADIANS_TO_DEGREES)
+        lift = qs * cl
+        drag = qs * (self._drag_coefficient[:n] + cl * cl * self._induced_factor[:n])
+        thrust = inputs[:, THROTTLE] * self._max_thrust[:n]
+
+        # Drag and thrust act along the direction of flight; at (almost) zero
+        # speed there is no drag and thrust points along the heading
+        moving = speed > 0.1
+        inverse_speed = np.divide(1.0, speed, out=np.zeros(n), where=moving)
+        np.multiply(velocity, ((thrust - drag) * inverse_speed)[:, None], out=acceleration)
+        still = ~moving
+        if still.any():
+            yaw = rotation[still, 2]
+            acceleration[still, 0] = thrust[still] * np.cos(yaw)
+            acceleration[still, 2] = thrust[still] * np.sin(yaw)
+        acceleration[:, 1] += lift - mass * GRAVITY
+        acceleration /= mass[:, None]
+
+        # Semi-implicit Euler
+        velocity += acceleration * dt
+        position += velocity * dt
+
+        # Rotation follows the inputs at fixed rates, wrapped to -π..π
+        rotation += inputs[:, :3] * _ROTATION_RATES * dt
+        rotation[rotation > math.pi] -= 2.0 * math.pi
+        rotation[rotation < -math.pi] += 2.0 * math.pi
+
+        # Ground clamp
+        grounded = position[:, 1] <= 0.0
+        position[grounded, 1] = 0.0
+        velocity[grounded, 1] = np.maximum(velocity[grounded, 1], 0.0)
+        self._on_ground[:n] = grounded
+
+        # Fuel burn
+        np.maximum(fuel - inputs[:, THROTTLE] * 0.01 * dt, 0.0, out=fuel)
+        np.add(self._empty_mass[:n], fuel, out=mass)
+
+    def get_state(self, aircraft_id: str) -> AircraftState:
+        """Copy one aircraft's state into an AircraftState.
+
+        Args:
+            aircraft_id: Aircraft id.
+
+        Returns:
+            A new AircraftState (not updated by later steps).
+
+        Raises:
+            KeyError: If the aircraft is unknown.
+        """
+        i = self._index[aircraft_id]
+        return AircraftState(
+            position=Vector3.from_array(self._position[i]),
+            velocity=Vector3.from_array(self._velocity[i]),
+            acceleration=Vector3.from_array(self._acceleration[i]),
+            rotation=Vector3.from_array(self._rotation[i]),
+            mass=float(self._mass[i]),
+            fuel=float(self._fuel[i]),
+            on_ground=bool(self._on_ground[i]),
+        )
+
+
+def _grown(array: npt.NDArray[_ScalarT], count: int, capacity: int) -> npt.NDArray[_ScalarT]:
+    """Copy the first count rows of array into new zeroed storage of capacity rows."""
+    grown = np.zeros((capacity, *array.shape[1:]), dtype=array.dtype)
+    grown[:count] = array[:count]
+    return grown
+
+
+def _as_xyz(value: Vec3Like) -> tuple[float, float, float]:
+    """Convert a Vector3 or 3-sequence to an (x, y, z) tuple."""
+    if isinstance(value, Vector3):
+        return (value.x, value.y, value.z)
+    x, y, z = np.asarray(value, dtype=np.float64)[:3]
+    return (float(x), float(y), float(z))
@@ -0,0 +1,324 @@
+"""Numerical integrators for flight models.
+
+An integrator advances position and velocity over one time step given the
+acceleration at the start of the step and a function evaluating the
+acceleration at any other (position, velocity). Flight models pick one by
+name from their configuration (see create_integrator()):
+
+- semi_implicit_euler: v += a*dt, then p += v*dt. One force evaluation per
+  step; the historical Simple6DOFFlightModel behavior.
+- rk4: classic fourth-order Runge-Kutta. Four force evaluations per step,
+  accurate at a much lower physics rate.
+- adaptive: Bogacki-Shampine 3(2) with error control. Splits the step into
+  as many sub-steps as the tolerance requires, which keeps long frames
+  (loop hitches) stable, and grows the sub-step again when the motion is
+  smooth.
+
+Integrators update the position and velocity vectors in place and only use
+scratch vectors allocated once, like the flight model itself.
+
+Typical usage example:
+    from airborne.physics.flight_model.integrators import create_integrator
+
+    integrator = create_integrator("rk4")
+    integrator.step(state.position, state.velocity, state.acceleration, dt, evaluate)
+"""
+
+import math
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import Any
+
+from airborne.physics.vectors import Vector3
+
+# evaluate(position, velocity, out): write the acceleration at that state into out
+AccelerationFunction = Callable[[Vector3, Vector3, Vector3], None]
+
+
+class IIntegrator(ABC):
+    """Abstract interface for position/velocity integrators.
+
+    Examples:
+        >>> integrator = RK4Integrator()
+        >>> integrator.step(position, velocity, acceleration, 0.016, evaluate)
+    """
+
+    name = ""
+
+    @abstractmethod
+    def step(
+        self,
+        position: Vector3,
+        velocity: Vector3,
+        acceleration: Vector3,
+        dt: float,
+        evaluate: AccelerationFunction,
+    ) -> None:
+        """Advance position and velocity by dt in place.
+
+        Args:
+            position: Position, updated in place (m).
+            velocity: Velocity, updated in place (m/s).
+            acceleration: Acceleration at the start of the step (m/s²); not modified.
+            dt: Time step in seconds.
+            evaluate: Computes the acceleration at another state.
+        """
+
+
+class SemiImplicitEulerIntegrator(IIntegrator):
+    """Semi-implicit (symplectic) Euler: velocity first, then position.
+
+    Needs no extra force evaluation. First-order accurate, but energy
+    behaves far better than with explicit Euler.
+    """
+
+    name = "semi_implicit_euler"
+
+    def step(
+        self,
+        position: Vector3,
+        velocity: Vector3,
+        acceleration: Vector3,
+        dt: float,
+        evaluate: AccelerationFunction,
+    ) -> None:
+        """Advance position and velocity by dt in place.
+
+        Args:
+            position: Position, updated in place (m).
+            velocity: Velocity, updated in place (m/s).
+            acceleration: Acceleration at the start of the step (m/s²).
+            dt: Time step in seconds.
+            evaluate: Unused.
+        """
+        velocity.imul_add(acceleration, dt)
+        position.imul_add(velocity, dt)
+
+
+class RK4Integrator(IIntegrator):
+    """Classic fourth-order Runge-Kutta (three extra force evaluations)."""
+
+    name = "rk4"
+
+    def __init__(self) -> None:
+        """Initialize scratch vectors."""
+        self._p = Vector3.zero()
+        self._v1 = Vector3.zero()
+        self._v2 = Vector3.zero()
+        self._v3 = Vector3.zero()
+        self._v4 = Vector3.zero()
+        self._a2 = Vector3.zero()
+        self._a3 = Vector3.zero()
+        self._a4 = Vector3.zero()
+
+    def step(
+        self,
+        position: Vector3,
+        velocity: Vector3,
+        acceleration: Vector3,
+        dt: float,
+        evaluate: AccelerationFunction,
+    ) -> None:
+        """Advance position and velocity by dt in place.
+
+        Args:
+            position: Position, updated in place (m).
+            velocity: Velocity, updated in place (m/s).
+            acceleration: Acceleration at the start of the step (m/s²).
+            dt: Time step in seconds.
+            evaluate: Computes the acceleration at the intermediate states.
+        """
+        half = 0.5 * dt
+        p, v1, v2, v3, v4 = self._p, self._v1, self._v2, self._v3, self._v4
+        a2, a3, a4 = self._a2, self._a3, self._a4
+
+        v1.copy_from(velocity)
+
+        p.copy_from(position).imul_add(v1, half)
+        v2.copy_from(velocity).imul_add(acceleration, half)
+        evaluate(p, v2, a2)
+
+        p.copy_from(position).imul_add(v2, half)
+        v3.copy_from(velocity).imul_add(a2, half)
+        evaluate(p, v3, a3)
+
+        p.copy_from(position).imul_add(v3, dt)
+        v4.copy_from(velocity).imul_add(a3, dt)
+        evaluate(p, v4, a4)
+
+        sixth = dt / 6.0
+        position.imul_add(v1, sixth).imul_add(v2, 2.0 * sixth).imul_add(v3, 2.0 * sixth)
+        position.imul_add(v4, sixth)
+        velocity.imul_add(acceleration, sixth).imul_add(a2, 2.0 * sixth)
+        velocity.imul_add(a3, 2.0 * sixth).imul_add(a4, sixth)
+
+
+class AdaptiveIntegrator(IIntegrator):
+    """Error-controlled Bogacki-Shampine 3(2) integrator with sub-stepping.
+
+    Each sub-step compares a third-order solution with an embedded
+    second-order one. Sub-steps whose error exceeds the tolerance are retried
+    with a smaller step; the accepted step size carries over to the next call.
+
+    Attributes:
+        tolerance: Accepted error per sub-step, in meters for position and
+            m/s for velocity.
+        min_substep: Sub-steps this short are accepted whatever their error.
+        max_substeps: Accepted sub-steps per call; the last one takes the
+            remaining time so a call always completes.
+        substeps: Accepted sub-steps in the last call.
+        rejected: Rejected sub-steps in the last call.
+    """
+
+    name = "adaptive"
+
+    def __init__(
+        self, tolerance: float = 1e-3, min_substep: float = 1e-4, max_substeps: int = 64
+    ) -> None:
+        """Initialize the integrator.
+
+        Args:
+            tolerance: Accepted error per sub-step (m and m/s).
+            min_substep: Shortest sub-step subject to error control (s).
+            max_substeps: Accepted sub-steps per call before finishing at once.
+
+        Raises:
+            ValueError: If a parameter is not positive.
+        """
+        if tolerance <= 0 or min_substep <= 0 or max_substeps < 1:
+            raise ValueError("Adaptive integrator parameters must be positive")
+        self.tolerance = tolerance
+        self.min_substep = min_substep
+        self.max_substeps = max_substeps
+        self.substeps = 0
+        self.rejected = 0
+        self._h = 0.0
+
+        self._p = Vector3.zero()
+        self._v1 = Vector3.zero()
+        self._v2 = Vector3.zero()
+        self._v3 = Vector3.zero()
+        self._a1 = Vector3.zero()
+        self._a2 = Vector3.zero()
+        self._a3 = Vector3.zero()
+        self._p_new = Vector3.zero()
+        self._v_new = Vector3.zero()
+        self._a_new = Vector3.zero()
+        self._error = Vector3.zero()
+
+    def step(
+        self,
+        position: Vector3,
+        velocity: Vector3,
+        acceleration: Vector3,
+        dt: float,
+        evaluate: AccelerationFunction,
+    ) -> None:
+        """Advance position and velocity by dt in place, sub-stepping as needed.
+
+        Args:
+            position: Position, updated in place (m).
+            velocity: Velocity, updated in place (m/s).
+            acceleration: Acceleration at the start of the step (m/s²).
+            dt: Time step in seconds.
+            evaluate: Computes the acceleration at the intermediate states.
+        """
+        p, v1, v2, v3 = self._p, self._v1, self._v2, self._v3
+        a1, a2, a3 = self._a1, self._a2, self._a3
+        p_new, v_new, a_new, error = self._p_new, self._v_new, self._a_new, self._error
+
+        v1.copy_from(velocity)
+        a1.copy_from(acceleration)
+        remaining = dt
+        h = min(self._h or dt, dt)
+        self.substeps = 0
+        self.rejected = 0
+
+        while remaining > 0.0:
+            last = self.substeps + 1 >= self.max_substeps
+            h = remaining if last else min(h, remaining)
+
+            p.copy_from(position).imul_add(v1, 0.5 * h)
+            v2.copy_from(velocity).imul_add(a1, 0.5 * h)
+            evaluate(p, v2, a2)
+
+            p.copy_from(position).imul_add(v2, 0.75 * h)
+            v3.copy_from(velocity).imul_add(a2, 0.75 * h)
+            evaluate(p, v3, a3)
+
+            p_new.copy_from(position).imul_add(v1, h * 2.0 / 9.0)
+            p_new.imul_add(v2, h / 3.0).imul_add(v3, h * 4.0 / 9.0)
+            v_new.copy_from(velocity).imul_add(a1, h * 2.0 / 9.0)
+            v_new.imul_add(a2, h / 3.0).imul_add(a3, h * 4.0 / 9.0)
+            evaluate(p_new, v_new, a_new)
+
+            # Difference between the 3rd and embedded 2nd order solutions
+            error.set(0.0, 0.0, 0.0).imul_add(v1, -5.0 / 72.0).imul_add(v2, 1.0 / 12.0)
+            error.imul_add(v3, 1.0 / 9.0).imul_add(v_new, -0.125)
+            position_error = h * error.magnitude()
+            error.set(0.0, 0.0, 0.0).imul_add(a1, -5.0 / 72.0).imul_add(a2, 1.0 / 12.0)
+            error.imul_add(a3, 1.0 / 9.0).imul_add(a_new, -0.125)
+            velocity_error = h * error.magnitude()
+            ratio = max(position_error, velocity_error) / self.tolerance
+
+            if ratio <= 1.0 or last or h <= self.min_substep:
+                position.copy_from(p_new)
+                velocity.copy_from(v_new)
+                # First same as last: the end state starts the next sub-step
+                v1.copy_from(v_new)
+                a1.copy_from(a_new)
+                remaining = 0.0 if h >= remaining else remaining - h
+                self.substeps += 1
+            else:
+                self.rejected += 1
+
+            factor = 5.0 if ratio == 0.0 else 0.9 * ratio ** (-1.0 / 3.0)
+            h = max(self.min_substep, h * min(5.0, max(0.2, factor)))
+
+        self._h = h
+
+
+INTEGRATORS: dict[str, type[IIntegrator]] = {
+    SemiImplicitEulerIntegrator.name: SemiImplicitEulerIntegrator,
+    RK4Integrator.name: RK4Integrator,
+    AdaptiveIntegrator.name: AdaptiveIntegrator,
+}
+
+
+def create_integrator(name: str, **options: Any) -> IIntegrator:
+    """Create an integrator by name.
+
+    Args:
+        name: One of the INTEGRATORS keys.
+        **options: Constructor arguments (e.g., tolerance for "adaptive").
+
+    Returns:
+        A new integrator.
+
+    Raises:
+        ValueError: If the name is unknown.
+
+    Examples:
+        >>> create_integrator("adaptive", tolerance=1e-4)
+    """
+    integrator_class = INTEGRATORS.get(name)
+    if integrator_class is None:
+        known = ", ".join(INTEGRATORS)
+        raise ValueError(f"Unknown integrator: {name} (expected one of {known})")
+    return integrator_class(**options)
+
+
+def substep_count(dt: float, max_substep: float | None) -> int:
+    """Number of equal sub-steps keeping each one at most max_substep long.
+
+    Args:
+        dt: Time step in seconds.
+        max_substep: Longest sub-step in seconds, or None for no limit.
+
+    Returns:
+        Sub-step count (at least 1).
+    """
+    if not max_substep or dt <= max_substep:
+        return 1
+    # Tolerance keeps exact multiples (0.1 / 0.02 = 5.000000000000001) at 5
+    return math.ceil(dt / max_substep - 1e-9)
@@ -3,10 +3,20 @@
 This module provides a basic but realistic flight model that balances
 accuracy with performance. It's optimized for real-time simulation at 60Hz.
 
+Lift and drag come from a linear lift curve with parasite and induced drag,
+or, when the configuration has an "aerodynamics" section, from coefficient
+tables over angle of attack, flaps and gear (see
+airborne.physics.flight_model.aero_tables).
+
+Velocity and position are advanced by a pluggable integrator (see
+airborne.physics.flight_model.integrators) chosen with the "integrator" key of
+the flight model configuration; long frames can be split into sub-steps with
+"max_substep_s".
+
 Performance optimizations:
 - Cached trigonometric values
-- In-place vector operations
-- Minimal allocations per frame
+- In-place vector operations on the state, force and scratch vectors
+  (a step allocates no vectors)
 - Fast approximations where appropriate
 
 Typical usage example:
@@ -21,12 +31,21 @@ import math
 from typing import TYPE_CHECKING
 
 from airborne.core.logging_system import get_logger
+from airborne.physics.atmosphere import Atmosphere, get_atmosphere
+from airborne.physics.flight_model.aero_tables import AeroCoefficientTable, induced_drag_factor
 from airborne.physics.flight_model.base import (
     AircraftState,
     ControlInputs,
     FlightForces,
     IFlightModel,
 )
+from airborne.physics.flight_model.integrators import (
+    AdaptiveIntegrator,
+    IIntegrator,
+    SemiImplicitEulerIntegrator,
+    create_integrator,
+    substep_count,
+)
 from airborne.physics.vectors import Vector3
 
 if TYPE_CHECKING:
@@ -50,6 +69,7 @@ class Simple6DOFFlightModel(IFlightModel):
     Physics model:
     - Lift = 0.5 * ρ * v² * S * CL
     - Drag = 0.5 * ρ * v² * S * CD
+    - ρ = ISA density at the current altitude (looked up once per step)
     - Thrust = throttle * max_thrust
     - Weight = mass * gravity
 
@@ -71,8 +91,19 @@ class Simple6DOFFlightModel(IFlightModel):
         self.max_thrust = 0.0  # N (fallback if no propeller)
         self.drag_coefficient = 0.027  # Typical for light aircraft
         self.lift_coefficient_slope = 0.1  # CL per degree AOA
+        self.aspect_ratio = 7.4
+        self.oswald_efficiency = 0.7
         self.max_fuel = 100.0  # kg
 
+        # Coefficient tables (optional - if present, replace the lift curve)
+        self.aero_table: AeroCoefficientTable | None = None
+        self.pitching_moment_coefficient = 0.0  # CM at the state of the last step
+        self._induced_drag_factor = induced_drag_factor(self.aspect_ratio, self.oswald_efficiency)
+
+        # Air density at the current altitude, from the shared ISA tables
+        self.atmosphere: Atmosphere = get_atmosphere()
+        self.air_density = AIR_DENSITY_SEA_LEVEL  # kg/m³
+
         # Propeller model (optional - if present, overrides max_thrust)
         self.propeller: IPropeller | None = None
         self.engine_power_hp = 0.0  # Current engine power (from ENGINE_STATE)
@@ -85,6 +116,17 @@ class Simple6DOFFlightModel(IFlightModel):
         # External forces (wind, collisions)
         self.external_force = Vector3.zero()
 
+        # Scratch vector: direction of flight, reused every step
+        self._direction = Vector3.zero()
+
+        # Integration (set in initialize()); extra force evaluations of
+        # higher-order integrators go to scratch forces
+        self.integrator: IIntegrator = SemiImplicitEulerIntegrator()
+        self.max_substep: float | None = None
+        self._stage_forces = FlightForces()
+        self._inputs = ControlInputs()
+        self._evaluate = self._evaluate_acceleration
+
         # Cached values for performance
         self._cos_pitch = 1.0
         self._sin_pitch = 0.0
@@ -96,6 +138,7 @@ class Simple6DOFFlightModel(IFlightModel):
 
         # Performance counters
         self._updates = 0
+        self._thrust_log_counter = -1  # Propeller thrust debug line every 60 steps
 
     def initialize(self, config: dict) -> None:
         """Initialize flight model from configuration.
@@ -107,9 +150,20 @@ class Simple6DOFFlightModel(IFlightModel):
                 - max_thrust_lbs: Maximum thrust in pounds
                 - drag_coefficient: Drag coefficient (optional, default: 0.027)
                 - fuel_capacity_lbs: Fuel capacity in pounds (optional)
+                - aspect_ratio, oswald_efficiency: Induced drag of the linear
+                  lift curve (optional, default: 7.4 and 0.7)
+                - aerodynamics: CL/CD/CM tables over angle of attack, flaps
+                  and gear (optional, see AeroCoefficientTable.from_config)
+                - integrator: "semi_implicit_euler" (default), "rk4" or
+                  "adaptive" (optional)
+                - integrator_tolerance: Error tolerance of the adaptive
+                  integrator, m and m/s (optional, default: 0.001)
+                - max_substep_s: Longest integration step; longer updates are
+                  split into equal sub-steps (optional, default: no limit)
 
         Raises:
-            ValueError: If required parameters missing.
+            ValueError: If required parameters missing, the integrator is unknown
+                or the coefficient tables are malformed.
         """
         # Convert imperial to metric for internal calculations
         if "wing_area_sqft" not in config:
@@ -129,21 +183,40 @@ class Simple6DOFFlightModel(IFlightModel):
         fuel_capacity_lbs = config.get("fuel_capacity_lbs", 220.0)
         self.max_fuel = fuel_capacity_lbs * 0.453592
 
+        # Aerodynamics
+        self.aspect_ratio = config.get("aspect_ratio", 7.4)
+        self.oswald_efficiency = config.get("oswald_efficiency", 0.7)
+        self._induced_drag_factor = induced_drag_factor(self.aspect_ratio, self.oswald_efficiency)
+        aerodynamics = config.get("aerodynamics")
+        self.aero_table = AeroCoefficientTable.from_config(aerodynamics) if aerodynamics else None
+
+        # Integration
+        integrator_name = config.get("integrator", SemiImplicitEulerIntegrator.name)
+        integrator_options = {}
+        if integrator_name == AdaptiveIntegrator.name and "integrator_tolerance" in config:
+            integrator_options["tolerance"] = float(config["integrator_tolerance"])
+        self.integrator = create_integrator(integrator_name, **integrator_options)
+        max_substep = config.get("max_substep_s")
+        self.max_substep = float(max_substep) if max_substep else None
+
         # Initialize state
         self.state.mass = self.empty_mass + self.max_fuel
         self.state.fuel = self.max_fuel
 
         logger.info(
-            "Initialized 6DOF model: wing_area=%.2fm², mass=%.1fkg, thrust=%.0fN",
+            "Initialized 6DOF model: wing_area=%.2fm², mass=%.1fkg, thrust=%.0fN, integrator=%s",
             self.wing_area,
             self.state.mass,
             self.max_thrust,
+            self.integrator.name,
         )
 
     def update(self, dt: float, inputs: ControlInputs) -> AircraftState:
         """Update physics for one time step.
 
-        Optimized for 60Hz updates with minimal allocations.
+        Optimized for 60Hz updates: vectors are updated in place, nothing is
+        allocated. When max_substep is set and dt is longer, the update is
+        split into equal sub-steps.
 
         Args:
             dt: Time step in seconds.
@@ -153,29 +226,49 @@ class Simple6DOFFlightModel(IFlightModel):
             Updated state (reference to internal state).
         """
         self._updates += 1
+        self._inputs = inputs
+
+        # External forces act during the whole update, then decay
+        external = self.external_force.magnitude_squared() > 0.001
+
+        substeps = substep_count(dt, self.max_substep)
+        step_dt = dt / substeps
+        for _ in range(substeps):
+            self._step(step_dt, inputs, external)
+
+        if external:
+            self.external_force.iscale(0.9)
+
+        return self.state
 
+    def _step(self, dt: float, inputs: ControlInputs, external: bool) -> None:
+        """Advance the state by one integration step.
+
+        Args:
+            dt: Step in seconds.
+            inputs: Control inputs.
+            external: Whether external forces apply.
+        """
         # Update cached trig values if rotation changed
         if self._trig_dirty:
             self._update_cached_trig()
 
+        state = self.state
+        self.air_density = self.atmosphere.density(state.position.y)
+
         # Calculate forces (updates self.forces in-place)
-        self._calculate_forces(inputs)
+        self._calculate_forces(inputs, state.velocity, self.forces)
 
         # Apply external forces
-        if self.external_force.magnitude_squared() > 0.001:
-            self.forces.total = self.forces.total + self.external_force
-            # Decay external forces
-            self.external_force = self.external_force * 0.9
+        if external:
+            self.forces.total.iadd(self.external_force)
 
         # Update acceleration: F = ma => a = F/m
-        self.state.acceleration = self.forces.total / self.state.mass
+        state.acceleration.copy_from(self.forces.total).idiv(state.mass)
 
-        # Integrate velocity: v = v + a*dt
-        self.state.velocity = self.state.velocity + self.state.acceleration * dt
-        self.state.mark_velocity_dirty()
-
-        # Integrate position: p = p + v*dt
-        self.state.position = self.state.position + self.state.velocity * dt
+        # Integrate velocity and position
+        self.integrator.step(state.position, state.velocity, state.acceleration, dt, self._evaluate)
+        state.mark_velocity_dirty()
 
         # Update rotation based on inputs (simplified)
         self._update_rotation(dt, inputs)
@@ -193,65 +286,86 @@ class Simple6DOFFlightModel(IFlightModel):
         self.state.fuel = max(0.0, self.state.fuel - fuel_flow)
         self.state.mass = self.empty_mass + self.state.fuel
 
-        return self.state
+    def _evaluate_acceleration(
+        self, position: Vector3, velocity: Vector3, acceleration: Vector3
+    ) -> None:
+        """Compute the acceleration at an intermediate integrator state.
+
+        Rotation, mass and inputs are those of the current step.
+
+        Args:
+            position: Position of the intermediate state (unused by this model).
+            velocity: Velocity of the intermediate state.
+            acceleration: Receives the acceleration (m/s²).
+        """
+        forces = self._stage_forces
+        self._calculate_forces(self._inputs, velocity, forces)
+        if self.external_force.magnitude_squared() > 0.001:
+            forces.total.iadd(self.external_force)
+        acceleration.copy_from(forces.total).idiv(self.state.mass)
 
-    def _calculate_forces(self, inputs: ControlInputs) -> None:
+    def _calculate_forces(
+        self, inputs: ControlInputs, velocity: Vector3, forces: FlightForces
+    ) -> None:
         """Calculate aerodynamic and propulsive forces.
 
-        Updates self.forces in-place for efficiency.
+        Updates forces in-place for efficiency. Only the evaluation into
+        self.forces (the step's own state) records pitching_moment_coefficient
+        and counts towards the thrust debug log; integrator stages do not.
 
         Args:
             inputs: Control inputs.
+            velocity: Velocity to evaluate the forces at (usually state.velocity).
+            forces: Receives the forces.
         """
-        airspeed = self.state.get_airspeed()
+        if velocity is self.state.velocity:
+            airspeed = self.state.get_airspeed()
+        else:
+            airspeed = velocity.magnitude()
 
         # Dynamic pressure: q = 0.5 * ρ * v²
         # Pre-compute for reuse
-        q = 0.5 * AIR_DENSITY_SEA_LEVEL * airspeed * airspeed
+        q = 0.5 * self.air_density * airspeed * airspeed
+
+        # --- Lift and drag coefficients ---
+        qs = q * self.wing_area
+        if self.aero_table is not None:
+            # Tables: angle of attack between the nose and the flight path
+            angle_of_attack = self.state.get_pitch()  # radians
+            if airspeed > 0.1:
+                horizontal = math.sqrt(velocity.x * velocity.x + velocity.z * velocity.z)
+                angle_of_attack -= math.atan2(velocity.y, horizontal)
+            cl, cd, cm = self.aero_table.lookup(
+                angle_of_attack * RADIANS_TO_DEGREES, inputs.flaps, inputs.gear
+            )
+            if forces is self.forces:
+                self.pitching_moment_coefficient = cm
+            drag_magnitude = qs * cd
+        else:
+            # Linear lift curve, angle of attack approximated by pitch
+            angle_of_attack = self.state.get_pitch()  # radians
+            cl = self.lift_coefficient_slope * (angle_of_attack * RADIANS_TO_DEGREES)
 
-        # --- Lift ---
-        # Simplified: Lift acts upward in body frame
-        # CL depends on angle of attack (approximated by pitch)
-        angle_of_attack = self.state.get_pitch()  # radians
-        cl = self.lift_coefficient_slope * (angle_of_attack * RADIANS_TO_DEGREES)
-        lift_magnitude = q * self.wing_area * cl
+            # Total drag = parasite drag + induced drag
+            # Parasite drag: D_p = q × S × CD_0
+            # Induced drag: D_i = (CL²) / (π × AR × e) × q × S
+            drag_parasite = qs * self.drag_coefficient
+            drag_induced = qs * (cl * cl * self._induced_drag_factor)
+            drag_magnitude = drag_parasite + drag_induced
 
+        # --- Lift ---
         # Lift direction: perpendicular to velocity
         # Simplified: assume lift acts upward in world frame
-        self.forces.lift = Vector3(0.0, lift_magnitude, 0.0)
-
-        # --- Drag ---
-        # Total drag = parasite drag + induced drag
-        # Parasite drag: D_p = q × S × CD_0
-        drag_parasite = q * self.wing_area * self.drag_coefficient
-
-        # Induced drag: D_i = (CL²) / (π × AR × e) × q × S
-        # For C172: AR ≈ 7.4, e (Oswald efficiency) ≈ 0.7
-        aspect_ratio = 7.4
-        oswald_efficiency = 0.7
-
-        # Lift coefficient from angle of attack
-        angle_of_attack = self.state.get_pitch()
-        cl = self.lift_coefficient_slope * (angle_of_attack * RADIANS_TO_DEGREES)
-
-        # Induced drag coefficient
-        if aspect_ratio > 0 and oswald_efficiency > 0:
-            cd_induced = (cl * cl) / (math.pi * aspect_ratio * oswald_efficiency)
-        else:
-            cd_induced = 0.0
-
-        # Induced drag force
-        drag_induced = q * self.wing_area * cd_induced
-
-        # Total drag
-        drag_magnitude = drag_parasite + drag_induced
+        forces.lift.set(0.0, qs * cl, 0.0)
 
-        if airspeed > 0.1:
+        # Direction of flight, shared by drag and thrust
+        moving = airspeed > 0.1
+        if moving:
+            direction = self._direction.copy_from(velocity).inormalize()
             # Drag in opposite direction of velocity
-            velocity_normalized = self.state.velocity.normalized()
-            self.forces.drag = velocity_normalized * (-drag_magnitude)
+            forces.drag.copy_from(direction).iscale(-drag_magnitude)
         else:
-            self.forces.drag = Vector3.zero()
+            forces.drag.set(0.0, 0.0, 0.0)
 
         # --- Thrust ---
         # Calculate thrust from propeller model if available, otherwise use simple model
@@ -261,39 +375,39 @@ class Simple6DOFFlightModel(IFlightModel):
                 power_hp=self.engine_power_hp,
                 rpm=self.engine_rpm,
                 airspeed_mps=airspeed,
-                air_density_kgm3=AIR_DENSITY_SEA_LEVEL,
+                air_density_kgm3=self.air_density,
             )
-            # Debug logging every 60 frames (~1 second at 60 FPS)
-            if hasattr(self, "_thrust_log_counter"):
+            # Debug logging every 60 frames (~1 second at 60 FPS); not for
+            # the intermediate evaluations of multi-stage integrators
+            if forces is self.forces:
                 self._thrust_log_counter += 1
-            else:
-                self._thrust_log_counter = 0
-
-            if self._thrust_log_counter % 60 == 0:
+            if forces is self.forces and self._thrust_log_counter % 60 == 0:
                 logger.debug(
-                    f"Propeller thrust: {thrust_magnitude:.1f}N from {self.engine_power_hp:.1f}HP "
-                    f"@ {self.engine_rpm:.0f}RPM, airspeed={airspeed:.1f}m/s"
+                    "Propeller thrust: %.1fN from %.1fHP @ %.0fRPM, airspeed=%.1fm/s",
+                    thrust_magnitude,
+                    self.engine_power_hp,
+                    self.engine_rpm,
+                    airspeed,
                 )
         else:
             # Fallback: Simple thrust model based on throttle
             thrust_magnitude = inputs.throttle * self.max_thrust
 
         # Apply thrust in forward direction
-        if airspeed > 0.1:
-            velocity_normalized = self.state.velocity.normalized()
-            self.forces.thrust = velocity_normalized * thrust_magnitude
+        if moving:
+            forces.thrust.copy_from(self._direction).iscale(thrust_magnitude)
         else:
             # At zero speed, thrust in forward direction (yaw)
             thrust_x = thrust_magnitude * self._cos_yaw
             thrust_z = thrust_magnitude * self._sin_yaw
-            self.forces.thrust = Vector3(thrust_x, 0.0, thrust_z)
+            forces.thrust.set(thrust_x, 0.0, thrust_z)
 
         # --- Weight ---
         # Weight always acts downward
-        self.forces.weight = Vector3(0.0, -self.state.mass * GRAVITY, 0.0)
+        forces.weight.set(0.0, -self.state.mass * GRAVITY, 0.0)
 
         # --- Total Force ---
-        self.forces.calculate_total()
+        forces.calculate_total()
 
     def _update_rotation(self, dt: float, inputs: ControlInputs) -> None:
         """Update aircraft rotation based on inputs.
@@ -310,13 +424,12 @@ class Simple6DOFFlightModel(IFlightModel):
         yaw_rate = 0.5  # rad/s
 
         # Update angular velocity based on inputs
-        self.state.angular_velocity = Vector3(
+        self.state.angular_velocity.set(
             inputs.pitch * pitch_rate, inputs.roll * roll_rate, inputs.yaw * yaw_rate
         )
 
         # Integrate rotation
-        rotation_delta = self.state.angular_velocity * dt
-        self.state.rotation = self.state.rotation + rotation_delta
+        self.state.rotation.imul_add(self.state.angular_velocity, dt)
 
         # Normalize angles to -π to π
         self.state.rotation.x = self._normalize_angle(self.state.rotation.x)
@@ -368,7 +481,7 @@ class Simple6DOFFlightModel(IFlightModel):
             initial_state: New state.
         """
         self.state = initial_state
-        self.external_force = Vector3.zero()
+        self.external_force.set(0.0, 0.0, 0.0)
         self._trig_dirty = True
         self._updates = 0
         logger.debug("Reset flight model to new state")
@@ -381,7 +494,7 @@ class Simple6DOFFlightModel(IFlightModel):
             position: Position (currently ignored - simplified model).
         """
         # Accumulate external forces
-        self.external_force = self.external_force + force
+        self.external_force.iadd(force)
 
     def get_forces(self) -> FlightForces:
         """Get current forces.
@@ -391,6 +504,31 @@ class Simple6DOFFlightModel(IFlightModel):
         """
         return self.forces
 
+    def evaluate_forces(
+        self, inputs: ControlInputs, velocity: Vector3, forces: FlightForces
+    ) -> FlightForces:
+        """Evaluate the forces on the current state without stepping.
+
+        Uses the current rotation, mass, air density and engine settings,
+        with the given inputs and velocity, e.g. to search for a trimmed
+        state. The state and the step's forces (get_forces()) are unchanged.
+
+        Args:
+            inputs: Control inputs.
+            velocity: Velocity to evaluate the forces at.
+            forces: Receives the forces (not get_forces()).
+
+        Returns:
+            forces, for convenience.
+
+        Raises:
+            ValueError: If forces is the model's own get_forces().
+        """
+        if forces is self.forces:
+            raise ValueError("evaluate_forces() needs its own FlightForces")
+        self._calculate_forces(inputs, velocity, forces)
+        return forces
+
     def get_update_count(self) -> int:
         """Get number of updates performed.
 
@@ -0,0 +1,509 @@
+"""Trim solver for starting Simple6DOFFlightModel in steady flight.
+
+Spawning airborne needs a state in which the aircraft keeps flying as it
+was placed: the forces balance at the target airspeed, altitude and
+flight-path angle. TrimSolver finds the pitch attitude and thrust setting
+that make the net force zero by Newton iteration on the model's own force
+function (Simple6DOFFlightModel.evaluate_forces()), instead of settling the
+model over many simulated seconds.
+
+The unknowns are the pitch angle and the thrust control: throttle with the
+simple thrust model, or engine power (at the model's current engine RPM)
+when a propeller is attached. Engine power is limited to what the engine
+delivers at full throttle (rated power scaled by RPM and altitude, as in the
+piston engine models) and reported back as the matching throttle setting.
+The residual is the net force along and normal to the flight path. The
+2×2 Jacobian is evaluated by finite differences and reused between
+iterations (and between solves with the same flaps, gear and thrust model),
+and only re-evaluated when the residual stops shrinking quickly, so a
+typical solve costs a handful of force evaluations.
+
+The model has no pitching-moment dynamics (rotation follows the control
+inputs), so trimmed elevator, aileron and rudder inputs are zero.
+
+Typical usage example:
+    from airborne.physics.flight_model.trim import TrimSolver
+
+    solver = TrimSolver(model, max_power_hp=180.0, max_rpm=2700.0)
+    result = solver.solve(airspeed_mps=50.0, altitude_m=900.0, flight_path_deg=-3.0, flaps=0.33)
+    solver.apply(result, heading_deg=310.0)
+    inputs = result.to_control_inputs()
+
+    # Or solve and apply in one go, raising TrimError if the forces cannot balance
+    result = solver.trim(airspeed_mps=50.0, altitude_m=900.0, heading_deg=310.0)
+"""
+
+import math
+from dataclasses import dataclass
+
+from airborne.core.logging_system import get_logger
+from airborne.physics.flight_model.base import AircraftState, ControlInputs, FlightForces
+from airborne.physics.flight_model.simple_6dof import GRAVITY, Simple6DOFFlightModel
+from airborne.physics.vectors import Vector3
+from airborne.systems.engines.piston_simple import altitude_power_factor
+
+logger = get_logger(__name__)
+
+# Jacobian [[dFt/dθ, dFt/du], [dFn/dθ, dFn/du]] of the normalized residual
+Jacobian = tuple[float, float, float, float]
+
+# Finite-difference steps: pitch (rad), throttle, engine power (hp)
+PITCH_STEP = 1e-5
+THROTTLE_STEP = 1e-4
+POWER_STEP = 1e-2
+
+# Largest pitch change per Newton iteration (rad)
+MAX_PITCH_STEP = math.radians(5.0)
+
+
+class TrimError(Exception):
+    """Raised when no pitch and thrust setting balance the forces."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class TrimResult:
+    """Trimmed control and attitude state.
+
+    Attributes:
+        airspeed_mps: Trimmed airspeed (m/s).
+        altitude_m: Trimmed altitude (m).
+        flight_path_deg: Flight-path angle (degrees, positive climbing).
+        pitch_deg: Pitch attitude (degrees).
+        angle_of_attack_deg: Angle of attack seen by the force model (degrees).
+        throttle: Throttle position (with a propeller, the throttle at which
+            the engine delivers engine_power_hp).
+        engine_power_hp: Engine power (hp, 0.0 with the simple thrust model).
+        thrust_n: Thrust (N).
+        flaps: Flap position used.
+        gear: Gear position used.
+        residual_n: Largest remaining force imbalance (N).
+        iterations: Newton iterations taken.
+        jacobian_evaluations: Finite-difference Jacobians evaluated.
+        converged: Whether the forces balance within tolerance.
+    """
+
+    airspeed_mps: float
+    altitude_m: float
+    flight_path_deg: float
+    pitch_deg: float
+    angle_of_attack_deg: float
+    throttle: float
+    engine_power_hp: float
+    thrust_n: float
+    flaps: float
+    gear: float
+    residual_n: float
+    iterations: int
+    jacobian_evaluations: int
+    converged: bool
+
+    def to_control_inputs(self) -> ControlInputs:
+        """Control inputs that hold the trimmed state.
+
+        Returns:
+            Inputs with the trimmed throttle, flaps and gear.
+        """
+        return ControlInputs(throttle=self.throttle, flaps=self.flaps, gear=self.gear)
+
+
+class TrimSolver:
+    """Newton trim solver for a Simple6DOFFlightModel.
+
+    Attributes:
+        model: Flight model to trim (configured with initialize()).
+        tolerance: Convergence tolerance on the force imbalance, as a
+            fraction of the aircraft weight.
+        max_iterations: Newton iterations before giving up.
+        max_power_hp: Rated engine power (hp), required with a propeller.
+        max_rpm: RPM of the rated power; below it, full-throttle power
+            scales with the model's engine RPM (None: no RPM scaling).
+
+    Examples:
+        >>> solver = TrimSolver(model, max_power_hp=180.0, max_rpm=2700.0)
+        >>> result = solver.solve(airspeed_mps=55.0, altitude_m=1500.0)
+        >>> result.converged
+        True
+        >>> solver.apply(result, heading_deg=90.0)
+    """
+
+    def __init__(
+        self,
+        model: Simple6DOFFlightModel,
+        tolerance: float = 1e-6,
+        max_iterations: int = 50,
+        max_power_hp: float | None = None,
+        max_rpm: float | None = None,
+    ) -> None:
+        """Initialize the solver.
+
+        Args:
+            model: Flight model to trim.
+            tolerance: Force imbalance tolerance (fraction of weight).
+            max_iterations: Newton iteration limit.
+            max_power_hp: Rated engine power (hp, the engine config's
+                max_power_hp); needed to trim with a propeller.
+            max_rpm: RPM of the rated power (the engine config's max_rpm).
+        """
+        self.model = model
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.max_power_hp = max_power_hp
+        self.max_rpm = max_rpm
+
+        # Last Jacobian per (flaps, gear, propeller), reused by later solves
+        self._jacobians: dict[tuple[float, float, bool], Jacobian] = {}
+
+        # Scratch state, flight-path velocity and forces for force evaluations
+        self._scratch = AircraftState()
+        self._velocity = Vector3.zero()
+        self._forces = FlightForces()
+        self._inputs = ControlInputs()
+
+    def full_throttle_power_hp(self, altitude_m: float) -> float:
+        """Engine power at full throttle and the model's engine RPM.
+
+        Args:
+            altitude_m: Altitude (m).
+
+        Returns:
+            Rated power scaled by RPM (if max_rpm is set) and air density.
+
+        Raises:
+            ValueError: If max_power_hp is not set.
+        """
+        if self.max_power_hp is None:
+            raise ValueError("max_power_hp must be set to trim with a propeller")
+        power = self.max_power_hp * altitude_power_factor(
+            self.model.atmosphere.density_ratio(altitude_m)
+        )
+        if self.max_rpm:
+            power *= min(1.0, self.model.engine_rpm / self.max_rpm)
+        return power
+
+    def clear_cache(self) -> None:
+        """Forget cached Jacobians (e.g., after reconfiguring the model)."""
+        self._jacobians.clear()
+
+    def solve(
+        self,
+        airspeed_mps: float,
+        altitude_m: float,
+        flight_path_deg: float = 0.0,
+        flaps: float = 0.0,
+        gear: float = 1.0,
+    ) -> TrimResult:
+        """Find the pitch and thrust setting for steady flight.
+
+        The model's state is not changed (see apply()). The aircraft mass is
+        the model's current mass.
+
+        Args:
+            airspeed_mps: Target airspeed (m/s).
+            altitude_m: Target altitude (m).
+            flight_path_deg: Target flight-path angle (degrees, positive climbing).
+            flaps: Flap position (0.0-1.0).
+            gear: Gear position (0.0 = up, 1.0 = down).
+
+        Returns:
+            Trimmed state; converged is False if the thrust limits (full
+            throttle) cannot balance the forces (e.g., a climb beyond the
+            aircraft's ability).
+
+        Raises:
+            ValueError: If the model is not configured, the airspeed is not
+                positive, or a propeller is attached but the engine RPM or
+                max_power_hp is not set.
+        """
+        model = self.model
+        if model.wing_area <= 0.0:
+            raise ValueError("Flight model must be initialized before trimming")
+        if airspeed_mps <= 0.0:
+            raise ValueError("Trim airspeed must be positive")
+        use_propeller = model.propeller is not None
+        if use_propeller and model.engine_rpm <= 0.0:
+            raise ValueError("engine_rpm must be set to trim with a propeller")
+        full_power = self.full_throttle_power_hp(altitude_m) if use_propeller else 0.0
+
+        gamma = math.radians(flight_path_deg)
+        sin_gamma = math.sin(gamma)
+        cos_gamma = math.cos(gamma)
+        self._velocity.set(0.0, airspeed_mps * sin_gamma, airspeed_mps * cos_gamma)
+        self._inputs = ControlInputs(flaps=flaps, gear=gear)
+        self._scratch.mass = model.state.mass
+        weight = model.state.mass * GRAVITY
+
+        if use_propeller:
+            control_step = POWER_STEP
+            control_max = full_power
+            power = model.engine_power_hp
+            control = power if 0.0 < power < full_power else 0.5 * full_power
+        else:
+            control_step = THROTTLE_STEP
+            control_max = 1.0
+            control = 0.5
+
+        # Angle of attack to start from: lift coefficient for weight with the
+        # linear lift curve, clamped to normal flight
+        density = model.atmosphere.density(altitude_m)
+        qs = 0.5 * density * airspeed_mps**2 * model.wing_area
+        alpha0 = weight / (qs * model.lift_coefficient_slope)
+        pitch = math.radians(max(-5.0, min(10.0, alpha0)))
+        if model.aero_table is not None:
+            pitch += gamma
+
+        saved = (
+            model.state,
+            model.air_density,
+            model.engine_power_hp,
+            model.pitching_moment_coefficient,
+        )
+        model.state = self._scratch
+        model.air_density = density
+        try:
+            key = (flaps, gear, use_propeller)
+            jacobian = self._jacobians.get(key)
+            jacobian_evaluations = 0
+            fresh = False
+            residual = self._residual(pitch, control, use_propeller, sin_gamma, cos_gamma, weight)
+            norm = max(abs(residual[0]), abs(residual[1]))
+            iterations = 0
+            converged = norm <= self.tolerance
+
+            while not converged and iterations < self.max_iterations:
+                if jacobian is None:
+                    jacobian = self._jacobian(
+                        pitch,
+                        control,
+                        control_step,
+                        control_max,
+                        residual,
+                        use_propeller,
+                        gamma,
+                        weight,
+                    )
+                    jacobian_evaluations += 1
+                    fresh = True
+                dt_dp, dt_du, dn_dp, dn_du = jacobian
+                det = dt_dp * dn_du - dt_du * dn_dp
+                if det == 0.0:
+                    if fresh:
+                        break
+                    jacobian = None
+                    continue
+
+                # Newton step J·dx = -r, limited in pitch, controls clamped
+                d_pitch = -(dn_du * residual[0] - dt_du * residual[1]) / det
+                d_control = -(dt_dp * residual[1] - dn_dp * residual[0]) / det
+                pitch += max(-MAX_PITCH_STEP, min(MAX_PITCH_STEP, d_pitch))
+                control = max(0.0, min(control_max, control + d_control))
+                iterations += 1
+
+                residual = self._residual(
+                    pitch, control, use_propeller, sin_gamma, cos_gamma, weight
+                )
+                new_norm = max(abs(residual[0]), abs(residual[1]))
+                converged = new_norm <= self.tolerance
+                if new_norm > 0.5 * norm:
+                    # Slow convergence: the cached Jacobian is out of date,
+                    # unless it was just evaluated (then we are at a limit)
+                    if fresh and new_norm >= norm:
+                        break
+                    jacobian = None
+                fresh = False
+                norm = new_norm
+
+            if jacobian is not None:
+                self._jacobians[key] = jacobian
+            # Forces at the final point (the last evaluation may be a Jacobian probe)
+            self._residual(pitch, control, use_propeller, sin_gamma, cos_gamma, weight)
+            thrust = self._forces.thrust.magnitude()
+            angle_of_attack = pitch - gamma if model.aero_table is not None else pitch
+        finally:
+            (
+                model.state,
+                model.air_density,
+                model.engine_power_hp,
+                model.pitching_moment_coefficient,
+            ) = saved
+
+        if not converged:
+            logger.warning(
+                "Trim did not converge at %.1f m/s, %.0f m, %.1f°: imbalance %.0f N",
+                airspeed_mps,
+                altitude_m,
+                flight_path_deg,
+                norm * weight,
+            )
+
+        return TrimResult(
+            airspeed_mps=airspeed_mps,
+            altitude_m=altitude_m,
+            flight_path_deg=flight_path_deg,
+            pitch_deg=math.degrees(pitch),
+            angle_of_attack_deg=math.degrees(angle_of_attack),
+            throttle=(control / full_power if full_power > 0.0 else 1.0)
+            if use_propeller
+            else control,
+            engine_power_hp=control if use_propeller else 0.0,
+            thrust_n=thrust,
+            flaps=flaps,
+            gear=gear,
+            residual_n=norm * weight,
+            iterations=iterations,
+            jacobian_evaluations=jacobian_evaluations,
+            converged=converged,
+        )
+
+    def trim(
+        self,
+        airspeed_mps: float,
+        altitude_m: float,
+        flight_path_deg: float = 0.0,
+        flaps: float = 0.0,
+        gear: float = 1.0,
+        heading_deg: float = 0.0,
+    ) -> TrimResult:
+        """Solve for steady flight and put the model in the trimmed state.
+
+        Args:
+            airspeed_mps: Target airspeed (m/s).
+            altitude_m: Target altitude (m).
+            flight_path_deg: Target flight-path angle (degrees, positive climbing).
+            flaps: Flap position (0.0-1.0).
+            gear: Gear position (0.0 = up, 1.0 = down).
+            heading_deg: Heading to fly (degrees, 0 = +Z/north, 90 = +X/east).
+
+        Returns:
+            The applied trim.
+
+        Raises:
+            TrimError: If the forces cannot be balanced (the model is unchanged).
+            ValueError: As for solve().
+        """
+        result = self.solve(airspeed_mps, altitude_m, flight_path_deg, flaps, gear)
+        if not result.converged:
+            raise TrimError(
+                f"Cannot trim for {airspeed_mps:.1f} m/s at {altitude_m:.0f} m and "
+                f"{flight_path_deg:.1f}°: {result.residual_n:.0f} N of force left "
+                f"unbalanced at throttle {result.throttle:.2f}"
+            )
+        self.apply(result, heading_deg)
+        return result
+
+    def apply(self, result: TrimResult, heading_deg: float = 0.0) -> None:
+        """Put the model in the trimmed state.
+
+        The horizontal position, mass and fuel of the current state are kept.
+
+        Args:
+            result: Result of solve().
+            heading_deg: Heading to fly (degrees, 0 = +Z/north, 90 = +X/east).
+        """
+        model = self.model
+        current = model.state
+        heading = math.radians(heading_deg)
+        gamma = math.radians(result.flight_path_deg)
+        horizontal = result.airspeed_mps * math.cos(gamma)
+
+        state = AircraftState(
+            position=Vector3(current.position.x, result.altitude_m, current.position.z),
+            velocity=Vector3(
+                horizontal * math.sin(heading),
+                result.airspeed_mps * math.sin(gamma),
+                horizontal * math.cos(heading),
+            ),
+            rotation=Vector3(
+                math.radians(result.pitch_deg),
+                0.0,
+                math.atan2(math.sin(heading), math.cos(heading)),
+            ),
+            mass=current.mass,
+            fuel=current.fuel,
+            on_ground=False,
+        )
+        model.reset(state)
+        if model.propeller is not None:
+            model.engine_power_hp = result.engine_power_hp
+
+    def _residual(
+        self,
+        pitch: float,
+        control: float,
+        use_propeller: bool,
+        sin_gamma: float,
+        cos_gamma: float,
+        weight: float,
+    ) -> tuple[float, float]:
+        """Net force along and normal to the flight path, over weight.
+
+        Args:
+            pitch: Pitch angle (rad).
+            control: Throttle, or engine power (hp) with a propeller.
+            use_propeller: Whether control is engine power.
+            sin_gamma: Sine of the flight-path angle.
+            cos_gamma: Cosine of the flight-path angle.
+            weight: Aircraft weight (N).
+
+        Returns:
+            (tangential, normal) force over weight.
+        """
+        model = self.model
+        self._scratch.rotation.x = pitch
+        if use_propeller:
+            model.engine_power_hp = control
+            self._inputs.throttle = 0.0
+        else:
+            self._inputs.throttle = control
+        model.evaluate_forces(self._inputs, self._velocity, self._forces)
+        total = self._forces.total
+        tangential = total.z * cos_gamma + total.y * sin_gamma
+        normal = total.y * cos_gamma - total.z * sin_gamma
+        return tangential / weight, normal / weight
+
+    def _jacobian(
+        self,
+        pitch: float,
+        control: float,
+        control_step: float,
+        control_max: float,
+        residual: tuple[float, float],
+        use_propeller: bool,
+        gamma: float,
+        weight: float,
+    ) -> Jacobian:
+        """Forward-difference Jacobian of the residual at (pitch, control).
+
+        Args:
+            pitch: Pitch angle (rad).
+            control: Thrust control value.
+            control_step: Finite-difference step of the control.
+            control_max: Upper limit of the control.
+            residual: Residual at (pitch, control).
+            use_propeller: Whether control is engine power.
+            gamma: Flight-path angle (rad).
+            weight: Aircraft weight (N).
+
+        Returns:
+            Jacobian (dFt/dθ, dFt/du, dFn/dθ, dFn/du).
+        """
+        sin_gamma = math.sin(gamma)
+        cos_gamma = math.cos(gamma)
+        # Step the control away from its limits so both points are valid
+        if control - control_step < 0.0:
+            control_step = abs(control_step)
+        elif control + control_step > control_max:
+            control_step = -abs(control_step)
+        tangential_p, normal_p = self._residual(
+            pitch + PITCH_STEP, control, use_propeller, sin_gamma, cos_gamma, weight
+        )
+        tangential_u, normal_u = self._residual(
+            pitch, control + control_step, use_propeller, sin_gamma, cos_gamma, weight
+        )
+        return (
+            (tangential_p - residual[0]) / PITCH_STEP,
+            (tangential_u - residual[0]) / control_step,
+            (normal_p - residual[1]) / PITCH_STEP,
+            (normal_u - residual[1]) / control_step,
+        )
@@ -59,6 +59,14 @@ class GroundForces:
         self.brake_force = Vector3(0, 0, 0)
         self.total_force = Vector3(0, 0, 0)
 
+    def clear(self) -> None:
+        """Set every force to zero in place."""
+        self.friction_force.set(0.0, 0.0, 0.0)
+        self.rolling_resistance.set(0.0, 0.0, 0.0)
+        self.steering_force.set(0.0, 0.0, 0.0)
+        self.brake_force.set(0.0, 0.0, 0.0)
+        self.total_force.set(0.0, 0.0, 0.0)
+
 
 class GroundPhysics:
     """Ground physics simulation for aircraft.
@@ -116,12 +124,17 @@ class GroundPhysics:
         self.max_brake_force_n = max_brake_force_n
         self.max_steering_angle_deg = max_steering_angle_deg
 
+        # Scratch vectors reused by calculate_ground_forces()
+        self._velocity = Vector3(0.0, 0.0, 0.0)
+        self._direction = Vector3(0.0, 0.0, 0.0)
+
     def calculate_ground_forces(
         self,
         contact: GroundContact,
         rudder_input: float = 0.0,
         brake_input: float = 0.0,
         velocity: Vector3 | None = None,
+        out: GroundForces | None = None,
     ) -> GroundForces:
         """Calculate all ground forces acting on aircraft.
 
@@ -130,16 +143,22 @@ class GroundPhysics:
             rudder_input: Rudder/nosewheel steering input (-1.0 to 1.0)
             brake_input: Brake input (0.0 to 1.0)
             velocity: Aircraft velocity vector (m/s), optional
+            out: GroundForces to fill in place instead of allocating new ones
+                (per-step callers keep one around), optional
 
         Returns:
-            GroundForces with all calculated forces
+            GroundForces with all calculated forces (out, if given)
 
         Examples:
             >>> ground = GroundPhysics(mass_kg=1000)
             >>> contact = GroundContact(on_ground=True, ground_speed_mps=20)
             >>> forces = ground.calculate_ground_forces(contact, brake=0.5)
         """
-        forces = GroundForces()
+        if out is None:
+            forces = GroundForces()
+        else:
+            forces = out
+            forces.clear()
 
         if not contact.on_ground:
             return forces
@@ -147,23 +166,26 @@ class GroundPhysics:
         # Use provided velocity or create from ground speed and heading
         if velocity is None:
             heading_rad = math.radians(contact.heading_deg)
-            velocity = Vector3(
+            velocity = self._velocity.set(
                 contact.ground_speed_mps * math.sin(heading_rad),
-                0,
+                0.0,
                 contact.ground_speed_mps * math.cos(heading_rad),
             )
 
         speed = velocity.magnitude()
 
+        # Direction of motion, shared by every force below
+        forward = self._direction
+        if speed > 0.01:
+            forward.copy_from(velocity).inormalize()
+
         # Calculate friction force (opposes motion)
         if speed > 0.01:
             friction_coef = self._get_friction_coefficient(contact.surface_type)
             normal_force = self.mass_kg * 9.81 * contact.gear_compression
 
             friction_magnitude = friction_coef * normal_force
-            friction_direction = velocity.normalized() * -1
-
-            forces.friction_force = friction_direction * friction_magnitude
+            forces.friction_force.copy_from(forward).iscale(-friction_magnitude)
 
         # Calculate rolling resistance (always opposes motion)
         if speed > 0.01:
@@ -171,9 +193,7 @@ class GroundPhysics:
             normal_force = self.mass_kg * 9.81 * contact.gear_compression
 
             rolling_magnitude = rolling_coef * normal_force
-            rolling_direction = velocity.normalized() * -1
-
-            forces.rolling_resistance = rolling_direction * rolling_magnitude
+            forces.rolling_resistance.copy_from(forward).iscale(-rolling_magnitude)
 
         # Calculate steering force (lateral force from nosewheel)
         if abs(rudder_input) > 0.01 and speed > 0.5:
@@ -185,26 +205,18 @@ class GroundPhysics:
             # Lateral force proportional to steering angle and speed
             lateral_force = self.mass_kg * 9.81 * 0.3 * math.sin(steering_angle_rad) * speed_factor
 
-            # Direction perpendicular to velocity
-            if velocity.magnitude() > 0.01:
-                forward = velocity.normalized()
-                right = Vector3(forward.z, 0, -forward.x)  # 90° right
-                forces.steering_force = right * lateral_force * rudder_input
+            # Direction perpendicular to velocity (90° right)
+            scale = lateral_force * rudder_input
+            forces.steering_force.set(forward.z * scale, 0.0, -forward.x * scale)
 
         # Calculate brake force (opposes motion)
         if brake_input > 0.01 and speed > 0.01:
             brake_magnitude = brake_input * self.max_brake_force_n * contact.gear_compression
-            brake_direction = velocity.normalized() * -1
-
-            forces.brake_force = brake_direction * brake_magnitude
+            forces.brake_force.copy_from(forward).iscale(-brake_magnitude)
 
         # Calculate total force
-        forces.total_force = (
-            forces.friction_force
-            + forces.rolling_resistance
-            + forces.steering_force
-            + forces.brake_force
-        )
+        total = forces.total_force.copy_from(forces.friction_force)
+        total.iadd(forces.rolling_resistance).iadd(forces.steering_force).iadd(forces.brake_force)
 
         return forces
 
@@ -0,0 +1,167 @@
+"""Grid lookups shared by the tabulated physics models.
+
+The atmosphere, aerodynamic coefficient and propeller performance tables
+all interpolate linearly between breakpoints, clamping queries to the edges
+of the table. This module finds the interval containing a query, for one
+value (plain Python arithmetic, for per-step lookups into list mirrors of
+the tables) or for many at once (NumPy, for the *_array() variants):
+
+- UniformAxis: evenly spaced breakpoints, located in O(1) by arithmetic
+- locate() / locate_array(): any increasing breakpoints, located by bisection
+
+Typical usage example:
+    from airborne.physics.interpolation import UniformAxis, lerp, mirror
+
+    axis = UniformAxis(first=-500.0, step=1.0, points=20501)
+    density = mirror(table[:, DENSITY])
+    rho = lerp(density, *axis.locate(1500.0))
+"""
+
+from bisect import bisect_right
+
+import numpy as np
+import numpy.typing as npt
+
+
+class UniformAxis:
+    """Evenly spaced breakpoints first, first + step, ... (points of them).
+
+    Examples:
+        >>> axis = UniformAxis(first=0.0, step=0.5, points=5)
+        >>> axis.locate(1.25)
+        (2, 0.5)
+        >>> axis.locate(10.0)  # clamped to the last interval
+        (3, 1.0)
+    """
+
+    __slots__ = ("first", "step", "points", "_scale", "_last")
+
+    def __init__(self, first: float, step: float, points: int) -> None:
+        """Initialize the axis.
+
+        Args:
+            first: First breakpoint.
+            step: Spacing of the breakpoints (positive).
+            points: Number of breakpoints.
+
+        Raises:
+            ValueError: If there are fewer than 2 points or the step is not positive.
+        """
+        if points < 2 or step <= 0.0:
+            raise ValueError(f"Invalid axis: {points} points, step {step}")
+        self.first = first
+        self.step = step
+        self.points = points
+        self._scale = 1.0 / step
+        self._last = points - 1
+
+    def locate(self, value: float) -> tuple[int, float]:
+        """Find the interval containing a value (clamped to the axis).
+
+        Args:
+            value: Query.
+
+        Returns:
+            Lower breakpoint index (at most points - 2) and the fraction of
+            the way to the next breakpoint (0.0 to 1.0).
+        """
+        x = (value - self.first) * self._scale
+        if x <= 0.0:
+            return 0, 0.0
+        if x >= self._last:
+            return self._last - 1, 1.0
+        i = int(x)
+        return i, x - i
+
+    def locate_array(
+        self, values: npt.ArrayLike
+    ) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.float64]]:
+        """Vectorized locate().
+
+        Args:
+            values: Queries (scalars are treated as one query).
+
+        Returns:
+            Lower breakpoint indices and fractions, both 1-D.
+        """
+        position = np.clip(
+            (np.atleast_1d(np.asarray(values, dtype=np.float64)) - self.first) * self._scale,
+            0.0,
+            float(self._last),
+        )
+        index = np.minimum(position.astype(np.intp), self._last - 1)
+        fraction: npt.NDArray[np.float64] = position - index
+        return index, fraction
+
+
+def mirror(column: npt.NDArray[np.float64]) -> list[float]:
+    """Copy a table column to a list for the scalar lookups.
+
+    Indexing a Python list is several times cheaper than indexing a NumPy
+    array from Python, so scalar lookups read from list mirrors of the
+    tables while the array lookups use the NumPy tables themselves.
+
+    Args:
+        column: Table values (flattened in C order).
+
+    Returns:
+        The values as Python floats.
+    """
+    values: list[float] = column.ravel().tolist()
+    return values
+
+
+def lerp(values: list[float], index: int, fraction: float) -> float:
+    """Interpolate between values[index] and values[index + 1].
+
+    Args:
+        values: Tabulated values (e.g., from mirror()).
+        index: Lower index (from UniformAxis.locate()).
+        fraction: Fraction of the way to the next value.
+
+    Returns:
+        Interpolated value.
+    """
+    low = values[index]
+    return low + (values[index + 1] - low) * fraction
+
+
+def locate(grid: list[float], value: float) -> tuple[int, int, float]:
+    """Find the interval of a sorted grid containing value.
+
+    Args:
+        grid: Increasing breakpoints (a single breakpoint is allowed).
+        value: Value to locate (clamped to the grid).
+
+    Returns:
+        Lower index, upper index and fraction of the way between them.
+    """
+    last = len(grid) - 1
+    if last == 0 or value <= grid[0]:
+        return 0, 0, 0.0
+    if value >= grid[last]:
+        return last, last, 0.0
+    i = bisect_right(grid, value) - 1
+    return i, i + 1, (value - grid[i]) / (grid[i + 1] - grid[i])
+
+
+def locate_array(
+    grid: npt.NDArray[np.float64], values: npt.NDArray[np.float64]
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp], npt.NDArray[np.float64]]:
+    """Vectorized locate().
+
+    Args:
+        grid: Increasing breakpoints (a single breakpoint is allowed).
+        values: Values to locate (clamped to the grid).
+
+    Returns:
+        Lower indices, upper indices and fractions.
+    """
+    if len(grid) == 1:
+        zeros = np.zeros(values.shape, dtype=np.intp)
+        return zeros, zeros, np.zeros(values.shape)
+    values = np.clip(values, grid[0], grid[-1])
+    lower = np.clip(np.searchsorted(grid, values, side="right") - 1, 0, len(grid) - 2)
+    upper = lower + 1
+    fraction: npt.NDArray[np.float64] = (values - grid[lower]) / (grid[upper] - grid[lower])
+    return lower, upper, fraction
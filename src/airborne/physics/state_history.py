@@ -0,0 +1,272 @@
+"""Fixed-capacity aircraft state history for rewind and crash analysis.
+
+StateHistory records AircraftState every physics step into a preallocated
+NumPy ring buffer. record() writes the fields into a preallocated staging row
+and copies it into the ring, so keeping the last N seconds of trajectory
+builds no per-sample containers (the row copies only create NumPy's transient
+row views) and the history never grows. Every sample is written twice, at its
+ring slot and at the same slot in a mirror half, which keeps the samples in
+chronological order in one contiguous block: array, times, positions and the
+other accessors return zero-copy views, with no unwrapping of the ring.
+
+Views alias the buffer and are overwritten as recording continues; copy them
+(e.g., trajectory = history.window(10.0).copy()) to keep the values.
+
+Typical usage example:
+    from airborne.physics.state_history import StateHistory
+
+    history = StateHistory(duration_s=60.0, step_s=1 / 60)
+    history.record(model.get_state(), sim_time)
+
+    altitudes = history.positions[:, 1]        # zero-copy view
+    history.restore(model, sim_time - 5.0)     # rewind five seconds
+"""
+
+import numpy as np
+import numpy.typing as npt
+
+from airborne.physics.flight_model.base import AircraftState, IFlightModel
+
+# Columns of a history row
+TIME = 0
+POSITION = slice(1, 4)
+VELOCITY = slice(4, 7)
+ACCELERATION = slice(7, 10)
+ROTATION = slice(10, 13)
+ANGULAR_VELOCITY = slice(13, 16)
+MASS = 16
+FUEL = 17
+ON_GROUND = 18
+
+ROW_SIZE = 19
+
+
+class StateHistory:
+    """Ring buffer of recent aircraft states.
+
+    Attributes:
+        capacity: Number of samples kept.
+        step_s: Nominal time between samples (seconds).
+
+    Examples:
+        >>> history = StateHistory(duration_s=30.0, step_s=1 / 60)
+        >>> history.record(state, 0.0)
+        >>> history.positions.shape
+        (1, 3)
+    """
+
+    def __init__(self, duration_s: float = 60.0, step_s: float = 1.0 / 60.0) -> None:
+        """Preallocate the history.
+
+        Args:
+            duration_s: Length of history to keep (seconds).
+            step_s: Physics step the history is recorded at (seconds).
+
+        Raises:
+            ValueError: If the duration or step is not positive.
+        """
+        if duration_s <= 0.0 or step_s <= 0.0:
+            raise ValueError("History duration and step must be positive")
+        self.step_s = step_s
+        self.capacity = max(1, round(duration_s / step_s))
+
+        # Rows [0, capacity) are the ring, rows [capacity, 2 * capacity) mirror it
+        self._buffer: npt.NDArray[np.float64] = np.zeros((2 * self.capacity, ROW_SIZE))
+        self._row: npt.NDArray[np.float64] = np.zeros(ROW_SIZE)  # Staging for record()
+        self._next = 0  # Ring slot of the next sample
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Number of samples currently held."""
+        return self._count
+
+    def record(self, state: AircraftState, time: float | None = None) -> None:
+        """Append a state, overwriting the oldest sample when full.
+
+        Args:
+            state: Aircraft state to copy.
+            time: Simulation time (seconds); defaults to one step after the
+                latest sample.
+        """
+        if time is None:
+            time = self.latest_time + self.step_s if self._count else 0.0
+        row = self._row
+        row[TIME] = time
+        pos = state.position
+        row[1] = pos.x
+        row[2] = pos.y
+        row[3] = pos.z
+        vel = state.velocity
+        row[4] = vel.x
+        row[5] = vel.y
+        row[6] = vel.z
+        acc = state.acceleration
+        row[7] = acc.x
+        row[8] = acc.y
+        row[9] = acc.z
+        rot = state.rotation
+        row[10] = rot.x
+        row[11] = rot.y
+        row[12] = rot.z
+        ang = state.angular_velocity
+        row[13] = ang.x
+        row[14] = ang.y
+        row[15] = ang.z
+        row[MASS] = state.mass
+        row[FUEL] = state.fuel
+        row[ON_GROUND] = 1.0 if state.on_ground else 0.0
+        slot = self._next
+        self._buffer[slot] = row
+        self._buffer[slot + self.capacity] = row
+
+        self._next = slot + 1 if slot + 1 < self.capacity else 0
+        if self._count < self.capacity:
+            self._count += 1
+
+    def clear(self) -> None:
+        """Discard all samples (storage is kept)."""
+        self._next = 0
+        self._count = 0
+
+    @property
+    def array(self) -> npt.NDArray[np.float64]:
+        """All samples, oldest first, shape (len, ROW_SIZE) (zero-copy view)."""
+        end = self._next + self.capacity
+        return self._buffer[end - self._count : end]
+
+    @property
+    def times(self) -> npt.NDArray[np.float64]:
+        """Sample times (seconds), oldest first (zero-copy view)."""
+        return self.array[:, TIME]
+
+    @property
+    def positions(self) -> npt.NDArray[np.float64]:
+        """Positions (m), shape (len, 3) (zero-copy view)."""
+        return self.array[:, POSITION]
+
+    @property
+    def velocities(self) -> npt.NDArray[np.float64]:
+        """Velocities (m/s), shape (len, 3) (zero-copy view)."""
+        return self.array[:, VELOCITY]
+
+    @property
+    def rotations(self) -> npt.NDArray[np.float64]:
+        """Euler angles (rad), [pitch, roll, yaw] per row (zero-copy view)."""
+        return self.array[:, ROTATION]
+
+    @property
+    def oldest_time(self) -> float:
+        """Time of the oldest sample (seconds).
+
+        Raises:
+            IndexError: If the history is empty.
+        """
+        if not self._count:
+            raise IndexError("State history is empty")
+        return float(self.array[0, TIME])
+
+    @property
+    def latest_time(self) -> float:
+        """Time of the most recent sample (seconds).
+
+        Raises:
+            IndexError: If the history is empty.
+        """
+        if not self._count:
+            raise IndexError("State history is empty")
+        return float(self._buffer[self._next + self.capacity - 1, TIME])
+
+    def window(self, duration_s: float) -> npt.NDArray[np.float64]:
+        """The most recent samples covering duration_s (zero-copy view).
+
+        Args:
+            duration_s: Length of the window (seconds).
+
+        Returns:
+            Rows from latest_time - duration_s onwards, oldest first.
+        """
+        if not self._count:
+            return self.array
+        return self.array[self.index_at(self.latest_time - duration_s) :]
+
+    def index_at(self, time: float) -> int:
+        """Row of the latest sample at or before time.
+
+        Args:
+            time: Simulation time (seconds); clamped to the recorded range.
+
+        Returns:
+            Index into array (0 is the oldest sample).
+
+        Raises:
+            IndexError: If the history is empty.
+        """
+        if not self._count:
+            raise IndexError("State history is empty")
+        index = int(np.searchsorted(self.times, time, side="right")) - 1
+        return max(0, index)
+
+    def state_at(self, time: float, out: AircraftState | None = None) -> AircraftState:
+        """Reconstruct the state recorded at or before time.
+
+        Args:
+            time: Simulation time (seconds); clamped to the recorded range.
+            out: State to overwrite in place (a new one is created if None).
+
+        Returns:
+            The reconstructed state.
+
+        Raises:
+            IndexError: If the history is empty.
+        """
+        row = self.array[self.index_at(time)].tolist()
+        state = out if out is not None else AircraftState()
+        for vector, start in (
+            (state.position, 1),
+            (state.velocity, 4),
+            (state.acceleration, 7),
+            (state.rotation, 10),
+            (state.angular_velocity, 13),
+        ):
+            vector.set(row[start], row[start + 1], row[start + 2])
+        state.mass = row[MASS]
+        state.fuel = row[FUEL]
+        state.on_ground = row[ON_GROUND] != 0.0
+        state.mark_velocity_dirty()
+        return state
+
+    def truncate(self, time: float) -> None:
+        """Discard samples recorded after time.
+
+        Args:
+            time: Simulation time (seconds).
+        """
+        if not self._count:
+            return
+        keep = int(np.searchsorted(self.times, time, side="right"))
+        dropped = self._count - keep
+        self._next = (self._next - dropped) % self.capacity
+        self._count = keep
+
+    def restore(self, model: IFlightModel, time: float) -> float:
+        """Rewind a flight model to a recorded state.
+
+        Samples after the restored one are discarded, so recording continues
+        from the rewound point.
+
+        Args:
+            model: Flight model to reset.
+            time: Simulation time to rewind to (seconds); the latest sample at
+                or before it is used.
+
+        Returns:
+            Time of the restored sample (seconds).
+
+        Raises:
+            IndexError: If the history is empty.
+        """
+        index = self.index_at(time)
+        restored_time = float(self.times[index])
+        model.reset(self.state_at(restored_time))
+        self.truncate(restored_time)
+        return restored_time
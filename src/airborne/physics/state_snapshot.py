@@ -0,0 +1,304 @@
+"""Reusable aircraft state payload for physics-to-plugin messages.
+
+The physics plugin publishes the aircraft state every tick. Instead of building
+a tree of nested dicts per publish, it keeps one AircraftStateSnapshot backed by
+a flat NumPy array and overwrites it in place. Consumers read attributes and
+NumPy views directly; code that still indexes the payload like the old dict
+(``data["position"]["x"]``) goes through a lazy Mapping adapter that only
+builds the nested dicts it is asked for, once per update.
+
+Typical usage example:
+    from airborne.physics.state_snapshot import AircraftStateSnapshot
+
+    snapshot = AircraftStateSnapshot()
+    snapshot.update_from_state(state, groundspeed_kts)
+
+    altitude = snapshot.position[1]          # NumPy view
+    airspeed = snapshot.airspeed             # float attribute
+    legacy_x = snapshot["position"]["x"]     # dict-style compatibility
+"""
+
+import math
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from airborne.physics.flight_model.base import AircraftState
+
+# Vector fields: name -> (offset into the backing array, dict keys)
+_VECTOR_LAYOUT: dict[str, tuple[int, tuple[str, str, str]]] = {
+    "position": (0, ("x", "y", "z")),
+    "velocity": (3, ("x", "y", "z")),
+    "acceleration": (6, ("x", "y", "z")),
+    "rotation": (9, ("pitch", "roll", "yaw")),
+    "angular_velocity": (12, ("x", "y", "z")),
+    "forward": (15, ("x", "y", "z")),
+    "up": (18, ("x", "y", "z")),
+}
+
+# Scalar fields: name -> offset into the backing array
+_SCALAR_LAYOUT: dict[str, int] = {
+    "airspeed": 21,
+    "groundspeed": 22,
+    "mass": 23,
+    "fuel": 24,
+    "on_ground": 25,
+}
+
+_ARRAY_SIZE = 26
+
+# Key order of the legacy POSITION_UPDATED dict payload
+_KEYS: tuple[str, ...] = (
+    "position",
+    "velocity",
+    "acceleration",
+    "rotation",
+    "angular_velocity",
+    "airspeed",
+    "groundspeed",
+    "mass",
+    "fuel",
+    "on_ground",
+    "forward",
+    "up",
+)
+
+
+class AircraftStateSnapshot(Mapping[str, Any]):
+    """Array-backed aircraft state published with POSITION_UPDATED.
+
+    One instance is owned by the publisher and overwritten every tick, so
+    consumers must copy() it if they need to keep the values across frames.
+    Nested dicts handed out through the Mapping interface are rebuilt after
+    each update and are therefore safe to keep.
+
+    Attributes:
+        array: Flat float64 backing store for every field.
+        position: View of position (m), [x, y, z].
+        velocity: View of velocity (m/s), [x, y, z].
+        acceleration: View of acceleration (m/s²), [x, y, z].
+        rotation: View of Euler angles (rad), [pitch, roll, yaw].
+        angular_velocity: View of angular velocity (rad/s), [x, y, z].
+        forward: View of the forward unit vector, [x, y, z], derived from
+            rotation (heading 0 points along +z, heading 90° along +x).
+        up: View of the up unit vector, [x, y, z], derived from rotation
+            (positive roll tilts it towards the right wing).
+        sequence: Incremented on every update, for change detection.
+
+    Examples:
+        >>> snapshot = AircraftStateSnapshot()
+        >>> snapshot.position[:] = (1.0, 2.0, 3.0)
+        >>> snapshot["position"]
+        {'x': 1.0, 'y': 2.0, 'z': 3.0}
+    """
+
+    __slots__ = (
+        "array",
+        "position",
+        "velocity",
+        "acceleration",
+        "rotation",
+        "angular_velocity",
+        "forward",
+        "up",
+        "sequence",
+        "_dict_cache",
+    )
+
+    def __init__(self) -> None:
+        """Initialize a zeroed snapshot (level, heading 0)."""
+        self.array: npt.NDArray[np.float64] = np.zeros(_ARRAY_SIZE, dtype=np.float64)
+        self.position = self.array[0:3]
+        self.velocity = self.array[3:6]
+        self.acceleration = self.array[6:9]
+        self.rotation = self.array[9:12]
+        self.angular_velocity = self.array[12:15]
+        self.forward = self.array[15:18]
+        self.up = self.array[18:21]
+        self.sequence = 0
+        self._dict_cache: dict[str, Any] = {}
+        self._update_orientation(0.0, 0.0, 0.0)
+
+    @property
+    def airspeed(self) -> float:
+        """Airspeed in m/s."""
+        return float(self.array[21])
+
+    @property
+    def groundspeed(self) -> float:
+        """Ground speed in knots."""
+        return float(self.array[22])
+
+    @property
+    def mass(self) -> float:
+        """Aircraft mass in kg."""
+        return float(self.array[23])
+
+    @property
+    def fuel(self) -> float:
+        """Fuel remaining in kg."""
+        return float(self.array[24])
+
+    @property
+    def on_ground(self) -> bool:
+        """Whether the aircraft is on the ground."""
+        return bool(self.array[25])
+
+    def update_from_state(self, state: AircraftState, groundspeed: float) -> None:
+        """Overwrite the snapshot with the current aircraft state.
+
+        Args:
+            state: Aircraft state from the flight model.
+            groundspeed: Ground speed in knots.
+        """
+        a = self.array
+        pos = state.position
+        vel = state.velocity
+        acc = state.acceleration
+        rot = state.rotation
+        ang = state.angular_velocity
+        a[0], a[1], a[2] = pos.x, pos.y, pos.z
+        a[3], a[4], a[5] = vel.x, vel.y, vel.z
+        a[6], a[7], a[8] = acc.x, acc.y, acc.z
+        a[9], a[10], a[11] = rot.x, rot.y, rot.z
+        a[12], a[13], a[14] = ang.x, ang.y, ang.z
+        self._update_orientation(rot.x, rot.y, rot.z)
+        a[21] = state.get_airspeed()
+        a[22] = groundspeed
+        a[23] = state.mass
+        a[24] = state.fuel
+        a[25] = 1.0 if state.on_ground else 0.0
+
+        self.sequence += 1
+        if self._dict_cache:
+            self._dict_cache.clear()
+
+    def _update_orientation(self, pitch: float, roll: float, yaw: float) -> None:
+        """Write the forward and up unit vectors for Euler angles.
+
+        Args:
+            pitch: Pitch in radians (nose up positive).
+            roll: Roll in radians (right wing down positive).
+            yaw: Heading in radians.
+        """
+        sp, cp = math.sin(pitch), math.cos(pitch)
+        sr, cr = math.sin(roll), math.cos(roll)
+        sy, cy = math.sin(yaw), math.cos(yaw)
+        a = self.array
+        a[15], a[16], a[17] = cp * sy, sp, cp * cy
+        # Up of the unbanked attitude, rotated about forward towards the
+        # right wing (cos(yaw), 0, -sin(yaw))
+        a[18] = sr * cy - cr * sp * sy
+        a[19] = cr * cp
+        a[20] = -sr * sy - cr * sp * cy
+
+    def copy(self) -> "AircraftStateSnapshot":
+        """Create an independent copy that is not overwritten by later updates.
+
+        Returns:
+            New snapshot with the same values and sequence number.
+        """
+        clone = AircraftStateSnapshot()
+        clone.array[:] = self.array
+        clone.sequence = self.sequence
+        return clone
+
+    def interpolate(
+        self, previous: "AircraftStateSnapshot", current: "AircraftStateSnapshot", alpha: float
+    ) -> None:
+        """Overwrite this snapshot with a blend of two others.
+
+        Used to render between two fixed physics steps. Euler angles are
+        blended the short way around; on_ground and the sequence number are
+        taken from ``current``. This snapshot must be distinct from both inputs.
+
+        Args:
+            previous: State at the earlier physics step.
+            current: State at the later physics step.
+            alpha: Blend factor, 0.0 for ``previous`` and 1.0 for ``current``.
+        """
+        a = self.array
+        prev = previous.array
+        np.subtract(current.array, prev, out=a)
+        a *= alpha
+        a += prev
+
+        # Wrap angle deltas into [-pi, pi) so 359° -> 1° does not spin backwards
+        delta = current.rotation - previous.rotation
+        delta += math.pi
+        delta %= 2.0 * math.pi
+        delta -= math.pi
+        np.multiply(delta, alpha, out=self.rotation)
+        self.rotation += previous.rotation
+        pitch, roll, yaw = self.rotation.tolist()
+        self._update_orientation(pitch, roll, yaw)
+
+        a[25] = current.array[25]
+        self.sequence = current.sequence
+        if self._dict_cache:
+            self._dict_cache.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Build the legacy nested-dict payload.
+
+        Returns:
+            Dictionary with the same layout as the old POSITION_UPDATED data.
+        """
+        return {key: self[key] for key in _KEYS}
+
+    def __getitem__(self, key: str) -> Any:
+        """Get a field in legacy dict form, building it on first access.
+
+        Args:
+            key: Legacy payload key (e.g., "position", "airspeed").
+
+        Returns:
+            Dict of axis values for vector fields, float/bool for scalars.
+
+        Raises:
+            KeyError: If the key is not part of the payload.
+        """
+        cached = self._dict_cache.get(key)
+        if cached is not None:
+            return cached
+
+        vector = _VECTOR_LAYOUT.get(key)
+        value: Any
+        if vector is not None:
+            offset, axes = vector
+            a = self.array
+            value = {
+                axes[0]: float(a[offset]),
+                axes[1]: float(a[offset + 1]),
+                axes[2]: float(a[offset + 2]),
+            }
+        elif key == "on_ground":
+            value = self.on_ground
+        elif key in _SCALAR_LAYOUT:
+            value = float(self.array[_SCALAR_LAYOUT[key]])
+        else:
+            raise KeyError(key)
+
+        self._dict_cache[key] = value
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a key is part of the payload."""
+        return key in _VECTOR_LAYOUT or key in _SCALAR_LAYOUT
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over legacy payload keys."""
+        return iter(_KEYS)
+
+    def __len__(self) -> int:
+        """Get the number of legacy payload keys."""
+        return len(_KEYS)
+
+    def __repr__(self) -> str:
+        """Get a readable representation."""
+        return (
+            f"AircraftStateSnapshot(seq={self.sequence}, "
+            f"position={self.position.tolist()}, airspeed={self.airspeed:.2f})"
+        )
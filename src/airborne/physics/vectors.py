@@ -3,12 +3,20 @@
 This module provides vector operations used throughout the physics system,
 including position, velocity, acceleration, and force calculations.
 
+The arithmetic operators return new vectors. Hot loops (the physics step)
+use the in-place methods instead (set, copy_from, iadd, isub, iscale, idiv,
+imul_add, inormalize), which modify the vector and return it so calls can be
+chained, together with scratch vectors allocated once by their owner.
+
 Typical usage example:
     from airborne.physics.vectors import Vector3
 
     position = Vector3(100.0, 500.0, 200.0)
     velocity = Vector3(50.0, 0.0, 10.0)
     new_position = position + velocity * dt
+
+    # Same update without allocating
+    position.imul_add(velocity, dt)
 """
 
 import math
@@ -18,7 +26,7 @@ import numpy as np
 import numpy.typing as npt
 
 
-@dataclass
+@dataclass(slots=True)
 class Vector3:
     """3D vector with common operations.
 
@@ -119,6 +127,136 @@ class Vector3:
         """
         return Vector3(-self.x, -self.y, -self.z)
 
+    def set(self, x: float, y: float, z: float) -> "Vector3":
+        """Set all components in place.
+
+        Args:
+            x: New X component.
+            y: New Y component.
+            z: New Z component.
+
+        Returns:
+            This vector.
+        """
+        self.x = x
+        self.y = y
+        self.z = z
+        return self
+
+    def copy_from(self, other: "Vector3") -> "Vector3":
+        """Copy another vector's components in place.
+
+        Args:
+            other: Vector to copy.
+
+        Returns:
+            This vector.
+        """
+        self.x = other.x
+        self.y = other.y
+        self.z = other.z
+        return self
+
+    def iadd(self, other: "Vector3") -> "Vector3":
+        """Add another vector in place.
+
+        Args:
+            other: Vector to add.
+
+        Returns:
+            This vector.
+
+        Examples:
+            >>> total = Vector3.zero()
+            >>> total.iadd(lift).iadd(drag)
+        """
+        self.x += other.x
+        self.y += other.y
+        self.z += other.z
+        return self
+
+    def isub(self, other: "Vector3") -> "Vector3":
+        """Subtract another vector in place.
+
+        Args:
+            other: Vector to subtract.
+
+        Returns:
+            This vector.
+        """
+        self.x -= other.x
+        self.y -= other.y
+        self.z -= other.z
+        return self
+
+    def iscale(self, scalar: float) -> "Vector3":
+        """Multiply by a scalar in place.
+
+        Args:
+            scalar: Scalar value.
+
+        Returns:
+            This vector.
+        """
+        self.x *= scalar
+        self.y *= scalar
+        self.z *= scalar
+        return self
+
+    def idiv(self, scalar: float) -> "Vector3":
+        """Divide by a scalar in place.
+
+        Args:
+            scalar: Scalar value.
+
+        Returns:
+            This vector.
+
+        Raises:
+            ZeroDivisionError: If scalar is zero.
+        """
+        if scalar == 0:
+            raise ZeroDivisionError("Cannot divide vector by zero")
+        self.x /= scalar
+        self.y /= scalar
+        self.z /= scalar
+        return self
+
+    def imul_add(self, other: "Vector3", scalar: float) -> "Vector3":
+        """Add a scaled vector in place (self += other * scalar).
+
+        Args:
+            other: Vector to scale and add.
+            scalar: Scale applied to other.
+
+        Returns:
+            This vector.
+
+        Examples:
+            >>> position.imul_add(velocity, dt)  # p = p + v*dt
+        """
+        self.x += other.x * scalar
+        self.y += other.y * scalar
+        self.z += other.z * scalar
+        return self
+
+    def inormalize(self) -> "Vector3":
+        """Scale to unit length in place.
+
+        Returns:
+            This vector.
+
+        Raises:
+            ValueError: If magnitude is zero.
+        """
+        mag = self.magnitude()
+        if mag == 0:
+            raise ValueError("Cannot normalize zero vector")
+        self.x /= mag
+        self.y /= mag
+        self.z /= mag
+        return self
+
     def magnitude(self) -> float:
         """Calculate the magnitude (length) of the vector.
 
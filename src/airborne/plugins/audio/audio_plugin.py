@@ -21,6 +21,7 @@ from airborne.core.logging_system import get_logger
 from airborne.core.messaging import Message, MessagePriority, MessageTopic
 from airborne.core.plugin import IPlugin, PluginContext, PluginMetadata, PluginType
 from airborne.core.resource_path import get_data_path, get_resource_path
+from airborne.physics.state_snapshot import AircraftStateSnapshot
 
 logger = get_logger(__name__)
 
@@ -144,7 +145,12 @@ class AudioPlugin(IPlugin):
         tts_config = context.config.get("tts", {})
 
         # Create audio engine and TTS provider
-        if AUDIO_ENGINE_AVAILABLE:
+        if audio_config.get("engine") == "null":
+            from airborne.audio.engine.null_engine import NullAudioEngine
+
+            self.audio_engine = NullAudioEngine()
+            logger.info("NullAudioEngine created (audio output disabled)")
+        elif AUDIO_ENGINE_AVAILABLE:
             try:
                 # Initialize FMOD
                 if FMODEngine is not None:
@@ -187,8 +193,8 @@ class AudioPlugin(IPlugin):
             logger.error("Sound manager disabled due to missing audio engine or TTS")
             self.sound_manager = None
 
-        # Create ATC audio manager for radio communications
-        if self.audio_engine:
+        # Create ATC audio manager for radio communications (needs FMOD DSP effects)
+        if self.audio_engine and audio_config.get("engine") != "null":
             try:
                 from airborne.audio.atc.atc_audio import ATCAudioManager
 
@@ -405,6 +411,11 @@ class AudioPlugin(IPlugin):
                     # TODO: Implement play_raw_samples() in audio engines
                     # self.audio_engine.play_raw_samples(samples, sample_rate)
 
+        elif message.topic == MessageTopic.POSITION_UPDATED and isinstance(
+            message.data, AircraftStateSnapshot
+        ):
+            self._apply_state_snapshot(message.data)
+
         elif message.topic == MessageTopic.POSITION_UPDATED:
             # Update listener position from aircraft position
             data = message.data
@@ -610,6 +621,34 @@ class AudioPlugin(IPlugin):
 
                 self.sound_manager.play_sound_2d(sound_file, volume=0.8)
 
+    def _apply_state_snapshot(self, snapshot: AircraftStateSnapshot) -> None:
+        """Update flight readouts and listener from a physics state snapshot.
+
+        Fast path for POSITION_UPDATED that reads the snapshot's arrays
+        directly instead of going through the dict-style payload.
+
+        Args:
+            snapshot: State published by the physics plugin.
+        """
+        airspeed = snapshot.airspeed
+        groundspeed = snapshot.groundspeed
+        self._airspeed = airspeed
+        self._groundspeed = groundspeed
+
+        if self.sound_manager:
+            self.sound_manager.update_wind_sound(airspeed)
+            self.sound_manager.update_rolling_sound(groundspeed, snapshot.on_ground)
+
+        # Overwrite the listener vectors rather than allocating new ones
+        position = self._listener_position
+        position.x, position.y, position.z = snapshot.position.tolist()
+        forward = self._listener_forward
+        forward.x, forward.y, forward.z = snapshot.forward.tolist()
+        up = self._listener_up
+        up.x, up.y, up.z = snapshot.up.tolist()
+        velocity = self._listener_velocity
+        velocity.x, velocity.y, velocity.z = snapshot.velocity.tolist()
+
     def on_config_changed(self, config: dict[str, Any]) -> None:
         """Handle configuration changes.
 
@@ -3,6 +3,7 @@
 from dataclasses import dataclass
 from enum import Enum
 
+from airborne.core.blackboard import StateBlackboard
 from airborne.core.messaging import Message, MessagePriority, MessageQueue, MessageTopic
 from airborne.core.plugin import IPlugin, PluginContext, PluginMetadata, PluginType
 from airborne.physics.vectors import Vector3
@@ -80,6 +81,7 @@ class TCASPlugin(IPlugin):
         self._own_position = Vector3(0, 0, 0)
         self._own_altitude_ft = 0.0
         self._own_vertical_speed_fpm = 0.0
+        self._own_state_version = 0  # Last blackboard version read
 
         # Traffic targets
         self._targets: dict[str, TrafficTarget] = {}
@@ -107,6 +109,7 @@ class TCASPlugin(IPlugin):
             description="TCAS traffic collision avoidance system",
             dependencies=["electrical"],
             provides=["tcas"],
+            update_rate_hz=10.0,  # Threat analysis does not need frame rate
         )
 
     def initialize(self, context: PluginContext) -> None:
@@ -114,9 +117,11 @@ class TCASPlugin(IPlugin):
         self._context = context
         self._message_queue = context.message_queue
 
-        # Subscribe to messages
+        # Subscribe to messages (own-ship state comes from the blackboard
+        # when there is one, position messages otherwise)
         if self._message_queue:
-            self._message_queue.subscribe(MessageTopic.POSITION_UPDATED, self.handle_message)
+            if context.blackboard is None:
+                self._message_queue.subscribe(MessageTopic.POSITION_UPDATED, self.handle_message)
             self._message_queue.subscribe(MessageTopic.TRAFFIC_UPDATE, self.handle_message)
             self._message_queue.subscribe(MessageTopic.ELECTRICAL_STATE, self.handle_message)
 
@@ -131,6 +136,13 @@ class TCASPlugin(IPlugin):
 
         self._time_accumulator += dt
 
+        # Pull own-ship state from the blackboard when it has changed
+        blackboard = self._context.blackboard if self._context else None
+        if blackboard is not None and blackboard.changed_since(
+            self._own_state_version, "position", "velocity"
+        ):
+            self._read_own_state(blackboard)
+
         # Analyze threats
         self._analyze_traffic()
 
@@ -140,7 +152,8 @@ class TCASPlugin(IPlugin):
     def shutdown(self) -> None:
         """Shutdown plugin."""
         if self._message_queue:
-            self._message_queue.unsubscribe(MessageTopic.POSITION_UPDATED, self.handle_message)
+            if self._context is None or self._context.blackboard is None:
+                self._message_queue.unsubscribe(MessageTopic.POSITION_UPDATED, self.handle_message)
             self._message_queue.unsubscribe(MessageTopic.TRAFFIC_UPDATE, self.handle_message)
             self._message_queue.unsubscribe(MessageTopic.ELECTRICAL_STATE, self.handle_message)
 
@@ -158,12 +171,30 @@ class TCASPlugin(IPlugin):
             self._handle_electrical_state(message)
 
     def _handle_position_update(self, message: Message) -> None:
-        """Handle position update from own aircraft."""
+        """Handle position update from own aircraft (without a blackboard)."""
         data = message.data
         if data and "position" in data:
-            self._own_position = data["position"]
-            self._own_altitude_ft = data.get("altitude_ft", 0.0)
-            self._own_vertical_speed_fpm = data.get("vertical_speed_fpm", 0.0)
+            position = data["position"]
+            if not isinstance(position, Vector3):
+                position = Vector3(position["x"], position["y"], position["z"])
+            self._own_position = position
+            self._own_altitude_ft = data.get("altitude_ft", position.y * 3.28084)
+            if "vertical_speed_fpm" in data:
+                self._own_vertical_speed_fpm = data["vertical_speed_fpm"]
+            elif "velocity" in data:
+                self._own_vertical_speed_fpm = data["velocity"]["y"] * 196.85  # m/s to fpm
+
+    def _read_own_state(self, blackboard: StateBlackboard) -> None:
+        """Update own aircraft state from the shared blackboard.
+
+        Args:
+            blackboard: Aircraft state blackboard.
+        """
+        x, y, z = blackboard.read("position").tolist()
+        self._own_position = Vector3(x, y, z)
+        self._own_altitude_ft = y * 3.28084  # meters to feet
+        self._own_vertical_speed_fpm = float(blackboard.read("velocity")[1]) * 196.85  # m/s to fpm
+        self._own_state_version = blackboard.version
 
     def _handle_traffic_update(self, message: Message) -> None:
         """Handle traffic update from AI traffic plugin."""
@@ -13,8 +13,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
-import yaml
-
+from airborne.core.config import ConfigLoader
 from airborne.core.logging_system import get_logger
 from airborne.core.messaging import Message, MessagePriority, MessageTopic
 from airborne.core.plugin import IPlugin, PluginContext, PluginMetadata, PluginType
@@ -124,6 +123,7 @@ class ChecklistPlugin(IPlugin):
             provides=["checklist_manager"],
             optional=False,
             update_priority=50,  # Mid-range priority
+            update_rate_hz=5.0,  # Auto-verification polls at 5 Hz
             requires_physics=False,
             description="Interactive checklists with challenge-response and auto-verification",
         )
@@ -224,8 +224,7 @@ class ChecklistPlugin(IPlugin):
 
         for yaml_file in checklist_dir.glob("*.yaml"):
             try:
-                with open(yaml_file) as f:
-                    data = yaml.safe_load(f)
+                data = ConfigLoader.load_yaml(yaml_file)
 
                 if not data:
                     continue
@@ -8,20 +8,31 @@ Typical usage:
     physics services to other plugins via the component registry.
 """
 
-from typing import Any
+import math
+from typing import TYPE_CHECKING, Any
 
 from airborne.core.logging_system import get_logger
 from airborne.core.messaging import Message, MessagePriority, MessageTopic
 from airborne.core.plugin import IPlugin, PluginContext, PluginMetadata, PluginType
+from airborne.core.resource_path import get_cache_dir
 from airborne.physics.collision import TerrainCollisionDetector
 from airborne.physics.flight_model.base import AircraftState, ControlInputs, IFlightModel
 from airborne.physics.flight_model.simple_6dof import Simple6DOFFlightModel
-from airborne.physics.ground_physics import GroundContact, GroundPhysics
+from airborne.physics.flight_model.trim import TrimResult, TrimSolver
+from airborne.physics.ground_physics import GroundContact, GroundForces, GroundPhysics
+from airborne.physics.state_history import StateHistory
+from airborne.physics.state_snapshot import AircraftStateSnapshot
 from airborne.physics.vectors import Vector3
-from airborne.systems.propeller import FixedPitchPropeller, IPropeller
+from airborne.systems.propeller import FixedPitchPropeller, IPropeller, PropellerPerformanceMap
+
+if TYPE_CHECKING:
+    from airborne.scenario import SpawnState
 
 logger = get_logger(__name__)
 
+# Simulation rate assumed when the config does not give physics.physics_hz
+DEFAULT_PHYSICS_HZ = 120.0
+
 
 class PhysicsPlugin(IPlugin):
     """Physics plugin that manages flight model and collision detection.
@@ -33,6 +44,8 @@ class PhysicsPlugin(IPlugin):
     The plugin provides:
     - flight_model: IFlightModel instance
     - collision_detector: TerrainCollisionDetector instance
+    - state_history: recent states for rewind() (pass it to
+      FailureAnalyzer(history=...) to attach trajectories to crash analyses)
     """
 
     def __init__(self) -> None:
@@ -52,6 +65,33 @@ class PhysicsPlugin(IPlugin):
         # Terrain elevation (updated via messages)
         self._terrain_elevation: float = 0.0
 
+        # Position update payload, overwritten in place every tick
+        self._state_snapshot = AircraftStateSnapshot()
+
+        # Recent trajectory for rewind (sized in initialize())
+        self._state_history = StateHistory()
+        self._sim_time = 0.0
+        self._rewind_count = 0
+
+        # Ground contact scratch, overwritten in place every grounded tick
+        self._ground_velocity = Vector3.zero()
+        self._ground_forces = GroundForces()
+
+    @property
+    def state_snapshot(self) -> AircraftStateSnapshot:
+        """State published by the most recent update (overwritten every tick)."""
+        return self._state_snapshot
+
+    @property
+    def state_history(self) -> StateHistory:
+        """Recent aircraft states, one per update (oldest overwritten)."""
+        return self._state_history
+
+    @property
+    def rewind_count(self) -> int:
+        """Number of rewinds so far (the published state jumped at each)."""
+        return self._rewind_count
+
     def get_metadata(self) -> PluginMetadata:
         """Return plugin metadata.
 
@@ -95,18 +135,38 @@ class PhysicsPlugin(IPlugin):
         # Initialize flight model with config
         self.flight_model.initialize(flight_model_config)
 
+        # State history: physics.history_seconds of updates at the
+        # simulation rate (physics.physics_hz, set by the main loop)
+        self._state_history = StateHistory(
+            duration_s=physics_config.get("history_seconds", 60.0),
+            step_s=1.0 / physics_config.get("physics_hz", DEFAULT_PHYSICS_HZ),
+        )
+        self._sim_time = 0.0
+
         # Create propeller model if configured
         propeller_config = context.config.get("propeller", {})
         if propeller_config:
             propeller_type = propeller_config.get("type", "fixed_pitch")
             if propeller_type == "fixed_pitch":
-                self.propeller = FixedPitchPropeller(
+                propeller = FixedPitchPropeller(
                     diameter_m=propeller_config.get("diameter_m", 1.905),
                     pitch_ratio=propeller_config.get("pitch_ratio", 0.6),
                     efficiency_static=propeller_config.get("efficiency_static", 0.50),
                     efficiency_cruise=propeller_config.get("efficiency_cruise", 0.80),
                     cruise_advance_ratio=propeller_config.get("cruise_advance_ratio", 0.6),
+                    static_thrust_coefficient=propeller_config.get(
+                        "static_thrust_coefficient", 0.09
+                    ),
                 )
+                self.propeller = propeller
+                if propeller_config.get("performance_map", False):
+                    # Tabulated thrust/efficiency, cached across launches
+                    prop_map = PropellerPerformanceMap.load_or_build(
+                        propeller, get_cache_dir() / "propeller"
+                    )
+                    if propeller_config.get("validate_performance_map", False):
+                        logger.info("Propeller map error: %s", prop_map.validate(propeller))
+                    self.propeller = prop_map
                 # Attach propeller to flight model
                 if hasattr(self.flight_model, "propeller"):
                     self.flight_model.propeller = self.propeller
@@ -203,9 +263,96 @@ class PhysicsPlugin(IPlugin):
                     )
                 )
 
+        # Record the final state of this update
+        self._sim_time += dt
+        self._state_history.record(state, self._sim_time)
+
         # Publish position update
         self._publish_position_update(state)
 
+    def apply_spawn(
+        self,
+        spawn: "SpawnState",
+        max_power_hp: float | None = None,
+        max_rpm: float | None = None,
+    ) -> TrimResult | None:
+        """Place the aircraft at a spawn point.
+
+        The horizontal position follows the published convention (x =
+        longitude, z = latitude) and the aircraft faces the spawn heading.
+        Ground spawns stay at the flight model's ground level (there is no
+        terrain elevation yet). Airborne spawns are trimmed for steady flight
+        at the spawn altitude, airspeed and flight-path angle, and the
+        trimmed throttle, flaps and gear become the current control inputs.
+
+        Args:
+            spawn: Spawn state from SpawnManager.spawn_aircraft().
+            max_power_hp: Rated engine power (hp), needed to trim an
+                airborne spawn with a propeller attached.
+            max_rpm: RPM of the rated power.
+
+        Returns:
+            The applied trim of an airborne spawn, None for ground spawns.
+
+        Raises:
+            TrimError: If no throttle setting holds the airborne spawn
+                conditions (the aircraft is left on the ground).
+            ValueError: If the plugin is not initialized.
+        """
+        model = self.flight_model
+        if not isinstance(model, Simple6DOFFlightModel):
+            raise ValueError("Physics plugin must be initialized before spawning")
+
+        state = model.get_state()
+        state.position.x = spawn.position.x
+        state.position.z = spawn.position.z
+        heading = math.radians(spawn.heading)
+        state.rotation.z = math.atan2(math.sin(heading), math.cos(heading))
+        model.reset(state)
+        if spawn.on_ground:
+            return None
+
+        result = TrimSolver(model, max_power_hp=max_power_hp, max_rpm=max_rpm).trim(
+            airspeed_mps=spawn.airspeed,
+            altitude_m=spawn.position.y,
+            flight_path_deg=spawn.flight_path_deg,
+            heading_deg=spawn.heading,
+        )
+        self.control_inputs.throttle = result.throttle
+        self.control_inputs.flaps = result.flaps
+        self.control_inputs.gear = result.gear
+        logger.info(
+            "Trimmed for %.0f m at %.1f m/s: pitch %.1f°, throttle %.2f",
+            result.altitude_m,
+            result.airspeed_mps,
+            result.pitch_deg,
+            result.throttle,
+        )
+        return result
+
+    def rewind(self, seconds: float) -> float:
+        """Rewind the flight model to a recorded state.
+
+        The rewound state is published straight away, and rewind_count goes
+        up so consumers that blend successive states know not to blend
+        across the jump.
+
+        Args:
+            seconds: How far back to go (limited to the recorded history).
+
+        Returns:
+            Seconds actually rewound (0.0 if nothing is recorded).
+        """
+        if not self.flight_model or not len(self._state_history):
+            return 0.0
+        restored_time = self._state_history.restore(self.flight_model, self._sim_time - seconds)
+        rewound = self._sim_time - restored_time
+        self._sim_time = restored_time
+        self._rewind_count += 1
+        self._publish_position_update(self.flight_model.get_state())
+        logger.info("Rewound flight by %.1f s", rewound)
+        return rewound
+
     def shutdown(self) -> None:
         """Shutdown the physics plugin."""
         if self.context:
@@ -332,12 +479,10 @@ class PhysicsPlugin(IPlugin):
             # Apply realistic ground physics when on ground
             if state.on_ground and self.ground_physics:
                 # Calculate ground speed (horizontal velocity magnitude)
-                ground_velocity = Vector3(state.velocity.x, 0.0, state.velocity.z)
+                ground_velocity = self._ground_velocity.set(state.velocity.x, 0.0, state.velocity.z)
                 ground_speed_mps = ground_velocity.magnitude()
 
                 # Calculate heading from velocity vector
-                import math
-
                 heading_deg = math.degrees(math.atan2(state.velocity.x, state.velocity.z))
 
                 # Create ground contact state
@@ -359,64 +504,49 @@ class PhysicsPlugin(IPlugin):
                     rudder_input=self.control_inputs.yaw,
                     brake_input=brake_input,
                     velocity=ground_velocity,
+                    out=self._ground_forces,
                 )
 
                 # Apply ground forces to aircraft state (convert N to acceleration)
                 # F = ma, so a = F/m
                 if self.ground_physics.mass_kg > 0:
-                    ground_accel = ground_forces.total_force * (1.0 / self.ground_physics.mass_kg)
-                    state.acceleration.x += ground_accel.x
-                    state.acceleration.z += ground_accel.z
+                    inv_mass = 1.0 / self.ground_physics.mass_kg
+                    state.acceleration.x += ground_forces.total_force.x * inv_mass
+                    state.acceleration.z += ground_forces.total_force.z * inv_mass
 
     def _publish_position_update(self, state: AircraftState) -> None:
         """Publish position update message.
 
+        The payload is an AircraftStateSnapshot reused across ticks, so no
+        nested dicts are built unless a consumer asks for dict-style access.
+
         Args:
             state: Aircraft state.
         """
         if not self.context:
             return
 
+        snapshot = self._state_snapshot
+        snapshot.update_from_state(state, self._calculate_groundspeed(state))
+
+        blackboard = self.context.blackboard
+        if blackboard is not None:
+            blackboard.write_many(
+                position=snapshot.position,
+                velocity=snapshot.velocity,
+                rotation=snapshot.rotation,
+                airspeed_mps=snapshot.airspeed,
+                groundspeed_kts=snapshot.groundspeed,
+                on_ground=state.on_ground,
+                mass_kg=state.mass,
+            )
+
         self.context.message_queue.publish(
             Message(
                 sender="physics_plugin",
                 recipients=["*"],
                 topic=MessageTopic.POSITION_UPDATED,
-                data={
-                    "position": {
-                        "x": state.position.x,
-                        "y": state.position.y,
-                        "z": state.position.z,
-                    },
-                    "velocity": {
-                        "x": state.velocity.x,
-                        "y": state.velocity.y,
-                        "z": state.velocity.z,
-                    },
-                    "acceleration": {
-                        "x": state.acceleration.x,
-                        "y": state.acceleration.y,
-                        "z": state.acceleration.z,
-                    },
-                    "rotation": {
-                        "pitch": state.rotation.x,
-                        "roll": state.rotation.y,
-                        "yaw": state.rotation.z,
-                    },
-                    "angular_velocity": {
-                        "x": state.angular_velocity.x,
-                        "y": state.angular_velocity.y,
-                        "z": state.angular_velocity.z,
-                    },
-                    "airspeed": state.get_airspeed(),
-                    "groundspeed": self._calculate_groundspeed(state),  # For rolling sound
-                    "mass": state.mass,
-                    "fuel": state.fuel,
-                    "on_ground": state.on_ground,
-                    # For audio system
-                    "forward": {"x": 0.0, "y": 0.0, "z": 1.0},  # TODO: Calculate from rotation
-                    "up": {"x": 0.0, "y": 1.0, "z": 0.0},  # TODO: Calculate from rotation
-                },
+                data=snapshot,
                 priority=MessagePriority.HIGH,
             )
         )
@@ -431,8 +561,7 @@ class PhysicsPlugin(IPlugin):
             Ground speed in knots.
         """
         # Ground speed = horizontal velocity magnitude (ignore vertical component)
-        ground_velocity = Vector3(state.velocity.x, 0.0, state.velocity.z)
-        ground_speed_mps = ground_velocity.magnitude()
+        ground_speed_mps = math.hypot(state.velocity.x, state.velocity.z)
 
         # Convert m/s to knots (1 m/s = 1.94384 knots)
         ground_speed_knots = ground_speed_mps * 1.94384
@@ -15,9 +15,14 @@ from airborne.core.event_bus import Event
 from airborne.core.logging_system import get_logger
 from airborne.core.messaging import Message, MessagePriority, MessageTopic
 from airborne.core.plugin import IPlugin, PluginContext, PluginMetadata, PluginType
+from airborne.physics.atmosphere import Atmosphere, get_atmosphere
+from airborne.physics.state_snapshot import AircraftStateSnapshot
+from airborne.systems.engines.piston_simple import altitude_power_factor
 
 logger = get_logger(__name__)
 
+PA_PER_INHG = 3386.389  # Pascals per inch of mercury
+
 
 @dataclass
 class EngineStateEvent(Event):
@@ -94,6 +99,11 @@ class SimplePistonEngine(IPlugin):
         self._electrical_available: bool = False
         self._fuel_available: bool = False
 
+        # Ambient air at the aircraft altitude (from POSITION_UPDATED)
+        self._atmosphere: Atmosphere = get_atmosphere()
+        self._ambient_pressure_inhg: float = 29.92
+        self._power_factor: float = 1.0
+
         # Internal state
         self._time_since_start: float = 0.0
         self._starter_time: float = 0.0
@@ -160,6 +170,9 @@ class SimplePistonEngine(IPlugin):
         context.message_queue.subscribe("engine.mixture", self.handle_message)
         context.message_queue.subscribe("engine.throttle", self.handle_message)
 
+        # Subscribe to position updates (altitude sets ambient air)
+        context.message_queue.subscribe(MessageTopic.POSITION_UPDATED, self.handle_message)
+
     def update(self, dt: float) -> None:
         """Update engine state.
 
@@ -195,6 +208,16 @@ class SimplePistonEngine(IPlugin):
             )
         )
 
+        # Share continuous state through the blackboard
+        if self.context.blackboard is not None:
+            self.context.blackboard.write_many(
+                engine_running=self.running,
+                engine_rpm=self.rpm,
+                engine_manifold_pressure_inhg=self.manifold_pressure,
+                engine_power_hp=self._calculate_power(),
+                engine_fuel_flow_gph=self.fuel_flow,
+            )
+
         # Publish message for other plugins
         self.context.message_queue.publish(
             Message(
@@ -230,6 +253,9 @@ class SimplePistonEngine(IPlugin):
             self.context.message_queue.unsubscribe("engine.starter", self.handle_message)
             self.context.message_queue.unsubscribe("engine.mixture", self.handle_message)
             self.context.message_queue.unsubscribe("engine.throttle", self.handle_message)
+            self.context.message_queue.unsubscribe(
+                MessageTopic.POSITION_UPDATED, self.handle_message
+            )
 
         # Engine shutdown
         self.running = False
@@ -287,6 +313,15 @@ class SimplePistonEngine(IPlugin):
                         self.throttle,
                     )
 
+        elif message.topic == MessageTopic.POSITION_UPDATED:
+            # Ambient pressure and density at the aircraft altitude
+            data = message.data
+            if isinstance(data, AircraftStateSnapshot):
+                altitude = float(data.position[1])
+            else:
+                altitude = float(data.get("position", {}).get("y", 0.0))
+            self._set_altitude(altitude)
+
         elif message.topic == MessageTopic.ELECTRICAL_STATE:
             # Update electrical state from electrical system
             data = message.data
@@ -505,10 +540,10 @@ class SimplePistonEngine(IPlugin):
             # No pressure when not spinning
             self.oil_pressure = 0.0
 
-        # Manifold pressure (simplified - should be based on atmospheric and throttle)
+        # Manifold pressure (simplified: ambient pressure less throttle vacuum)
         # Full throttle = atmospheric pressure
         # Closed throttle = vacuum (lower pressure)
-        atmospheric = 29.92  # inches Hg at sea level
+        atmospheric = self._ambient_pressure_inhg
         if self.running:
             # Running engine creates vacuum
             vacuum = (1.0 - self.throttle) * 15.0
@@ -528,6 +563,15 @@ class SimplePistonEngine(IPlugin):
         else:
             self.fuel_flow = 0.0
 
+    def _set_altitude(self, altitude_m: float) -> None:
+        """Update ambient pressure and altitude power loss.
+
+        Args:
+            altitude_m: Aircraft altitude in meters.
+        """
+        self._ambient_pressure_inhg = self._atmosphere.pressure(altitude_m) / PA_PER_INHG
+        self._power_factor = altitude_power_factor(self._atmosphere.density_ratio(altitude_m))
+
     def _calculate_power(self) -> float:
         """Calculate engine power output.
 
@@ -546,5 +590,5 @@ class SimplePistonEngine(IPlugin):
         mixture_efficiency = 1.0 - abs(self.mixture - 0.8) * 0.3
         mixture_efficiency = max(0.5, min(1.0, mixture_efficiency))
 
-        power = max_power * rpm_factor * throttle_factor * mixture_efficiency
+        power = max_power * rpm_factor * throttle_factor * mixture_efficiency * self._power_factor
         return max(0.0, power)
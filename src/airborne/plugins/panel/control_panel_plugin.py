@@ -14,8 +14,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
-import yaml
-
+from airborne.core.config import ConfigLoader
 from airborne.core.logging_system import get_logger
 from airborne.core.messaging import Message, MessagePriority, MessageTopic
 from airborne.core.plugin import IPlugin, PluginContext, PluginMetadata, PluginType
@@ -302,8 +301,7 @@ class ControlPanelPlugin(IPlugin):
             return
 
         try:
-            with open(panel_file) as f:
-                data = yaml.safe_load(f)
+            data = ConfigLoader.load_yaml(panel_file)
 
             if not data or "panels" not in data:
                 return
@@ -17,6 +17,7 @@ Typical usage:
     to other plugins and the main loop via messages and the component registry.
 """
 
+from collections.abc import Mapping
 from typing import Any
 
 from airborne.core.logging_system import get_logger
@@ -363,7 +364,7 @@ class RadioPlugin(IPlugin):
 
         logger.info("ATC controllers and ATIS created for %s (%s)", airport_name, airport_icao)
 
-    def _transmit_request(self, request_type: str, data: dict[str, Any]) -> None:
+    def _transmit_request(self, request_type: str, data: Mapping[str, Any]) -> None:
         """Transmit a request to ATC.
 
         Args:
@@ -49,6 +49,7 @@ class ElectricalPlugin(IPlugin):
             provides=["electrical_system"],
             optional=False,
             update_priority=20,  # Update after physics but before other systems
+            update_rate_hz=20.0,  # Bus voltages change slowly
             requires_physics=False,
             description="Electrical system with battery, alternator, and buses",
         )
@@ -11,6 +11,8 @@ from typing import Any
 from airborne.core.logging_system import get_logger
 from airborne.core.messaging import Message, MessagePriority, MessageTopic
 from airborne.core.plugin import IPlugin, PluginContext, PluginMetadata, PluginType
+from airborne.physics.atmosphere import Atmosphere, get_atmosphere
+from airborne.physics.state_snapshot import AircraftStateSnapshot
 from airborne.systems.engines.base import EngineControls, IEngine
 from airborne.systems.engines.piston_simple import SimplePistonEngine
 
@@ -37,6 +39,9 @@ class EnginePlugin(IPlugin):
         self.electrical_available = False
         self.fuel_available_gph = 0.0
 
+        # Air density at the aircraft altitude (from POSITION_UPDATED)
+        self._atmosphere: Atmosphere = get_atmosphere()
+
         # Current controls
         self.controls = EngineControls(
             throttle=0.0,
@@ -100,6 +105,7 @@ class EnginePlugin(IPlugin):
         context.message_queue.subscribe("engine.magnetos", self.handle_message)
         context.message_queue.subscribe("engine.starter", self.handle_message)
         context.message_queue.subscribe(MessageTopic.SYSTEM_STATE, self.handle_message)
+        context.message_queue.subscribe(MessageTopic.POSITION_UPDATED, self.handle_message)
 
         # Register component
         if context.plugin_registry:
@@ -122,6 +128,16 @@ class EnginePlugin(IPlugin):
         # Get current state
         state = self.engine.get_state()
 
+        # Share continuous state through the blackboard
+        if self.context.blackboard is not None:
+            self.context.blackboard.write_many(
+                engine_running=state.running,
+                engine_rpm=state.rpm or 0.0,
+                engine_manifold_pressure_inhg=state.manifold_pressure_inhg or 0.0,
+                engine_power_hp=state.power_output_hp,
+                engine_fuel_flow_gph=state.fuel_flow_gph,
+            )
+
         # Publish engine state for other systems
         self.context.message_queue.publish(
             Message(
@@ -179,6 +195,9 @@ class EnginePlugin(IPlugin):
             self.context.message_queue.unsubscribe("engine.magnetos", self.handle_message)
             self.context.message_queue.unsubscribe("engine.starter", self.handle_message)
             self.context.message_queue.unsubscribe(MessageTopic.SYSTEM_STATE, self.handle_message)
+            self.context.message_queue.unsubscribe(
+                MessageTopic.POSITION_UPDATED, self.handle_message
+            )
 
             # Unregister component
             if self.context.plugin_registry:
@@ -209,6 +228,15 @@ class EnginePlugin(IPlugin):
                 # Get available fuel flow
                 self.fuel_available_gph = data.get("available_fuel_flow_gph", 0.0)
 
+        elif message.topic == MessageTopic.POSITION_UPDATED:
+            # Air density at the aircraft altitude (altitude power loss)
+            data = message.data
+            if isinstance(data, AircraftStateSnapshot):
+                altitude = float(data.position[1])
+            else:
+                altitude = float(data.get("position", {}).get("y", 0.0))
+            self._set_altitude(altitude)
+
         elif message.topic == "engine.throttle":
             # Throttle lever (0-100%)
             value = message.data.get("value", 0.0)
@@ -265,6 +293,15 @@ class EnginePlugin(IPlugin):
             # In real aircraft, this enriches mixture for cold starts
             pass
 
+    def _set_altitude(self, altitude_m: float) -> None:
+        """Update the engine's air density ratio.
+
+        Args:
+            altitude_m: Aircraft altitude in meters.
+        """
+        if isinstance(self.engine, SimplePistonEngine):
+            self.engine.density_ratio = self._atmosphere.density_ratio(altitude_m)
+
     def on_config_changed(self, config: dict[str, Any]) -> None:
         """Handle configuration changes.
 
@@ -105,6 +105,7 @@ class SimpleElectricalSystem(IPlugin):
             provides=["electrical", "power"],
             optional=False,
             update_priority=60,  # Update after engine
+            update_rate_hz=20.0,  # Bus voltages change slowly
             requires_physics=True,
             description="Simple electrical system with battery and alternator",
         )
@@ -186,6 +187,15 @@ class SimpleElectricalSystem(IPlugin):
             )
         )
 
+        # Share continuous state through the blackboard
+        if self.context.blackboard is not None:
+            self.context.blackboard.write_many(
+                battery_voltage=self.battery_voltage,
+                bus_voltage=self.bus_voltage,
+                alternator_online=self.alternator_online,
+                electrical_power_available=self.bus_voltage > 11.0,
+            )
+
         # Publish message for other plugins
         self.context.message_queue.publish(
             Message(
@@ -182,6 +182,15 @@ class SimpleFuelSystem(IPlugin):
             )
         )
 
+        # Share continuous state through the blackboard
+        if self.context.blackboard is not None:
+            self.context.blackboard.write_many(
+                fuel_total_gal=self._get_total_fuel(),
+                fuel_flow_gph=self.fuel_flow,
+                fuel_pressure_psi=self.fuel_pressure,
+                fuel_available=self._is_fuel_available(),
+            )
+
         # Publish message for other plugins
         self.context.message_queue.publish(
             Message(
@@ -4,6 +4,9 @@ This plugin manages dynamic weight calculation and publishes weight updates
 to the physics system. Weight changes with fuel consumption, passenger loading, etc.
 """
 
+from collections.abc import Mapping
+from typing import Any
+
 from airborne.core.logging_system import get_logger
 from airborne.core.messaging import Message, MessagePriority, MessageTopic
 from airborne.core.plugin import IPlugin, PluginContext, PluginMetadata, PluginType
@@ -132,7 +135,7 @@ class WeightBalancePlugin(IPlugin):
             # Update fuel weight when fuel state changes
             self._update_fuel_weight(message.data)
 
-    def _update_fuel_weight(self, fuel_data: dict) -> None:
+    def _update_fuel_weight(self, fuel_data: Mapping[str, Any]) -> None:
         """Update fuel station weights from fuel system data.
 
         Args:
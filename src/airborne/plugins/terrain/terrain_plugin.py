@@ -19,6 +19,7 @@ from airborne.core.logging_system import get_logger
 from airborne.core.messaging import Message, MessagePriority, MessageTopic
 from airborne.core.plugin import IPlugin, PluginContext, PluginMetadata, PluginType
 from airborne.physics.collision import TerrainCollisionDetector
+from airborne.physics.state_snapshot import AircraftStateSnapshot
 from airborne.physics.vectors import Vector3
 from airborne.terrain import (
     ElevationService,
@@ -71,6 +72,7 @@ class TerrainPlugin(IPlugin):
             provides=["elevation_service", "osm_provider", "terrain_collision_detector"],
             optional=False,
             update_priority=15,  # Update after physics but before other systems
+            update_rate_hz=10.0,  # Elevation lookups at 10 Hz
             requires_physics=False,
             description="Terrain elevation and geographic features plugin",
         )
@@ -203,7 +205,11 @@ class TerrainPlugin(IPlugin):
         if message.topic == MessageTopic.POSITION_UPDATED:
             # Update current position
             data = message.data
-            if "position" in data:
+            if isinstance(data, AircraftStateSnapshot):
+                x, y, z = data.position.tolist()
+                self._current_position = Vector3(x, y, z)
+                self._current_altitude = y
+            elif "position" in data:
                 pos = data["position"]
                 self._current_position = Vector3(
                     float(pos.get("x", 0.0)), float(pos.get("y", 0.0)), float(pos.get("z", 0.0))
@@ -47,6 +47,7 @@ class AITrafficPlugin(IPlugin):
             description="AI traffic generation and management",
             dependencies=[],
             provides=["ai_traffic"],
+            update_rate_hz=10.0,  # Matches the traffic broadcast interval
         )
 
     def initialize(self, context: PluginContext) -> None:
@@ -12,6 +12,7 @@ Typical usage:
         .build()
 """
 
+from airborne.scenario.run import ScenarioEndCondition, ScenarioRunStats
 from airborne.scenario.scenario import (
     EngineState,
     Scenario,
@@ -24,6 +25,8 @@ __all__ = [
     "EngineState",
     "Scenario",
     "ScenarioBuilder",
+    "ScenarioEndCondition",
+    "ScenarioRunStats",
     "SpawnLocation",
     "SpawnManager",
     "SpawnState",
@@ -0,0 +1,132 @@
+"""End conditions and statistics for unattended scenario runs.
+
+Headless runs (``python -m airborne.main --headless``) step the simulation
+until a ScenarioEndCondition is met, tracking a ScenarioRunStats summary that
+is logged and optionally written as JSON at the end.
+
+Typical usage:
+    from airborne.scenario.run import ScenarioEndCondition, ScenarioRunStats
+
+    condition = ScenarioEndCondition(max_sim_time_s=900.0, on_landing=True)
+    stats = ScenarioRunStats()
+    while True:
+        step_simulation(dt)
+        stats.advance(dt)
+        stats.record(physics.state_snapshot)
+        if condition.check(stats):
+            break
+"""
+
+from dataclasses import asdict, dataclass
+from typing import Any
+
+# Unit conversions
+_M_TO_FT = 3.28084
+_MPS_TO_KTS = 1.94384
+
+
+@dataclass
+class ScenarioEndCondition:
+    """When an unattended scenario run ends.
+
+    The run ends as soon as any configured criterion is met.
+
+    Attributes:
+        max_sim_time_s: Simulated time limit in seconds (None for no limit).
+        altitude_ft: End once the aircraft reaches this altitude (MSL, feet).
+        on_landing: End when the aircraft touches down after being airborne.
+
+    Examples:
+        >>> condition = ScenarioEndCondition(max_sim_time_s=300.0, altitude_ft=3000.0)
+    """
+
+    max_sim_time_s: float | None = 600.0
+    altitude_ft: float | None = None
+    on_landing: bool = False
+
+    def check(self, stats: "ScenarioRunStats") -> str | None:
+        """Check whether the run should end.
+
+        Args:
+            stats: Statistics of the run so far.
+
+        Returns:
+            Reason the run ended, or None to keep going.
+        """
+        if self.altitude_ft is not None and stats.altitude_ft >= self.altitude_ft:
+            return "altitude_reached"
+        if self.on_landing and stats.landed:
+            return "landed"
+        if self.max_sim_time_s is not None and stats.sim_time_s >= self.max_sim_time_s:
+            return "time_limit"
+        return None
+
+
+@dataclass
+class ScenarioRunStats:
+    """Summary of an unattended scenario run.
+
+    Attributes:
+        sim_time_s: Simulated time in seconds.
+        wall_time_s: Wall-clock time in seconds.
+        frames: Frames (outer loop iterations) executed.
+        altitude_ft: Current altitude (MSL, feet).
+        airspeed_kts: Current airspeed (knots).
+        max_altitude_ft: Highest altitude reached (MSL, feet).
+        max_airspeed_kts: Highest airspeed reached (knots).
+        airborne: Whether the aircraft has left the ground.
+        landed: Whether the aircraft touched down after being airborne.
+        diverged_frame: First frame whose physics state differed from the
+            replayed recording (None if identical or not replaying).
+        end_reason: Why the run ended (empty while running).
+    """
+
+    sim_time_s: float = 0.0
+    wall_time_s: float = 0.0
+    frames: int = 0
+    altitude_ft: float = 0.0
+    airspeed_kts: float = 0.0
+    max_altitude_ft: float = 0.0
+    max_airspeed_kts: float = 0.0
+    airborne: bool = False
+    landed: bool = False
+    diverged_frame: int | None = None
+    end_reason: str = ""
+
+    @property
+    def time_scale(self) -> float:
+        """Achieved ratio of simulated time to wall-clock time."""
+        return self.sim_time_s / self.wall_time_s if self.wall_time_s > 0 else 0.0
+
+    def advance(self, dt: float) -> None:
+        """Count one frame of simulated time.
+
+        Args:
+            dt: Simulated time covered by the frame in seconds.
+        """
+        self.frames += 1
+        self.sim_time_s += dt
+
+    def record(self, state: Any) -> None:
+        """Update flight statistics from the current physics state.
+
+        Args:
+            state: AircraftStateSnapshot published by the physics plugin.
+        """
+        self.altitude_ft = float(state.position[1]) * _M_TO_FT
+        self.airspeed_kts = state.airspeed * _MPS_TO_KTS
+        self.max_altitude_ft = max(self.max_altitude_ft, self.altitude_ft)
+        self.max_airspeed_kts = max(self.max_airspeed_kts, self.airspeed_kts)
+
+        if not state.on_ground:
+            self.airborne = True
+        elif self.airborne:
+            self.landed = True
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary.
+
+        Returns:
+            Statistics including the achieved time scale.
+        """
+        return {**asdict(self), "time_scale": self.time_scale}
@@ -22,6 +22,7 @@ from dataclasses import dataclass
 from enum import Enum
 
 from airborne.physics.vectors import Vector3
+from airborne.scenario.run import ScenarioEndCondition
 
 logger = logging.getLogger(__name__)
 
@@ -34,12 +35,15 @@ class SpawnLocation(Enum):
         RUNWAY: Active runway threshold
         TAXIWAY: Random taxiway
         GATE: Gate (if available)
+        AIRBORNE: In flight over the airport (the flight model must be
+            trimmed for it, see TrimSolver)
     """
 
     RAMP = "ramp"
     RUNWAY = "runway"
     TAXIWAY = "taxiway"
     GATE = "gate"
+    AIRBORNE = "airborne"
 
 
 class EngineState(Enum):
@@ -74,6 +78,11 @@ class Scenario:
         time_of_day: Hour of day (0-23)
         weather_preset: Weather preset name (optional)
         callsign: Aircraft callsign (if None, auto-generated)
+        end_condition: When an unattended (headless) run ends (optional)
+        spawn_altitude_ft: Altitude of an airborne spawn (MSL, feet)
+        spawn_airspeed_kts: Airspeed of an airborne spawn (knots)
+        spawn_flight_path_deg: Flight-path angle of an airborne spawn
+            (degrees, positive climbing, e.g. -3 on approach)
 
     Examples:
         >>> scenario = Scenario(
@@ -95,6 +104,10 @@ class Scenario:
     time_of_day: int = 12
     weather_preset: str | None = None
     callsign: str | None = None
+    end_condition: ScenarioEndCondition | None = None
+    spawn_altitude_ft: float = 0.0
+    spawn_airspeed_kts: float = 0.0
+    spawn_flight_path_deg: float = 0.0
 
 
 class ScenarioBuilder:
@@ -123,6 +136,10 @@ class ScenarioBuilder:
         self._time_of_day: int = 12
         self._weather_preset: str | None = None
         self._callsign: str | None = None
+        self._end_condition: ScenarioEndCondition | None = None
+        self._spawn_altitude_ft: float = 0.0
+        self._spawn_airspeed_kts: float = 0.0
+        self._spawn_flight_path_deg: float = 0.0
 
     def with_airport(self, icao: str) -> "ScenarioBuilder":
         """Set departure airport.
@@ -172,6 +189,29 @@ class ScenarioBuilder:
         self._spawn_heading = heading % 360
         return self
 
+    def with_airborne_spawn(
+        self, altitude_ft: float, airspeed_kts: float, flight_path_deg: float = 0.0
+    ) -> "ScenarioBuilder":
+        """Start in flight instead of on the ground.
+
+        The spawn state carries these conditions and a running engine;
+        PhysicsPlugin.apply_spawn() trims the flight model for them.
+
+        Args:
+            altitude_ft: Altitude (MSL, feet)
+            airspeed_kts: Airspeed (knots)
+            flight_path_deg: Flight-path angle (degrees, positive climbing)
+
+        Returns:
+            Self for method chaining
+        """
+        self._spawn_location = SpawnLocation.AIRBORNE
+        self._spawn_altitude_ft = altitude_ft
+        self._spawn_airspeed_kts = airspeed_kts
+        self._spawn_flight_path_deg = flight_path_deg
+        self._engine_state = EngineState.RUNNING
+        return self
+
     def with_aircraft(self, aircraft_type: str) -> "ScenarioBuilder":
         """Set aircraft type.
 
@@ -256,6 +296,18 @@ class ScenarioBuilder:
         self._callsign = callsign
         return self
 
+    def with_end_condition(self, condition: ScenarioEndCondition) -> "ScenarioBuilder":
+        """Set when an unattended run of the scenario ends.
+
+        Args:
+            condition: End condition
+
+        Returns:
+            Self for method chaining
+        """
+        self._end_condition = condition
+        return self
+
     def build(self) -> Scenario:
         """Build the scenario.
 
@@ -263,10 +315,13 @@ class ScenarioBuilder:
             Configured scenario instance
 
         Raises:
-            ValueError: If airport_icao not set
+            ValueError: If airport_icao not set, or an airborne spawn has
+                no airspeed
         """
         if not self._airport_icao:
             raise ValueError("Airport ICAO code is required")
+        if self._spawn_location == SpawnLocation.AIRBORNE and self._spawn_airspeed_kts <= 0:
+            raise ValueError("Airborne spawn requires a positive airspeed")
 
         return Scenario(
             airport_icao=self._airport_icao,
@@ -280,6 +335,10 @@ class ScenarioBuilder:
             time_of_day=self._time_of_day,
             weather_preset=self._weather_preset,
             callsign=self._callsign,
+            end_condition=self._end_condition,
+            spawn_altitude_ft=self._spawn_altitude_ft,
+            spawn_airspeed_kts=self._spawn_airspeed_kts,
+            spawn_flight_path_deg=self._spawn_flight_path_deg,
         )
 
     @staticmethod
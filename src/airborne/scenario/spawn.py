@@ -19,6 +19,10 @@ from airborne.scenario.scenario import EngineState, Scenario, SpawnLocation
 
 logger = logging.getLogger(__name__)
 
+# Unit conversions
+_FT_TO_M = 0.3048
+_KTS_TO_MPS = 0.514444
+
 
 @dataclass
 class SpawnState:
@@ -31,6 +35,8 @@ class SpawnState:
         engine_running: Whether engine should be running
         on_ground: Whether aircraft is on ground
         parking_brake: Whether parking brake is set
+        flight_path_deg: Flight-path angle of an airborne spawn (degrees);
+            PhysicsPlugin.apply_spawn() trims the flight model for it
     """
 
     position: Vector3
@@ -39,6 +45,7 @@ class SpawnState:
     engine_running: bool = False
     on_ground: bool = True
     parking_brake: bool = True
+    flight_path_deg: float = 0.0
 
 
 class SpawnManager:
@@ -83,6 +90,9 @@ class SpawnManager:
 
         logger.info(f"Spawning at {airport.name} ({scenario.airport_icao})")
 
+        if scenario.spawn_location == SpawnLocation.AIRBORNE:
+            return self._get_airborne_spawn(scenario, airport.position)
+
         # Determine spawn position
         if scenario.spawn_position:
             position = scenario.spawn_position
@@ -141,6 +151,38 @@ class SpawnManager:
             else:
                 return Vector3(0, 0, 0), 0.0
 
+    def _get_airborne_spawn(self, scenario: Scenario, airport_position: Vector3) -> SpawnState:
+        """Get spawn state in flight.
+
+        Args:
+            scenario: Scenario configuration
+            airport_position: Airport reference point
+
+        Returns:
+            Airborne spawn state over the spawn position (default: airport)
+        """
+        reference = scenario.spawn_position or airport_position
+        position = Vector3(
+            reference.x,
+            scenario.spawn_altitude_ft * _FT_TO_M,
+            reference.z,
+        )
+
+        logger.info(
+            f"Spawning airborne at {scenario.spawn_altitude_ft:.0f} ft, "
+            f"{scenario.spawn_airspeed_kts:.0f} kts"
+        )
+
+        return SpawnState(
+            position=position,
+            heading=scenario.spawn_heading,
+            airspeed=scenario.spawn_airspeed_kts * _KTS_TO_MPS,
+            engine_running=True,
+            on_ground=False,
+            parking_brake=False,
+            flight_path_deg=scenario.spawn_flight_path_deg,
+        )
+
     def _get_runway_spawn(
         self, airport_icao: str, preferred_heading: float
     ) -> tuple[Vector3, float]:
@@ -7,7 +7,7 @@ Realistic behavior:
 - Requires fuel flow from fuel system (dies immediately if zero)
 - Starter draws 150A from electrical system
 - Engine starts only with starter + fuel + magnetos
-- Power output depends on throttle, mixture, and RPM
+- Power output depends on throttle, mixture, RPM and air density (altitude)
 - Realistic fuel consumption based on power setting
 """
 
@@ -19,6 +19,20 @@ from airborne.systems.engines.base import EngineControls, EngineState, EngineTyp
 logger = get_logger(__name__)
 
 
+def altitude_power_factor(density_ratio: float) -> float:
+    """Full-throttle power of a naturally aspirated engine relative to sea level.
+
+    Uses the Gagg-Ferrar relation P/P0 = 1.132σ - 0.132.
+
+    Args:
+        density_ratio: Air density relative to ISA sea level (σ).
+
+    Returns:
+        Power factor (1.0 at sea level, never negative).
+    """
+    return max(0.0, 1.132 * density_ratio - 0.132)
+
+
 @dataclass
 class SimplePistonEngineConfig:
     """Configuration for simple piston engine."""
@@ -70,6 +84,9 @@ class SimplePistonEngine(IEngine):
         self.running = False
         self.starting = False
 
+        # Air density relative to ISA sea level (set from altitude by the owner)
+        self.density_ratio = 1.0
+
         # Failures
         self.failed = False
         self.failure_type: str | None = None
@@ -329,6 +346,9 @@ class SimplePistonEngine(IEngine):
         # Warmup penalty (cold engine makes less power)
         warmup_penalty = 0.7 + 0.3 * self._warmup_factor
 
+        # Thinner air at altitude (naturally aspirated)
+        altitude_factor = altitude_power_factor(self.density_ratio)
+
         # Calculate horsepower
         self.horsepower = (
             self.config.max_horsepower
@@ -336,6 +356,7 @@ class SimplePistonEngine(IEngine):
             * throttle_factor
             * mixture_factor
             * warmup_penalty
+            * altitude_factor
         )
 
         # Manifold pressure (throttle controlled)
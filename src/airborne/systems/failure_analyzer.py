@@ -8,7 +8,8 @@ Typical usage:
     analyzer.record_event(120.5, "Low fuel warning")
     analyzer.record_warning(180.0, "Fuel exhausted")
 
-    # At crash
+    # At crash (with a StateHistory attached, the analysis also carries the
+    # recorded trajectory leading up to impact)
     analysis = analyzer.analyze_failure(failure_snapshot, impact_snapshot)
     report = analyzer.generate_report(analysis)
     print(report)
@@ -18,6 +19,11 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 
+import numpy as np
+import numpy.typing as npt
+
+from airborne.physics.state_history import StateHistory
+
 
 class FailureType(Enum):
     """Types of flight failures.
@@ -107,6 +113,8 @@ class FailureAnalysis:
         lessons_learned: List of lessons for pilot
         timeline: Timeline of events (time_offset, description)
         flight_duration: Total flight duration in seconds
+        trajectory: StateHistory rows (copied) leading up to the analysis,
+            or None without a history
     """
 
     failure_type: FailureType
@@ -119,6 +127,7 @@ class FailureAnalysis:
     lessons_learned: list[str]
     timeline: list[tuple[float, str]]  # (time_offset_seconds, event_description)
     flight_duration: float  # seconds
+    trajectory: npt.NDArray[np.float64] | None = None
 
 
 class FailureAnalyzer:
@@ -131,8 +140,16 @@ class FailureAnalyzer:
     No forgiveness - failures are realistic and analysis is honest.
     """
 
-    def __init__(self):
-        """Initialize failure analyzer."""
+    def __init__(self, history: StateHistory | None = None, trajectory_seconds: float = 30.0):
+        """Initialize failure analyzer.
+
+        Args:
+            history: Recorded aircraft states (e.g., the physics plugin's
+                state_history) to attach to analyses
+            trajectory_seconds: Length of trajectory attached to an analysis
+        """
+        self.history = history
+        self.trajectory_seconds = trajectory_seconds
         self.event_timeline: list[tuple[float, str]] = []
         self.warnings_given: list[tuple[float, str]] = []
         self.flight_start_time: datetime | None = None
@@ -203,6 +220,11 @@ class FailureAnalyzer:
         else:
             duration = 0.0
 
+        # Copy the recent trajectory out of the ring before it is overwritten
+        trajectory = None
+        if self.history is not None and len(self.history):
+            trajectory = self.history.window(self.trajectory_seconds).copy()
+
         return FailureAnalysis(
             failure_type=failure_type,
             primary_cause=primary_cause,
@@ -214,6 +236,7 @@ class FailureAnalyzer:
             lessons_learned=lessons,
             timeline=self.event_timeline,
             flight_duration=duration,
+            trajectory=trajectory,
         )
 
     def _determine_failure_type(
@@ -7,10 +7,13 @@ metrics based on weight, power, atmospheric conditions, and configuration.
 from dataclasses import dataclass
 
 from airborne.core.logging_system import get_logger
+from airborne.physics.atmosphere import Atmosphere, get_atmosphere
 from airborne.systems.performance.vspeeds import VSpeedCalculator, VSpeeds
 
 logger = get_logger(__name__)
 
+FEET_TO_METERS = 0.3048
+
 
 @dataclass
 class TakeoffPerformance:
@@ -46,7 +49,7 @@ class PerformanceCalculator:
         Ground roll: 960 ft
     """
 
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, atmosphere: Atmosphere | None = None):
         """Initialize performance calculator.
 
         Args:
@@ -58,8 +61,10 @@ class PerformanceCalculator:
                 - vspeeds_reference: Reference V-speeds dict
                 - takeoff_reference: Reference takeoff performance dict
                 - max_power_hp: Maximum engine power
+            atmosphere: Atmosphere for density altitude (standard day if None)
         """
         self.config = config
+        self.atmosphere = atmosphere if atmosphere is not None else get_atmosphere()
 
         # V-speed calculator
         ref_weight = config.get("reference_weight_lbs", 2550.0)
@@ -90,6 +95,18 @@ class PerformanceCalculator:
             f"ref_ground_roll={self.ref_ground_roll_ft:.0f} ft"
         )
 
+    def density_altitude_ft(self, pressure_altitude_ft: float) -> float:
+        """Calculate density altitude from the atmosphere tables.
+
+        Args:
+            pressure_altitude_ft: Pressure altitude (ft)
+
+        Returns:
+            Density altitude (ft)
+        """
+        altitude_m = pressure_altitude_ft * FEET_TO_METERS
+        return self.atmosphere.density_altitude(altitude_m) / FEET_TO_METERS
+
     def calculate_vspeeds(self, weight_lbs: float, density_altitude_ft: float = 0.0) -> VSpeeds:
         """Calculate V-speeds for current weight.
 
@@ -242,12 +259,15 @@ class PerformanceCalculator:
 
         return climb_rate
 
-    def get_performance_summary(self, weight_lbs: float, headwind_kts: float = 0.0) -> dict:
+    def get_performance_summary(
+        self, weight_lbs: float, headwind_kts: float = 0.0, pressure_altitude_ft: float = 0.0
+    ) -> dict:
         """Get comprehensive performance summary.
 
         Args:
             weight_lbs: Current aircraft weight (lbs)
             headwind_kts: Headwind component (kts)
+            pressure_altitude_ft: Field pressure altitude (ft)
 
         Returns:
             Dictionary with performance data:
@@ -255,13 +275,18 @@ class PerformanceCalculator:
                 - takeoff: TakeoffPerformance object
                 - climb_rate_fpm: Climb rate
                 - weight_lbs: Input weight
+                - density_altitude_ft: Density altitude used
         """
-        vspeeds = self.calculate_vspeeds(weight_lbs)
-        takeoff = self.calculate_takeoff_distance(weight_lbs, headwind_kts)
-        climb_rate = self.calculate_climb_rate(weight_lbs)
+        density_altitude = self.density_altitude_ft(pressure_altitude_ft)
+        vspeeds = self.calculate_vspeeds(weight_lbs, density_altitude)
+        takeoff = self.calculate_takeoff_distance(
+            weight_lbs, headwind_kts, density_altitude_ft=density_altitude
+        )
+        climb_rate = self.calculate_climb_rate(weight_lbs, density_altitude_ft=density_altitude)
 
         return {
             "weight_lbs": weight_lbs,
+            "density_altitude_ft": density_altitude,
             "vspeeds": vspeeds,
             "takeoff": takeoff,
             "climb_rate_fpm": climb_rate,
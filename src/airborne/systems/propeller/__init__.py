@@ -7,5 +7,6 @@ efficiency characteristics.
 
 from airborne.systems.propeller.base import IPropeller
 from airborne.systems.propeller.fixed_pitch import FixedPitchPropeller
+from airborne.systems.propeller.performance_map import PropellerPerformanceMap
 
-__all__ = ["IPropeller", "FixedPitchPropeller"]
+__all__ = ["IPropeller", "FixedPitchPropeller", "PropellerPerformanceMap"]
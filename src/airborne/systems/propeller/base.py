@@ -42,7 +42,7 @@ class IPropeller(ABC):
 
         Note:
             Implementation should handle v=0 (static thrust) as a special case,
-            using momentum theory rather than power/velocity formula.
+            using a static thrust model rather than the power/velocity formula.
         """
         pass
 
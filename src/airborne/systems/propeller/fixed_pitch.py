@@ -12,6 +12,8 @@ from airborne.systems.propeller.base import IPropeller
 
 logger = get_logger(__name__)
 
+HP_TO_WATTS = 745.7
+
 
 class FixedPitchPropeller(IPropeller):
     """Fixed-pitch propeller model for piston aircraft.
@@ -22,7 +24,7 @@ class FixedPitchPropeller(IPropeller):
 
     Physics model:
     - Advance ratio: J = v / (n × D) where v=airspeed, n=rps, D=diameter
-    - Static thrust (v≈0): T = sqrt(η × P × ρ × A)
+    - Static thrust (v≈0): T = C_T × ρ × n² × D⁴ (thrust coefficient C_T)
     - Dynamic thrust (v>0): T = (η × P) / v
     - Efficiency η varies with J (peaks at cruise, drops at static/high speed)
 
@@ -41,7 +43,7 @@ class FixedPitchPropeller(IPropeller):
         ...     airspeed_mps=0.0,
         ...     air_density_kgm3=1.225
         ... )
-        >>> print(f"Static thrust: {thrust:.0f} N")  # ~785 N (176 lbf)
+        >>> print(f"Static thrust: {thrust:.0f} N")  # ~2940 N (661 lbf)
     """
 
     def __init__(
@@ -51,6 +53,7 @@ class FixedPitchPropeller(IPropeller):
         efficiency_static: float = 0.50,
         efficiency_cruise: float = 0.80,
         cruise_advance_ratio: float = 0.6,
+        static_thrust_coefficient: float = 0.09,
     ):
         """Initialize fixed-pitch propeller.
 
@@ -60,6 +63,8 @@ class FixedPitchPropeller(IPropeller):
             efficiency_static: Efficiency at zero airspeed (typical: 0.45-0.55).
             efficiency_cruise: Peak efficiency at cruise speed (typical: 0.75-0.85).
             cruise_advance_ratio: Advance ratio where efficiency peaks (typical: 0.5-0.7).
+            static_thrust_coefficient: Thrust coefficient C_T at zero airspeed
+                (typical: 0.08-0.12 for light aircraft propellers).
 
         Note:
             Pitch ratio determines optimal operating speed. Higher pitch = faster cruise,
@@ -70,6 +75,7 @@ class FixedPitchPropeller(IPropeller):
         self.efficiency_static = efficiency_static
         self.efficiency_cruise = efficiency_cruise
         self.cruise_advance_ratio = cruise_advance_ratio
+        self.static_thrust_coefficient = static_thrust_coefficient
 
         # Derived properties
         self.disc_area = math.pi * (diameter_m / 2.0) ** 2
@@ -90,7 +96,7 @@ class FixedPitchPropeller(IPropeller):
         """Calculate thrust force in Newtons.
 
         Uses different formulas for static (v≈0) vs dynamic (v>0) conditions:
-        - Static: T = sqrt(η_static × P × ρ × A) - momentum theory
+        - Static: T = C_T × ρ × n² × D⁴ - thrust coefficient
         - Dynamic: T = (η × P) / v - power-velocity relationship
 
         Args:
@@ -109,72 +115,68 @@ class FixedPitchPropeller(IPropeller):
         if power_hp <= 0.0 or rpm <= 0.0:
             return 0.0
 
-        # Convert horsepower to watts
-        power_watts = power_hp * 745.7
+        static, dynamic, limit = self.thrust_coefficients(rpm, airspeed_mps)
+        return thrust_from_coefficients(power_hp, air_density_kgm3, static, dynamic, limit)
+
+    def thrust_coefficients(self, rpm: float, airspeed_mps: float) -> tuple[float, float, float]:
+        """Split the thrust model into power- and density-independent coefficients.
+
+        With P the power in watts and ρ the air density, thrust is
+        min(static × ρ + dynamic × P, limit × ρ); see
+        thrust_from_coefficients(). The coefficients depend only on RPM and
+        airspeed, which lets them be tabulated (see PropellerPerformanceMap).
+
+        Args:
+            rpm: Engine/propeller RPM.
+            airspeed_mps: True airspeed in meters per second.
+
+        Returns:
+            Static (N/(kg/m³)), dynamic (N/W) and limit (N/(kg/m³))
+            coefficients.
+        """
+        if rpm <= 0.0:
+            return 0.0, 0.0, 0.0
 
         # Get propeller efficiency for current conditions
         efficiency = self.get_efficiency(airspeed_mps, rpm)
 
-        # Calculate thrust based on airspeed regime
+        # Static thrust: T = C_T × ρ × n² × D⁴
+        # Where:
+        #   C_T = static thrust coefficient
+        #   ρ = air density (kg/m³)
+        #   n = revolutions per second
+        #   D = propeller diameter (m)
+        rps = rpm / 60.0
+        static = self.static_thrust_coefficient * rps**2 * self.diameter**4
+
+        # Thrust can't exceed static thrust by more than 20%
+        limit = static * 1.2
+
         if airspeed_mps < 1.0:
-            # Static thrust: use momentum theory
-            # T_static = sqrt(η × P × ρ × A)
-            # Where:
-            #   η = propeller efficiency at static conditions
-            #   P = power in Watts
-            #   ρ = air density (kg/m³)
-            #   A = propeller disc area (m²)
-            thrust = math.sqrt(efficiency * power_watts * air_density_kgm3 * self.disc_area)
+            # Static thrust only
+            return static, 0.0, limit
+
+        # Dynamic thrust: blend the static thrust with the power-velocity
+        # relationship T = (η × P) / v, which dominates at high speeds
+
+        # Use empirical blend factor based on advance ratio
+        advance_ratio = airspeed_mps / (rps * self.diameter)
+
+        # Blend between static and dynamic formulas
+        # At J < 0.2: mostly static formula
+        # At J > 0.6: mostly dynamic formula
+        if advance_ratio < 0.2:
+            blend = 0.1  # 90% static, 10% dynamic
+        elif advance_ratio > 0.6:
+            blend = 0.9  # 10% static, 90% dynamic
         else:
-            # Dynamic thrust: Combined momentum and blade element theory
-            # At low speeds, use momentum theory with correction
-            # At high speeds, use power-velocity relationship
+            # Linear interpolation
+            blend = (advance_ratio - 0.2) / (0.6 - 0.2)
 
-            # Momentum theory component (dominates at low speed)
-            thrust_momentum = math.sqrt(
-                efficiency * power_watts * air_density_kgm3 * self.disc_area
-            )
+        # Simple dynamic thrust: η × P / (v + 1), +1 to prevent division issues
+        dynamic = efficiency / (airspeed_mps + 1.0)
 
-            # Power-velocity component (dominates at high speed)
-            # T = (η × P) / (v + v_induced)
-            # Approximate v_induced from momentum theory: v_i = sqrt(T / (2 × ρ × A))
-            # For simplicity, use a blended formula
-
-            # Blended formula that transitions smoothly
-            # At low v: thrust ≈ T_static
-            # At high v: thrust ≈ (η × P) / v
-
-            # Use empirical blend factor based on advance ratio
-            rps = rpm / 60.0
-            if rps > 0:
-                advance_ratio = airspeed_mps / (rps * self.diameter)
-            else:
-                advance_ratio = 0
-
-            # Blend between static and dynamic formulas
-            # At J < 0.2: mostly static formula
-            # At J > 0.6: mostly dynamic formula
-            if advance_ratio < 0.2:
-                blend = 0.1  # 90% static, 10% dynamic
-            elif advance_ratio > 0.6:
-                blend = 0.9  # 10% static, 90% dynamic
-            else:
-                # Linear interpolation
-                blend = (advance_ratio - 0.2) / (0.6 - 0.2)
-
-            # Simple dynamic thrust (with limiting)
-            thrust_dynamic = (efficiency * power_watts) / (
-                airspeed_mps + 1.0
-            )  # +1 to prevent division issues
-
-            # Blend the two methods
-            thrust = (1.0 - blend) * thrust_momentum + blend * thrust_dynamic
-
-            # Clamp to reasonable maximum (can't exceed static thrust by more than 20%)
-            max_thrust = thrust_momentum * 1.2
-            thrust = min(thrust, max_thrust)
-
-        return thrust
+        return (1.0 - blend) * static, blend * dynamic, limit
 
     def get_efficiency(self, airspeed_mps: float, rpm: float) -> float:
         """Get current propeller efficiency based on advance ratio.
@@ -250,3 +252,25 @@ class FixedPitchPropeller(IPropeller):
 
         rps = rpm / 60.0
         return airspeed_mps / (rps * self.diameter)
+
+
+def thrust_from_coefficients(
+    power_hp: float, air_density_kgm3: float, static: float, dynamic: float, limit: float
+) -> float:
+    """Thrust from the coefficients of FixedPitchPropeller.thrust_coefficients().
+
+    Args:
+        power_hp: Engine power output in horsepower.
+        air_density_kgm3: Air density in kg/m³.
+        static: Static coefficient (N/(kg/m³)).
+        dynamic: Dynamic coefficient (N/W).
+        limit: Thrust limit coefficient (N/(kg/m³)).
+
+    Returns:
+        Thrust force in Newtons (0 without power).
+    """
+    if power_hp <= 0.0:
+        return 0.0
+    return min(
+        static * air_density_kgm3 + dynamic * power_hp * HP_TO_WATTS, limit * air_density_kgm3
+    )
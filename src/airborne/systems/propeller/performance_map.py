@@ -0,0 +1,418 @@
+"""Precomputed propeller thrust and efficiency maps.
+
+PropellerPerformanceMap tabulates a FixedPitchPropeller over a uniform
+RPM × airspeed grid and answers thrust and efficiency queries by bilinear
+interpolation, so the flight model no longer runs the advance-ratio,
+efficiency and blending logic on every physics step.
+
+Power and density are not grid axes: thrust is stored as the coefficients
+of FixedPitchPropeller.thrust_coefficients(), in which power and density
+enter analytically (linearly, through ρ and P). The map is therefore exact in
+power and density and only interpolates over RPM and airspeed. Queries
+outside the grid are clamped to the nearest edge.
+
+Maps are built at aircraft load time (a few tens of milliseconds for the
+default grid) or loaded from a cached .npz keyed by the propeller parameters
+and grid (see load_or_build()). validate() reports the interpolation error
+against the analytic model. calculate_thrust_array() evaluates many
+propellers in one vectorized call.
+
+Typical usage example:
+    from airborne.systems.propeller.performance_map import PropellerPerformanceMap
+
+    prop_map = PropellerPerformanceMap.load_or_build(propeller, get_cache_dir() / "propeller")
+    flight_model.propeller = prop_map
+    thrust = prop_map.calculate_thrust(180.0, 2700.0, 50.0, 1.225)
+"""
+
+import hashlib
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+from airborne.core.logging_system import get_logger
+from airborne.physics.interpolation import UniformAxis, mirror
+from airborne.systems.propeller.base import IPropeller
+from airborne.systems.propeller.fixed_pitch import HP_TO_WATTS, FixedPitchPropeller
+
+logger = get_logger(__name__)
+
+# Bump to invalidate every cached map (e.g. after a propeller model change)
+_MAP_FORMAT = 2
+
+# Default grids: (first, last, points). Below idle the engine produces
+# (almost) no power, so the RPM axis starts there and lower RPMs are clamped.
+DEFAULT_RPM_GRID = (500.0, 3000.0, 101)  # 25 RPM steps
+DEFAULT_AIRSPEED_GRID = (0.0, 100.0, 201)  # 0.5 m/s steps
+
+Grid = tuple[float, float, int]
+
+
+def _axis(grid: Grid) -> npt.NDArray[np.float64]:
+    """Breakpoints of a uniform grid.
+
+    Raises:
+        ValueError: If the grid has fewer than two points or is not increasing.
+    """
+    first, last, points = grid
+    if points < 2 or last <= first:
+        raise ValueError(f"Invalid grid {grid}: need at least 2 increasing points")
+    return np.linspace(first, last, int(points))
+
+
+@dataclass(frozen=True)
+class MapValidation:
+    """Interpolation error of a map against the analytic propeller model.
+
+    Attributes:
+        max_error_n: Largest absolute thrust error (N).
+        max_relative_error: Largest thrust error relative to the analytic
+            thrust (where it exceeds 1 N).
+        max_efficiency_error: Largest absolute efficiency error.
+        worst_case: (power_hp, rpm, airspeed_mps, density) of the largest
+            absolute thrust error.
+        samples: Number of thrust comparisons.
+    """
+
+    max_error_n: float
+    max_relative_error: float
+    max_efficiency_error: float
+    worst_case: tuple[float, float, float, float]
+    samples: int
+
+
+class PropellerPerformanceMap(IPropeller):
+    """Tabulated propeller model with O(1) interpolated lookups.
+
+    Drop-in replacement for the analytic propeller: assign it to
+    Simple6DOFFlightModel.propeller.
+
+    Attributes:
+        rpm: RPM breakpoints.
+        airspeed: Airspeed breakpoints (m/s).
+        table: Contiguous array (rpm, airspeed, 4) of the static, dynamic
+            and limit thrust coefficients and the efficiency.
+
+    Examples:
+        >>> prop_map = PropellerPerformanceMap.build(FixedPitchPropeller(diameter_m=1.905))
+        >>> prop_map.calculate_thrust(180.0, 2700.0, 30.0, 1.225)
+    """
+
+    def __init__(self, rpm: npt.ArrayLike, airspeed: npt.ArrayLike, table: npt.ArrayLike) -> None:
+        """Initialize from tabulated values.
+
+        Args:
+            rpm: Uniform RPM breakpoints.
+            airspeed: Uniform airspeed breakpoints (m/s).
+            table: Coefficients and efficiency, shape (rpm, airspeed, 4).
+
+        Raises:
+            ValueError: If the shapes do not match the breakpoints.
+        """
+        self.rpm = np.asarray(rpm, dtype=np.float64)
+        self.airspeed = np.asarray(airspeed, dtype=np.float64)
+        self.table = np.ascontiguousarray(table, dtype=np.float64)
+
+        if len(self.rpm) < 2 or len(self.airspeed) < 2:
+            raise ValueError("Every grid needs at least 2 points")
+        if self.table.shape != (len(self.rpm), len(self.airspeed), 4):
+            raise ValueError(
+                f"Table shape {self.table.shape} does not match grids of sizes "
+                f"{len(self.rpm)} and {len(self.airspeed)}"
+            )
+
+        # Uniform axes and a flat list mirror for the scalar lookups
+        self._rpm_axis = UniformAxis(
+            float(self.rpm[0]), float(self.rpm[1] - self.rpm[0]), len(self.rpm)
+        )
+        self._speed_axis = UniformAxis(
+            float(self.airspeed[0]), float(self.airspeed[1] - self.airspeed[0]), len(self.airspeed)
+        )
+        self._row = len(self.airspeed) * 4
+        self._flat = mirror(self.table)
+
+    @classmethod
+    def build(
+        cls,
+        propeller: FixedPitchPropeller,
+        rpm_grid: Grid = DEFAULT_RPM_GRID,
+        airspeed_grid: Grid = DEFAULT_AIRSPEED_GRID,
+    ) -> "PropellerPerformanceMap":
+        """Tabulate a propeller.
+
+        Args:
+            propeller: Analytic propeller model.
+            rpm_grid: (first, last, points) of the RPM axis.
+            airspeed_grid: (first, last, points) of the airspeed axis (m/s).
+
+        Returns:
+            The performance map.
+
+        Raises:
+            ValueError: If a grid is invalid.
+        """
+        rpm, airspeed = _axis(rpm_grid), _axis(airspeed_grid)
+        table = np.empty((len(rpm), len(airspeed), 4))
+        for i, r in enumerate(rpm.tolist()):
+            for j, v in enumerate(airspeed.tolist()):
+                table[i, j, :3] = propeller.thrust_coefficients(r, v)
+                table[i, j, 3] = propeller.get_efficiency(v, r)
+        return cls(rpm, airspeed, table)
+
+    @classmethod
+    def load_or_build(
+        cls,
+        propeller: FixedPitchPropeller,
+        cache_dir: str | Path | None = None,
+        rpm_grid: Grid = DEFAULT_RPM_GRID,
+        airspeed_grid: Grid = DEFAULT_AIRSPEED_GRID,
+    ) -> "PropellerPerformanceMap":
+        """Load a cached map for the propeller, building and caching it if needed.
+
+        Args:
+            propeller: Analytic propeller model.
+            cache_dir: Directory of cached maps (None: always build).
+            rpm_grid: (first, last, points) of the RPM axis.
+            airspeed_grid: (first, last, points) of the airspeed axis (m/s).
+
+        Returns:
+            The performance map.
+        """
+        if cache_dir is None:
+            return cls.build(propeller, rpm_grid, airspeed_grid)
+
+        key = repr(
+            (
+                _MAP_FORMAT,
+                propeller.diameter,
+                propeller.pitch_ratio,
+                propeller.efficiency_static,
+                propeller.efficiency_cruise,
+                propeller.cruise_advance_ratio,
+                propeller.static_thrust_coefficient,
+                tuple(rpm_grid),
+                tuple(airspeed_grid),
+            )
+        )
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        cache_file = Path(cache_dir) / f"propeller_{digest}.npz"
+
+        if cache_file.exists():
+            try:
+                return cls.load(cache_file)
+            except (OSError, ValueError, KeyError) as e:
+                logger.debug("Ignoring unreadable propeller map %s: %s", cache_file, e)
+
+        prop_map = cls.build(propeller, rpm_grid, airspeed_grid)
+        prop_map.save(cache_file)
+        return prop_map
+
+    @classmethod
+    def load(cls, path: str | Path) -> "PropellerPerformanceMap":
+        """Load a map saved with save().
+
+        Args:
+            path: .npz file.
+
+        Returns:
+            The performance map.
+
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If the file is not a valid map.
+            KeyError: If an array is missing.
+        """
+        with np.load(path) as data:
+            return cls(data["rpm"], data["airspeed"], data["table"])
+
+    def save(self, path: str | Path) -> None:
+        """Atomically save the map as .npz (failures are logged, not raised).
+
+        Args:
+            path: Destination file.
+        """
+        path = Path(path)
+        tmp_file = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp_file.open("wb") as f:
+                np.savez(f, rpm=self.rpm, airspeed=self.airspeed, table=self.table)
+            os.replace(tmp_file, path)
+        except OSError as e:
+            logger.warning("Failed to write propeller map %s: %s", path, e)
+
+    def _interpolate(self, rpm: float, airspeed_mps: float) -> tuple[int, float, float]:
+        """Locate a query in the grid (clamped).
+
+        Returns:
+            Flat index of the lower corner and fractions along RPM and airspeed.
+        """
+        i, ti = self._rpm_axis.locate(rpm)
+        j, tj = self._speed_axis.locate(airspeed_mps)
+        return i * self._row + j * 4, ti, tj
+
+    def thrust_coefficients(self, rpm: float, airspeed_mps: float) -> tuple[float, float, float]:
+        """Interpolate the thrust coefficients (bilinear).
+
+        Args:
+            rpm: Engine/propeller RPM.
+            airspeed_mps: True airspeed in meters per second.
+
+        Returns:
+            Static, dynamic and limit coefficients (see
+            FixedPitchPropeller.thrust_coefficients()).
+        """
+        lo, ti, tj = self._interpolate(rpm, airspeed_mps)
+        hi = lo + self._row
+        f = self._flat
+        a = 1.0 - ti
+        result = []
+        for c in range(3):
+            low = f[lo + c] + (f[lo + 4 + c] - f[lo + c]) * tj
+            high = f[hi + c] + (f[hi + 4 + c] - f[hi + c]) * tj
+            result.append(a * low + ti * high)
+        return result[0], result[1], result[2]
+
+    def calculate_thrust(
+        self,
+        power_hp: float,
+        rpm: float,
+        airspeed_mps: float,
+        air_density_kgm3: float,
+    ) -> float:
+        """Calculate thrust force in Newtons from the map.
+
+        Args:
+            power_hp: Engine power output in horsepower.
+            rpm: Engine/propeller RPM.
+            airspeed_mps: True airspeed in meters per second.
+            air_density_kgm3: Air density in kg/m³.
+
+        Returns:
+            Thrust force in Newtons (0 if power or RPM is zero).
+        """
+        if power_hp <= 0.0 or rpm <= 0.0:
+            return 0.0
+
+        lo, ti, tj = self._interpolate(rpm, airspeed_mps)
+        hi = lo + self._row
+        f = self._flat
+        sj = 1.0 - tj
+        si = 1.0 - ti
+        static = si * (sj * f[lo] + tj * f[lo + 4]) + ti * (sj * f[hi] + tj * f[hi + 4])
+        dynamic = si * (sj * f[lo + 1] + tj * f[lo + 5]) + ti * (sj * f[hi + 1] + tj * f[hi + 5])
+        limit = si * (sj * f[lo + 2] + tj * f[lo + 6]) + ti * (sj * f[hi + 2] + tj * f[hi + 6])
+
+        return min(
+            static * air_density_kgm3 + dynamic * power_hp * HP_TO_WATTS,
+            limit * air_density_kgm3,
+        )
+
+    def get_efficiency(self, airspeed_mps: float, rpm: float) -> float:
+        """Interpolate the propeller efficiency (bilinear).
+
+        Args:
+            airspeed_mps: True airspeed in meters per second.
+            rpm: Engine/propeller RPM.
+
+        Returns:
+            Propeller efficiency as fraction (0.0 to 1.0).
+        """
+        if rpm <= 0.0:
+            return 0.0
+        lo, ti, tj = self._interpolate(rpm, airspeed_mps)
+        hi = lo + self._row
+        f = self._flat
+        low = f[lo + 3] + (f[lo + 7] - f[lo + 3]) * tj
+        high = f[hi + 3] + (f[hi + 7] - f[hi + 3]) * tj
+        return low + (high - low) * ti
+
+    def calculate_thrust_array(
+        self,
+        power_hp: npt.ArrayLike,
+        rpm: npt.ArrayLike,
+        airspeed_mps: npt.ArrayLike,
+        air_density_kgm3: npt.ArrayLike,
+    ) -> npt.NDArray[np.float64]:
+        """Calculate thrust for many propellers at once.
+
+        Args:
+            power_hp: Engine powers (hp).
+            rpm: RPMs.
+            airspeed_mps: True airspeeds (m/s).
+            air_density_kgm3: Air densities (kg/m³).
+
+        Returns:
+            Thrust forces in Newtons (1-D, broadcast length of the arguments).
+        """
+        power, rpm_, speed, rho = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(power_hp, dtype=np.float64)),
+            np.asarray(rpm, dtype=np.float64),
+            np.asarray(airspeed_mps, dtype=np.float64),
+            np.asarray(air_density_kgm3, dtype=np.float64),
+        )
+        i, ti = self._rpm_axis.locate_array(rpm_)
+        j, tj = self._speed_axis.locate_array(speed)
+
+        table = self.table
+        ti = ti[:, None]
+        tj = tj[:, None]
+        low = table[i, j, :3] + (table[i, j + 1, :3] - table[i, j, :3]) * tj
+        high = table[i + 1, j, :3] + (table[i + 1, j + 1, :3] - table[i + 1, j, :3]) * tj
+        static, dynamic, limit = (low + (high - low) * ti).T
+
+        thrust: npt.NDArray[np.float64] = np.minimum(
+            static * rho + dynamic * power * HP_TO_WATTS, limit * rho
+        )
+        thrust[(power <= 0.0) | (rpm_ <= 0.0)] = 0.0
+        return thrust
+
+    def validate(
+        self,
+        propeller: FixedPitchPropeller,
+        powers_hp: tuple[float, ...] = (45.0, 90.0, 135.0, 180.0),
+        air_density_kgm3: float = 1.225,
+    ) -> MapValidation:
+        """Compare the map against the analytic model at cell midpoints.
+
+        Midpoints are where bilinear interpolation errs most. Errors
+        concentrate where the analytic model has kinks or jumps: the
+        static/dynamic switch at 1 m/s and the advance-ratio breakpoints of
+        the efficiency curve and thrust blend.
+
+        Args:
+            propeller: Analytic model the map was built from.
+            powers_hp: Engine powers to compare at.
+            air_density_kgm3: Air density to compare at (the map is exact in
+                density, up to the same relative error).
+
+        Returns:
+            Error summary.
+        """
+        rpms = ((self.rpm[:-1] + self.rpm[1:]) / 2.0).tolist()
+        speeds = ((self.airspeed[:-1] + self.airspeed[1:]) / 2.0).tolist()
+        rho = air_density_kgm3
+
+        max_error = max_relative = max_efficiency = 0.0
+        worst = (0.0, 0.0, 0.0, rho)
+        samples = 0
+        for rpm in rpms:
+            for speed in speeds:
+                efficiency_error = abs(
+                    self.get_efficiency(speed, rpm) - propeller.get_efficiency(speed, rpm)
+                )
+                max_efficiency = max(max_efficiency, efficiency_error)
+                for power in powers_hp:
+                    expected = propeller.calculate_thrust(power, rpm, speed, rho)
+                    error = abs(self.calculate_thrust(power, rpm, speed, rho) - expected)
+                    samples += 1
+                    if error > max_error:
+                        max_error = error
+                        worst = (power, rpm, speed, rho)
+                    if expected > 1.0:
+                        max_relative = max(max_relative, error / expected)
+
+        return MapValidation(max_error, max_relative, max_efficiency, worst, samples)
@@ -0,0 +1,254 @@
+"""Cached, dirty-region text rendering for the pygame status window.
+
+The status window shows a handful of text lines that mostly change a few
+times per second while the window is redrawn at the render rate. Rendering a
+string with pygame.font is by far the most expensive part of drawing it, and
+flipping the whole display is the second.
+
+TextSurfaceCache keeps rendered text surfaces keyed by (font, text, color)
+with least-recently-used eviction. DirtyTextRenderer draws named text slots
+onto a surface and only repaints a slot when its text, color or position
+changed (or when it appeared or disappeared). It returns the rectangles that
+changed so the caller can pass them to pygame.display.update() instead of
+flipping the whole display. Slots that did not change are never re-rendered,
+so static text (titles, instructions) is effectively drawn once.
+
+Typical usage example:
+    from airborne.ui.text_renderer import DirtyTextRenderer
+
+    renderer = DirtyTextRenderer()
+    while running:
+        renderer.begin_frame(screen)
+        renderer.draw("title", large_font, "AirBorne", (255, 255, 255), center=(400, 50))
+        pygame.display.update(renderer.end_frame())
+"""
+
+from collections import OrderedDict
+from typing import Any
+
+import pygame
+
+Color = tuple[int, int, int]
+
+# Rendered strings kept by default; a few changing values times their recent
+# history is far below this.
+_DEFAULT_MAX_ENTRIES = 256
+
+
+class TextSurfaceCache:
+    """LRU cache of rendered text surfaces.
+
+    Examples:
+        >>> cache = TextSurfaceCache(max_entries=128)
+        >>> surface = cache.render(font, "ALTITUDE: 1200 FT", (0, 255, 0))
+        >>> cache.render(font, "ALTITUDE: 1200 FT", (0, 255, 0)) is surface
+        True
+    """
+
+    def __init__(self, max_entries: int = _DEFAULT_MAX_ENTRIES) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Surfaces kept before the least recently used is evicted.
+
+        Raises:
+            ValueError: If max_entries is not positive.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self._surfaces: OrderedDict[tuple[Any, str, Color], pygame.Surface] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def render(self, font: Any, text: str, color: Color) -> pygame.Surface:
+        """Get the antialiased surface for a string, rendering it on a miss.
+
+        Args:
+            font: pygame Font to render with.
+            text: String to render.
+            color: RGB text color.
+
+        Returns:
+            The rendered surface (shared; do not modify it).
+        """
+        key = (font, text, color)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        rendered: pygame.Surface = font.render(text, True, color)
+        self._surfaces[key] = rendered
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return rendered
+
+    def clear(self) -> None:
+        """Drop every cached surface."""
+        self._surfaces.clear()
+
+
+class _Slot:
+    """Text currently shown in one named slot."""
+
+    __slots__ = ("font", "text", "color", "surface", "rect")
+
+    def __init__(
+        self, font: Any, text: str, color: Color, surface: pygame.Surface, rect: pygame.Rect
+    ) -> None:
+        self.font = font
+        self.text = text
+        self.color = color
+        self.surface = surface
+        self.rect = rect
+
+
+class DirtyTextRenderer:
+    """Draw named text slots, repainting only what changed.
+
+    Every frame, call begin_frame(), draw() each visible slot, then
+    end_frame(). Slots drawn in the previous frame but not in this one are
+    erased. Changed areas are cleared to the background color and every slot
+    overlapping them is repainted (clipped to the area), so overlapping text
+    stays intact.
+
+    The first frame, a target surface of a new size or a call to invalidate()
+    repaints the whole surface; end_frame() then returns a single rectangle
+    covering it.
+
+    Examples:
+        >>> renderer = DirtyTextRenderer(background=(0, 0, 0))
+        >>> renderer.begin_frame(screen)
+        >>> renderer.draw("fps", font, f"FPS: {fps:.1f}", (0, 255, 0), topleft=(10, 10))
+        >>> dirty_rects = renderer.end_frame()
+        >>> pygame.display.update(dirty_rects)
+    """
+
+    def __init__(
+        self, background: Color = (0, 0, 0), cache: TextSurfaceCache | None = None
+    ) -> None:
+        """Initialize the renderer.
+
+        Args:
+            background: RGB color erased areas are filled with.
+            cache: Text surface cache to use (a private one by default).
+        """
+        self.background = background
+        self.cache = cache or TextSurfaceCache()
+        self._surface: pygame.Surface | None = None
+        self._size: tuple[int, int] | None = None
+        self._slots: dict[str, _Slot] = {}
+        self._drawn: dict[str, _Slot] = {}
+        self._dirty: list[pygame.Rect] = []
+        self._full_redraw = True
+
+    def invalidate(self) -> None:
+        """Repaint the whole surface on the next frame."""
+        self._full_redraw = True
+
+    def begin_frame(self, surface: pygame.Surface) -> None:
+        """Start drawing a frame.
+
+        Args:
+            surface: Surface the slots are drawn on (usually the display).
+        """
+        size = surface.get_size()
+        if surface is not self._surface or size != self._size:
+            self._surface = surface
+            self._size = size
+            self._full_redraw = True
+        self._drawn = {}
+        self._dirty = []
+
+    def draw(
+        self,
+        slot: str,
+        font: Any,
+        text: str,
+        color: Color,
+        *,
+        topleft: tuple[int, int] | None = None,
+        center: tuple[int, int] | None = None,
+    ) -> None:
+        """Show text in a slot for this frame.
+
+        Args:
+            slot: Unique name of the slot (e.g., "instrument.airspeed").
+            font: pygame Font to render with.
+            text: String to show.
+            color: RGB text color.
+            topleft: Position of the top-left corner of the text.
+            center: Position of the center of the text (used if topleft is None).
+
+        Raises:
+            ValueError: If neither topleft nor center is given.
+        """
+        previous = self._slots.get(slot)
+        if (
+            previous is not None
+            and previous.text == text
+            and previous.color == color
+            and previous.font is font
+        ):
+            # Same text: keep the surface, only the position may have moved
+            surface = previous.surface
+        else:
+            surface = self.cache.render(font, text, color)
+
+        if topleft is not None:
+            rect = surface.get_rect(topleft=topleft)
+        elif center is not None:
+            rect = surface.get_rect(center=center)
+        else:
+            raise ValueError("draw() needs topleft or center")
+
+        current = _Slot(font, text, color, surface, rect)
+        self._drawn[slot] = current
+        if previous is None:
+            self._dirty.append(rect)
+        elif previous.surface is not surface or previous.rect != rect:
+            self._dirty.append(previous.rect.union(rect))
+
+    def end_frame(self) -> list[pygame.Rect]:
+        """Repaint the changed areas of the frame.
+
+        Returns:
+            Rectangles of the surface that changed (empty if nothing did).
+        """
+        surface = self._surface
+        if surface is None:
+            return []
+
+        for slot, previous in self._slots.items():
+            if slot not in self._drawn:
+                self._dirty.append(previous.rect)
+        self._slots = self._drawn
+
+        if self._full_redraw:
+            self._full_redraw = False
+            surface.fill(self.background)
+            for current in self._slots.values():
+                surface.blit(current.surface, current.rect)
+            return [surface.get_rect()]
+
+        if not self._dirty:
+            return []
+
+        bounds = surface.get_rect()
+        dirty = [rect.clip(bounds) for rect in self._dirty]
+        dirty = [rect for rect in dirty if rect.width and rect.height]
+        slots = list(self._slots.values())
+        for area in dirty:
+            surface.set_clip(area)
+            surface.fill(self.background, area)
+            for current in slots:
+                if current.rect.colliderect(area):
+                    surface.blit(current.surface, current.rect)
+        surface.set_clip(None)
+        return dirty
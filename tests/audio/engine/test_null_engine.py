@@ -0,0 +1,38 @@
+"""Tests for the silent audio engine."""
+
+from airborne.audio.engine.base import SourceState, Vector3
+from airborne.audio.engine.null_engine import NullAudioEngine
+
+
+class TestNullAudioEngine:
+    """Test suite for NullAudioEngine."""
+
+    def test_load_sound_does_not_read_file(self) -> None:
+        """Test loading a nonexistent file returns a placeholder sound."""
+        engine = NullAudioEngine()
+        engine.initialize({})
+
+        sound = engine.load_sound("does/not/exist.wav")
+
+        assert sound.path == "does/not/exist.wav"
+        assert sound.duration == 0.0
+        assert engine.load_sound("does/not/exist.wav") is sound
+
+    def test_play_returns_unique_stopped_sources(self) -> None:
+        """Test played sources get unique IDs and finish immediately."""
+        engine = NullAudioEngine()
+        engine.initialize({})
+        sound = engine.load_sound("beep.wav")
+
+        first = engine.play_2d(sound, loop=True)
+        second = engine.play_3d(sound, Vector3(1.0, 0.0, 0.0))
+
+        assert first != second
+        assert engine.play_count == 2
+        assert engine.get_source_state(first) == SourceState.STOPPED
+
+    def test_master_volume_clamped(self) -> None:
+        """Test master volume is clamped to [0, 1]."""
+        engine = NullAudioEngine()
+        engine.set_master_volume(2.0)
+        assert engine._master_volume == 1.0
@@ -0,0 +1,12 @@
+"""Physics micro-benchmarks.
+
+Measures ns/step and allocations/step of the physics hot paths and compares
+them with the baselines in baselines.json. Run from the repository root:
+
+    python -m tests.benchmarks              # fail (exit 1) on regression
+    python -m tests.benchmarks --update     # record new baselines
+    python -m tests.benchmarks --filter vector3
+
+Baselines are machine specific: re-record them (--update) on the machine
+that runs the comparison, and commit them only from a quiet machine.
+"""
@@ -0,0 +1,92 @@
+"""Run the physics benchmarks and compare them with the baselines."""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from tests.benchmarks.harness import (
+    find_regressions,
+    load_baselines,
+    load_machine,
+    machine_differences,
+    measure_all,
+    save_baselines,
+)
+from tests.benchmarks.physics_benchmarks import BENCHMARKS
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines.json"
+
+
+def main() -> int:
+    """Run the benchmarks.
+
+    Returns:
+        0 on success, 1 if a benchmark regressed past the threshold. Baselines
+        recorded by another interpreter or on another kind of machine are
+        shown for reference but not gated.
+    """
+    parser = argparse.ArgumentParser(description="Physics micro-benchmarks")
+    parser.add_argument(
+        "--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON file"
+    )
+    parser.add_argument(
+        "--update", action="store_true", help="Record the results as the new baselines"
+    )
+    parser.add_argument("--filter", default="", help="Only run benchmarks containing this text")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.3,
+        help="Allowed slowdown before failing (default: 0.3 = 30%%)",
+    )
+    parser.add_argument("--steps", type=int, default=2000, help="Steps per timed batch")
+    parser.add_argument("--repeats", type=int, default=15, help="Timed batches per benchmark")
+    args = parser.parse_args()
+
+    # Time the physics, not log record handling (debug records are otherwise
+    # queued to the logging thread, and setup messages clutter the table)
+    logging.disable(logging.INFO)
+
+    baselines = load_baselines(args.baseline)
+    differences = machine_differences(load_machine(args.baseline)) if baselines else []
+    selected = {name: factory for name, factory in BENCHMARKS.items() if args.filter in name}
+    results = measure_all(selected, steps=args.steps, repeats=args.repeats)
+
+    print(f"{'benchmark':<42} {'ns/step':>10} {'baseline':>10} {'peak B':>8} {'kept/step':>10}")
+    for name, result in results.items():
+        baseline = baselines.get(name)
+        baseline_ns = f"{baseline.ns_per_step:.0f}" if baseline else "-"
+        print(
+            f"{name:<42} {result.ns_per_step:>10.0f} {baseline_ns:>10} "
+            f"{result.peak_bytes_per_step:>8.0f} {result.retained_blocks_per_step:>10.3f}"
+        )
+
+    if args.update:
+        # Keep baselines of benchmarks that were filtered out, unless they
+        # were recorded elsewhere (one file describes one machine)
+        if differences:
+            print("\nDiscarding baselines recorded on another machine")
+            baselines = {}
+        save_baselines(args.baseline, {**baselines, **results})
+        print(f"\nBaselines written to {args.baseline}")
+        return 0
+
+    regressions = find_regressions(results, baselines, time_threshold=args.threshold)
+    if differences:
+        print("\nBaselines were recorded on a different machine, not gating:")
+        for message in differences + regressions:
+            print(f"  {message}")
+        print("Run with --update to record baselines for this machine")
+        return 0
+    if regressions:
+        print("\nRegressions:")
+        for message in regressions:
+            print(f"  {message}")
+        return 1
+    print("\nNo regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,280 @@
+"""Measurement and regression gating for the physics micro-benchmarks.
+
+Each benchmark is a factory returning a zero-argument step function. The
+harness times batches of steps with perf_counter_ns (fresh step function per
+batch, so state such as a flight model's position cannot drift far), takes
+the median batch and subtracts the cost of calling an empty function, giving
+ns per step. The median ignores batches slowed (or, on CPUs that boost,
+sped up) by bursts of background load, which a minimum or mean does not.
+Batches are lengthened until they take at least min_batch_s, so
+sub-microsecond steps are not lost in timer and scheduler noise, and batches
+of different benchmarks are interleaved (see measure_all).
+
+CPython does not expose a count of every allocation, so allocations are
+measured with tracemalloc as two proxies:
+
+- peak_bytes_per_step: transient allocation high-water mark of one step
+  (temporaries such as Vector3 results show up here)
+- retained_blocks_per_step: memory blocks still alive after many steps,
+  per step (non-zero means the step leaks or grows a container)
+
+Results are compared against a JSON baseline; a benchmark regresses when it
+is slower than baseline × (1 + time_threshold), or allocates more than
+baseline × (1 + memory_threshold) + MEMORY_SLACK_BYTES, or retains more
+than RETAINED_BLOCKS_SLACK blocks per step above baseline. Absolute
+figures only mean something on the interpreter and machine that recorded
+them, so the baseline file stores both (see machine_info) and the gate
+should only be applied when they match (see machine_differences).
+"""
+
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+StepFactory = Callable[[], Callable[[], object]]
+
+MEMORY_SLACK_BYTES = 256
+RETAINED_BLOCKS_SLACK = 0.05
+
+# machine_info() keys that must match for baselines to be comparable
+# ("platform" also names the kernel build, so it is informational only)
+COMPARED_MACHINE_KEYS = ("python", "implementation", "system", "processor")
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Cost of one benchmark step.
+
+    Attributes:
+        ns_per_step: Wall time per step (ns), call overhead removed.
+        peak_bytes_per_step: Transient allocation high-water mark (bytes).
+        retained_blocks_per_step: Memory blocks kept alive per step.
+    """
+
+    ns_per_step: float
+    peak_bytes_per_step: float
+    retained_blocks_per_step: float
+
+
+def _time_batch(step: Callable[[], object], steps: int) -> int:
+    """Run steps calls and return the elapsed ns."""
+    start = time.perf_counter_ns()
+    for _ in range(steps):
+        step()
+    return time.perf_counter_ns() - start
+
+
+def _noop() -> None:
+    """Empty step, used to measure call overhead."""
+
+
+def _measure_allocations(factory: StepFactory, steps: int) -> tuple[float, float]:
+    """Peak bytes of one step and retained blocks per step."""
+    step = factory()
+    step()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        start_bytes = tracemalloc.get_traced_memory()[0]
+        step()
+        peak_bytes = tracemalloc.get_traced_memory()[1] - start_bytes
+
+        start_blocks = len(tracemalloc.take_snapshot().traces)
+        for _ in range(steps):
+            step()
+        retained_blocks = len(tracemalloc.take_snapshot().traces) - start_blocks
+    finally:
+        tracemalloc.stop()
+    return float(max(0, peak_bytes)), max(0, retained_blocks) / steps
+
+
+def measure_all(
+    factories: dict[str, StepFactory],
+    steps: int = 2000,
+    repeats: int = 15,
+    min_batch_s: float = 0.05,
+) -> dict[str, BenchmarkResult]:
+    """Measure benchmarks.
+
+    Timed batches are taken round-robin (one batch of every benchmark per
+    round), so a burst of background load slows one sample of each benchmark
+    rather than every sample of one.
+
+    Args:
+        factories: Step function factories by benchmark name.
+        steps: Minimum steps per timed batch (also the steps of the retained
+            blocks measurement).
+        repeats: Timed batches per benchmark (the median is used).
+        min_batch_s: Minimum duration of a timed batch (seconds).
+
+    Returns:
+        Per-step time and allocation figures by benchmark name.
+    """
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        # Warm up caches (lazy tables, freelists) and size the batches
+        batch_steps = {}
+        for name, factory in factories.items():
+            warmup_ns = _time_batch(factory(), steps)
+            batch_steps[name] = max(steps, int(steps * min_batch_s * 1e9 / max(warmup_ns, 1)))
+
+        samples: dict[str, list[int]] = {name: [] for name in factories}
+        overhead_samples = []
+        for _ in range(repeats):
+            overhead_samples.append(_time_batch(_noop, steps * 10) / (steps * 10))
+            for name, factory in factories.items():
+                samples[name].append(_time_batch(factory(), batch_steps[name]))
+        overhead_ns = statistics.median(overhead_samples)
+
+        results = {}
+        for name, factory in factories.items():
+            peak_bytes, retained_blocks = _measure_allocations(factory, steps)
+            results[name] = BenchmarkResult(
+                ns_per_step=max(
+                    0.0, statistics.median(samples[name]) / batch_steps[name] - overhead_ns
+                ),
+                peak_bytes_per_step=peak_bytes,
+                retained_blocks_per_step=retained_blocks,
+            )
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return results
+
+
+def find_regressions(
+    results: dict[str, BenchmarkResult],
+    baselines: dict[str, BenchmarkResult],
+    time_threshold: float = 0.3,
+    memory_threshold: float = 0.25,
+) -> list[str]:
+    """Compare results with baselines.
+
+    Benchmarks without a baseline are not gated.
+
+    Args:
+        results: Measured results by benchmark name.
+        baselines: Baseline results by benchmark name.
+        time_threshold: Allowed relative slowdown (0.3 = 30%).
+        memory_threshold: Allowed relative growth of peak bytes.
+
+    Returns:
+        One message per regression (empty if none).
+    """
+    regressions = []
+    for name, result in results.items():
+        baseline = baselines.get(name)
+        if baseline is None:
+            continue
+        if result.ns_per_step > baseline.ns_per_step * (1.0 + time_threshold):
+            regressions.append(
+                f"{name}: {result.ns_per_step:.0f} ns/step, "
+                f"baseline {baseline.ns_per_step:.0f} (+{time_threshold:.0%} allowed)"
+            )
+        peak_limit = baseline.peak_bytes_per_step * (1.0 + memory_threshold) + MEMORY_SLACK_BYTES
+        if result.peak_bytes_per_step > peak_limit:
+            regressions.append(
+                f"{name}: {result.peak_bytes_per_step:.0f} peak bytes/step, "
+                f"baseline {baseline.peak_bytes_per_step:.0f}"
+            )
+        if (
+            result.retained_blocks_per_step
+            > baseline.retained_blocks_per_step + RETAINED_BLOCKS_SLACK
+        ):
+            regressions.append(
+                f"{name}: retains {result.retained_blocks_per_step:.2f} blocks/step, "
+                f"baseline {baseline.retained_blocks_per_step:.2f}"
+            )
+    return regressions
+
+
+def machine_info() -> dict[str, str]:
+    """Describe the interpreter and machine running the benchmarks.
+
+    Returns:
+        Python version, implementation, OS, processor and platform string.
+    """
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "system": platform.system(),
+        "processor": platform.processor() or platform.machine(),
+        "platform": platform.platform(),
+    }
+
+
+def machine_differences(recorded: dict[str, str]) -> list[str]:
+    """Compare the machine that recorded baselines with this one.
+
+    Args:
+        recorded: machine_info() stored with the baselines.
+
+    Returns:
+        One "key: recorded != current" message per COMPARED_MACHINE_KEYS
+        entry that differs (empty if the baselines are comparable).
+    """
+    current = machine_info()
+    return [
+        f"{key}: {recorded.get(key, 'unknown')} != {current[key]}"
+        for key in COMPARED_MACHINE_KEYS
+        if recorded.get(key) != current[key]
+    ]
+
+
+def load_machine(path: Path) -> dict[str, str]:
+    """Load the machine_info() stored by save_baselines().
+
+    Args:
+        path: Baseline JSON file.
+
+    Returns:
+        Machine description (empty if the file does not exist).
+    """
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        machine: dict[str, str] = json.load(f).get("machine", {})
+    return machine
+
+
+def load_baselines(path: Path) -> dict[str, BenchmarkResult]:
+    """Load baselines saved by save_baselines().
+
+    Args:
+        path: Baseline JSON file.
+
+    Returns:
+        Baselines by benchmark name (empty if the file does not exist).
+    """
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return {name: BenchmarkResult(**values) for name, values in data["benchmarks"].items()}
+
+
+def save_baselines(path: Path, results: dict[str, BenchmarkResult]) -> None:
+    """Save results as the new baselines.
+
+    Args:
+        path: Baseline JSON file.
+        results: Results by benchmark name.
+    """
+    data = {
+        "machine": machine_info(),
+        "benchmarks": {
+            name: {key: round(value, 2) for key, value in asdict(result).items()}
+            for name, result in sorted(results.items())
+        },
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
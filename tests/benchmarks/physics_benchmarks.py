@@ -0,0 +1,154 @@
+"""Physics hot-path benchmarks.
+
+Each entry of BENCHMARKS maps a name to a factory that builds the objects a
+benchmark needs and returns the step function to time. Factories do their
+setup (config loading, table building) outside the timed region.
+"""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from airborne.core.config import ConfigLoader
+from airborne.physics.collision import TerrainCollisionDetector
+from airborne.physics.flight_model.base import ControlInputs
+from airborne.physics.flight_model.simple_6dof import Simple6DOFFlightModel
+from airborne.physics.ground_physics import GroundContact, GroundForces, GroundPhysics
+from airborne.physics.vectors import Vector3
+from airborne.systems.propeller.fixed_pitch import FixedPitchPropeller
+from airborne.terrain.elevation_service import ElevationService
+from airborne.terrain.srtm_provider import SimpleFlatEarthProvider
+
+CESSNA_YAML = Path(__file__).parents[2] / "config" / "aircraft" / "cessna172.yaml"
+
+DT = 1.0 / 60.0
+
+
+def _cessna_config() -> dict[str, Any]:
+    """The Cessna 172 aircraft section."""
+    return ConfigLoader.load_yaml(CESSNA_YAML)["aircraft"]
+
+
+def _cessna_propeller(aircraft: dict[str, Any]) -> FixedPitchPropeller:
+    """Propeller configured like the physics plugin does."""
+    config = aircraft["propeller"]
+    return FixedPitchPropeller(
+        diameter_m=config["diameter_m"],
+        pitch_ratio=config["pitch_ratio"],
+        efficiency_static=config["efficiency_static"],
+        efficiency_cruise=config["efficiency_cruise"],
+        cruise_advance_ratio=config["cruise_advance_ratio"],
+    )
+
+
+def _cruising_model(with_propeller: bool) -> Simple6DOFFlightModel:
+    """C172 in cruise at 1000 m, 55 m/s."""
+    aircraft = _cessna_config()
+    model = Simple6DOFFlightModel()
+    model.initialize(aircraft["flight_model_config"])
+    if with_propeller:
+        model.propeller = _cessna_propeller(aircraft)
+        model.engine_power_hp = 130.0
+        model.engine_rpm = 2400.0
+    model.state.position.set(0.0, 1000.0, 0.0)
+    model.state.velocity.set(0.0, 0.0, 55.0)
+    model.state.on_ground = False
+    return model
+
+
+def simple_6dof_update() -> Callable[[], object]:
+    """One 60 Hz Simple6DOF step with the simple thrust model."""
+    model = _cruising_model(with_propeller=False)
+    inputs = ControlInputs(throttle=0.7)
+    return lambda: model.update(DT, inputs)
+
+
+def simple_6dof_update_propeller() -> Callable[[], object]:
+    """One 60 Hz Simple6DOF step with the propeller thrust model."""
+    model = _cruising_model(with_propeller=True)
+    inputs = ControlInputs(throttle=0.7)
+    return lambda: model.update(DT, inputs)
+
+
+def fixed_pitch_calculate_thrust() -> Callable[[], object]:
+    """Fixed-pitch propeller thrust at climb power."""
+    propeller = _cessna_propeller(_cessna_config())
+    return lambda: propeller.calculate_thrust(150.0, 2500.0, 40.0, 1.112)
+
+
+def ground_physics_calculate_ground_forces() -> Callable[[], object]:
+    """Ground forces of a braking, steering takeoff roll (reused output)."""
+    physics = GroundPhysics(mass_kg=1111.0)
+    contact = GroundContact(
+        on_ground=True, gear_compression=0.4, ground_speed_mps=15.0, heading_deg=90.0
+    )
+    velocity = Vector3(15.0, 0.0, 0.5)
+    forces = GroundForces()
+    return lambda: physics.calculate_ground_forces(
+        contact, rudder_input=0.2, brake_input=0.3, velocity=velocity, out=forces
+    )
+
+
+def collision_check_flight_path_collision() -> Callable[[], object]:
+    """Ten-sample terrain look-ahead along a descending path."""
+    service = ElevationService()
+    service.add_provider(SimpleFlatEarthProvider())
+    detector = TerrainCollisionDetector(elevation_service=service)
+    position = Vector3(-122.4194, 1000.0, 37.7749)
+    velocity = Vector3(0.0, -5.0, 50.0)
+    return lambda: detector.check_flight_path_collision(position, 1000.0, velocity)
+
+
+def _vector_pair() -> tuple[Vector3, Vector3]:
+    return Vector3(1.5, -2.0, 3.25), Vector3(-0.5, 4.0, 2.0)
+
+
+def vector3_add() -> Callable[[], object]:
+    """Allocating vector addition."""
+    a, b = _vector_pair()
+    return lambda: a + b
+
+
+def vector3_iadd() -> Callable[[], object]:
+    """In-place vector addition (and subtraction, so the vector stays bounded)."""
+    a, b = _vector_pair()
+    return lambda: a.iadd(b).isub(b)
+
+
+def vector3_normalized() -> Callable[[], object]:
+    """Allocating normalization."""
+    a, _ = _vector_pair()
+    return a.normalized
+
+
+def vector3_inormalize() -> Callable[[], object]:
+    """In-place normalization."""
+    a, _ = _vector_pair()
+    return a.inormalize
+
+
+def vector3_dot() -> Callable[[], object]:
+    """Dot product."""
+    a, b = _vector_pair()
+    return lambda: a.dot(b)
+
+
+def vector3_cross() -> Callable[[], object]:
+    """Allocating cross product."""
+    a, b = _vector_pair()
+    return lambda: a.cross(b)
+
+
+BENCHMARKS: dict[str, Callable[[], Callable[[], object]]] = {
+    "simple_6dof.update": simple_6dof_update,
+    "simple_6dof.update_propeller": simple_6dof_update_propeller,
+    "fixed_pitch.calculate_thrust": fixed_pitch_calculate_thrust,
+    "ground_physics.calculate_ground_forces": ground_physics_calculate_ground_forces,
+    "collision.check_flight_path_collision": collision_check_flight_path_collision,
+    "vector3.add": vector3_add,
+    "vector3.iadd": vector3_iadd,
+    "vector3.normalized": vector3_normalized,
+    "vector3.inormalize": vector3_inormalize,
+    "vector3.dot": vector3_dot,
+    "vector3.cross": vector3_cross,
+}
@@ -0,0 +1,118 @@
+"""Tests for the benchmark harness."""
+
+import logging
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from tests.benchmarks.harness import (
+    BenchmarkResult,
+    find_regressions,
+    load_baselines,
+    load_machine,
+    machine_differences,
+    machine_info,
+    measure_all,
+    save_baselines,
+)
+from tests.benchmarks.physics_benchmarks import BENCHMARKS
+
+BASELINE = BenchmarkResult(
+    ns_per_step=1000.0, peak_bytes_per_step=1000.0, retained_blocks_per_step=0.0
+)
+
+
+def allocating_step() -> Callable[[], object]:
+    """Step that keeps every list it creates."""
+    kept: list[list[int]] = []
+    return lambda: kept.append([1, 2, 3])
+
+
+class TestFindRegressions:
+    """Test suite for the regression gate."""
+
+    def test_within_threshold(self) -> None:
+        """Test that small slowdowns and missing baselines pass."""
+        results = {
+            "a": BenchmarkResult(1250.0, 1200.0, 0.01),
+            "new": BenchmarkResult(1e9, 1e9, 10.0),
+        }
+
+        assert find_regressions(results, {"a": BASELINE}) == []
+
+    def test_slowdown(self) -> None:
+        """Test that a slowdown past the threshold is reported."""
+        results = {"a": BenchmarkResult(1400.0, 1000.0, 0.0)}
+
+        assert len(find_regressions(results, {"a": BASELINE})) == 1
+        assert find_regressions(results, {"a": BASELINE}, time_threshold=0.5) == []
+
+    def test_allocation_growth(self) -> None:
+        """Test that more allocation or retained memory is reported."""
+        results = {"a": BenchmarkResult(1000.0, 2000.0, 1.0)}
+
+        regressions = find_regressions(results, {"a": BASELINE})
+
+        assert len(regressions) == 2
+        assert "peak bytes" in regressions[0]
+        assert "retains" in regressions[1]
+
+
+class TestBaselines:
+    """Test suite for baseline storage."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test that saved baselines load back."""
+        path = tmp_path / "baselines.json"
+        save_baselines(path, {"a": BASELINE})
+
+        assert load_baselines(path) == {"a": BASELINE}
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """Test that a missing baseline file means no baselines."""
+        assert load_baselines(tmp_path / "missing.json") == {}
+        assert load_machine(tmp_path / "missing.json") == {}
+
+    def test_machine_recorded(self, tmp_path: Path) -> None:
+        """Test that baselines record the machine and compare equal to it."""
+        path = tmp_path / "baselines.json"
+        save_baselines(path, {"a": BASELINE})
+
+        assert load_machine(path) == machine_info()
+        assert machine_differences(load_machine(path)) == []
+
+    def test_machine_differences(self) -> None:
+        """Test that another interpreter makes baselines incomparable."""
+        recorded = {**machine_info(), "python": "2.7.18", "platform": "other"}
+
+        assert machine_differences(recorded) == [f"python: 2.7.18 != {machine_info()['python']}"]
+        assert len(machine_differences({})) == 4
+
+    def test_committed_baselines_cover_benchmarks(self) -> None:
+        """Test that every benchmark has a committed baseline."""
+        baselines = load_baselines(Path(__file__).parent / "baselines.json")
+
+        assert set(baselines) == set(BENCHMARKS)
+
+
+class TestMeasure:
+    """Test suite for measurement."""
+
+    def test_detects_retained_allocations(self) -> None:
+        """Test that a step keeping its allocations is measured as such."""
+        result = measure_all({"leak": allocating_step}, steps=100, repeats=1, min_batch_s=0.0)
+
+        assert result["leak"].retained_blocks_per_step >= 1.0
+        assert result["leak"].peak_bytes_per_step > 0.0
+
+    @pytest.mark.parametrize("name", list(BENCHMARKS))
+    def test_benchmark_runs(self, name: str) -> None:
+        """Test that each benchmark runs (smoke test, few steps)."""
+        logging.disable(logging.INFO)
+        try:
+            results = measure_all({name: BENCHMARKS[name]}, steps=5, repeats=1, min_batch_s=0.0)
+        finally:
+            logging.disable(logging.NOTSET)
+
+        assert results[name].ns_per_step >= 0.0
@@ -0,0 +1,134 @@
+"""Tests for the shared aircraft state blackboard."""
+
+import numpy as np
+import pytest
+
+from airborne.core.blackboard import (
+    AIRCRAFT_STATE_FIELDS,
+    BlackboardError,
+    BlackboardField,
+    StateBlackboard,
+)
+
+
+class TestStateBlackboard:
+    """Test suite for StateBlackboard."""
+
+    def test_default_fields(self) -> None:
+        """Test that the default layout covers physics and aircraft systems."""
+        board = StateBlackboard()
+        for name in ("position", "engine_rpm", "bus_voltage", "fuel_total_gal"):
+            assert board.has_field(name)
+        assert board.fields == AIRCRAFT_STATE_FIELDS
+        assert board.version == 0
+
+    def test_write_and_read_scalar(self) -> None:
+        """Test writing and reading a scalar field."""
+        board = StateBlackboard()
+        assert board.write("engine_rpm", 2400.0)
+        assert board.read("engine_rpm") == 2400.0
+        assert isinstance(board.read("engine_rpm"), float)
+
+    def test_write_and_read_bool(self) -> None:
+        """Test that boolean fields round-trip as Python bools."""
+        board = StateBlackboard()
+        board.write("engine_running", True)
+        assert board.read("engine_running") is True
+
+    def test_write_and_read_vector(self) -> None:
+        """Test that vector fields return read-only views."""
+        board = StateBlackboard()
+        board.write("position", (1.0, 2.0, 3.0))
+
+        position = board.read("position")
+        np.testing.assert_array_equal(position, [1.0, 2.0, 3.0])
+        with pytest.raises(ValueError):
+            position[0] = 10.0
+
+    def test_versions(self) -> None:
+        """Test global and per-field version stamps."""
+        board = StateBlackboard()
+        board.write("engine_rpm", 1000.0)
+        rpm_version = board.version
+        board.write("bus_voltage", 28.0)
+
+        assert board.get_version("engine_rpm") == rpm_version
+        assert board.get_version("bus_voltage") == board.version
+        assert board.get_version("fuel_total_gal") == 0
+        assert board.version > rpm_version
+
+    def test_unchanged_write_does_not_bump_version(self) -> None:
+        """Test that writing the same value is a no-op for versions."""
+        board = StateBlackboard()
+        board.write("position", (1.0, 2.0, 3.0))
+        board.write("bus_voltage", 28.0)
+        version = board.version
+
+        assert not board.write("position", np.array([1.0, 2.0, 3.0]))
+        assert not board.write("bus_voltage", 28.0)
+        assert board.version == version
+
+    def test_changed_since(self) -> None:
+        """Test change detection for selected fields."""
+        board = StateBlackboard()
+        seen = board.version
+        assert not board.changed_since(seen)
+
+        board.write("engine_rpm", 800.0)
+        assert board.changed_since(seen)
+        assert board.changed_since(seen, "engine_rpm", "bus_voltage")
+        assert not board.changed_since(seen, "bus_voltage")
+
+        seen = board.version
+        assert not board.changed_since(seen, "engine_rpm")
+
+    def test_write_many(self) -> None:
+        """Test writing several fields at once."""
+        board = StateBlackboard()
+        assert board.write_many(engine_rpm=2400.0, engine_running=True)
+        assert not board.write_many(engine_rpm=2400.0, engine_running=True)
+        assert board.read("engine_rpm") == 2400.0
+
+    def test_access_hook(self) -> None:
+        """Test that the access hook sees reads and writes."""
+        board = StateBlackboard()
+        accesses: list[tuple[str, bool]] = []
+        board.set_access_hook(lambda name, write: accesses.append((name, write)))
+
+        board.write("bus_voltage", 28.0)
+        board.read("engine_rpm")
+        board.set_access_hook(None)
+        board.read("bus_voltage")
+
+        assert accesses == [("bus_voltage", True), ("engine_rpm", False)]
+
+    def test_unknown_field(self) -> None:
+        """Test that undeclared fields raise BlackboardError."""
+        board = StateBlackboard()
+        with pytest.raises(BlackboardError):
+            board.write("warp_factor", 9.0)
+        with pytest.raises(BlackboardError):
+            board.read("warp_factor")
+        with pytest.raises(BlackboardError):
+            board.changed_since(0, "warp_factor")
+
+    def test_custom_fields(self) -> None:
+        """Test creating a blackboard with its own layout."""
+        board = StateBlackboard([BlackboardField("flap_angle_deg"), BlackboardField("gear", "?")])
+        board.write("flap_angle_deg", 10.0)
+        assert board.to_dict() == {"flap_angle_deg": 10.0, "gear": False}
+
+    def test_duplicate_fields_rejected(self) -> None:
+        """Test that duplicate declarations are rejected."""
+        with pytest.raises(BlackboardError):
+            StateBlackboard([BlackboardField("a"), BlackboardField("a")])
+
+    def test_as_record_is_read_only(self) -> None:
+        """Test that the structured record cannot be written by readers."""
+        board = StateBlackboard()
+        board.write("bus_voltage", 28.0)
+        record = board.as_record()
+
+        assert record["bus_voltage"] == 28.0
+        with pytest.raises(ValueError):
+            record["bus_voltage"] = 0.0
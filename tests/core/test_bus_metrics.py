@@ -0,0 +1,147 @@
+"""Tests for message queue and event bus instrumentation."""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from airborne.core.bus_metrics import BusMetrics, BusMetricsReporter, LatencyHistogram
+from airborne.core.event_bus import Event, EventBus
+from airborne.core.messaging import Message, MessageQueue
+
+
+@dataclass
+class PingEvent(Event):
+    """Event used for testing."""
+
+    value: int = 0
+
+
+def _message(topic: str = "test.topic") -> Message:
+    return Message(sender="test", recipients=["*"], topic=topic, data={})
+
+
+class TestLatencyHistogram:
+    """Test suite for LatencyHistogram."""
+
+    def test_percentiles(self) -> None:
+        """Test nearest-rank percentiles and exact max."""
+        hist = LatencyHistogram()
+        for i in range(1, 101):
+            hist.record(i / 1000.0)
+
+        assert hist.count == 100
+        assert hist.percentile(50) == pytest.approx(0.050)
+        assert hist.percentile(95) == pytest.approx(0.095)
+        assert hist.max_s == pytest.approx(0.100)
+
+    def test_empty(self) -> None:
+        """Test an empty histogram reports zeros."""
+        summary = LatencyHistogram().to_dict()
+        assert summary["count"] == 0
+        assert summary["p95_ms"] == 0.0
+
+
+class TestMessageQueueMetrics:
+    """Test suite for MessageQueue instrumentation."""
+
+    def test_counts_publish_and_dispatch(self) -> None:
+        """Test per-topic publish and dispatch counts."""
+        metrics = BusMetrics("queue")
+        queue = MessageQueue(metrics=metrics)
+        queue.subscribe("test.topic", lambda msg: None)
+        queue.subscribe("test.*", lambda msg: None)
+
+        queue.publish(_message())
+        queue.publish(_message())
+        queue.publish(_message("other.topic"))
+        queue.process()
+
+        assert metrics.topics["test.topic"].published == 2
+        assert metrics.topics["test.topic"].dispatched == 4
+        assert metrics.topics["other.topic"].published == 1
+        assert metrics.topics["other.topic"].dispatched == 0
+
+    def test_handler_latency_keyed_by_topic_and_handler(self) -> None:
+        """Test that handler latency is recorded under the handler's name."""
+
+        def slow_handler(msg: Message) -> None:
+            pass
+
+        metrics = BusMetrics("queue")
+        queue = MessageQueue(metrics=metrics)
+        queue.subscribe("test.topic", slow_handler)
+        queue.publish(_message())
+        queue.process()
+
+        (row,) = metrics.top_handlers()
+        assert row["topic"] == "test.topic"
+        assert row["handler"].endswith("slow_handler")
+        assert row["count"] == 1
+
+    def test_depth_and_deferred(self) -> None:
+        """Test queue depth and deferral by the max_messages cap."""
+        metrics = BusMetrics("queue")
+        queue = MessageQueue(metrics=metrics)
+        for _ in range(5):
+            queue.publish(_message())
+
+        queue.process(max_messages=2)
+        assert metrics.queue_depth == 3
+        assert metrics.deferred == 3
+
+        queue.process()
+        assert metrics.queue_depth == 0
+        assert metrics.deferred == 0
+        assert metrics.deferred_total == 3
+        assert metrics.max_queue_depth == 3
+        assert metrics.process_calls == 2
+
+    def test_disabled_by_default(self) -> None:
+        """Test that queues are uninstrumented unless metrics are attached."""
+        queue = MessageQueue()
+        assert queue.metrics is None
+
+        metrics = BusMetrics("queue")
+        queue.set_metrics(metrics)
+        queue.publish(_message())
+        assert metrics.topics["test.topic"].published == 1
+
+
+class TestEventBusMetrics:
+    """Test suite for EventBus instrumentation."""
+
+    def test_counts_events_by_type_name(self) -> None:
+        """Test events are counted and timed under their class name."""
+        metrics = BusMetrics("events")
+        bus = EventBus(metrics=metrics)
+        received: list[int] = []
+        bus.subscribe(PingEvent, lambda e: received.append(e.value))
+
+        bus.publish(PingEvent(value=1))
+        bus.publish(PingEvent(value=2))
+
+        assert received == [1, 2]
+        assert metrics.topics["PingEvent"].published == 2
+        assert metrics.topics["PingEvent"].dispatched == 2
+        assert metrics.top_handlers()[0]["count"] == 2
+
+
+class TestBusMetricsReporter:
+    """Test suite for periodic reporting."""
+
+    def test_periodic_json_dump(self, tmp_path: Path) -> None:
+        """Test that the reporter writes JSON once the interval elapses."""
+        metrics = BusMetrics("queue")
+        metrics.record_publish("test.topic")
+        path = tmp_path / "metrics.json"
+        reporter = BusMetricsReporter([metrics], interval=5.0, json_path=path)
+
+        start = reporter._next_report - 5.0
+        assert not reporter.tick(now=start + 1.0)
+        assert not path.exists()
+
+        assert reporter.tick(now=start + 5.0)
+        data = json.loads(path.read_text())
+        assert data["queue"]["topics"]["test.topic"]["published"] == 1
@@ -0,0 +1,119 @@
+"""Tests for configuration loading and the parsed-YAML cache."""
+
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+
+from airborne.core.config import ConfigError, ConfigLoader
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path):
+    """Enable the config cache in a temporary directory for one test."""
+    directory = tmp_path / "cache"
+    ConfigLoader.enable_cache(directory)
+    yield directory
+    ConfigLoader.disable_cache()
+
+
+def bump_mtime(path: Path) -> None:
+    """Move a file's mtime forward without changing its contents."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestConfigLoader:
+    """Test suite for ConfigLoader."""
+
+    def test_load_and_get(self, tmp_path: Path) -> None:
+        """Test loading a file and dot-notation access."""
+        path = tmp_path / "settings.yaml"
+        path.write_text("audio:\n  master_volume: 0.5\n", encoding="utf-8")
+
+        config = ConfigLoader.load(path)
+
+        assert config.get("audio.master_volume") == 0.5
+        assert config.get("audio.missing", default=1.0) == 1.0
+
+    def test_load_missing_file(self, tmp_path: Path) -> None:
+        """Test loading a missing file raises ConfigError."""
+        with pytest.raises(ConfigError):
+            ConfigLoader.load(tmp_path / "missing.yaml")
+
+
+class TestYamlCache:
+    """Test suite for ConfigLoader.load_yaml caching."""
+
+    def test_uncached_matches_safe_load(self, tmp_path: Path) -> None:
+        """Test load_yaml parses like yaml.safe_load without a cache."""
+        path = tmp_path / "doc.yaml"
+        path.write_text("a: [1, 2]\nb: {c: yes}\n", encoding="utf-8")
+
+        assert ConfigLoader.load_yaml(path) == yaml.safe_load(path.read_text(encoding="utf-8"))
+
+    def test_cache_hit_skips_parsing(self, tmp_path: Path, cache_dir: Path, monkeypatch) -> None:
+        """Test an unchanged file is served from the cache."""
+        path = tmp_path / "doc.yaml"
+        path.write_text("value: 1\n", encoding="utf-8")
+        assert ConfigLoader.load_yaml(path) == {"value": 1}
+        assert len(list(cache_dir.iterdir())) == 1
+
+        def fail(*args, **kwargs):
+            raise AssertionError("YAML parsed despite cache hit")
+
+        monkeypatch.setattr(yaml, "load", fail)
+        assert ConfigLoader.load_yaml(path) == {"value": 1}
+
+        bump_mtime(path)  # same contents: validated by hash, still no parse
+        assert ConfigLoader.load_yaml(path) == {"value": 1}
+
+    def test_results_are_independent(self, tmp_path: Path, cache_dir: Path) -> None:
+        """Test callers may modify the returned data."""
+        path = tmp_path / "doc.yaml"
+        path.write_text("items: [1]\n", encoding="utf-8")
+
+        ConfigLoader.load_yaml(path)["items"].append(2)
+
+        assert ConfigLoader.load_yaml(path) == {"items": [1]}
+
+    def test_modified_file_is_reparsed(self, tmp_path: Path, cache_dir: Path) -> None:
+        """Test an edited file is parsed again."""
+        path = tmp_path / "doc.yaml"
+        path.write_text("value: 1\n", encoding="utf-8")
+        ConfigLoader.load_yaml(path)
+
+        path.write_text("value: 2\n", encoding="utf-8")
+        bump_mtime(path)
+
+        assert ConfigLoader.load_yaml(path) == {"value": 2}
+
+    def test_rebuild_clears_cache(self, tmp_path: Path, cache_dir: Path) -> None:
+        """Test rebuilding discards cached documents."""
+        path = tmp_path / "doc.yaml"
+        path.write_text("value: 1\n", encoding="utf-8")
+        ConfigLoader.load_yaml(path)
+
+        ConfigLoader.enable_cache(cache_dir, rebuild=True)
+
+        assert not cache_dir.exists()
+        assert ConfigLoader.load_yaml(path) == {"value": 1}
+
+    def test_corrupt_cache_entry_is_ignored(self, tmp_path: Path, cache_dir: Path) -> None:
+        """Test an unreadable cache file falls back to parsing."""
+        path = tmp_path / "doc.yaml"
+        path.write_text("value: 1\n", encoding="utf-8")
+        ConfigLoader.load_yaml(path)
+        (cache_file,) = cache_dir.iterdir()
+        cache_file.write_bytes(b"garbage")
+
+        assert ConfigLoader.load_yaml(path) == {"value": 1}
+
+    def test_parse_errors_propagate(self, tmp_path: Path, cache_dir: Path) -> None:
+        """Test invalid YAML raises yaml.YAMLError as before."""
+        path = tmp_path / "bad.yaml"
+        path.write_text("a: [1, 2\n", encoding="utf-8")
+
+        with pytest.raises(yaml.YAMLError):
+            ConfigLoader.load_yaml(path)
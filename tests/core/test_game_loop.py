@@ -0,0 +1,282 @@
+"""Tests for the game loop plugin scheduler."""
+
+import threading
+from collections.abc import Callable
+
+import pytest
+
+from airborne.core.blackboard import StateBlackboard
+from airborne.core.game_loop import FixedTimestep, PluginScheduler
+from airborne.core.plugin import IPlugin, PluginContext, PluginMetadata, PluginType
+
+
+class RatePlugin(IPlugin):
+    """Plugin recording the dt of every update."""
+
+    def __init__(
+        self,
+        name: str,
+        rate_hz: float | None = None,
+        phase: float | None = None,
+        dependencies: list[str] | None = None,
+        action: Callable[[], None] | None = None,
+    ) -> None:
+        self.name = name
+        self.rate_hz = rate_hz
+        self.phase = phase
+        self.dependencies = dependencies or []
+        self.action = action
+        self.dts: list[float] = []
+        self.errors: list[Exception] = []
+
+    def get_metadata(self) -> PluginMetadata:
+        return PluginMetadata(
+            name=self.name,
+            version="1.0.0",
+            author="Test",
+            plugin_type=PluginType.FEATURE,
+            dependencies=self.dependencies,
+            update_rate_hz=self.rate_hz,
+            update_phase=self.phase,
+        )
+
+    def initialize(self, context: PluginContext) -> None:
+        pass
+
+    def update(self, dt: float) -> None:
+        self.dts.append(dt)
+        if self.action is not None:
+            self.action()
+
+    def shutdown(self) -> None:
+        pass
+
+    def handle_message(self, message: object) -> None:
+        pass
+
+    def on_error(self, error: Exception) -> None:
+        self.errors.append(error)
+
+
+def _run(scheduler: PluginScheduler, ticks: int, dt: float) -> list[int]:
+    return [scheduler.tick(dt) for _ in range(ticks)]
+
+
+class TestPluginScheduler:
+    """Test suite for PluginScheduler."""
+
+    def test_full_rate_plugin_updates_every_tick(self) -> None:
+        """Test that plugins without a rate update on every tick."""
+        scheduler = PluginScheduler()
+        plugin = RatePlugin("fast")
+        scheduler.add(plugin)
+
+        _run(scheduler, 10, 0.01)
+
+        assert plugin.dts == pytest.approx([0.01] * 10)
+
+    def test_low_rate_plugin_gets_accumulated_dt(self) -> None:
+        """Test that a 10 Hz plugin on a 100 Hz tick gets 0.1 s per update."""
+        scheduler = PluginScheduler()
+        plugin = RatePlugin("slow", rate_hz=10.0, phase=0.0)
+        scheduler.add(plugin)
+
+        _run(scheduler, 100, 0.01)
+
+        # Due at t=0, 0.1, ..., 1.0; the first update happens on the first tick
+        assert len(plugin.dts) == 11
+        assert plugin.dts[:2] == pytest.approx([0.01, 0.09])
+        assert plugin.dts[2:] == pytest.approx([0.1] * 9)
+        assert sum(plugin.dts) == pytest.approx(1.0)
+
+    def test_low_rate_plugins_are_staggered(self) -> None:
+        """Test that plugins sharing a rate do not all update on the same tick."""
+        scheduler = PluginScheduler()
+        plugins = [RatePlugin(f"p{i}", rate_hz=10.0) for i in range(5)]
+        for plugin in plugins:
+            scheduler.add(plugin)
+
+        counts = _run(scheduler, 100, 0.01)
+
+        assert all(len(p.dts) in (10, 11) for p in plugins)
+        assert max(counts) < len(plugins)
+
+    def test_explicit_phase(self) -> None:
+        """Test that update_phase offsets the first update."""
+        scheduler = PluginScheduler()
+        plugin = RatePlugin("slow", rate_hz=10.0, phase=0.5)
+        scheduler.add(plugin)
+
+        _run(scheduler, 4, 0.01)
+        assert plugin.dts == []
+
+        _run(scheduler, 1, 0.01)
+        assert plugin.dts == pytest.approx([0.05])
+
+    def test_falls_behind_without_burst(self) -> None:
+        """Test that a long tick triggers one update, not a burst of catch-ups."""
+        scheduler = PluginScheduler()
+        plugin = RatePlugin("slow", rate_hz=10.0, phase=0.0)
+        scheduler.add(plugin)
+
+        scheduler.tick(0.01)
+        scheduler.tick(1.0)
+
+        assert plugin.dts == pytest.approx([0.01, 1.0])
+
+    def test_errors_are_isolated(self) -> None:
+        """Test that a failing plugin does not stop the others."""
+
+        class FailingPlugin(RatePlugin):
+            def update(self, dt: float) -> None:
+                raise RuntimeError("boom")
+
+        scheduler = PluginScheduler()
+        bad = FailingPlugin("bad")
+        good = RatePlugin("good")
+        scheduler.add(bad)
+        scheduler.add(good)
+
+        scheduler.tick(0.01)
+
+        assert len(bad.errors) == 1
+        assert good.dts == pytest.approx([0.01])
+
+    def test_sync_preserves_state_and_order(self) -> None:
+        """Test that sync keeps existing entries and follows the given order."""
+        scheduler = PluginScheduler()
+        a = RatePlugin("a", rate_hz=10.0, phase=0.3)
+        b = RatePlugin("b")
+        scheduler.sync([(a, "a")])
+        entry_a = scheduler.entries[0]
+
+        scheduler.sync([(b, "b"), (a, "a")])
+
+        assert [e.plugin for e in scheduler.entries] == [b, a]
+        assert scheduler.entries[1] is entry_a
+
+        scheduler.sync([(b, "b")])
+        assert [e.plugin for e in scheduler.entries] == [b]
+
+
+class TestPluginStages:
+    """Test suite for dependency stages in PluginScheduler."""
+
+    def _stage_names(self, scheduler: PluginScheduler) -> list[list[str]]:
+        return [[e.name for e in stage] for stage in scheduler.stages]
+
+    def test_stages_follow_dependencies(self) -> None:
+        """Test that plugins are grouped after the plugins they depend on."""
+        scheduler = PluginScheduler()
+        scheduler.add(RatePlugin("electrical"))
+        scheduler.add(RatePlugin("fuel"))
+        scheduler.add(RatePlugin("engine", dependencies=["electrical", "fuel"]))
+        scheduler.add(RatePlugin("lighting", dependencies=["electrical", "unknown"]))
+
+        assert self._stage_names(scheduler) == [["electrical", "fuel"], ["engine", "lighting"]]
+
+        scheduler.remove(scheduler.entries[0].plugin)
+        assert self._stage_names(scheduler) == [["fuel", "lighting"], ["engine"]]
+
+    def test_cycle_falls_back_to_one_plugin_per_stage(self) -> None:
+        """Test that circular dependencies disable grouping."""
+        scheduler = PluginScheduler()
+        scheduler.add(RatePlugin("a", dependencies=["b"]))
+        scheduler.add(RatePlugin("b", dependencies=["a"]))
+
+        assert self._stage_names(scheduler) == [["a"], ["b"]]
+
+    def test_parallel_stage_runs_concurrently(self) -> None:
+        """Test that plugins of one stage run at the same time."""
+        barrier = threading.Barrier(2, timeout=5.0)
+        order: list[str] = []
+        scheduler = PluginScheduler(max_workers=2)
+        scheduler.add(RatePlugin("a", action=barrier.wait))
+        scheduler.add(RatePlugin("b", action=barrier.wait))
+        scheduler.add(RatePlugin("c", dependencies=["a", "b"], action=lambda: order.append("c")))
+
+        try:
+            assert scheduler.tick(0.01) == 3
+        finally:
+            scheduler.shutdown()
+
+        assert order == ["c"]
+        assert scheduler.max_workers == 0
+
+    def test_parallel_respects_rates_and_errors(self) -> None:
+        """Test that staged updates keep rate scheduling and error isolation."""
+        scheduler = PluginScheduler(max_workers=4)
+        fast = RatePlugin("fast")
+        slow = RatePlugin("slow", rate_hz=10.0, phase=0.0)
+        bad = RatePlugin("bad", action=lambda: 1 / 0)
+        for plugin in (fast, slow, bad):
+            scheduler.add(plugin)
+
+        try:
+            counts = _run(scheduler, 20, 0.01)
+        finally:
+            scheduler.shutdown()
+
+        assert sum(counts) == 20 + 3 + 20
+        assert len(fast.dts) == 20
+        assert slow.dts == pytest.approx([0.01, 0.09, 0.1])
+        assert len(bad.errors) == 20
+
+    def test_negative_workers_rejected(self) -> None:
+        """Test that a negative worker count is rejected."""
+        with pytest.raises(ValueError):
+            PluginScheduler(max_workers=-1)
+
+    def test_race_check_reports_shared_fields(self) -> None:
+        """Test that race checking reports same-stage plugins sharing a field."""
+        board = StateBlackboard()
+        scheduler = PluginScheduler()
+        scheduler.enable_race_check(board)
+        scheduler.add(RatePlugin("electrical", action=lambda: board.write("bus_voltage", 28.0)))
+        scheduler.add(RatePlugin("lighting", action=lambda: board.read("bus_voltage")))
+        scheduler.add(RatePlugin("fuel", action=lambda: board.write("fuel_total_gal", 40.0)))
+        scheduler.add(
+            RatePlugin(
+                "avionics",
+                dependencies=["electrical"],
+                action=lambda: board.read("bus_voltage"),
+            )
+        )
+
+        _run(scheduler, 3, 0.01)
+
+        assert scheduler.races == [("bus_voltage", "electrical", "lighting")]
+
+        scheduler.disable_race_check()
+        scheduler.tick(0.01)
+        assert board.read("bus_voltage") == 28.0
+
+
+class TestFixedTimestep:
+    """Test suite for FixedTimestep."""
+
+    def test_steps_and_remainder(self) -> None:
+        """Test that frame time is split into whole steps plus a remainder."""
+        stepper = FixedTimestep(120)
+
+        assert stepper.advance(1 / 60) == 2
+        assert stepper.accumulator == pytest.approx(0.0, abs=1e-12)
+
+        assert stepper.advance(1 / 240) == 0
+        assert stepper.alpha == pytest.approx(0.5)
+
+        assert stepper.advance(1 / 240) == 1
+        assert stepper.alpha == pytest.approx(0.0, abs=1e-9)
+
+    def test_clamps_long_frames(self) -> None:
+        """Test that a long frame runs at most max_steps steps."""
+        stepper = FixedTimestep(100, max_steps=5)
+
+        assert stepper.advance(1.0) == 5
+        assert stepper.dropped_time == pytest.approx(0.95)
+        assert stepper.accumulator == pytest.approx(0.0, abs=1e-12)
+
+    def test_invalid_rate(self) -> None:
+        """Test that the step rate must be positive."""
+        with pytest.raises(ValueError):
+            FixedTimestep(0)
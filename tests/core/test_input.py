@@ -291,6 +291,16 @@ class TestInputManagerUpdate:
 
         assert manager.state.throttle == 0.0
 
+    def test_set_controls_holds_setting(self, manager: InputManager) -> None:
+        """Test that directly set controls are not smoothed away."""
+        manager.set_controls(throttle=0.65, flaps=0.25)
+
+        for _ in range(10):
+            manager.update(0.016)
+
+        assert manager.state.throttle == pytest.approx(0.65)
+        assert manager.state.flaps == 0.25
+
     def test_update_publishes_state_event(self, manager: InputManager, event_bus: EventBus) -> None:
         """Test update publishes input state event."""
         received_events = []
@@ -1,6 +1,7 @@
 """Unit tests for the logging system with platform-aware paths and rotation."""
 
 import logging
+import queue
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
@@ -8,7 +9,12 @@ from unittest.mock import patch
 import pytest
 
 from airborne.core.logging_system import (
+    AsyncQueueHandler,
     LoggingError,
+    MillisecondFormatter,
+    RateLimitFilter,
+    RingBufferHandler,
+    TokenBucket,
     get_logger,
     get_platform_log_dir,
     initialize_logging,
@@ -154,17 +160,19 @@ class TestLoggingInitialization:
 
             shutdown_logging()
 
-    def test_initialize_without_platform_dir(self) -> None:
+    def test_initialize_without_platform_dir(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test initialization uses config directory when use_platform_dir=False."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Initialize with custom log dir
-            initialize_logging(use_platform_dir=False)
+        # The default config's 'logs' directory is relative to the working directory
+        monkeypatch.chdir(tmp_path)
+        initialize_logging(use_platform_dir=False)
 
-            # Should use 'logs' directory from config
-            logger = get_logger("test")
-            logger.info("Test message")
+        logger = get_logger("test")
+        logger.info("Test message")
 
-            shutdown_logging()
+        shutdown_logging()
+        assert (tmp_path / "logs" / "airborne.log").exists()
 
     def test_initialize_with_missing_config(self) -> None:
         """Test initialization fails gracefully with missing config file."""
@@ -310,3 +318,180 @@ class TestLogRotationIntegration:
             content_5 = rotated_5.read_text()
             # .5 should have session 1 (0 was deleted, 1->2->3->4->5)
             assert "Session 1" in content_5
+
+
+def make_record(name: str, level: int, msg: str, *args: object) -> logging.LogRecord:
+    """Create a log record."""
+    return logging.LogRecord(name, level, __file__, 1, msg, args or None, None)
+
+
+class ListHandler(logging.Handler):
+    """Handler collecting formatted messages."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+class TestRateLimiting:
+    """Tests for TokenBucket and RateLimitFilter."""
+
+    def test_token_bucket_refills(self) -> None:
+        """Test a bucket allows a burst, then refills at its rate."""
+        bucket = TokenBucket(rate=2.0, burst=2)
+        now = bucket._last
+
+        assert bucket.consume(now)
+        assert bucket.consume(now)
+        assert not bucket.consume(now)
+        assert bucket.consume(now + 0.5)
+
+    def test_filter_limits_child_loggers(self) -> None:
+        """Test limits apply to child loggers and spare other loggers and warnings."""
+        rate_filter = RateLimitFilter({"airborne.audio": (0.0, 2)})
+        name = "airborne.audio.tts"
+
+        passed = [rate_filter.filter(make_record(name, logging.INFO, "x")) for _ in range(5)]
+        assert passed == [True, True, False, False, False]
+        assert rate_filter.suppressed_count("airborne.audio") == 3
+
+        assert rate_filter.filter(make_record(name, logging.WARNING, "w"))
+        assert rate_filter.filter(make_record("airborne.physics", logging.INFO, "y"))
+
+    def test_filter_reports_suppressed(self) -> None:
+        """Test the next record let through notes how many were dropped."""
+        rate_filter = RateLimitFilter({"chatty": (0.0, 1)})
+        rate_filter.filter(make_record("chatty", logging.INFO, "first"))
+        rate_filter.filter(make_record("chatty", logging.INFO, "dropped"))
+
+        bucket = rate_filter._buckets["chatty"]
+        bucket.tokens = 1.0
+        record = make_record("chatty", logging.INFO, "after")
+        assert rate_filter.filter(record)
+        assert record.getMessage() == "after"
+        assert MillisecondFormatter("%(message)s").format(record) == (
+            "after [1 earlier records rate-limited]"
+        )
+
+    def test_shared_filter_decides_once_per_record(self) -> None:
+        """Test a filter on several handlers consumes one token per record."""
+        rate_filter = RateLimitFilter({"chatty": (0.0, 1)})
+        record = make_record("chatty", logging.INFO, "x")
+
+        assert rate_filter.filter(record)
+        assert rate_filter.filter(record)
+
+
+class TestRingBufferHandler:
+    """Tests for RingBufferHandler."""
+
+    def test_buffers_until_error(self) -> None:
+        """Test low-level records are written only when an error is logged."""
+        target = ListHandler()
+        ring = RingBufferHandler(target, capacity=2)
+
+        ring.handle(make_record("a", logging.DEBUG, "d1"))
+        ring.handle(make_record("a", logging.DEBUG, "d2"))
+        ring.handle(make_record("a", logging.DEBUG, "d3"))
+        ring.handle(make_record("a", logging.INFO, "info"))
+        assert target.messages == ["info"]
+
+        ring.handle(make_record("a", logging.ERROR, "boom"))
+        assert target.messages == ["info", "d2", "d3", "boom"]
+
+
+class TestAsyncQueueHandler:
+    """Tests for AsyncQueueHandler."""
+
+    def test_defers_formatting_of_immutable_args(self) -> None:
+        """Test immutable arguments are left for the listener to format."""
+        log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+        handler = AsyncQueueHandler(log_queue)
+
+        handler.handle(make_record("a", logging.INFO, "value=%d", 42))
+        record = log_queue.get_nowait()
+
+        assert record.args == (42,)
+        assert record.getMessage() == "value=42"
+
+    def test_snapshots_mutable_args(self) -> None:
+        """Test mutable arguments are formatted before the record is queued."""
+        log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+        handler = AsyncQueueHandler(log_queue)
+        items = [1]
+
+        handler.handle(make_record("a", logging.INFO, "items=%s", items))
+        items.append(2)
+
+        assert log_queue.get_nowait().getMessage() == "items=[1]"
+
+    def test_drops_when_full(self) -> None:
+        """Test a full queue drops records instead of blocking."""
+        handler = AsyncQueueHandler(queue.Queue(maxsize=1))
+
+        handler.handle(make_record("a", logging.INFO, "one"))
+        handler.handle(make_record("a", logging.INFO, "two"))
+
+        assert handler.dropped == 1
+
+    def test_pipeline_from_config(self, tmp_path: Path) -> None:
+        """Test async logging with rate limits and ring buffer configured in YAML."""
+        config = tmp_path / "logging.yaml"
+        config.write_text(
+            f"""
+log_dir: "{tmp_path}"
+console: {{enabled: false}}
+combined_log: {{enabled: true, filename: "airborne.log"}}
+async: {{enabled: true, queue_size: 100}}
+rate_limits:
+  test.chatty: {{rate: 0.0001, burst: 2}}
+ring_buffer: {{enabled: true, capacity: 10, level: INFO, flush_level: ERROR}}
+""",
+            encoding="utf-8",
+        )
+        initialize_logging(config, use_platform_dir=False)
+
+        chatty = logging.getLogger("test.chatty")
+        for i in range(5):
+            chatty.info("chatty %d", i)
+        quiet = logging.getLogger("test.quiet")
+        quiet.debug("held in memory")
+        quiet.info("written")
+
+        shutdown_logging()
+        content = (tmp_path / "airborne.log").read_text(encoding="utf-8")
+        assert "chatty 1" in content
+        assert "chatty 2" not in content
+        assert "written" in content
+        assert "held in memory" not in content
+
+    def test_dedicated_file_written_by_listener(self, tmp_path: Path) -> None:
+        """Test that a plugin's dedicated log file is written off the caller's thread."""
+        config = tmp_path / "logging.yaml"
+        config.write_text(
+            f"""
+log_dir: "{tmp_path}"
+console: {{enabled: false}}
+combined_log: {{enabled: true, filename: "airborne.log"}}
+async: {{enabled: true, queue_size: 100}}
+plugins:
+  test_dedicated: {{dedicated_file: true}}
+""",
+            encoding="utf-8",
+        )
+        initialize_logging(config, use_platform_dir=False)
+
+        logger = get_logger("test_dedicated")
+        assert not logger.handlers
+        logger.info("own file")
+        logging.getLogger("test.other").info("combined only")
+
+        shutdown_logging()
+        dedicated = (tmp_path / "test_dedicated.log").read_text(encoding="utf-8")
+        combined = (tmp_path / "airborne.log").read_text(encoding="utf-8")
+        assert "own file" in dedicated
+        assert "combined only" not in dedicated
+        assert "own file" in combined
@@ -372,3 +372,406 @@ class TestMessageQueue:
 
         count = queue.process()
         assert count == 5
+
+    def test_fifo_within_priority(self) -> None:
+        """Test that messages of equal priority are delivered in publish order."""
+        queue = MessageQueue()
+        order = []
+
+        queue.subscribe("test.topic", lambda msg: order.append(msg.data["index"]))
+
+        for i in range(5):
+            queue.publish(
+                Message(
+                    sender="test",
+                    recipients=["*"],
+                    topic="test.topic",
+                    data={"index": i},
+                    priority=MessagePriority.NORMAL,
+                )
+            )
+
+        queue.process()
+        assert order == [0, 1, 2, 3, 4]
+
+    def test_higher_priority_published_during_dispatch_runs_next(self) -> None:
+        """Test that a message published by a handler preempts lower lanes."""
+        queue = MessageQueue()
+        order = []
+
+        def handler(msg: Message) -> None:
+            order.append(msg.data["name"])
+            if msg.data["name"] == "first":
+                queue.publish(
+                    Message(
+                        sender="test",
+                        recipients=["*"],
+                        topic="test.topic",
+                        data={"name": "urgent"},
+                        priority=MessagePriority.CRITICAL,
+                    )
+                )
+
+        queue.subscribe("test.topic", handler)
+        for name in ("first", "second"):
+            queue.publish(
+                Message(
+                    sender="test",
+                    recipients=["*"],
+                    topic="test.topic",
+                    data={"name": name},
+                    priority=MessagePriority.NORMAL,
+                )
+            )
+
+        queue.process()
+        assert order == ["first", "urgent", "second"]
+
+
+class TestMessagePooling:
+    """Test suite for pooled message recycling."""
+
+    def test_acquired_message_is_delivered(self) -> None:
+        """Test that pooled messages are dispatched like regular ones."""
+        queue = MessageQueue()
+        received = []
+
+        queue.subscribe("test.topic", lambda msg: received.append(dict(msg.data)))
+        message = queue.acquire_message(
+            sender="test",
+            recipients=["*"],
+            topic="test.topic",
+            data={"key": "value"},
+            priority=MessagePriority.HIGH,
+        )
+        assert message.pooled
+        assert message.priority == MessagePriority.HIGH.value
+
+        queue.publish(message)
+        queue.process()
+
+        assert received == [{"key": "value"}]
+
+    def test_message_recycled_after_dispatch(self) -> None:
+        """Test that a dispatched pooled message is reused by the next acquire."""
+        queue = MessageQueue()
+        first = queue.acquire_message("test", ["*"], "test.topic", {"index": 1})
+        queue.publish(first)
+        queue.process()
+
+        assert first.data == {}
+
+        second = queue.acquire_message("test", ["*"], "test.topic", {"index": 2})
+        assert second is first
+        assert second.data == {"index": 2}
+
+    def test_publish_tap_sees_messages(self) -> None:
+        """Test that the publish tap observes each message until removed."""
+        queue = MessageQueue()
+        tapped: list[str] = []
+        queue.set_publish_tap(lambda msg: tapped.append(msg.topic))
+
+        queue.publish(queue.acquire_message("test", ["*"], "test.one", {}))
+        queue.set_publish_tap(None)
+        queue.publish(queue.acquire_message("test", ["*"], "test.two", {}))
+
+        assert tapped == ["test.one"]
+        assert queue.pending_count() == 2
+
+    def test_message_recycled_when_handler_raises(self) -> None:
+        """Test that pooled messages return to the pool even if a handler fails."""
+        queue = MessageQueue()
+
+        def failing_handler(msg: Message) -> None:
+            raise ValueError("Handler error")
+
+        queue.subscribe("test.topic", failing_handler)
+        message = queue.acquire_message("test", ["*"], "test.topic", {})
+        queue.publish(message)
+
+        with pytest.raises(ValueError):
+            queue.process()
+
+        assert queue.acquire_message("test", ["*"], "test.topic", {}) is message
+
+    def test_pooled_message_stamped_on_publish(self) -> None:
+        """Test that a recycled message gets the time it was published."""
+        import time
+
+        queue = MessageQueue()
+        queue.publish(queue.acquire_message("test", ["*"], "test.topic", {}))
+        queue.process()
+        time.sleep(0.01)
+
+        message = queue.acquire_message("test", ["*"], "test.topic", {})
+        before = time.time()
+        queue.publish(message)
+
+        assert before <= message.timestamp <= time.time()
+
+    def test_regular_messages_not_recycled(self) -> None:
+        """Test that caller-owned messages are never placed in the pool."""
+        queue = MessageQueue()
+        message = Message(sender="test", recipients=["*"], topic="test.topic", data={"k": 1})
+        queue.publish(message)
+        queue.process()
+
+        assert message.data == {"k": 1}
+        assert queue.acquire_message("test", ["*"], "test.topic", {}) is not message
+
+
+class TestThreadSafeQueue:
+    """Test suite for the locked cross-thread mode."""
+
+    def test_publish_from_other_threads(self) -> None:
+        """Test that messages published from worker threads are all delivered."""
+        import threading
+
+        queue = MessageQueue(thread_safe=True)
+        assert queue.thread_safe
+        received = []
+        queue.subscribe("test.topic", lambda msg: received.append(msg.data["index"]))
+
+        def worker(offset: int) -> None:
+            for i in range(100):
+                queue.publish(
+                    Message(
+                        sender="worker",
+                        recipients=["*"],
+                        topic="test.topic",
+                        data={"index": offset + i},
+                    )
+                )
+
+        threads = [threading.Thread(target=worker, args=(n * 100,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert queue.pending_count() == 400
+        queue.process(max_messages=1000)
+        assert sorted(received) == list(range(400))
+
+
+class TestCoalescingTopics:
+    """Test suite for latest-value coalescing."""
+
+    @staticmethod
+    def _position(sender: str, index: int) -> Message:
+        return Message(
+            sender=sender,
+            recipients=["*"],
+            topic=MessageTopic.POSITION_UPDATED,
+            data={"index": index},
+            priority=MessagePriority.HIGH,
+        )
+
+    def test_position_updates_coalesce_by_default(self) -> None:
+        """Test that only the newest pending position update is delivered."""
+        queue = MessageQueue()
+        received = []
+        queue.subscribe(MessageTopic.POSITION_UPDATED, lambda msg: received.append(msg.data))
+
+        for i in range(10):
+            queue.publish(self._position("physics_plugin", i))
+
+        assert queue.pending_count() == 1
+        assert queue.process() == 1
+        assert received == [{"index": 9}]
+        assert queue.get_dropped_count() == 9
+        assert queue.get_dropped_count(MessageTopic.POSITION_UPDATED) == 9
+
+    def test_coalescing_is_per_sender(self) -> None:
+        """Test that different senders on the same topic are kept apart."""
+        queue = MessageQueue()
+        received = []
+        queue.subscribe(
+            MessageTopic.POSITION_UPDATED,
+            lambda msg: received.append((msg.sender, msg.data["index"])),
+        )
+
+        queue.publish(self._position("a", 1))
+        queue.publish(self._position("b", 1))
+        queue.publish(self._position("a", 2))
+        queue.process()
+
+        assert received == [("a", 2), ("b", 1)]
+
+    def test_coalesced_stream_does_not_starve_events(self) -> None:
+        """Test that a backed-up state stream leaves budget for real events."""
+        queue = MessageQueue()
+        collisions = []
+        queue.subscribe(MessageTopic.COLLISION_DETECTED, collisions.append)
+
+        for i in range(500):
+            queue.publish(self._position("physics_plugin", i))
+        queue.publish(
+            Message(
+                sender="physics_plugin",
+                recipients=["*"],
+                topic=MessageTopic.COLLISION_DETECTED,
+                data={},
+                priority=MessagePriority.HIGH,
+            )
+        )
+
+        queue.process(max_messages=2)
+        assert len(collisions) == 1
+
+    def test_new_message_after_process_is_delivered(self) -> None:
+        """Test that coalescing only spans messages pending at the same time."""
+        queue = MessageQueue()
+        received = []
+        queue.subscribe(MessageTopic.POSITION_UPDATED, lambda msg: received.append(msg.data))
+
+        queue.publish(self._position("physics_plugin", 1))
+        queue.process()
+        queue.publish(self._position("physics_plugin", 2))
+        queue.process()
+
+        assert received == [{"index": 1}, {"index": 2}]
+        assert queue.get_dropped_count() == 0
+
+    def test_set_coalescing(self) -> None:
+        """Test declaring and removing coalescing topics at runtime."""
+        queue = MessageQueue(coalescing_topics=set())
+        assert not queue.is_coalescing(MessageTopic.POSITION_UPDATED)
+
+        queue.set_coalescing("test.topic")
+        assert queue.is_coalescing("test.topic")
+        for i in range(3):
+            queue.publish(Message(sender="s", recipients=["*"], topic="test.topic", data={"i": i}))
+        assert queue.pending_count() == 1
+
+        queue.set_coalescing("test.topic", enabled=False)
+        queue.process()
+        for i in range(3):
+            queue.publish(Message(sender="s", recipients=["*"], topic="test.topic", data={"i": i}))
+        assert queue.pending_count() == 3
+
+    def test_superseded_pooled_message_is_recycled(self) -> None:
+        """Test that the pooled message holding the lane slot returns to the pool."""
+        queue = MessageQueue()
+        first = queue.acquire_message("physics_plugin", ["*"], MessageTopic.POSITION_UPDATED, {})
+        queue.publish(first)
+        queue.publish(self._position("physics_plugin", 2))
+        queue.process()
+
+        assert queue.acquire_message("x", ["*"], "test.topic", {}) is first
+
+    def test_every_superseded_pooled_message_is_recycled(self) -> None:
+        """Test that replacements superseded before dispatch return to the pool."""
+        queue = MessageQueue()
+        received = []
+        queue.subscribe(MessageTopic.POSITION_UPDATED, lambda msg: received.append(msg.data))
+        messages = [
+            queue.acquire_message("physics_plugin", ["*"], MessageTopic.POSITION_UPDATED, {"i": i})
+            for i in range(4)
+        ]
+        for message in messages:
+            queue.publish(message)
+        queue.process()
+
+        assert received == [{"i": 3}]
+        recycled = [queue.acquire_message("x", ["*"], "test.topic", {}) for _ in range(4)]
+        assert {id(message) for message in recycled} == {id(message) for message in messages}
+
+
+class TestWildcardSubscriptions:
+    """Test suite for '*' and '**' topic patterns."""
+
+    @staticmethod
+    def _publish(queue: MessageQueue, topic: str) -> None:
+        queue.publish(Message(sender="test", recipients=["*"], topic=topic, data={}))
+
+    def test_single_segment_wildcard(self) -> None:
+        """Test that '*' matches exactly one segment."""
+        queue = MessageQueue()
+        received: list[str] = []
+        queue.subscribe("system.*", lambda msg: received.append(msg.topic))
+
+        self._publish(queue, "system.warning")
+        self._publish(queue, "system.engine.state")
+        self._publish(queue, "engine.state")
+        queue.process()
+
+        assert received == ["system.warning"]
+
+    def test_multi_segment_wildcard(self) -> None:
+        """Test that a trailing '**' matches any number of segments."""
+        queue = MessageQueue()
+        received: list[str] = []
+        queue.subscribe("system.**", lambda msg: received.append(msg.topic))
+
+        self._publish(queue, "system")
+        self._publish(queue, "system.warning")
+        self._publish(queue, "system.engine.state")
+        self._publish(queue, "systems.other")
+        queue.process()
+
+        assert received == ["system", "system.warning", "system.engine.state"]
+
+    def test_inner_wildcard(self) -> None:
+        """Test a '*' in the middle of a pattern."""
+        queue = MessageQueue()
+        received: list[str] = []
+        queue.subscribe("aircraft.*.state", lambda msg: received.append(msg.topic))
+
+        self._publish(queue, "aircraft.engine.state")
+        self._publish(queue, "aircraft.engine.command")
+        queue.process()
+
+        assert received == ["aircraft.engine.state"]
+
+    def test_dispatch_order(self) -> None:
+        """Test exact subscribers run first, then patterns in subscription order."""
+        queue = MessageQueue()
+        calls: list[str] = []
+        queue.subscribe("system.**", lambda msg: calls.append("deep"))
+        queue.subscribe("system.*", lambda msg: calls.append("single"))
+        queue.subscribe("system.warning", lambda msg: calls.append("exact"))
+
+        self._publish(queue, "system.warning")
+        queue.process()
+
+        assert calls == ["exact", "deep", "single"]
+
+    def test_cache_invalidated_on_subscription_change(self) -> None:
+        """Test that compiled handler lists follow subscribe/unsubscribe."""
+        queue = MessageQueue()
+        calls: list[str] = []
+
+        def handler(msg: Message) -> None:
+            calls.append(msg.topic)
+
+        self._publish(queue, "system.warning")
+        queue.process()
+
+        queue.subscribe("system.*", handler)
+        self._publish(queue, "system.warning")
+        queue.process()
+        assert calls == ["system.warning"]
+
+        queue.unsubscribe("system.*", handler)
+        self._publish(queue, "system.warning")
+        queue.process()
+        assert calls == ["system.warning"]
+
+    def test_subscriber_count_for_pattern(self) -> None:
+        """Test counting subscribers of a pattern."""
+        queue = MessageQueue()
+        queue.subscribe("system.**", lambda msg: None)
+        queue.subscribe("system.**", lambda msg: None)
+
+        assert queue.get_subscriber_count("system.**") == 2
+        assert queue.get_subscriber_count("system.*") == 0
+
+        queue.clear()
+        assert queue.get_subscriber_count("system.**") == 0
+
+    def test_invalid_pattern(self) -> None:
+        """Test that '**' is only allowed as the last segment."""
+        queue = MessageQueue()
+        with pytest.raises(ValueError):
+            queue.subscribe("system.**.state", lambda msg: None)
@@ -86,6 +86,26 @@ class TestPluginMetadata:
                 update_priority=1001,
             )
 
+    def test_metadata_validation_update_rate(self) -> None:
+        """Test that update rate and phase must be in valid ranges."""
+        with pytest.raises(ValueError, match="Update rate must be positive"):
+            PluginMetadata(
+                name="test",
+                version="1.0.0",
+                author="Test Author",
+                plugin_type=PluginType.CORE,
+                update_rate_hz=0.0,
+            )
+        with pytest.raises(ValueError, match="Update phase"):
+            PluginMetadata(
+                name="test",
+                version="1.0.0",
+                author="Test Author",
+                plugin_type=PluginType.CORE,
+                update_rate_hz=10.0,
+                update_phase=1.0,
+            )
+
     def test_metadata_defaults(self) -> None:
         """Test metadata default values."""
         metadata = PluginMetadata(
@@ -96,6 +116,8 @@ class TestPluginMetadata:
         assert metadata.provides == []
         assert metadata.optional is False
         assert metadata.update_priority == 100
+        assert metadata.update_rate_hz is None
+        assert metadata.update_phase is None
         assert metadata.requires_physics is True
         assert metadata.requires_network is False
         assert metadata.config_schema is None
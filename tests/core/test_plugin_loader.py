@@ -0,0 +1,185 @@
+"""Tests for plugin discovery and the discovery manifest cache."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from airborne.core.plugin import PluginType
+from airborne.core.plugin_loader import (
+    DependencyError,
+    PluginLoader,
+    PluginLoadError,
+    dependency_stages,
+)
+
+PLUGIN_SOURCE = """
+from airborne.core.plugin import IPlugin, PluginMetadata, PluginType
+
+
+class {cls}(IPlugin):
+    def get_metadata(self):
+        return PluginMetadata(
+            name="{name}",
+            version="{version}",
+            author="Test Suite",
+            plugin_type=PluginType.FEATURE,
+            dependencies={deps!r},
+            update_rate_hz=5.0,
+        )
+
+    def initialize(self, context):
+        self.context = context
+
+    def update(self, dt):
+        pass
+
+    def shutdown(self):
+        pass
+
+    def handle_message(self, message):
+        pass
+"""
+
+
+def write_plugin(
+    directory: Path, name: str, version: str = "1.0.0", deps: list[str] | None = None
+) -> Path:
+    """Write a minimal plugin module and return its path."""
+    path = directory / f"{name}_plugin.py"
+    cls = "".join(part.title() for part in name.split("_")) + "Plugin"
+    path.write_text(
+        PLUGIN_SOURCE.format(cls=cls, name=name, version=version, deps=deps or []),
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture
+def plugin_dir(tmp_path: Path) -> Path:
+    """Directory with two plugins, one depending on the other."""
+    directory = tmp_path / "plugins"
+    directory.mkdir()
+    write_plugin(directory, "alpha")
+    write_plugin(directory, "beta", deps=["alpha"])
+    (directory / "helpers_plugin.py").write_text("VALUE = 1\n", encoding="utf-8")
+    return directory
+
+
+class TestPluginDiscovery:
+    """Test suite for PluginLoader discovery."""
+
+    def test_discover_without_manifest(self, plugin_dir: Path) -> None:
+        """Test discovery imports plugin files and finds their metadata."""
+        loader = PluginLoader([plugin_dir])
+        names = sorted(meta.name for meta in loader.discover_plugins())
+
+        assert names == ["alpha", "beta"]
+        assert set(loader.plugin_classes) == {"alpha", "beta"}
+        assert loader.resolve_dependencies(["beta", "alpha"]) == ["alpha", "beta"]
+
+    def test_manifest_skips_imports(self, plugin_dir: Path, tmp_path: Path) -> None:
+        """Test a warm manifest discovers plugins without importing them."""
+        manifest = tmp_path / "cache" / "manifest.json"
+        PluginLoader([plugin_dir], manifest_path=manifest).discover_plugins()
+        assert manifest.exists()
+
+        loader = PluginLoader([plugin_dir], manifest_path=manifest)
+        discovered = {meta.name: meta for meta in loader.discover_plugins()}
+
+        assert set(discovered) == {"alpha", "beta"}
+        assert discovered["beta"].dependencies == ["alpha"]
+        assert discovered["beta"].plugin_type == PluginType.FEATURE
+        assert discovered["beta"].update_rate_hz == 5.0
+        assert loader.plugin_classes == {}
+
+    def test_load_plugin_imports_lazily(self, plugin_dir: Path, tmp_path: Path) -> None:
+        """Test load_plugin imports a cached plugin and its dependencies on demand."""
+        manifest = tmp_path / "manifest.json"
+        PluginLoader([plugin_dir], manifest_path=manifest).discover_plugins()
+        loader = PluginLoader([plugin_dir], manifest_path=manifest)
+        loader.discover_plugins()
+
+        context = MagicMock()
+        plugin = loader.load_plugin("beta", context)
+
+        assert plugin.context is context
+        assert loader.list_loaded_plugins() == ["alpha", "beta"]
+        assert set(loader.plugin_classes) == {"alpha", "beta"}
+
+    def test_modified_file_is_rescanned(self, plugin_dir: Path, tmp_path: Path) -> None:
+        """Test an edited plugin file is re-imported and the manifest updated."""
+        manifest = tmp_path / "manifest.json"
+        PluginLoader([plugin_dir], manifest_path=manifest).discover_plugins()
+
+        path = write_plugin(plugin_dir, "alpha", version="2.0.0")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        loader = PluginLoader([plugin_dir], manifest_path=manifest)
+        versions = {meta.name: meta.version for meta in loader.discover_plugins()}
+
+        assert versions["alpha"] == "2.0.0"
+        assert set(loader.plugin_classes) == {"alpha"}
+        entries = json.loads(manifest.read_text(encoding="utf-8"))["plugins"]
+        assert entries[str(path.resolve())]["metadata"]["version"] == "2.0.0"
+
+    def test_touched_file_uses_hash(self, plugin_dir: Path, tmp_path: Path) -> None:
+        """Test a file with a new mtime but identical contents is not re-imported."""
+        manifest = tmp_path / "manifest.json"
+        PluginLoader([plugin_dir], manifest_path=manifest).discover_plugins()
+
+        path = plugin_dir / "alpha_plugin.py"
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        loader = PluginLoader([plugin_dir], manifest_path=manifest)
+        loader.discover_plugins()
+
+        assert loader.plugin_classes == {}
+        entries = json.loads(manifest.read_text(encoding="utf-8"))["plugins"]
+        assert entries[str(path.resolve())]["mtime_ns"] == path.stat().st_mtime_ns
+
+    def test_corrupt_manifest_is_ignored(self, plugin_dir: Path, tmp_path: Path) -> None:
+        """Test an unreadable manifest falls back to importing and is rewritten."""
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text("{not json", encoding="utf-8")
+
+        loader = PluginLoader([plugin_dir], manifest_path=manifest)
+        assert len(loader.discover_plugins()) == 2
+        assert json.loads(manifest.read_text(encoding="utf-8"))["version"] == 1
+
+    def test_unknown_plugin(self, plugin_dir: Path) -> None:
+        """Test loading an undiscovered plugin raises PluginLoadError."""
+        loader = PluginLoader([plugin_dir])
+        loader.discover_plugins()
+
+        with pytest.raises(PluginLoadError):
+            loader.load_plugin("gamma", MagicMock())
+
+
+class TestDependencyStages:
+    """Test suite for grouping plugins into execution stages."""
+
+    def test_resolve_stages(self, plugin_dir: Path) -> None:
+        """Test that dependents land in a later stage than their dependencies."""
+        write_plugin(plugin_dir, "gamma")
+        loader = PluginLoader([plugin_dir])
+        loader.discover_plugins()
+
+        assert loader.resolve_stages(["beta", "alpha", "gamma"]) == [["alpha", "gamma"], ["beta"]]
+        with pytest.raises(DependencyError):
+            loader.resolve_stages(["delta"])
+
+    def test_longest_path_decides_stage(self) -> None:
+        """Test that a node runs after its deepest dependency chain."""
+        stages = dependency_stages({"d": ["b", "c"], "c": ["b"], "b": ["a"], "a": [], "e": ["x"]})
+
+        assert stages == [["a", "e"], ["b"], ["c"], ["d"]]
+
+    def test_cycle_detected(self) -> None:
+        """Test that circular dependencies raise DependencyError."""
+        with pytest.raises(DependencyError):
+            dependency_stages({"a": ["b"], "b": ["c"], "c": ["a"]})
@@ -0,0 +1,73 @@
+"""Tests for the frame profiler."""
+
+import json
+from pathlib import Path
+
+from airborne.core.profiler import FrameProfiler
+
+
+class TestFrameProfiler:
+    """Test suite for FrameProfiler."""
+
+    def test_sections_are_timed(self) -> None:
+        """Test that sections and frames are recorded."""
+        profiler = FrameProfiler()
+        for _ in range(3):
+            profiler.begin_frame()
+            with profiler.section("physics", "plugin"):
+                pass
+            with profiler.section("render", "render"):
+                pass
+            profiler.end_frame()
+
+        assert profiler.frame_count == 3
+        assert profiler.stats["physics"].count == 3
+        assert profiler.stats["render"].count == 3
+        assert profiler.stats["frame"].count == 3
+        assert {row["section"] for row in profiler.summary()} == {"physics", "render", "frame"}
+
+    def test_disabled_profiler_records_nothing(self) -> None:
+        """Test that a disabled profiler is a no-op."""
+        profiler = FrameProfiler(enabled=False)
+        profiler.begin_frame()
+        with profiler.section("physics"):
+            pass
+        profiler.end_frame()
+
+        assert profiler.stats == {}
+        assert profiler.frame_count == 0
+
+    def test_section_records_on_exception(self) -> None:
+        """Test that a section is still recorded when its block raises."""
+        profiler = FrameProfiler()
+        try:
+            with profiler.section("failing"):
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+
+        assert profiler.stats["failing"].count == 1
+
+    def test_write_chrome_trace(self, tmp_path: Path) -> None:
+        """Test Chrome trace export format."""
+        profiler = FrameProfiler()
+        profiler.record("plugin.physics", 1.0, 1.002, "plugin")
+
+        path = tmp_path / "trace.json"
+        profiler.write_trace(path)
+        trace = json.loads(path.read_text())
+
+        (event,) = trace["traceEvents"]
+        assert event["name"] == "plugin.physics"
+        assert event["cat"] == "plugin"
+        assert event["ph"] == "X"
+        assert abs(event["dur"] - 2000.0) < 1e-6
+
+    def test_event_buffer_is_bounded(self) -> None:
+        """Test that old trace events are discarded past max_events."""
+        profiler = FrameProfiler(max_events=10)
+        for i in range(25):
+            profiler.record("section", float(i), float(i) + 0.001)
+
+        assert len(profiler.to_trace()["traceEvents"]) == 10
+        assert profiler.stats["section"].count == 25
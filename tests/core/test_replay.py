@@ -0,0 +1,98 @@
+"""Tests for the replay journal."""
+
+import numpy as np
+import pytest
+
+from airborne.core.input import InputState
+from airborne.core.messaging import Message, MessagePriority, MessageQueue
+from airborne.core.replay import (
+    JournalError,
+    JournalReader,
+    JournalWriter,
+    state_checksum,
+)
+from airborne.physics.state_snapshot import AircraftStateSnapshot
+
+
+class TestJournal:
+    """Test suite for JournalWriter and JournalReader."""
+
+    @pytest.mark.parametrize("name", ["run.abrj", "run.abrj.gz"])
+    def test_round_trip(self, tmp_path, name) -> None:
+        """Test frames, controls and messages are read back exactly."""
+        path = tmp_path / name
+        state = InputState(pitch=0.1, roll=-0.3, throttle=1 / 3, gear=0.0)
+        dt = 0.016666666666666666
+
+        with JournalWriter(path, physics_hz=120.0, seed=1234) as journal:
+            journal.write_message(
+                Message(
+                    "menu", ["radio_plugin"], "radio.tune", {"mhz": 121.5}, MessagePriority.HIGH
+                )
+            )
+            journal.write_frame(dt, state, 0xDEADBEEF)
+            journal.write_frame(0.02, InputState(), 7)
+
+        with JournalReader(path) as journal:
+            assert journal.physics_hz == 120.0
+            assert journal.seed == 1234
+            frames = list(journal)
+
+        assert len(frames) == 2
+        first, second = frames
+        assert first.dt == dt
+        assert first.state_crc == 0xDEADBEEF
+        assert len(first.messages) == 1
+        assert second.messages == []
+
+        message = first.messages[0].to_message()
+        assert message.topic == "radio.tune"
+        assert message.data == {"mhz": 121.5}
+        assert message.priority == MessagePriority.HIGH.value
+
+        replayed = InputState()
+        first.apply_controls(replayed)
+        assert replayed == state
+
+    def test_records_pooled_messages_via_tap(self, tmp_path) -> None:
+        """Test pooled messages are copied when published, not when recycled."""
+        path = tmp_path / "run.abrj"
+        queue = MessageQueue()
+
+        with JournalWriter(path, physics_hz=60.0, seed=0) as journal:
+            queue.set_publish_tap(journal.write_message)
+            queue.publish(queue.acquire_message("input_manager", ["*"], "control.input", {"x": 1}))
+            queue.set_publish_tap(None)
+            queue.process()  # recycles the pooled message
+            journal.write_frame(1 / 60, InputState(), 0)
+
+        with JournalReader(path) as journal:
+            (frame,) = list(journal)
+        assert frame.messages[0].data == {"x": 1}
+
+    def test_rejects_other_files(self, tmp_path) -> None:
+        """Test non-journal files are rejected."""
+        path = tmp_path / "not_a_journal.bin"
+        path.write_bytes(b"PNG\x00" * 8)
+
+        with pytest.raises(JournalError):
+            JournalReader(path)
+
+    def test_truncated_frame(self, tmp_path) -> None:
+        """Test a truncated frame record raises JournalError."""
+        path = tmp_path / "run.abrj"
+        with JournalWriter(path, physics_hz=60.0, seed=0) as journal:
+            journal.write_frame(1 / 60, InputState(), 0)
+        path.write_bytes(path.read_bytes()[:-4])
+
+        with JournalReader(path) as journal, pytest.raises(JournalError):
+            list(journal)
+
+
+def test_state_checksum_detects_any_change() -> None:
+    """Test the checksum changes with a one-ulp state difference."""
+    snapshot = AircraftStateSnapshot()
+    before = state_checksum(snapshot)
+    snapshot.array[0] = np.nextafter(snapshot.array[0], 1.0)
+
+    assert state_checksum(snapshot) != before
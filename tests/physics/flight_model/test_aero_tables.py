@@ -0,0 +1,117 @@
+"""Tests for table-driven aerodynamic coefficients."""
+
+import math
+
+import numpy as np
+import pytest
+
+from airborne.physics.flight_model.aero_tables import (
+    CD,
+    CL,
+    CM,
+    AeroCoefficientTable,
+    induced_drag_factor,
+)
+
+AERODYNAMICS = {
+    "aspect_ratio": 8.0,
+    "alpha_deg": [0.0, 10.0, 20.0],
+    "flaps": [0.0, 1.0],
+    "oswald_efficiency": [0.8, 0.6],
+    "gear_up": {
+        "cl": [[0.2, 1.2, 1.0], [0.6, 1.6, 1.4]],
+        "cd": [[0.02, 0.03, 0.10], [0.05, 0.06, 0.13]],
+        "cm": [[0.05, -0.05, -0.15], [0.0, -0.10, -0.20]],
+    },
+    "gear_down": {
+        "cl": [[0.2, 1.2, 1.0], [0.6, 1.6, 1.4]],
+        "cd": [[0.04, 0.05, 0.12], [0.07, 0.08, 0.15]],
+        "cm": [[0.05, -0.05, -0.15], [0.0, -0.10, -0.20]],
+    },
+}
+
+
+@pytest.fixture
+def table() -> AeroCoefficientTable:
+    """Retractable gear table."""
+    return AeroCoefficientTable.from_config(AERODYNAMICS)
+
+
+def profile_drag(table: AeroCoefficientTable, cl: float, cd: float, flaps: float) -> float:
+    """Remove induced drag from a looked-up CD."""
+    factor = np.interp(flaps, table.flaps, table.induced_drag_factors)
+    return cd - factor * cl * cl
+
+
+class TestAeroCoefficientTable:
+    """Test suite for AeroCoefficientTable."""
+
+    def test_breakpoints(self, table: AeroCoefficientTable) -> None:
+        """Test that table values are returned at breakpoints."""
+        cl, cd, cm = table.lookup(10.0, flaps=1.0, gear=0.0)
+
+        assert cl == pytest.approx(1.6)
+        assert profile_drag(table, cl, cd, 1.0) == pytest.approx(0.06)
+        assert cm == pytest.approx(-0.10)
+
+    def test_trilinear_interpolation(self, table: AeroCoefficientTable) -> None:
+        """Test interpolation along all three axes."""
+        cl, cd, _ = table.lookup(5.0, flaps=0.5, gear=0.5)
+
+        assert cl == pytest.approx(0.9)
+        assert profile_drag(table, cl, cd, 0.5) == pytest.approx(0.05)
+
+    def test_out_of_range_is_clamped(self, table: AeroCoefficientTable) -> None:
+        """Test that values beyond the table hold the edge values."""
+        assert table.lookup(40.0, flaps=2.0, gear=1.0) == table.lookup(20.0, flaps=1.0, gear=1.0)
+        assert table.lookup(-5.0)[CL] == pytest.approx(0.2)
+
+    def test_induced_drag_factors(self, table: AeroCoefficientTable) -> None:
+        """Test that induced drag factors are cached per flap setting."""
+        assert table.induced_drag_factors == pytest.approx(
+            [1.0 / (math.pi * 8.0 * 0.8), 1.0 / (math.pi * 8.0 * 0.6)]
+        )
+        assert induced_drag_factor(8.0, 0.0) == 0.0
+
+    def test_array_lookup_matches_scalar(self, table: AeroCoefficientTable) -> None:
+        """Test that the vectorized lookup agrees with the scalar one."""
+        rng = np.random.default_rng(1)
+        alpha = rng.uniform(-5.0, 25.0, 200)
+        flaps = rng.uniform(0.0, 1.0, 200)
+        gear = rng.uniform(0.0, 1.0, 200)
+
+        result = table.lookup_array(alpha, flaps, gear)
+
+        expected = [table.lookup(a, f, g) for a, f, g in zip(alpha, flaps, gear, strict=True)]
+        assert result.shape == (200, 3)
+        assert result == pytest.approx(np.array(expected))
+        assert table.lookup_array(10.0)[0, CM] == pytest.approx(-0.05)
+
+    def test_fixed_gear(self) -> None:
+        """Test that a single gear table applies at every gear position."""
+        config = {key: value for key, value in AERODYNAMICS.items() if key != "gear_up"}
+        table = AeroCoefficientTable.from_config(config)
+
+        assert table.coefficients.shape == (1, 2, 3, 3)
+        assert table.lookup(0.0, gear=0.0) == table.lookup(0.0, gear=1.0)
+        assert table.coefficients.flags["C_CONTIGUOUS"]
+
+    def test_invalid_config(self) -> None:
+        """Test that malformed tables are rejected."""
+        with pytest.raises(ValueError, match="alpha_deg required"):
+            AeroCoefficientTable.from_config({})
+        with pytest.raises(ValueError, match="increasing"):
+            AeroCoefficientTable.from_config({**AERODYNAMICS, "alpha_deg": [0.0, 20.0, 10.0]})
+        with pytest.raises(ValueError, match="gear_down or aerodynamics.gear_up"):
+            AeroCoefficientTable.from_config({"alpha_deg": [0.0, 10.0, 20.0]})
+        with pytest.raises(ValueError, match="cd table"):
+            bad = {**AERODYNAMICS["gear_down"], "cd": [[0.04, 0.05, 0.12]]}
+            AeroCoefficientTable.from_config({**AERODYNAMICS, "gear_down": bad})
+        with pytest.raises(ValueError, match="oswald_efficiency"):
+            AeroCoefficientTable.from_config({**AERODYNAMICS, "oswald_efficiency": [0.8]})
+
+    def test_column_order(self, table: AeroCoefficientTable) -> None:
+        """Test the coefficient column constants."""
+        assert table.coefficients[1, 0, 0, CL] == 0.2
+        assert table.coefficients[1, 0, 0, CD] == 0.04
+        assert table.coefficients[1, 0, 0, CM] == 0.05
@@ -0,0 +1,163 @@
+"""Tests for BatchedFlightModel."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from airborne.physics.flight_model.base import ControlInputs
+from airborne.physics.flight_model.batched import (
+    PITCH,
+    THROTTLE,
+    AircraftParameters,
+    BatchedFlightModel,
+)
+from airborne.physics.flight_model.simple_6dof import Simple6DOFFlightModel
+from airborne.physics.vectors import Vector3
+
+CONFIG = {
+    "wing_area_sqft": 174.0,
+    "weight_lbs": 2400.0,
+    "max_thrust_lbs": 300.0,
+    "drag_coefficient": 0.03,
+}
+
+CESSNA_YAML = Path(__file__).parents[3] / "config" / "aircraft" / "cessna172.yaml"
+
+
+@pytest.fixture
+def parameters() -> AircraftParameters:
+    """Light single parameters."""
+    return AircraftParameters.from_config(CONFIG)
+
+
+class TestAircraftParameters:
+    """Test suite for AircraftParameters."""
+
+    def test_from_config_converts_units(self, parameters: AircraftParameters) -> None:
+        """Test that imperial configuration values are converted like Simple6DOF."""
+        model = Simple6DOFFlightModel()
+        model.initialize(CONFIG)
+
+        assert parameters.wing_area == pytest.approx(model.wing_area)
+        assert parameters.empty_mass == pytest.approx(model.empty_mass)
+        assert parameters.max_thrust == pytest.approx(model.max_thrust)
+        assert parameters.max_fuel == pytest.approx(model.max_fuel)
+        assert parameters.drag_coefficient == 0.03
+
+    def test_from_config_missing_key(self) -> None:
+        """Test that required keys are enforced."""
+        with pytest.raises(ValueError, match="max_thrust_lbs required"):
+            AircraftParameters.from_config({"wing_area_sqft": 174.0, "weight_lbs": 2400.0})
+
+    def test_from_yaml(self) -> None:
+        """Test loading parameters from an aircraft configuration file."""
+        parameters = AircraftParameters.from_yaml(CESSNA_YAML)
+
+        assert parameters.wing_area == pytest.approx(174.0 * 0.092903)
+        assert parameters.lift_coefficient_slope == 0.09
+        assert parameters.drag_coefficient == 0.042
+
+
+class TestBatchedFlightModel:
+    """Test suite for BatchedFlightModel."""
+
+    def test_matches_simple_6dof(self, parameters: AircraftParameters) -> None:
+        """Test that every aircraft follows the scalar model's trajectory."""
+        cases = [
+            (Vector3(0.0, 500.0, 0.0), Vector3(0.0, 0.0, 50.0), ControlInputs(throttle=0.8)),
+            (
+                Vector3(10.0, 300.0, 5.0),
+                Vector3(40.0, 0.0, 0.0),
+                ControlInputs(pitch=0.1, roll=-0.3),
+            ),
+            (Vector3(0.0, 0.0, 0.0), Vector3.zero(), ControlInputs(throttle=1.0, yaw=0.2)),
+        ]
+        fleet = BatchedFlightModel(capacity=1)
+        models = []
+        for index, (position, velocity, inputs) in enumerate(cases):
+            model = Simple6DOFFlightModel()
+            model.initialize(CONFIG)
+            model.state.position.copy_from(position)
+            model.state.velocity.copy_from(velocity)
+            models.append((model, inputs))
+
+            fleet.add(f"AI{index}", parameters, position=position, velocity=velocity)
+            fleet.set_inputs(
+                f"AI{index}",
+                pitch=inputs.pitch,
+                roll=inputs.roll,
+                yaw=inputs.yaw,
+                throttle=inputs.throttle,
+            )
+
+        for _ in range(120):
+            fleet.step(1 / 60)
+            for model, inputs in models:
+                model.update(1 / 60, inputs)
+
+        for index, (model, _) in enumerate(models):
+            state = fleet.get_state(f"AI{index}")
+            for actual, expected in (
+                (state.position, model.state.position),
+                (state.velocity, model.state.velocity),
+                (state.rotation, model.state.rotation),
+            ):
+                assert actual.to_array() == pytest.approx(expected.to_array(), rel=1e-9, abs=1e-9)
+            assert state.mass == pytest.approx(model.state.mass)
+            assert state.on_ground == model.state.on_ground
+
+    def test_array_inputs(self, parameters: AircraftParameters) -> None:
+        """Test driving all aircraft through the input array."""
+        fleet = BatchedFlightModel()
+        for index in range(50):
+            fleet.add(
+                f"AI{index}", parameters, position=(0.0, 1000.0, 0.0), velocity=(0.0, 0.0, 50.0)
+            )
+
+        fleet.inputs[:, THROTTLE] = np.linspace(0.0, 1.0, 50)
+        fleet.step(0.1)
+
+        assert fleet.position.shape == (50, 3)
+        assert np.all(np.diff(fleet.velocity[:, 2]) > 0)
+        assert np.all(fleet.fuel <= parameters.max_fuel)
+
+    def test_ground_clamp(self, parameters: AircraftParameters) -> None:
+        """Test that aircraft cannot sink below the ground."""
+        fleet = BatchedFlightModel()
+        fleet.add("AI0", parameters, position=(0.0, 0.5, 0.0), velocity=(0.0, -20.0, 0.0))
+
+        fleet.step(0.1)
+
+        assert fleet.position[0, 1] == 0.0
+        assert fleet.velocity[0, 1] == 0.0
+        assert fleet.on_ground[0]
+
+    def test_remove_moves_last_row(self, parameters: AircraftParameters) -> None:
+        """Test that removal keeps rows dense and ids consistent."""
+        fleet = BatchedFlightModel(capacity=2)
+        for index in range(3):
+            fleet.add(f"AI{index}", parameters, position=(float(index), 100.0, 0.0))
+        fleet.set_inputs("AI2", pitch=2.0)
+
+        assert fleet.remove("AI0")
+        assert not fleet.remove("AI0")
+
+        assert fleet.count == 2
+        assert fleet.ids == ["AI2", "AI1"]
+        assert fleet.index_of("AI2") == 0
+        assert fleet.position[0, 0] == 2.0
+        assert fleet.inputs[0, PITCH] == 1.0
+
+    def test_duplicate_id(self, parameters: AircraftParameters) -> None:
+        """Test that ids are unique."""
+        fleet = BatchedFlightModel()
+        fleet.add("AI0", parameters)
+        with pytest.raises(ValueError):
+            fleet.add("AI0", parameters)
+
+    def test_empty_step(self) -> None:
+        """Test that stepping an empty fleet is a no-op."""
+        fleet = BatchedFlightModel()
+        fleet.step(0.1)
+        assert fleet.count == 0
@@ -0,0 +1,115 @@
+"""Tests for flight model integrators."""
+
+import math
+
+import pytest
+
+from airborne.physics.flight_model.integrators import (
+    AdaptiveIntegrator,
+    RK4Integrator,
+    SemiImplicitEulerIntegrator,
+    create_integrator,
+    substep_count,
+)
+from airborne.physics.vectors import Vector3
+
+DAMPING = 1.5  # 1/s, a = -k*v
+
+
+def damped(position: Vector3, velocity: Vector3, out: Vector3) -> None:
+    """Linear drag: a = -k*v."""
+    out.copy_from(velocity).iscale(-DAMPING)
+
+
+def run(integrator, dt: float, duration: float) -> tuple[Vector3, Vector3]:
+    """Integrate the damped motion from v=10 m/s and return (position, velocity)."""
+    position = Vector3.zero()
+    velocity = Vector3(10.0, 0.0, 0.0)
+    acceleration = Vector3.zero()
+    for _ in range(round(duration / dt)):
+        damped(position, velocity, acceleration)
+        integrator.step(position, velocity, acceleration, dt, damped)
+    return position, velocity
+
+
+def exact(duration: float) -> tuple[float, float]:
+    """Analytic (position, velocity) of the damped motion."""
+    decay = math.exp(-DAMPING * duration)
+    return 10.0 / DAMPING * (1.0 - decay), 10.0 * decay
+
+
+class TestIntegrators:
+    """Test suite for the integrators."""
+
+    def test_semi_implicit_euler_order(self) -> None:
+        """Test that velocity is updated before position."""
+        position = Vector3.zero()
+        velocity = Vector3(1.0, 0.0, 0.0)
+        SemiImplicitEulerIntegrator().step(
+            position, velocity, Vector3(0.0, -10.0, 0.0), 0.1, damped
+        )
+
+        assert velocity == Vector3(1.0, -1.0, 0.0)
+        assert position == Vector3(0.1, -0.1, 0.0)
+
+    def test_rk4_is_more_accurate(self) -> None:
+        """Test that RK4 at a low rate beats Euler at a high rate."""
+        expected_position, expected_velocity = exact(2.0)
+
+        _, euler_velocity = run(SemiImplicitEulerIntegrator(), 1 / 120, 2.0)
+        rk4_position, rk4_velocity = run(RK4Integrator(), 1 / 30, 2.0)
+
+        assert abs(rk4_velocity.x - expected_velocity) < 1e-5
+        assert abs(rk4_position.x - expected_position) < 1e-5
+        assert abs(rk4_velocity.x - expected_velocity) < abs(euler_velocity.x - expected_velocity)
+
+    def test_rk4_exact_for_constant_acceleration(self) -> None:
+        """Test that RK4 integrates constant acceleration exactly."""
+        position = Vector3.zero()
+        velocity = Vector3(0.0, 5.0, 0.0)
+        gravity = Vector3(0.0, -9.81, 0.0)
+
+        def constant(p: Vector3, v: Vector3, out: Vector3) -> None:
+            out.copy_from(gravity)
+
+        RK4Integrator().step(position, velocity, gravity, 1.0, constant)
+
+        assert position.y == pytest.approx(5.0 - 0.5 * 9.81)
+        assert velocity.y == pytest.approx(5.0 - 9.81)
+
+    def test_adaptive_substeps_long_frames(self) -> None:
+        """Test that a hitch is split into sub-steps within tolerance."""
+        integrator = AdaptiveIntegrator(tolerance=1e-4)
+        run(integrator, 0.5, 0.5)
+        assert integrator.substeps > 1
+
+        integrator = AdaptiveIntegrator(tolerance=1e-4)
+        position, velocity = run(integrator, 0.5, 2.0)
+        expected_position, expected_velocity = exact(2.0)
+
+        assert velocity.x == pytest.approx(expected_velocity, abs=1e-3)
+        assert position.x == pytest.approx(expected_position, abs=1e-3)
+
+    def test_adaptive_stops_at_max_substeps(self) -> None:
+        """Test that a call completes after max_substeps sub-steps."""
+        integrator = AdaptiveIntegrator(tolerance=1e-12, min_substep=1e-9, max_substeps=4)
+        run(integrator, 1.0, 1.0)
+
+        assert integrator.substeps == 4
+
+    def test_create_integrator(self) -> None:
+        """Test creating integrators by name."""
+        assert isinstance(create_integrator("rk4"), RK4Integrator)
+        adaptive = create_integrator("adaptive", tolerance=0.01)
+        assert isinstance(adaptive, AdaptiveIntegrator)
+        assert adaptive.tolerance == 0.01
+        with pytest.raises(ValueError):
+            create_integrator("verlet")
+        with pytest.raises(ValueError):
+            AdaptiveIntegrator(tolerance=0.0)
+
+    def test_substep_count(self) -> None:
+        """Test splitting long steps."""
+        assert substep_count(0.1, None) == 1
+        assert substep_count(0.01, 0.02) == 1
+        assert substep_count(0.1, 0.02) == 5
@@ -4,9 +4,11 @@ import math
 
 import pytest
 
+from airborne.physics.atmosphere import isa_conditions
 from airborne.physics.flight_model.base import AircraftState, ControlInputs
-from airborne.physics.flight_model.simple_6dof import Simple6DOFFlightModel
+from airborne.physics.flight_model.simple_6dof import AIR_DENSITY_SEA_LEVEL, Simple6DOFFlightModel
 from airborne.physics.vectors import Vector3
+from airborne.systems.propeller.fixed_pitch import FixedPitchPropeller
 
 
 class TestSimple6DOFInitialization:
@@ -537,3 +539,167 @@ class TestSimple6DOFPerformance:
 
         # Counter should increment correctly
         assert model.get_update_count() == initial + num_updates
+
+    def test_update_reuses_vectors(self, model: Simple6DOFFlightModel) -> None:
+        """Test that a physics step updates the state and force vectors in place."""
+        model.state.velocity = Vector3(50.0, 0.0, 0.0)
+        model.state.mark_velocity_dirty()
+
+        def vectors() -> list[Vector3]:
+            state, forces = model.state, model.forces
+            return [
+                state.position,
+                state.velocity,
+                state.acceleration,
+                state.rotation,
+                forces.lift,
+                forces.drag,
+                forces.thrust,
+                forces.weight,
+                forces.total,
+            ]
+
+        before = vectors()
+        model.update(dt=0.016, inputs=ControlInputs(throttle=0.8, pitch=0.2))
+
+        assert model.state.position.x > 0.0
+        assert all(a is b for a, b in zip(vectors(), before, strict=True))
+
+
+class TestSimple6DOFIntegration:
+    """Test integrator selection and sub-stepping."""
+
+    CONFIG = {"wing_area_sqft": 174.0, "weight_lbs": 2400.0, "max_thrust_lbs": 300.0}
+
+    def _fly(self, config: dict, dt: float, steps: int) -> AircraftState:
+        model = Simple6DOFFlightModel()
+        model.initialize({**self.CONFIG, **config})
+        model.state.position = Vector3(0.0, 1000.0, 0.0)
+        model.state.velocity = Vector3(50.0, 0.0, 0.0)
+        model.state.mark_velocity_dirty()
+        inputs = ControlInputs(throttle=0.8)
+        for _ in range(steps):
+            model.update(dt, inputs)
+        return model.state
+
+    def test_default_integrator(self) -> None:
+        """Test that semi-implicit Euler is the default."""
+        model = Simple6DOFFlightModel()
+        model.initialize(self.CONFIG)
+        assert model.integrator.name == "semi_implicit_euler"
+        assert model.max_substep is None
+
+    def test_unknown_integrator(self) -> None:
+        """Test that an unknown integrator is rejected."""
+        model = Simple6DOFFlightModel()
+        with pytest.raises(ValueError):
+            model.initialize({**self.CONFIG, "integrator": "verlet"})
+
+    @pytest.mark.parametrize("integrator", ["rk4", "adaptive"])
+    def test_higher_order_at_low_rate(self, integrator: str) -> None:
+        """Test that higher-order integrators at 20 Hz track Euler at 960 Hz."""
+        reference = self._fly({}, 1 / 960, 960)
+        euler = self._fly({}, 1 / 20, 20)
+        state = self._fly({"integrator": integrator, "integrator_tolerance": 1e-4}, 1 / 20, 20)
+
+        error = state.position.distance_to(reference.position)
+        assert error < 0.1
+        assert error < euler.position.distance_to(reference.position)
+
+    def test_substeps_split_hitches(self) -> None:
+        """Test that max_substep_s makes a long frame match short ones."""
+        short = self._fly({}, 0.02, 25)
+        hitch = self._fly({"max_substep_s": 0.02}, 0.5, 1)
+
+        assert hitch.position.x == pytest.approx(short.position.x)
+        assert hitch.velocity.y == pytest.approx(short.velocity.y)
+
+
+class TestSimple6DOFAeroTables:
+    """Test table-driven aerodynamic coefficients."""
+
+    CONFIG = {
+        "wing_area_sqft": 174.0,
+        "weight_lbs": 2400.0,
+        "max_thrust_lbs": 300.0,
+        "aerodynamics": {
+            "alpha_deg": [-10.0, 0.0, 10.0, 20.0],
+            "flaps": [0.0, 1.0],
+            "gear_down": {
+                "cl": [[-0.7, 0.3, 1.2, 1.0], [-0.3, 0.7, 1.6, 1.4]],
+                "cd": [[0.04, 0.03, 0.05, 0.15], [0.08, 0.07, 0.09, 0.19]],
+                "cm": [[0.1, 0.0, -0.1, -0.2], [0.05, -0.05, -0.15, -0.25]],
+            },
+        },
+    }
+
+    def _lift(self, velocity: Vector3, pitch: float = 0.0, flaps: float = 0.0) -> float:
+        model = Simple6DOFFlightModel()
+        model.initialize(self.CONFIG)
+        model.state.position = Vector3(0.0, 1000.0, 0.0)
+        model.state.velocity = velocity
+        model.state.rotation = Vector3(pitch, 0.0, 0.0)
+        model.state.mark_velocity_dirty()
+        model.update(0.01, ControlInputs(flaps=flaps))
+        return model.forces.lift.y
+
+    def test_configured_induced_drag(self) -> None:
+        """Test that aspect ratio and Oswald efficiency come from the config."""
+        model = Simple6DOFFlightModel()
+        model.initialize({**TestSimple6DOFIntegration.CONFIG, "aspect_ratio": 9.0})
+
+        assert model.aero_table is None
+        assert model.aspect_ratio == 9.0
+        assert model._induced_drag_factor == pytest.approx(1.0 / (math.pi * 9.0 * 0.7))
+
+    def test_table_lift(self) -> None:
+        """Test that lift follows the CL table at zero angle of attack."""
+        q = 0.5 * isa_conditions(1000.0).density * 50.0 * 50.0
+        wing_area = 174.0 * 0.092903
+
+        assert self._lift(Vector3(0.0, 0.0, 50.0)) == pytest.approx(q * wing_area * 0.3)
+
+    def test_density_follows_altitude(self) -> None:
+        """Test that air density is looked up at the current altitude."""
+        model = Simple6DOFFlightModel()
+        model.initialize(self.CONFIG)
+        model.state.position = Vector3(0.0, 3000.0, 0.0)
+        model.state.velocity = Vector3(0.0, 0.0, 50.0)
+        model.state.mark_velocity_dirty()
+
+        model.update(0.01, ControlInputs())
+
+        assert model.air_density == pytest.approx(isa_conditions(3000.0).density, rel=1e-6)
+        assert model.air_density < AIR_DENSITY_SEA_LEVEL
+
+    def test_angle_of_attack_from_flight_path(self) -> None:
+        """Test that climbing at the pitch angle leaves zero angle of attack."""
+        pitch = 10.0 * math.pi / 180.0
+        climbing = Vector3(0.0, 50.0 * math.sin(pitch), 50.0 * math.cos(pitch))
+
+        assert self._lift(climbing, pitch) == pytest.approx(self._lift(Vector3(0.0, 0.0, 50.0)))
+        assert self._lift(Vector3(0.0, 0.0, 50.0), pitch) > self._lift(climbing, pitch)
+
+    def test_flaps_add_lift(self) -> None:
+        """Test that the flap axis of the table is used."""
+        velocity = Vector3(0.0, 0.0, 40.0)
+
+        assert self._lift(velocity, flaps=1.0) > self._lift(velocity, flaps=0.0)
+
+    def test_rk4_stages_have_no_side_effects(self) -> None:
+        """Test that RK4 stages leave the step's pitching moment and log count alone."""
+        model = Simple6DOFFlightModel()
+        model.initialize({**self.CONFIG, "integrator": "rk4"})
+        model.state.position = Vector3(0.0, 1000.0, 0.0)
+        model.state.velocity = Vector3(0.0, 0.0, 50.0)
+        model.state.rotation = Vector3(5.0 * math.pi / 180.0, 0.0, 0.0)
+        model.state.mark_velocity_dirty()
+
+        model.propeller = FixedPitchPropeller(diameter_m=1.9)
+        model.engine_power_hp = 100.0
+        model.engine_rpm = 2400.0
+
+        model.update(0.5, ControlInputs())
+
+        assert model.pitching_moment_coefficient == pytest.approx(-0.05)
+        assert model._thrust_log_counter == 0
@@ -0,0 +1,198 @@
+"""Tests for the trim solver."""
+
+import math
+from pathlib import Path
+
+import pytest
+
+from airborne.core.config import ConfigLoader
+from airborne.physics.flight_model.simple_6dof import Simple6DOFFlightModel
+from airborne.physics.flight_model.trim import TrimError, TrimSolver
+from airborne.physics.vectors import Vector3
+from airborne.systems.propeller.fixed_pitch import FixedPitchPropeller
+
+CONFIG = {
+    "wing_area_sqft": 174.0,
+    "weight_lbs": 2400.0,
+    "max_thrust_lbs": 300.0,
+    "drag_coefficient": 0.03,
+}
+
+CESSNA_YAML = Path(__file__).parents[3] / "config" / "aircraft" / "cessna172.yaml"
+
+
+@pytest.fixture
+def model() -> Simple6DOFFlightModel:
+    """Light single with the linear lift curve and simple thrust."""
+    model = Simple6DOFFlightModel()
+    model.initialize(CONFIG)
+    return model
+
+
+def cessna_engine() -> dict:
+    """Engine plugin config of the Cessna 172."""
+    aircraft = ConfigLoader.load_yaml(CESSNA_YAML)["aircraft"]
+    plugin = next(p for p in aircraft["plugins"] if p["plugin"] == "simple_piston_engine")
+    return plugin["config"]
+
+
+def cessna_solver(model: Simple6DOFFlightModel) -> TrimSolver:
+    """Trim solver limited to the Cessna 172 engine."""
+    engine = cessna_engine()
+    return TrimSolver(model, max_power_hp=engine["max_power_hp"], max_rpm=engine["max_rpm"])
+
+
+@pytest.fixture
+def cessna() -> Simple6DOFFlightModel:
+    """Cessna 172 with coefficient tables and a fixed-pitch propeller."""
+    aircraft = ConfigLoader.load_yaml(CESSNA_YAML)["aircraft"]
+    model = Simple6DOFFlightModel()
+    model.initialize(aircraft["flight_model_config"])
+    propeller = aircraft["propeller"]
+    model.propeller = FixedPitchPropeller(
+        diameter_m=propeller["diameter_m"],
+        pitch_ratio=propeller["pitch_ratio"],
+        efficiency_static=propeller["efficiency_static"],
+        efficiency_cruise=propeller["efficiency_cruise"],
+        cruise_advance_ratio=propeller["cruise_advance_ratio"],
+        static_thrust_coefficient=propeller["static_thrust_coefficient"],
+    )
+    model.engine_rpm = 2400.0
+    return model
+
+
+def fly(model: Simple6DOFFlightModel, inputs, seconds: float) -> None:
+    """Run the model at 60 Hz."""
+    for _ in range(round(seconds * 60)):
+        model.update(1.0 / 60.0, inputs)
+
+
+class TestTrimSolver:
+    """Test suite for TrimSolver."""
+
+    def test_level_flight_balances_forces(self, model: Simple6DOFFlightModel) -> None:
+        """Test that the trimmed state has no net force."""
+        result = TrimSolver(model).solve(airspeed_mps=50.0, altitude_m=1000.0)
+
+        assert result.converged
+        assert result.residual_n < 0.01
+        assert 0.0 < result.throttle < 1.0
+        assert 0.0 < result.pitch_deg < 10.0
+        assert result.thrust_n == pytest.approx(result.throttle * model.max_thrust)
+
+    def test_solve_does_not_change_model(self, model: Simple6DOFFlightModel) -> None:
+        """Test that solve() leaves the model's state and forces alone."""
+        state = model.state
+        model.state.position = Vector3(1.0, 2.0, 3.0)
+
+        TrimSolver(model).solve(airspeed_mps=50.0, altitude_m=1000.0)
+
+        assert model.state is state
+        assert model.state.position.y == 2.0
+        assert model.forces.total.magnitude() == 0.0
+
+    def test_trimmed_model_holds_flight_path(self, model: Simple6DOFFlightModel) -> None:
+        """Test that the applied trim flies a steady descent."""
+        solver = TrimSolver(model)
+        result = solver.solve(airspeed_mps=45.0, altitude_m=600.0, flight_path_deg=-3.0)
+
+        solver.apply(result, heading_deg=90.0)
+        state = model.get_state()
+        assert state.velocity.x == pytest.approx(45.0 * math.cos(math.radians(3.0)))
+        assert state.velocity.z == pytest.approx(0.0, abs=1e-9)
+        assert not state.on_ground
+
+        fly(model, result.to_control_inputs(), 5.0)
+        expected_altitude = 600.0 - 5.0 * 45.0 * math.sin(math.radians(3.0))
+        assert state.position.y == pytest.approx(expected_altitude, abs=0.5)
+        assert state.get_airspeed() == pytest.approx(45.0, abs=0.1)
+
+    def test_propeller_and_tables(self, cessna: Simple6DOFFlightModel) -> None:
+        """Test trimming engine power with coefficient tables and a propeller."""
+        solver = cessna_solver(cessna)
+        result = solver.solve(
+            airspeed_mps=40.0, altitude_m=500.0, flight_path_deg=-3.0, flaps=0.333
+        )
+
+        assert result.converged
+        assert result.engine_power_hp > 0.0
+        assert 0.0 < result.throttle < 1.0
+        assert result.throttle * solver.full_throttle_power_hp(500.0) == pytest.approx(
+            result.engine_power_hp
+        )
+        assert result.angle_of_attack_deg == pytest.approx(result.pitch_deg + 3.0)
+
+        solver.apply(result)
+        assert cessna.engine_power_hp == result.engine_power_hp
+        fly(cessna, result.to_control_inputs(), 5.0)
+        assert cessna.state.get_airspeed() == pytest.approx(40.0, abs=0.1)
+        assert cessna.state.position.y == pytest.approx(
+            500.0 - 5.0 * 40.0 * math.sin(math.radians(3.0)), abs=0.5
+        )
+
+    @pytest.mark.parametrize("airspeed", [35.0, 40.0, 45.0, 50.0, 55.0])
+    def test_cessna_level_flight(self, cessna: Simple6DOFFlightModel, airspeed: float) -> None:
+        """Test that the Cessna 172 trims to level flight on its own engine."""
+        solver = cessna_solver(cessna)
+        result = solver.solve(airspeed_mps=airspeed, altitude_m=1500.0)
+
+        assert result.converged
+        assert 0.0 < result.throttle < 1.0
+        assert result.engine_power_hp < cessna_engine()["max_power_hp"]
+
+    def test_jacobian_is_cached(self, cessna: Simple6DOFFlightModel) -> None:
+        """Test that later solves reuse the Jacobian of earlier ones."""
+        solver = cessna_solver(cessna)
+        first = solver.solve(airspeed_mps=40.0, altitude_m=500.0)
+        again = solver.solve(airspeed_mps=40.0, altitude_m=500.0)
+
+        assert first.jacobian_evaluations >= 1
+        assert again.jacobian_evaluations == 0
+        assert again.pitch_deg == pytest.approx(first.pitch_deg, abs=1e-6)
+
+        solver.clear_cache()
+        assert solver.solve(airspeed_mps=40.0, altitude_m=500.0).jacobian_evaluations >= 1
+
+    def test_beyond_full_throttle(self, model: Simple6DOFFlightModel) -> None:
+        """Test that drag beyond full throttle reports no convergence."""
+        result = TrimSolver(model).solve(airspeed_mps=90.0, altitude_m=0.0)
+
+        assert not result.converged
+        assert result.throttle == 1.0
+
+    def test_beyond_full_power(self, cessna: Simple6DOFFlightModel) -> None:
+        """Test that needing more than the engine's power reports no convergence."""
+        solver = cessna_solver(cessna)
+        result = solver.solve(airspeed_mps=65.0, altitude_m=3000.0)
+
+        assert not result.converged
+        assert result.throttle == pytest.approx(1.0)
+        assert result.engine_power_hp == pytest.approx(solver.full_throttle_power_hp(3000.0))
+        assert result.engine_power_hp < cessna_engine()["max_power_hp"]
+
+    def test_trim_applies_or_raises(self, model: Simple6DOFFlightModel) -> None:
+        """Test that trim() applies a converged trim and rejects the rest."""
+        solver = TrimSolver(model)
+
+        result = solver.trim(airspeed_mps=50.0, altitude_m=1000.0, heading_deg=180.0)
+        assert result.converged
+        assert model.state.position.y == 1000.0
+        assert model.state.velocity.z == pytest.approx(-50.0)
+
+        with pytest.raises(TrimError, match="90.0 m/s"):
+            solver.trim(airspeed_mps=90.0, altitude_m=0.0)
+        assert model.state.position.y == 1000.0
+
+    def test_invalid_requests(self, model: Simple6DOFFlightModel) -> None:
+        """Test that unsolvable setups are rejected."""
+        with pytest.raises(ValueError, match="initialized"):
+            TrimSolver(Simple6DOFFlightModel()).solve(airspeed_mps=50.0, altitude_m=0.0)
+        with pytest.raises(ValueError, match="airspeed"):
+            TrimSolver(model).solve(airspeed_mps=0.0, altitude_m=0.0)
+
+        model.propeller = FixedPitchPropeller(diameter_m=1.9)
+        with pytest.raises(ValueError, match="engine_rpm"):
+            TrimSolver(model, max_power_hp=180.0).solve(airspeed_mps=50.0, altitude_m=0.0)
+        model.engine_rpm = 2400.0
+        with pytest.raises(ValueError, match="max_power_hp"):
+            TrimSolver(model).solve(airspeed_mps=50.0, altitude_m=0.0)
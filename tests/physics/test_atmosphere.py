@@ -0,0 +1,124 @@
+"""Tests for the tabulated ISA atmosphere."""
+
+import numpy as np
+import pytest
+
+from airborne.physics.atmosphere import (
+    DENSITY,
+    PRESSURE,
+    SEA_LEVEL_DENSITY,
+    SPEED_OF_SOUND,
+    TEMPERATURE,
+    Atmosphere,
+    get_atmosphere,
+    isa_conditions,
+    standard_altitude_for_density,
+)
+
+
+@pytest.fixture
+def atmosphere() -> Atmosphere:
+    """Standard day atmosphere."""
+    return get_atmosphere()
+
+
+class TestIsaConditions:
+    """Test the analytic reference model."""
+
+    def test_sea_level(self) -> None:
+        """Test the standard sea level values."""
+        conditions = isa_conditions(0.0)
+
+        assert conditions.temperature_k == pytest.approx(288.15)
+        assert conditions.pressure_pa == pytest.approx(101325.0)
+        assert conditions.density == pytest.approx(1.225, abs=1e-4)
+        assert conditions.speed_of_sound == pytest.approx(340.29, abs=0.01)
+
+    def test_published_values(self) -> None:
+        """Test against published ISA table values (geopotential altitude)."""
+        assert isa_conditions(3000.0).density == pytest.approx(0.9091, abs=1e-4)
+        assert isa_conditions(11000.0).pressure_pa == pytest.approx(22632.0, rel=1e-4)
+        assert isa_conditions(15000.0).temperature_k == pytest.approx(216.65)
+        assert isa_conditions(15000.0).density == pytest.approx(0.1937, abs=1e-4)
+
+    def test_temperature_offset(self) -> None:
+        """Test that a hot day keeps pressure and lowers density."""
+        standard = isa_conditions(1000.0)
+        hot = isa_conditions(1000.0, temperature_offset_c=20.0)
+
+        assert hot.temperature_k == pytest.approx(standard.temperature_k + 20.0)
+        assert hot.pressure_pa == pytest.approx(standard.pressure_pa)
+        assert hot.density < standard.density
+
+
+class TestAtmosphere:
+    """Test suite for the tabulated Atmosphere."""
+
+    @pytest.mark.parametrize("altitude", [-300.0, 0.0, 152.4, 1234.56, 10999.5, 11000.0, 17500.3])
+    def test_matches_analytic_model(self, atmosphere: Atmosphere, altitude: float) -> None:
+        """Test that interpolated values agree with the analytic model."""
+        expected = isa_conditions(altitude)
+        conditions = atmosphere.conditions(altitude)
+
+        assert conditions.temperature_k == pytest.approx(expected.temperature_k, rel=1e-9)
+        assert conditions.pressure_pa == pytest.approx(expected.pressure_pa, rel=1e-7)
+        assert conditions.density == pytest.approx(expected.density, rel=1e-7)
+        assert conditions.speed_of_sound == pytest.approx(expected.speed_of_sound, rel=1e-7)
+
+    def test_weather_state(self) -> None:
+        """Test temperature offset and sea level pressure."""
+        atmosphere = Atmosphere(temperature_offset_c=-10.0, sea_level_pressure_pa=102000.0)
+        expected = isa_conditions(2500.0, -10.0, 102000.0)
+
+        assert atmosphere.density(2500.0) == pytest.approx(expected.density, rel=1e-7)
+        assert atmosphere.pressure(0.0) == pytest.approx(102000.0)
+
+    def test_clamped_outside_table(self, atmosphere: Atmosphere) -> None:
+        """Test that altitudes beyond the table use the edge values."""
+        assert atmosphere.density(-2000.0) == atmosphere.density(-500.0)
+        assert atmosphere.density(40000.0) == atmosphere.density(20000.0)
+
+    def test_density_ratio(self, atmosphere: Atmosphere) -> None:
+        """Test density relative to sea level."""
+        assert atmosphere.density_ratio(0.0) == pytest.approx(1.0, abs=1e-6)
+        assert atmosphere.density_ratio(3000.0) == pytest.approx(0.9091 / SEA_LEVEL_DENSITY, 1e-3)
+
+    def test_array_lookup_matches_scalar(self, atmosphere: Atmosphere) -> None:
+        """Test that the vectorized lookups agree with the scalar ones."""
+        rng = np.random.default_rng(7)
+        altitudes = rng.uniform(-1000.0, 25000.0, 300)
+
+        table = atmosphere.lookup_array(altitudes)
+        density = atmosphere.density_array(altitudes)
+
+        assert table.shape == (300, 4)
+        for column, lookup in (
+            (TEMPERATURE, atmosphere.temperature),
+            (PRESSURE, atmosphere.pressure),
+            (DENSITY, atmosphere.density),
+            (SPEED_OF_SOUND, atmosphere.speed_of_sound),
+        ):
+            assert table[:, column] == pytest.approx([lookup(h) for h in altitudes])
+        assert density == pytest.approx(table[:, DENSITY])
+        assert atmosphere.density_array(1000.0).shape == (1,)
+
+    def test_density_altitude(self) -> None:
+        """Test density altitude on standard and hot days."""
+        assert get_atmosphere().density_altitude(1500.0) == pytest.approx(1500.0, abs=0.5)
+        assert get_atmosphere(20.0).density_altitude(1500.0) > 2100.0
+        assert standard_altitude_for_density(isa_conditions(14000.0).density) == pytest.approx(
+            14000.0, abs=0.5
+        )
+
+    def test_cached_per_weather_state(self) -> None:
+        """Test that consumers share tables for the same weather."""
+        assert get_atmosphere() is get_atmosphere(0.0, 101325.0)
+        assert get_atmosphere(15.0) is get_atmosphere(15.0)
+        assert get_atmosphere(15.0) is not get_atmosphere()
+
+    def test_invalid_weather(self) -> None:
+        """Test that impossible weather states are rejected."""
+        with pytest.raises(ValueError):
+            Atmosphere(sea_level_pressure_pa=0.0)
+        with pytest.raises(ValueError):
+            Atmosphere(temperature_offset_c=-300.0)
@@ -4,7 +4,7 @@ import math
 
 import pytest
 
-from airborne.physics.ground_physics import GroundContact, GroundPhysics
+from airborne.physics.ground_physics import GroundContact, GroundForces, GroundPhysics
 from airborne.physics.vectors import Vector3
 
 
@@ -35,6 +35,20 @@ class TestGroundPhysicsBasics:
         # Friction should oppose motion (point south)
         assert forces.friction_force.z < 0
 
+    def test_out_forces_are_reused(self, ground: GroundPhysics) -> None:
+        """Test that forces passed as out are cleared and filled in place."""
+        moving = GroundContact(on_ground=True, gear_compression=1.0, ground_speed_mps=10.0)
+        out = GroundForces()
+
+        forces = ground.calculate_ground_forces(moving, brake_input=1.0, out=out)
+        expected = ground.calculate_ground_forces(moving, brake_input=1.0)
+        assert forces is out
+        assert out.total_force == expected.total_force
+
+        ground.calculate_ground_forces(GroundContact(on_ground=False), out=out)
+        assert out.total_force.magnitude() == 0.0
+        assert out.brake_force.magnitude() == 0.0
+
     def test_brake_force_opposes_motion(self, ground: GroundPhysics) -> None:
         """Test that braking force opposes motion."""
         contact = GroundContact(
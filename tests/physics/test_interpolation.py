@@ -0,0 +1,69 @@
+"""Tests for the shared grid lookups."""
+
+import numpy as np
+import pytest
+
+from airborne.physics.interpolation import UniformAxis, lerp, locate, locate_array, mirror
+
+
+class TestUniformAxis:
+    """Test suite for UniformAxis."""
+
+    def test_locate(self) -> None:
+        """Test interior and clamped queries."""
+        axis = UniformAxis(first=-1.0, step=0.5, points=5)
+
+        assert axis.locate(0.25) == (2, pytest.approx(0.5))
+        assert axis.locate(-5.0) == (0, 0.0)
+        assert axis.locate(5.0) == (3, 1.0)
+
+    def test_locate_array_matches_scalar(self) -> None:
+        """Test that the vectorized lookup agrees with locate()."""
+        axis = UniformAxis(first=0.0, step=2.0, points=11)
+        values = np.array([-3.0, 0.0, 1.0, 7.5, 19.9, 20.0, 30.0])
+
+        index, fraction = axis.locate_array(values)
+
+        for value, i, t in zip(values, index, fraction, strict=True):
+            expected_i, expected_t = axis.locate(float(value))
+            assert i == expected_i
+            assert t == pytest.approx(expected_t)
+
+    def test_invalid(self) -> None:
+        """Test that degenerate axes are rejected."""
+        with pytest.raises(ValueError):
+            UniformAxis(first=0.0, step=1.0, points=1)
+        with pytest.raises(ValueError):
+            UniformAxis(first=0.0, step=0.0, points=3)
+
+
+class TestLocate:
+    """Test suite for lookups on irregular grids."""
+
+    def test_locate(self) -> None:
+        """Test interior, clamped and single-point grids."""
+        grid = [-10.0, 0.0, 4.0]
+
+        assert locate(grid, 2.0) == (1, 2, pytest.approx(0.5))
+        assert locate(grid, -20.0) == (0, 0, 0.0)
+        assert locate(grid, 9.0) == (2, 2, 0.0)
+        assert locate([1.0], 5.0) == (0, 0, 0.0)
+
+    def test_locate_array(self) -> None:
+        """Test that the vectorized lookup interpolates the same values."""
+        grid = np.array([-10.0, 0.0, 4.0])
+        values = np.array([-20.0, -5.0, 2.0, 9.0])
+        samples = np.array([1.0, 3.0, 7.0])
+
+        lower, upper, fraction = locate_array(grid, values)
+
+        result = samples[lower] + (samples[upper] - samples[lower]) * fraction
+        assert result.tolist() == pytest.approx([1.0, 2.0, 5.0, 7.0])
+
+
+def test_mirror_and_lerp() -> None:
+    """Test interpolating a list mirror of a table column."""
+    values = mirror(np.array([[1.0, 2.0], [4.0, 8.0]]))
+
+    assert values == [1.0, 2.0, 4.0, 8.0]
+    assert lerp(values, 2, 0.25) == pytest.approx(5.0)
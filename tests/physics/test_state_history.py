@@ -0,0 +1,149 @@
+"""Tests for the aircraft state ring buffer."""
+
+import numpy as np
+import pytest
+
+from airborne.physics.flight_model.base import AircraftState, ControlInputs
+from airborne.physics.flight_model.simple_6dof import Simple6DOFFlightModel
+from airborne.physics.state_history import MASS, ROW_SIZE, StateHistory
+from airborne.physics.vectors import Vector3
+
+
+def state_at_altitude(altitude: float) -> AircraftState:
+    """State with a recognizable altitude and speed."""
+    return AircraftState(
+        position=Vector3(1.0, altitude, 2.0),
+        velocity=Vector3(0.0, -1.0, altitude / 10.0),
+        rotation=Vector3(0.1, 0.0, 1.5),
+        mass=1100.0,
+        fuel=altitude / 100.0,
+        on_ground=altitude == 0.0,
+    )
+
+
+class TestStateHistory:
+    """Test suite for StateHistory."""
+
+    def test_capacity_from_duration(self) -> None:
+        """Test that the buffer holds duration / step samples."""
+        history = StateHistory(duration_s=2.0, step_s=0.1)
+
+        assert history.capacity == 20
+        assert len(history) == 0
+        assert history.array.shape == (0, ROW_SIZE)
+
+    def test_record_and_read(self) -> None:
+        """Test that recorded states are read back oldest first."""
+        history = StateHistory(duration_s=1.0, step_s=0.1)
+        for i in range(5):
+            history.record(state_at_altitude(100.0 * i), 0.1 * i)
+
+        assert len(history) == 5
+        assert history.times == pytest.approx([0.0, 0.1, 0.2, 0.3, 0.4])
+        assert history.positions[:, 1] == pytest.approx([0.0, 100.0, 200.0, 300.0, 400.0])
+        assert history.array[0, MASS] == 1100.0
+
+    def test_wraps_in_chronological_order(self) -> None:
+        """Test that the oldest samples are overwritten when full."""
+        history = StateHistory(duration_s=1.0, step_s=0.25)
+        for i in range(10):
+            history.record(state_at_altitude(float(i)), 0.25 * i)
+
+        assert len(history) == 4
+        assert history.positions[:, 1] == pytest.approx([6.0, 7.0, 8.0, 9.0])
+        assert history.oldest_time == pytest.approx(1.5)
+        assert history.latest_time == pytest.approx(2.25)
+
+    def test_views_are_zero_copy(self) -> None:
+        """Test that accessors return views of the preallocated buffer."""
+        history = StateHistory(duration_s=1.0, step_s=0.25)
+        for i in range(7):
+            history.record(state_at_altitude(float(i)))
+
+        assert history.array.base is history._buffer
+        assert np.shares_memory(history.positions, history._buffer)
+        assert history.array.flags["C_CONTIGUOUS"]
+        assert history.times == pytest.approx([0.75, 1.0, 1.25, 1.5])
+
+    def test_window(self) -> None:
+        """Test selecting the most recent seconds."""
+        history = StateHistory(duration_s=10.0, step_s=1.0)
+        for i in range(10):
+            history.record(state_at_altitude(float(i)), float(i))
+
+        assert history.window(3.0)[:, 0] == pytest.approx([6.0, 7.0, 8.0, 9.0])
+        assert len(history.window(100.0)) == 10
+
+    def test_state_at(self) -> None:
+        """Test reconstructing the state at or before a time."""
+        history = StateHistory(duration_s=1.0, step_s=0.1)
+        for i in range(5):
+            history.record(state_at_altitude(100.0 * i), 0.1 * i)
+
+        state = history.state_at(0.25)
+
+        assert state.position.y == 200.0
+        assert state.get_airspeed() == pytest.approx(Vector3(0.0, -1.0, 20.0).magnitude())
+        assert state.rotation.z == 1.5
+        assert state.fuel == 2.0
+        assert history.state_at(0.0).on_ground
+
+        out = AircraftState()
+        assert history.state_at(-5.0, out) is out
+        assert out.position.y == 0.0
+
+    def test_truncate(self) -> None:
+        """Test discarding samples after a time across the wrap point."""
+        history = StateHistory(duration_s=1.0, step_s=0.25)
+        for i in range(6):
+            history.record(state_at_altitude(float(i)), 0.25 * i)
+
+        history.truncate(0.8)
+        assert history.positions[:, 1] == pytest.approx([2.0, 3.0])
+
+        history.record(state_at_altitude(42.0), 1.0)
+        assert history.positions[:, 1] == pytest.approx([2.0, 3.0, 42.0])
+
+    def test_restore_rewinds_flight_model(self) -> None:
+        """Test that restore() puts a flight model back on a recorded state."""
+        model = Simple6DOFFlightModel()
+        model.initialize({"wing_area_sqft": 174.0, "weight_lbs": 2400.0, "max_thrust_lbs": 300.0})
+        model.state.position = Vector3(0.0, 1000.0, 0.0)
+        model.state.velocity = Vector3(0.0, 0.0, 50.0)
+        inputs = ControlInputs(throttle=0.8)
+        history = StateHistory(duration_s=5.0, step_s=0.02)
+
+        for i in range(1, 101):
+            model.update(0.02, inputs)
+            history.record(model.get_state(), 0.02 * i)
+        expected = history.state_at(1.0)
+        original = history.positions.copy()
+
+        assert history.restore(model, 1.0) == pytest.approx(1.0)
+        state = model.get_state()
+        assert state.position.z == pytest.approx(expected.position.z)
+        assert state.velocity.y == pytest.approx(expected.velocity.y)
+        assert history.latest_time == pytest.approx(1.0)
+
+        # Flying on from the restored state reproduces the original trajectory
+        model.update(0.02, inputs)
+        assert model.get_state().position.z == pytest.approx(original[50, 2])
+        assert model.get_state().position.y == pytest.approx(original[50, 1])
+
+    def test_empty_history(self) -> None:
+        """Test errors and no-ops on an empty history."""
+        history = StateHistory()
+
+        with pytest.raises(IndexError):
+            history.state_at(0.0)
+        with pytest.raises(IndexError):
+            history.latest_time  # noqa: B018
+        history.truncate(0.0)
+        assert len(history.window(1.0)) == 0
+
+    def test_invalid_size(self) -> None:
+        """Test that non-positive sizes are rejected."""
+        with pytest.raises(ValueError):
+            StateHistory(duration_s=0.0)
+        with pytest.raises(ValueError):
+            StateHistory(step_s=-1.0)
@@ -0,0 +1,174 @@
+"""Tests for AircraftStateSnapshot."""
+
+import numpy as np
+import pytest
+
+from airborne.physics.flight_model.base import AircraftState
+from airborne.physics.state_snapshot import AircraftStateSnapshot
+from airborne.physics.vectors import Vector3
+
+
+@pytest.fixture
+def state() -> AircraftState:
+    """Create an aircraft state with distinct values in every field."""
+    return AircraftState(
+        position=Vector3(1.0, 2.0, 3.0),
+        velocity=Vector3(3.0, 0.0, 4.0),
+        acceleration=Vector3(0.1, 0.2, 0.3),
+        rotation=Vector3(0.05, -0.1, 1.5),
+        angular_velocity=Vector3(0.01, 0.02, 0.03),
+        mass=1100.0,
+        fuel=150.0,
+        on_ground=True,
+    )
+
+
+class TestSnapshotAttributes:
+    """Test attribute and NumPy access."""
+
+    def test_update_from_state(self, state: AircraftState) -> None:
+        """Test that update copies every field into the backing array."""
+        snapshot = AircraftStateSnapshot()
+        snapshot.update_from_state(state, groundspeed=9.7)
+
+        np.testing.assert_array_equal(snapshot.position, [1.0, 2.0, 3.0])
+        np.testing.assert_array_equal(snapshot.velocity, [3.0, 0.0, 4.0])
+        np.testing.assert_array_equal(snapshot.rotation, [0.05, -0.1, 1.5])
+        assert snapshot.airspeed == pytest.approx(5.0)
+        assert snapshot.groundspeed == pytest.approx(9.7)
+        assert snapshot.mass == 1100.0
+        assert snapshot.fuel == 150.0
+        assert snapshot.on_ground is True
+
+    def test_views_share_backing_array(self) -> None:
+        """Test that field views write through to the flat array."""
+        snapshot = AircraftStateSnapshot()
+        snapshot.velocity[:] = (7.0, 8.0, 9.0)
+
+        assert snapshot.array[3:6].tolist() == [7.0, 8.0, 9.0]
+        assert np.shares_memory(snapshot.velocity, snapshot.array)
+
+    def test_default_orientation(self) -> None:
+        """Test forward/up default to +Z and +Y."""
+        snapshot = AircraftStateSnapshot()
+        assert snapshot.forward.tolist() == [0.0, 0.0, 1.0]
+        assert snapshot.up.tolist() == [0.0, 1.0, 0.0]
+
+    @pytest.mark.parametrize(
+        ("rotation", "forward", "up"),
+        [
+            ((0.0, 0.0, np.pi / 2), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0)),
+            ((np.pi / 2, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, -1.0)),
+            ((0.0, np.pi / 2, 0.0), (0.0, 0.0, 1.0), (1.0, 0.0, 0.0)),
+            ((0.0, np.pi / 2, np.pi / 2), (1.0, 0.0, 0.0), (0.0, 0.0, -1.0)),
+        ],
+    )
+    def test_orientation_from_rotation(
+        self,
+        state: AircraftState,
+        rotation: tuple[float, float, float],
+        forward: tuple[float, float, float],
+        up: tuple[float, float, float],
+    ) -> None:
+        """Test forward/up follow heading, pitch and roll."""
+        state.rotation = Vector3(*rotation)
+        snapshot = AircraftStateSnapshot()
+        snapshot.update_from_state(state, 0.0)
+
+        np.testing.assert_allclose(snapshot.forward, forward, atol=1e-12)
+        np.testing.assert_allclose(snapshot.up, up, atol=1e-12)
+
+    def test_sequence_increments(self, state: AircraftState) -> None:
+        """Test that each update bumps the sequence number."""
+        snapshot = AircraftStateSnapshot()
+        snapshot.update_from_state(state, 0.0)
+        snapshot.update_from_state(state, 0.0)
+        assert snapshot.sequence == 2
+
+    def test_copy_is_independent(self, state: AircraftState) -> None:
+        """Test that a copy does not follow later updates."""
+        snapshot = AircraftStateSnapshot()
+        snapshot.update_from_state(state, 0.0)
+        clone = snapshot.copy()
+
+        state.position = Vector3(100.0, 200.0, 300.0)
+        snapshot.update_from_state(state, 0.0)
+
+        assert clone.position.tolist() == [1.0, 2.0, 3.0]
+        assert clone.sequence == 1
+
+
+class TestSnapshotMappingAdapter:
+    """Test dict-style compatibility with the legacy payload."""
+
+    def test_legacy_keys(self, state: AircraftState) -> None:
+        """Test that the payload exposes the old POSITION_UPDATED layout."""
+        snapshot = AircraftStateSnapshot()
+        snapshot.update_from_state(state, groundspeed=9.7)
+
+        assert snapshot["position"] == {"x": 1.0, "y": 2.0, "z": 3.0}
+        assert snapshot["rotation"] == {"pitch": 0.05, "roll": -0.1, "yaw": 1.5}
+        assert snapshot["forward"] == {
+            "x": pytest.approx(np.cos(0.05) * np.sin(1.5)),
+            "y": pytest.approx(np.sin(0.05)),
+            "z": pytest.approx(np.cos(0.05) * np.cos(1.5)),
+        }
+        assert snapshot["airspeed"] == pytest.approx(5.0)
+        assert snapshot["on_ground"] is True
+        assert snapshot.get("position", {}).get("x", 0.0) == 1.0
+        assert "velocity" in snapshot
+        assert "heading" not in snapshot
+        assert snapshot.get("heading") is None
+
+    def test_missing_key_raises(self) -> None:
+        """Test that unknown keys raise KeyError like a dict."""
+        with pytest.raises(KeyError):
+            AircraftStateSnapshot()["altitude_ft"]
+
+    def test_nested_dicts_built_once_per_update(self, state: AircraftState) -> None:
+        """Test that repeated dict-style reads reuse the same nested dict."""
+        snapshot = AircraftStateSnapshot()
+        snapshot.update_from_state(state, 0.0)
+
+        first = snapshot["position"]
+        assert snapshot["position"] is first
+
+        state.position = Vector3(5.0, 6.0, 7.0)
+        snapshot.update_from_state(state, 0.0)
+
+        assert snapshot["position"] == {"x": 5.0, "y": 6.0, "z": 7.0}
+        # Dicts handed out before the update keep their values
+        assert first == {"x": 1.0, "y": 2.0, "z": 3.0}
+
+    def test_to_dict_matches_mapping(self, state: AircraftState) -> None:
+        """Test that to_dict() produces the full legacy payload."""
+        snapshot = AircraftStateSnapshot()
+        snapshot.update_from_state(state, 0.0)
+
+        payload = snapshot.to_dict()
+        assert list(payload) == list(snapshot)
+        assert len(payload) == len(snapshot) == 12
+        assert payload == dict(snapshot.items())
+
+    def test_interpolate(self) -> None:
+        """Test blending two snapshots for rendering between physics steps."""
+        previous = AircraftStateSnapshot()
+        current = AircraftStateSnapshot()
+        previous.position[:] = (0.0, 100.0, 0.0)
+        current.position[:] = (10.0, 200.0, 0.0)
+        # Yaw crosses the +/-pi boundary: must blend the short way around
+        previous.rotation[2] = np.pi - 0.1
+        current.rotation[2] = -np.pi + 0.1
+        current.array[25] = 1.0
+        current.sequence = 7
+
+        blended = AircraftStateSnapshot()
+        blended.interpolate(previous, current, 0.25)
+
+        np.testing.assert_allclose(blended.position, [2.5, 125.0, 0.0])
+        assert blended.rotation[2] == pytest.approx(np.pi - 0.05)
+        np.testing.assert_allclose(
+            blended.forward, [np.sin(np.pi - 0.05), 0.0, np.cos(np.pi - 0.05)], atol=1e-12
+        )
+        assert blended.on_ground is True
+        assert blended.sequence == 7
@@ -263,6 +263,51 @@ class TestVector3Conversion:
         assert "3.0" in s
 
 
+class TestVector3InPlace:
+    """Test Vector3 in-place operations."""
+
+    def test_in_place_ops_return_self(self) -> None:
+        """Test that in-place operations modify and return the vector."""
+        v = Vector3(1.0, 2.0, 3.0)
+
+        assert v.iadd(Vector3(1.0, 1.0, 1.0)) is v
+        assert v == Vector3(2.0, 3.0, 4.0)
+        assert v.isub(Vector3(2.0, 2.0, 2.0)).iscale(2.0) is v
+        assert v == Vector3(0.0, 2.0, 4.0)
+        assert v.idiv(2.0) == Vector3(0.0, 1.0, 2.0)
+        assert v.set(3.0, 0.0, 4.0).inormalize() == Vector3(0.6, 0.0, 0.8)
+
+    def test_imul_add_matches_operators(self) -> None:
+        """Test that imul_add gives the same result as p + v * dt."""
+        position = Vector3(100.0, 500.0, 200.0)
+        velocity = Vector3(50.0, -1.5, 10.0)
+        expected = position + velocity * 0.016
+
+        position.imul_add(velocity, 0.016)
+
+        assert position == expected
+
+    def test_copy_from(self) -> None:
+        """Test that copy_from copies components, not the object."""
+        source = Vector3(1.0, 2.0, 3.0)
+        target = Vector3.zero().copy_from(source)
+        source.x = 9.0
+
+        assert target == Vector3(1.0, 2.0, 3.0)
+
+    def test_slots(self) -> None:
+        """Test that vectors have no per-instance dict."""
+        with pytest.raises(AttributeError):
+            Vector3.zero().w = 1.0  # type: ignore[attr-defined]
+
+    def test_in_place_errors(self) -> None:
+        """Test that in-place division and normalization reject zero."""
+        with pytest.raises(ZeroDivisionError):
+            Vector3.one().idiv(0.0)
+        with pytest.raises(ValueError):
+            Vector3.zero().inormalize()
+
+
 class TestVector3EdgeCases:
     """Test Vector3 edge cases and error handling."""
 
@@ -11,6 +11,7 @@ sys.modules["pybass3"] = Mock()
 from airborne.core.event_bus import EventBus  # noqa: E402
 from airborne.core.messaging import Message, MessageTopic  # noqa: E402
 from airborne.core.plugin import PluginContext, PluginType  # noqa: E402
+from airborne.physics.state_snapshot import AircraftStateSnapshot  # noqa: E402
 from airborne.plugins.audio.audio_plugin import AudioPlugin  # noqa: E402
 
 
@@ -163,6 +164,30 @@ class TestAudioPluginPositionHandling:
         assert plugin._listener_position.x == 100.0
         assert plugin._listener_forward.z == 1.0
 
+    def test_handle_position_update_snapshot(self, plugin: AudioPlugin) -> None:
+        """Test that a state snapshot updates the listener vectors in place."""
+        snapshot = AircraftStateSnapshot()
+        snapshot.position[:] = (100.0, 50.0, 200.0)
+        snapshot.velocity[:] = (10.0, 0.0, 20.0)
+        snapshot.forward[:] = (1.0, 0.0, 0.0)
+        position = plugin._listener_position
+        forward = plugin._listener_forward
+
+        plugin.handle_message(
+            Message(
+                sender="physics",
+                recipients=["*"],
+                topic=MessageTopic.POSITION_UPDATED,
+                data=snapshot,
+            )
+        )
+
+        assert plugin._listener_position is position
+        assert plugin._listener_forward is forward
+        assert (position.x, position.y, position.z) == (100.0, 50.0, 200.0)
+        assert forward.x == 1.0
+        assert plugin._listener_velocity.z == 20.0
+
 
 class TestAudioPluginShutdown:
     """Test audio plugin shutdown."""
@@ -206,3 +206,95 @@ def test_tcas_get_targets(tcas_plugin):
     targets = tcas_plugin.get_targets()
     assert isinstance(targets, dict)
     assert len(targets) == 0  # Initially empty
+
+
+def test_tcas_reads_own_state_from_blackboard():
+    """Test TCAS pulls own-ship state from the blackboard only when it changes."""
+    from airborne.core.blackboard import StateBlackboard
+
+    blackboard = StateBlackboard()
+    plugin = TCASPlugin()
+    plugin.initialize(
+        PluginContext(
+            event_bus=EventBus(),
+            message_queue=MessageQueue(),
+            config={},
+            plugin_registry=ComponentRegistry(),
+            blackboard=blackboard,
+        )
+    )
+    plugin._powered = True
+
+    blackboard.write_many(position=(100.0, 1000.0, 200.0), velocity=(0.0, 2.54, 50.0))
+    plugin.update(0.1)
+
+    assert plugin._own_position == Vector3(100.0, 1000.0, 200.0)
+    assert plugin._own_altitude_ft == pytest.approx(3280.84)
+    assert plugin._own_vertical_speed_fpm == pytest.approx(500.0, rel=1e-3)
+    assert plugin._own_state_version == blackboard.version
+
+    # Unrelated writes do not trigger a re-read
+    plugin._own_position = Vector3(0, 0, 0)
+    blackboard.write("engine_rpm", 2400.0)
+    plugin.update(0.1)
+    assert plugin._own_position == Vector3(0, 0, 0)
+
+
+def test_tcas_ignores_position_messages_with_blackboard():
+    """Test that position messages do not overwrite blackboard own-ship state."""
+    from airborne.core.blackboard import StateBlackboard
+
+    blackboard = StateBlackboard()
+    message_queue = MessageQueue()
+    plugin = TCASPlugin()
+    plugin.initialize(
+        PluginContext(
+            event_bus=EventBus(),
+            message_queue=message_queue,
+            config={},
+            plugin_registry=ComponentRegistry(),
+            blackboard=blackboard,
+        )
+    )
+    plugin._powered = True
+    blackboard.write_many(position=(100.0, 1000.0, 200.0), velocity=(0.0, 0.0, 50.0))
+    plugin.update(0.1)
+
+    message_queue.publish(
+        Message(
+            sender="physics",
+            recipients=["*"],
+            topic=MessageTopic.POSITION_UPDATED,
+            data={"position": {"x": 0.0, "y": 0.0, "z": 0.0}},
+        )
+    )
+    message_queue.process()
+    plugin.update(0.1)
+
+    assert plugin._own_position == Vector3(100.0, 1000.0, 200.0)
+    assert plugin._own_altitude_ft == pytest.approx(3280.84)
+
+
+def test_tcas_position_update_from_snapshot(tcas_plugin):
+    """Test that the physics snapshot payload gives a Vector3 own position."""
+    from airborne.physics.flight_model.base import AircraftState
+    from airborne.physics.state_snapshot import AircraftStateSnapshot
+
+    snapshot = AircraftStateSnapshot()
+    snapshot.update_from_state(
+        AircraftState(position=Vector3(10.0, 500.0, 20.0), velocity=Vector3(0.0, 1.0, 50.0)),
+        groundspeed=97.0,
+    )
+
+    tcas_plugin.handle_message(
+        Message(
+            sender="physics",
+            recipients=["*"],
+            topic=MessageTopic.POSITION_UPDATED,
+            data=snapshot,
+        )
+    )
+
+    assert tcas_plugin._own_position == Vector3(10.0, 500.0, 20.0)
+    assert tcas_plugin._own_altitude_ft == pytest.approx(1640.42)
+    assert tcas_plugin._own_vertical_speed_fpm == pytest.approx(196.85)
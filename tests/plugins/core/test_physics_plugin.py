@@ -1,5 +1,6 @@
 """Tests for physics plugin."""
 
+import math
 from unittest.mock import Mock
 
 import pytest
@@ -87,6 +88,16 @@ class TestPhysicsPluginInitialization:
         # Should subscribe to four topics (control inputs, terrain, parking_brake, engine_state)
         assert context.message_queue.subscribe.call_count == 4
 
+    def test_history_sized_for_physics_rate(self, context: PluginContext) -> None:
+        """Test that the state history covers history_seconds at physics_hz."""
+        context.config["physics"]["physics_hz"] = 200.0
+        context.config["physics"]["history_seconds"] = 10.0
+        plugin = PhysicsPlugin()
+        plugin.initialize(context)
+
+        assert plugin.state_history.step_s == pytest.approx(1.0 / 200.0)
+        assert plugin.state_history.capacity == 2000
+
 
 class TestPhysicsPluginControlInput:
     """Test physics plugin control input handling."""
@@ -360,3 +371,178 @@ class TestPhysicsPluginShutdown:
 
         # Should unregister three components (flight_model, collision_detector, ground_physics)
         assert plugin.context.plugin_registry.unregister.call_count == 3
+
+
+class TestPhysicsPluginStateSnapshot:
+    """Test the reusable POSITION_UPDATED payload."""
+
+    @pytest.fixture
+    def plugin(self) -> PhysicsPlugin:
+        """Create initialized physics plugin with a mock queue."""
+        queue = Mock()
+        context = PluginContext(
+            event_bus=EventBus(),
+            message_queue=queue,
+            config={
+                "physics": {
+                    "flight_model": {
+                        "type": "simple_6dof",
+                        "wing_area_sqft": 174.0,
+                        "weight_lbs": 2400.0,
+                        "max_thrust_lbs": 180.0,
+                    }
+                }
+            },
+            plugin_registry=Mock(),
+        )
+        plugin = PhysicsPlugin()
+        plugin.initialize(context)
+        return plugin
+
+    def _published_positions(self, plugin: PhysicsPlugin) -> list[Message]:
+        calls = plugin.context.message_queue.publish.call_args_list
+        return [c[0][0] for c in calls if c[0][0].topic == MessageTopic.POSITION_UPDATED]
+
+    def test_payload_is_reused_snapshot(self, plugin: PhysicsPlugin) -> None:
+        """Test that every tick publishes the same snapshot instance."""
+        from airborne.physics.state_snapshot import AircraftStateSnapshot
+
+        plugin.update(0.016)
+        plugin.update(0.016)
+
+        messages = self._published_positions(plugin)
+        assert len(messages) == 2
+        assert isinstance(messages[0].data, AircraftStateSnapshot)
+        assert messages[0].data is messages[1].data
+        assert messages[1].data.sequence == 2
+
+    def test_payload_matches_flight_model(self, plugin: PhysicsPlugin) -> None:
+        """Test that the snapshot mirrors the flight model state."""
+        plugin.update(0.016)
+        state = plugin.flight_model.get_state()
+        data = self._published_positions(plugin)[-1].data
+
+        assert data["position"]["y"] == pytest.approx(state.position.y)
+        assert data["airspeed"] == pytest.approx(state.get_airspeed())
+        assert data["on_ground"] == state.on_ground
+
+    def test_update_writes_blackboard(self, plugin: PhysicsPlugin) -> None:
+        """Test that physics publishes continuous state to the blackboard."""
+        from airborne.core.blackboard import StateBlackboard
+
+        blackboard = StateBlackboard()
+        plugin.context.blackboard = blackboard
+        plugin.update(0.016)
+
+        state = plugin.flight_model.get_state()
+        assert blackboard.read("position")[1] == pytest.approx(state.position.y)
+        assert blackboard.read("mass_kg") == pytest.approx(state.mass)
+        assert blackboard.get_version("mass_kg") > 0
+
+    def test_update_records_history(self, plugin: PhysicsPlugin) -> None:
+        """Test that every update is recorded in the state history."""
+        for _ in range(3):
+            plugin.update(0.016)
+
+        history = plugin.state_history
+        assert len(history) == 3
+        assert history.latest_time == pytest.approx(0.048)
+        assert history.positions[-1, 1] == pytest.approx(plugin.flight_model.get_state().position.y)
+
+    def test_rewind(self, plugin: PhysicsPlugin) -> None:
+        """Test rewinding the flight model to a recorded state."""
+        plugin.flight_model.get_state().position.y = 500.0
+        for _ in range(60):
+            plugin.update(1.0 / 60.0)
+        altitude_half_second = plugin.state_history.positions[29, 1]
+
+        rewound = plugin.rewind(0.5)
+
+        assert rewound == pytest.approx(0.5)
+        assert plugin.flight_model.get_state().position.y == pytest.approx(altitude_half_second)
+        assert len(plugin.state_history) == 30
+        assert plugin.rewind_count == 1
+        assert plugin.state_snapshot.position[1] == pytest.approx(altitude_half_second)
+
+
+class TestPhysicsPluginSpawn:
+    """Test placing the aircraft at a spawn point."""
+
+    @pytest.fixture
+    def plugin(self) -> PhysicsPlugin:
+        """Create initialized physics plugin with a mock queue."""
+        context = PluginContext(
+            event_bus=EventBus(),
+            message_queue=Mock(),
+            config={
+                "physics": {
+                    "flight_model": {
+                        "type": "simple_6dof",
+                        "wing_area_sqft": 174.0,
+                        "weight_lbs": 2400.0,
+                        "max_thrust_lbs": 400.0,
+                        "drag_coefficient": 0.03,
+                    }
+                }
+            },
+            plugin_registry=Mock(),
+        )
+        plugin = PhysicsPlugin()
+        plugin.initialize(context)
+        return plugin
+
+    def test_ground_spawn(self, plugin: PhysicsPlugin) -> None:
+        """Test that a ground spawn sets the position and heading only."""
+        from airborne.physics.vectors import Vector3
+        from airborne.scenario import SpawnState
+
+        spawn = SpawnState(position=Vector3(-122.1, 2.0, 37.46), heading=270.0)
+
+        assert plugin.apply_spawn(spawn) is None
+
+        state = plugin.flight_model.get_state()
+        assert state.position.x == pytest.approx(-122.1)
+        assert state.position.z == pytest.approx(37.46)
+        assert state.position.y == 0.0
+        assert state.get_heading() == pytest.approx(-math.pi / 2)
+        assert plugin.control_inputs.throttle == 0.0
+
+    def test_airborne_spawn_is_trimmed(self, plugin: PhysicsPlugin) -> None:
+        """Test that an airborne spawn holds its altitude and airspeed."""
+        from airborne.physics.vectors import Vector3
+        from airborne.scenario import SpawnState
+
+        spawn = SpawnState(
+            position=Vector3(-122.1, 900.0, 37.46),
+            heading=90.0,
+            airspeed=50.0,
+            engine_running=True,
+            on_ground=False,
+            parking_brake=False,
+        )
+
+        trim = plugin.apply_spawn(spawn)
+
+        assert trim is not None and trim.converged
+        assert plugin.control_inputs.throttle == trim.throttle
+        for _ in range(5 * 120):
+            plugin.update(1.0 / 120.0)
+        state = plugin.flight_model.get_state()
+        assert state.position.y == pytest.approx(900.0, abs=1.0)
+        assert state.get_airspeed() == pytest.approx(50.0, abs=0.1)
+        assert state.position.z == pytest.approx(37.46)
+        assert not state.on_ground
+
+    def test_untrimmable_spawn_raises(self, plugin: PhysicsPlugin) -> None:
+        """Test that a spawn beyond the aircraft's performance is rejected."""
+        from airborne.physics.flight_model.trim import TrimError
+        from airborne.physics.vectors import Vector3
+        from airborne.scenario import SpawnState
+
+        spawn = SpawnState(
+            position=Vector3(0.0, 900.0, 0.0), heading=0.0, airspeed=120.0, on_ground=False
+        )
+
+        with pytest.raises(TrimError, match="120.0 m/s"):
+            plugin.apply_spawn(spawn)
+        assert plugin.flight_model.get_state().position.y == 0.0
@@ -60,8 +60,8 @@ class TestSimplePistonEngineInitialization:
         engine.initialize(context)
 
         assert engine.context == context
-        # Should subscribe to eight message topics (4 system + 4 control panel)
-        assert context.message_queue.subscribe.call_count == 8
+        # Should subscribe to nine message topics (5 system + 4 control panel)
+        assert context.message_queue.subscribe.call_count == 9
 
         # Verify each expected subscribe call
         subscribe_calls = context.message_queue.subscribe.call_args_list
@@ -70,6 +70,7 @@ class TestSimplePistonEngineInitialization:
         assert MessageTopic.ENGINE_STATE in topics_subscribed
         assert MessageTopic.ELECTRICAL_STATE in topics_subscribed
         assert MessageTopic.FUEL_STATE in topics_subscribed
+        assert MessageTopic.POSITION_UPDATED in topics_subscribed
         assert "engine.magnetos" in topics_subscribed
         assert "engine.starter" in topics_subscribed
         assert "engine.mixture" in topics_subscribed
@@ -165,6 +166,26 @@ class TestSimplePistonEngineControls:
         engine.handle_message(message)
         assert engine.throttle == 0.5
 
+    def test_position_sets_ambient_air(self, engine: SimplePistonEngine) -> None:
+        """Test that altitude lowers ambient pressure and available power."""
+        engine.running = True
+        engine.rpm = 2700.0
+        engine.throttle = 1.0
+        sea_level_power = engine._calculate_power()
+
+        message = Message(
+            sender="physics_plugin",
+            recipients=["*"],
+            topic=MessageTopic.POSITION_UPDATED,
+            data={"position": {"x": 0.0, "y": 2438.4, "z": 0.0}},
+        )
+        engine.handle_message(message)
+        engine._update_pressures()
+
+        # 8000 ft: about 22.2 inHg and three quarters of sea level power
+        assert engine.manifold_pressure == pytest.approx(22.2, abs=0.1)
+        assert engine._calculate_power() == pytest.approx(0.75 * sea_level_power, abs=2.0)
+
 
 class TestSimplePistonEngineStartup:
     """Test engine startup behavior."""
@@ -489,8 +510,8 @@ class TestSimplePistonEngineShutdown:
         """Test shutdown cleans up subscriptions."""
         running_engine.shutdown()
 
-        # Should unsubscribe from all eight message topics (4 system + 4 control panel)
-        assert running_engine.context.message_queue.unsubscribe.call_count == 8
+        # Should unsubscribe from all nine message topics (5 system + 4 control panel)
+        assert running_engine.context.message_queue.unsubscribe.call_count == 9
 
         # Verify each expected unsubscribe call
         unsubscribe_calls = running_engine.context.message_queue.unsubscribe.call_args_list
@@ -499,6 +520,7 @@ class TestSimplePistonEngineShutdown:
         assert MessageTopic.ENGINE_STATE in topics_unsubscribed
         assert MessageTopic.ELECTRICAL_STATE in topics_unsubscribed
         assert MessageTopic.FUEL_STATE in topics_unsubscribed
+        assert MessageTopic.POSITION_UPDATED in topics_unsubscribed
         assert "engine.magnetos" in topics_unsubscribed
         assert "engine.starter" in topics_unsubscribed
         assert "engine.mixture" in topics_unsubscribed
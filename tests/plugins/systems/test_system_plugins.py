@@ -2,6 +2,8 @@
 
 from unittest.mock import Mock
 
+import pytest
+
 from airborne.core.event_bus import EventBus
 from airborne.core.messaging import Message, MessagePriority, MessageQueue, MessageTopic
 from airborne.core.plugin import PluginContext
@@ -576,6 +578,31 @@ class TestEnginePlugin:
         queue.process()
         assert plugin.fuel_available_gph == 0.0
 
+    def test_position_sets_density_ratio(self):
+        """Test plugin passes the air density at the aircraft altitude to the engine."""
+        plugin = EnginePlugin()
+        queue = MessageQueue()
+        context = create_test_context(
+            queue=queue,
+            config={"engine": {"implementation": "piston_simple"}},
+        )
+
+        plugin.initialize(context)
+        assert plugin.engine.density_ratio == 1.0
+
+        queue.publish(
+            Message(
+                sender="physics_plugin",
+                recipients=["*"],
+                topic=MessageTopic.POSITION_UPDATED,
+                data={"position": {"x": 0.0, "y": 2000.0, "z": 0.0}},
+                priority=MessagePriority.NORMAL,
+            )
+        )
+
+        queue.process()
+        assert plugin.engine.density_ratio == pytest.approx(0.8217, abs=1e-3)
+
     def test_publishes_engine_state(self):
         """Test plugin publishes engine state."""
         plugin = EnginePlugin()
@@ -0,0 +1,86 @@
+"""Tests for scenario run end conditions and statistics."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from airborne.scenario import ScenarioEndCondition, ScenarioRunStats
+
+
+def _state(altitude_m: float, airspeed_mps: float, on_ground: bool) -> SimpleNamespace:
+    return SimpleNamespace(
+        position=(0.0, altitude_m, 0.0), airspeed=airspeed_mps, on_ground=on_ground
+    )
+
+
+class TestScenarioRunStats:
+    """Test ScenarioRunStats."""
+
+    def test_advance_counts_frames_and_time(self):
+        """Test frames and simulated time accumulate."""
+        stats = ScenarioRunStats()
+        for _ in range(60):
+            stats.advance(1 / 60)
+
+        assert stats.frames == 60
+        assert stats.sim_time_s == pytest.approx(1.0)
+
+    def test_record_converts_units_and_tracks_max(self):
+        """Test altitude/airspeed are converted and maxima kept."""
+        stats = ScenarioRunStats()
+        stats.record(_state(1000.0, 50.0, on_ground=False))
+        stats.record(_state(500.0, 40.0, on_ground=False))
+
+        assert stats.altitude_ft == pytest.approx(1640.42)
+        assert stats.max_altitude_ft == pytest.approx(3280.84)
+        assert stats.max_airspeed_kts == pytest.approx(97.192)
+
+    def test_landed_only_after_airborne(self):
+        """Test touching down counts as landing only after leaving the ground."""
+        stats = ScenarioRunStats()
+        stats.record(_state(0.0, 10.0, on_ground=True))
+        assert not stats.landed
+
+        stats.record(_state(100.0, 50.0, on_ground=False))
+        stats.record(_state(0.0, 30.0, on_ground=True))
+        assert stats.airborne
+        assert stats.landed
+
+    def test_time_scale(self):
+        """Test achieved time scale and dictionary output."""
+        stats = ScenarioRunStats(sim_time_s=60.0, wall_time_s=2.0)
+
+        assert stats.time_scale == pytest.approx(30.0)
+        assert stats.to_dict()["time_scale"] == pytest.approx(30.0)
+        assert ScenarioRunStats().time_scale == 0.0
+
+
+class TestScenarioEndCondition:
+    """Test ScenarioEndCondition."""
+
+    def test_time_limit(self):
+        """Test run ends at the simulated time limit."""
+        condition = ScenarioEndCondition(max_sim_time_s=10.0)
+
+        assert condition.check(ScenarioRunStats(sim_time_s=9.9)) is None
+        assert condition.check(ScenarioRunStats(sim_time_s=10.0)) == "time_limit"
+
+    def test_altitude_reached(self):
+        """Test run ends when the target altitude is reached."""
+        condition = ScenarioEndCondition(altitude_ft=3000.0)
+
+        assert condition.check(ScenarioRunStats(altitude_ft=2999.0)) is None
+        assert condition.check(ScenarioRunStats(altitude_ft=3001.0)) == "altitude_reached"
+
+    def test_on_landing(self):
+        """Test run ends on landing only when requested."""
+        stats = ScenarioRunStats(landed=True)
+
+        assert ScenarioEndCondition().check(stats) is None
+        assert ScenarioEndCondition(on_landing=True).check(stats) == "landed"
+
+    def test_no_time_limit(self):
+        """Test a None time limit never ends the run."""
+        condition = ScenarioEndCondition(max_sim_time_s=None)
+
+        assert condition.check(ScenarioRunStats(sim_time_s=1e9)) is None
@@ -3,7 +3,13 @@
 import pytest
 
 from airborne.physics.vectors import Vector3
-from airborne.scenario import EngineState, Scenario, ScenarioBuilder, SpawnLocation
+from airborne.scenario import (
+    EngineState,
+    Scenario,
+    ScenarioBuilder,
+    ScenarioEndCondition,
+    SpawnLocation,
+)
 
 
 class TestSpawnLocation:
@@ -15,6 +21,7 @@ class TestSpawnLocation:
         assert SpawnLocation.RUNWAY.value == "runway"
         assert SpawnLocation.TAXIWAY.value == "taxiway"
         assert SpawnLocation.GATE.value == "gate"
+        assert SpawnLocation.AIRBORNE.value == "airborne"
 
 
 class TestEngineState:
@@ -198,6 +205,36 @@ class TestScenarioBuilder:
 
         assert scenario.callsign == "N12345"
 
+    def test_with_end_condition(self):
+        """Test setting the end condition for unattended runs."""
+        condition = ScenarioEndCondition(altitude_ft=3000.0)
+        scenario = ScenarioBuilder().with_airport("KPAO").with_end_condition(condition).build()
+
+        assert scenario.end_condition is condition
+        assert ScenarioBuilder().with_airport("KPAO").build().end_condition is None
+
+    def test_with_airborne_spawn(self):
+        """Test starting in flight."""
+        scenario = (
+            ScenarioBuilder()
+            .with_airport("KPAO")
+            .with_airborne_spawn(altitude_ft=1500.0, airspeed_kts=90.0, flight_path_deg=-3.0)
+            .build()
+        )
+
+        assert scenario.spawn_location == SpawnLocation.AIRBORNE
+        assert scenario.spawn_altitude_ft == 1500.0
+        assert scenario.spawn_airspeed_kts == 90.0
+        assert scenario.spawn_flight_path_deg == -3.0
+        assert scenario.engine_state == EngineState.RUNNING
+
+    def test_airborne_spawn_without_airspeed_raises(self):
+        """Test that an airborne spawn needs an airspeed."""
+        builder = ScenarioBuilder().with_airport("KPAO").with_airborne_spawn(1500.0, 0.0)
+
+        with pytest.raises(ValueError, match="airspeed"):
+            builder.build()
+
     def test_method_chaining(self):
         """Test fluent API method chaining."""
         scenario = (
@@ -231,6 +231,27 @@ class TestSpawnManager:
         # Should fall back to ramp for now
         assert state.on_ground is True
 
+    def test_spawn_airborne(self, spawn_manager):
+        """Test spawning in flight over the airport."""
+        scenario = Scenario(
+            airport_icao="KPAO",
+            spawn_location=SpawnLocation.AIRBORNE,
+            spawn_heading=310.0,
+            spawn_altitude_ft=1000.0,
+            spawn_airspeed_kts=80.0,
+            spawn_flight_path_deg=-3.0,
+        )
+        state = spawn_manager.spawn_aircraft(scenario)
+
+        assert state.on_ground is False
+        assert state.engine_running is True
+        assert state.parking_brake is False
+        assert state.position.x == -122.115
+        assert state.position.y == pytest.approx(304.8)
+        assert state.heading == 310.0
+        assert state.airspeed == pytest.approx(41.16, abs=0.01)
+        assert state.flight_path_deg == -3.0
+
     def test_spawn_at_airport_without_runways(self, mock_airport_db):
         """Test spawning at airport without runways."""
         # Add airport without runways
@@ -2,6 +2,7 @@
 
 import pytest
 
+from airborne.physics.atmosphere import get_atmosphere
 from airborne.systems.performance import PerformanceCalculator, VSpeedCalculator
 
 
@@ -262,6 +263,26 @@ class TestPerformanceCalculator:
         assert summary["takeoff"].ground_roll_ft > 0
         assert summary["climb_rate_fpm"] > 0
 
+    def test_density_altitude(self, c172_config: dict) -> None:
+        """Test density altitude from the shared atmosphere tables."""
+        standard = PerformanceCalculator(c172_config)
+        hot = PerformanceCalculator(c172_config, atmosphere=get_atmosphere(20.0))
+
+        assert standard.density_altitude_ft(5000.0) == pytest.approx(5000.0, abs=1.0)
+        # Rule of thumb: about 120 ft per °C above standard
+        assert hot.density_altitude_ft(5000.0) == pytest.approx(7400.0, abs=250.0)
+
+    def test_performance_summary_at_altitude(self, c172_config: dict) -> None:
+        """Test that a high field lengthens the takeoff."""
+        calc = PerformanceCalculator(c172_config)
+
+        sea_level = calc.get_performance_summary(2550.0)
+        high = calc.get_performance_summary(2550.0, pressure_altitude_ft=5000.0)
+
+        assert high["density_altitude_ft"] == pytest.approx(5000.0, abs=1.0)
+        assert high["takeoff"].ground_roll_ft > sea_level["takeoff"].ground_roll_ft
+        assert high["climb_rate_fpm"] < sea_level["climb_rate_fpm"]
+
 
 class TestPerformanceEdgeCases:
     """Test edge cases and extreme scenarios."""
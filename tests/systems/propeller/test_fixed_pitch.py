@@ -80,6 +80,14 @@ class TestFixedPitchPropellerStaticThrust:
         assert thrust > 1300
         assert thrust < 2000
 
+    def test_static_thrust_coefficient(self, c172_prop: FixedPitchPropeller) -> None:
+        """Test that static thrust follows T = C_T × ρ × n² × D⁴."""
+        thrust = c172_prop.calculate_thrust(
+            power_hp=180.0, rpm=2700.0, airspeed_mps=0.0, air_density_kgm3=1.225
+        )
+
+        assert thrust == pytest.approx(0.09 * 1.225 * 45.0**2 * 1.905**4)
+
     def test_static_thrust_zero_power(self, c172_prop: FixedPitchPropeller) -> None:
         """Test that zero power gives zero thrust."""
         thrust = c172_prop.calculate_thrust(
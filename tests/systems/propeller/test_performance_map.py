@@ -0,0 +1,143 @@
+"""Tests for the tabulated propeller performance map."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from airborne.systems.propeller.fixed_pitch import FixedPitchPropeller, thrust_from_coefficients
+from airborne.systems.propeller.performance_map import PropellerPerformanceMap
+
+
+@pytest.fixture
+def propeller() -> FixedPitchPropeller:
+    """Cessna 172 propeller."""
+    return FixedPitchPropeller(
+        diameter_m=1.905,
+        pitch_ratio=0.6,
+        efficiency_static=0.72,
+        efficiency_cruise=0.85,
+        cruise_advance_ratio=0.6,
+    )
+
+
+@pytest.fixture
+def prop_map(propeller: FixedPitchPropeller) -> PropellerPerformanceMap:
+    """Default-grid map of the propeller."""
+    return PropellerPerformanceMap.build(propeller)
+
+
+class TestThrustCoefficients:
+    """Test the coefficient form of the analytic model."""
+
+    @pytest.mark.parametrize("airspeed", [0.0, 0.5, 10.0, 30.0, 60.0])
+    def test_coefficients_reproduce_thrust(
+        self, propeller: FixedPitchPropeller, airspeed: float
+    ) -> None:
+        """Test that thrust is exactly recovered from the coefficients."""
+        coefficients = propeller.thrust_coefficients(2500.0, airspeed)
+
+        for power, density in ((180.0, 1.225), (60.0, 0.9)):
+            assert thrust_from_coefficients(power, density, *coefficients) == pytest.approx(
+                propeller.calculate_thrust(power, 2500.0, airspeed, density), rel=1e-12
+            )
+
+
+class TestPropellerPerformanceMap:
+    """Test suite for PropellerPerformanceMap."""
+
+    def test_exact_at_grid_points(
+        self, propeller: FixedPitchPropeller, prop_map: PropellerPerformanceMap
+    ) -> None:
+        """Test that breakpoints reproduce the analytic model at any power and density."""
+        for rpm, airspeed in ((2700.0, 0.0), (2500.0, 30.0), (1000.0, 45.5)):
+            for power, density in ((180.0, 1.225), (75.0, 0.8)):
+                assert prop_map.calculate_thrust(power, rpm, airspeed, density) == pytest.approx(
+                    propeller.calculate_thrust(power, rpm, airspeed, density), rel=1e-9
+                )
+            assert prop_map.get_efficiency(airspeed, rpm) == pytest.approx(
+                propeller.get_efficiency(airspeed, rpm)
+            )
+
+    def test_validation_reports_error(
+        self, propeller: FixedPitchPropeller, prop_map: PropellerPerformanceMap
+    ) -> None:
+        """Test the validation against the analytic model."""
+        validation = prop_map.validate(propeller, powers_hp=(180.0,))
+
+        assert validation.samples == 100 * 200
+        assert validation.max_efficiency_error < 0.05
+        assert validation.max_error_n > 0.0
+        assert validation.worst_case[0] == 180.0
+
+    def test_smooth_regions_are_accurate(
+        self, propeller: FixedPitchPropeller, prop_map: PropellerPerformanceMap
+    ) -> None:
+        """Test interpolation away from the analytic model's breakpoints."""
+        for airspeed in (25.3, 40.1, 55.7):
+            expected = propeller.calculate_thrust(160.0, 2612.0, airspeed, 1.1)
+            assert prop_map.calculate_thrust(160.0, 2612.0, airspeed, 1.1) == pytest.approx(
+                expected, rel=0.01
+            )
+
+    def test_no_power_no_thrust(self, prop_map: PropellerPerformanceMap) -> None:
+        """Test that a stopped engine gives no thrust."""
+        assert prop_map.calculate_thrust(0.0, 2500.0, 30.0, 1.225) == 0.0
+        assert prop_map.calculate_thrust(180.0, 0.0, 30.0, 1.225) == 0.0
+        assert prop_map.get_efficiency(30.0, 0.0) == 0.0
+
+    def test_out_of_range_is_clamped(self, prop_map: PropellerPerformanceMap) -> None:
+        """Test that queries beyond the grid use the edge values."""
+        assert prop_map.calculate_thrust(180.0, 3500.0, 150.0, 1.225) == pytest.approx(
+            prop_map.calculate_thrust(180.0, 3000.0, 100.0, 1.225)
+        )
+
+    def test_array_lookup_matches_scalar(self, prop_map: PropellerPerformanceMap) -> None:
+        """Test that the vectorized lookup agrees with the scalar one."""
+        rng = np.random.default_rng(3)
+        power = rng.uniform(0.0, 180.0, 100)
+        rpm = rng.uniform(400.0, 3100.0, 100)
+        airspeed = rng.uniform(0.0, 90.0, 100)
+        power[0] = 0.0
+
+        thrust = prop_map.calculate_thrust_array(power, rpm, airspeed, 1.1)
+
+        expected = [
+            prop_map.calculate_thrust(p, r, v, 1.1)
+            for p, r, v in zip(power, rpm, airspeed, strict=True)
+        ]
+        assert thrust == pytest.approx(np.array(expected))
+        assert thrust[0] == 0.0
+
+    def test_cache_round_trip(self, propeller: FixedPitchPropeller, tmp_path: Path) -> None:
+        """Test that maps are cached as .npz and reused."""
+        grid = {"rpm_grid": (500.0, 3000.0, 11), "airspeed_grid": (0.0, 80.0, 9)}
+        built = PropellerPerformanceMap.load_or_build(propeller, tmp_path, **grid)
+        files = list(tmp_path.glob("propeller_*.npz"))
+        assert len(files) == 1
+
+        loaded = PropellerPerformanceMap.load_or_build(propeller, tmp_path, **grid)
+        assert np.array_equal(loaded.table, built.table)
+
+        other = FixedPitchPropeller(diameter_m=1.8)
+        PropellerPerformanceMap.load_or_build(other, tmp_path, **grid)
+        assert len(list(tmp_path.glob("propeller_*.npz"))) == 2
+
+    def test_corrupt_cache_is_rebuilt(self, propeller: FixedPitchPropeller, tmp_path: Path) -> None:
+        """Test that an unreadable cached map is replaced."""
+        grid = {"rpm_grid": (500.0, 3000.0, 11), "airspeed_grid": (0.0, 80.0, 9)}
+        PropellerPerformanceMap.load_or_build(propeller, tmp_path, **grid)
+        cache_file = next(tmp_path.glob("propeller_*.npz"))
+        cache_file.write_bytes(b"not a map")
+
+        prop_map = PropellerPerformanceMap.load_or_build(propeller, tmp_path, **grid)
+
+        assert prop_map.table.shape == (11, 9, 4)
+        assert PropellerPerformanceMap.load(cache_file).table.shape == (11, 9, 4)
+
+    def test_invalid_grid(self, propeller: FixedPitchPropeller) -> None:
+        """Test that degenerate grids are rejected."""
+        with pytest.raises(ValueError):
+            PropellerPerformanceMap.build(propeller, rpm_grid=(500.0, 3000.0, 1))
+        with pytest.raises(ValueError):
+            PropellerPerformanceMap(np.arange(3.0), np.arange(2.0), np.zeros((2, 2, 4)))
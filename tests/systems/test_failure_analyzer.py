@@ -2,6 +2,9 @@
 
 from datetime import datetime, timedelta
 
+from airborne.physics.flight_model.base import AircraftState
+from airborne.physics.state_history import POSITION, StateHistory
+from airborne.physics.vectors import Vector3
 from airborne.systems.failure_analyzer import (
     FailureAnalyzer,
     FailureSnapshot,
@@ -271,3 +274,36 @@ class TestFailureAnalyzer:
         assert "Lessons Learned" in report
         assert "ignored" in report.lower()  # Should mention ignored warning
         assert "gear" in report.lower()  # Should mention gear retracted
+
+    def test_analysis_includes_trajectory(self):
+        """Test that an attached state history is copied into the analysis."""
+        history = StateHistory(duration_s=10.0, step_s=0.5)
+        for i in range(40):
+            history.record(AircraftState(position=Vector3(0.0, 600.0 - 15.0 * i, 0.0)), i * 0.5)
+        analyzer = FailureAnalyzer(history=history, trajectory_seconds=5.0)
+
+        snapshot = FailureSnapshot(
+            time=datetime.now(),
+            position=(37.5, -122.5, 0.0),
+            velocity=(0.0, -10.0, 80.0),
+            airspeed_knots=60.0,
+            ground_speed_knots=60.0,
+            vertical_speed_fpm=-1800.0,
+            heading=90.0,
+            pitch=-10.0,
+            roll=0.0,
+            engine_state={"running": True, "rpm": 2300},
+            electrical_state={"battery_voltage": 12.6},
+            fuel_state={"total_usable_gallons": 20.0, "tanks": {}},
+            control_inputs={"throttle": 0.5, "gear": True},
+        )
+        analysis = analyzer.analyze_failure(snapshot, snapshot)
+
+        assert analysis.trajectory is not None
+        assert len(analysis.trajectory) == 11  # 14.5 s back to 9.5 s
+        assert analysis.trajectory[-1, POSITION][1] == 15.0
+
+        # The analysis keeps its own copy
+        history.record(AircraftState(), 20.0)
+        assert analysis.trajectory[-1, POSITION][1] == 15.0
+        assert FailureAnalyzer().analyze_failure(snapshot, snapshot).trajectory is None
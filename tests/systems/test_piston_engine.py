@@ -1,5 +1,7 @@
 """Tests for SimplePistonEngine implementation."""
 
+import pytest
+
 from airborne.systems.engines.base import EngineControls, EngineType
 from airborne.systems.engines.piston_simple import SimplePistonEngine
 
@@ -285,6 +287,23 @@ class TestSimplePistonEngine:
         state_full = engine.get_state()
         assert state_full.power_output_hp > state.power_output_hp
 
+    def test_power_decreases_with_altitude(self):
+        """Test that thinner air reduces power."""
+        engine = SimplePistonEngine()
+        engine.initialize({})
+        engine.rpm = 2700.0
+        engine._warmup_factor = 1.0
+        controls = EngineControls(mixture=0.8, throttle=1.0)
+
+        engine._calculate_power(controls)
+        sea_level_hp = engine.horsepower
+
+        engine.density_ratio = 0.7860  # ~8000 ft standard day
+        engine._calculate_power(controls)
+
+        assert sea_level_hp == pytest.approx(engine.config.max_horsepower)
+        assert engine.horsepower == pytest.approx(0.758 * sea_level_hp, rel=1e-3)
+
     def test_engine_state_reporting(self):
         """Test engine reports state correctly."""
         engine = SimplePistonEngine()
@@ -0,0 +1,107 @@
+"""Tests for the cached, dirty-region text renderer."""
+
+import pygame
+import pytest
+
+from airborne.ui.text_renderer import DirtyTextRenderer, TextSurfaceCache
+
+
+@pytest.fixture
+def font() -> pygame.font.Font:
+    """Default pygame font."""
+    return pygame.font.Font(None, 20)
+
+
+class TestTextSurfaceCache:
+    """Test suite for TextSurfaceCache."""
+
+    def test_render_is_cached(self, font: pygame.font.Font) -> None:
+        """Test that the same (font, text, color) reuses one surface."""
+        cache = TextSurfaceCache()
+
+        first = cache.render(font, "ALT 1200", (0, 255, 0))
+        assert cache.render(font, "ALT 1200", (0, 255, 0)) is first
+        assert cache.render(font, "ALT 1200", (255, 0, 0)) is not first
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_least_recently_used_is_evicted(self, font: pygame.font.Font) -> None:
+        """Test that the oldest unused surface is dropped first."""
+        cache = TextSurfaceCache(max_entries=2)
+        a = cache.render(font, "a", (255, 255, 255))
+        cache.render(font, "b", (255, 255, 255))
+        cache.render(font, "a", (255, 255, 255))
+        cache.render(font, "c", (255, 255, 255))
+
+        assert len(cache) == 2
+        assert cache.render(font, "a", (255, 255, 255)) is a
+        assert cache.misses == 3
+
+    def test_invalid_size(self) -> None:
+        """Test that a non-positive size is rejected."""
+        with pytest.raises(ValueError):
+            TextSurfaceCache(max_entries=0)
+
+
+class TestDirtyTextRenderer:
+    """Test suite for DirtyTextRenderer."""
+
+    def _frame(
+        self, renderer: DirtyTextRenderer, surface: pygame.Surface, lines: dict[str, str], font
+    ) -> list[pygame.Rect]:
+        renderer.begin_frame(surface)
+        for index, (slot, text) in enumerate(lines.items()):
+            renderer.draw(slot, font, text, (255, 255, 255), topleft=(10, 10 + index * 30))
+        return renderer.end_frame()
+
+    def test_first_frame_is_full(self, font: pygame.font.Font) -> None:
+        """Test that the first frame repaints the whole surface."""
+        surface = pygame.Surface((200, 100))
+        renderer = DirtyTextRenderer()
+
+        dirty = self._frame(renderer, surface, {"title": "AirBorne"}, font)
+
+        assert dirty == [surface.get_rect()]
+
+    def test_only_changed_slots_are_dirty(self, font: pygame.font.Font) -> None:
+        """Test that unchanged text is neither rendered nor repainted."""
+        surface = pygame.Surface((200, 100))
+        renderer = DirtyTextRenderer()
+        self._frame(renderer, surface, {"title": "AirBorne", "fps": "FPS: 60"}, font)
+        misses = renderer.cache.misses
+
+        assert self._frame(renderer, surface, {"title": "AirBorne", "fps": "FPS: 60"}, font) == []
+        assert renderer.cache.misses == misses
+
+        dirty = self._frame(renderer, surface, {"title": "AirBorne", "fps": "FPS: 59"}, font)
+        assert len(dirty) == 1
+        assert dirty[0].top >= 40
+
+    def test_removed_slot_is_erased(self, font: pygame.font.Font) -> None:
+        """Test that a slot not drawn any more is cleared to the background."""
+        surface = pygame.Surface((200, 100))
+        renderer = DirtyTextRenderer(background=(0, 0, 0))
+        self._frame(renderer, surface, {"paused": "PAUSED"}, font)
+        assert pygame.mask.from_threshold(surface, (0, 0, 0), (1, 1, 1, 255)).count() < 200 * 100
+
+        dirty = self._frame(renderer, surface, {}, font)
+
+        assert len(dirty) == 1
+        assert pygame.mask.from_threshold(surface, (0, 0, 0), (1, 1, 1, 255)).count() == 200 * 100
+
+    def test_resize_repaints_everything(self, font: pygame.font.Font) -> None:
+        """Test that a new target size forces a full repaint."""
+        renderer = DirtyTextRenderer()
+        self._frame(renderer, pygame.Surface((200, 100)), {"title": "AirBorne"}, font)
+
+        bigger = pygame.Surface((300, 200))
+        assert self._frame(renderer, bigger, {"title": "AirBorne"}, font) == [bigger.get_rect()]
+
+        renderer.invalidate()
+        assert self._frame(renderer, bigger, {"title": "AirBorne"}, font) == [bigger.get_rect()]
+
+    def test_position_required(self, font: pygame.font.Font) -> None:
+        """Test that draw() needs a position."""
+        renderer = DirtyTextRenderer()
+        renderer.begin_frame(pygame.Surface((10, 10)))
+        with pytest.raises(ValueError):
+            renderer.draw("title", font, "AirBorne", (255, 255, 255))